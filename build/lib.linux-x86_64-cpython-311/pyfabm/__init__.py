@@ -0,0 +1,2537 @@
+from __future__ import annotations
+
+import sys
+import os
+import ctypes
+import re
+import enum
+import fnmatch
+from typing import (
+    MutableMapping,
+    Optional,
+    Tuple,
+    Iterable,
+    Union,
+    Callable,
+    Mapping,
+    Sequence,
+    TypeVar,
+    List,
+    Dict,
+    Set,
+    Any,
+    TYPE_CHECKING,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    print("Unable to import NumPy. Please ensure it is installed.")
+    sys.exit(1)
+
+if TYPE_CHECKING:
+    import logging
+    import numpy.typing as npt
+
+
+def __getattr__(name: str) -> Any:
+    # Determine the package version only when it is asked for,
+    # as importlib.metadata is slow to import.
+    if name == "__version__":
+        try:
+            import importlib.metadata
+
+            global __version__
+            __version__ = importlib.metadata.version("pyfabm")
+            return __version__
+        except ImportError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+LOG_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_char_p)
+
+name2lib: MutableMapping[str, ctypes.CDLL] = {}
+
+
+def _find_library(name: str) -> str:
+    # Determine potential names of dynamic library.
+    libdir, name = os.path.split(name)
+    if os.name == "nt":
+        names = (f"{name}.dll", f"lib{name}.dll")
+    elif os.name == "posix" and sys.platform == "darwin":
+        names = (f"lib{name}.dylib",)
+    else:
+        names = (f"lib{name}.so",)
+
+    # Find FABM dynamic library.
+    basedirs = []
+    if libdir != "":
+        # Library name already includes directory
+        basedirs.append(libdir)
+    else:
+        # Look first in pyfabm directory, then in Python path.
+        basedirs.append(os.path.dirname(os.path.abspath(__file__)))
+        basedirs.extend(sys.path)
+    for basedir in basedirs:
+        for possible_name in names:
+            path = os.path.join(basedir, possible_name)
+            if os.path.isfile(path):
+                return path
+    raise Exception(
+        f"Unable to locate FABM library {name}."
+        f" Looked in {basedirs} for a file named {' or '.join(names)}."
+    )
+
+
+# Placeholders for argument and return types that depend on the library:
+# its real data type, the dimensionality of its domain, and the number of
+# spatial indices needed to identify a location.
+REAL = "real"
+REAL_POINTER = "real_pointer"
+LOCATION = "location"
+MASKS = "masks"
+ARR_0D = "array_0d"
+ARR_1D = "array_1d"
+ARR_INTERIOR = "array_interior"
+ARR_HORIZONTAL = "array_horizontal"
+ARR_INTERIOR_EXT = "array_interior_ext"
+ARR_HORIZONTAL_EXT = "array_horizontal_ext"
+ARR_INTERIOR_EXT2 = "array_interior_ext2"
+INT_ARR_INTERIOR = "int_array_interior"
+INT_ARR_HORIZONTAL = "int_array_horizontal"
+INT_ARR_1D = "int_array_1d"
+INT_ARR_2D = "int_array_2d"
+BOOL_ARR_INTERIOR = "bool_array_interior"
+
+c_int_p = ctypes.POINTER(ctypes.c_int)
+
+# Prototypes of all routines in the FABM library: name -> (argtypes, restype)
+# These are assigned to each routine when it is first used.
+# fmt: off
+PROTOTYPES: Dict[str, Tuple[List[Any], Any]] = {
+    # Driver settings (number of spatial dimensions, depth index)
+    "get_driver_settings": ([c_int_p, c_int_p, c_int_p, c_int_p], ctypes.c_void_p),
+
+    # Initialization
+    "create_model": ([ctypes.c_char_p, LOCATION], ctypes.c_void_p),
+    "finalize_model": ([ctypes.c_void_p], None),
+    "set_domain_start": ([ctypes.c_void_p, LOCATION], ctypes.c_void_p),
+    "set_domain_stop": ([ctypes.c_void_p, LOCATION], ctypes.c_void_p),
+
+    # Access to model objects (variables, parameters, dependencies, couplings,
+    # model instances)
+    "get_counts": ([ctypes.c_void_p] + [c_int_p] * 11, None),
+    "get_variable_metadata": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p], None),
+    "set_variable_save": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int], None),
+    "get_variable": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], ctypes.c_void_p),
+    "get_parameter_metadata": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, c_int_p, c_int_p], None),
+    "get_model_metadata": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, c_int_p], None),
+    "get_coupling": ([ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_void_p)], None),
+    "get_error_state": ([], ctypes.c_int),
+    "get_error": ([ctypes.c_int, ctypes.c_char_p], None),
+    "reset_error_state": ([], None),
+    "set_log_callback": ([LOG_CALLBACK], None),
+    "set_mask": ([ctypes.c_void_p, MASKS], None),
+    "set_bottom_index": ([ctypes.c_void_p, INT_ARR_HORIZONTAL], None),
+
+    # Read access to variable attributes
+    "variable_get_metadata": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p], None),
+    "variable_get_background_value": ([ctypes.c_void_p], REAL),
+    "variable_get_missing_value": ([ctypes.c_void_p], REAL),
+    "variable_get_long_path": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p], None),
+    "variable_get_suitable_masters": ([ctypes.c_void_p, ctypes.c_void_p], ctypes.c_void_p),
+    "variable_get_output": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_is_required": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_get_no_river_dilution": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_get_no_precipitation_dilution": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_get_property_type": ([ctypes.c_void_p, ctypes.c_char_p], ctypes.c_int),
+    "variable_get_real_property": ([ctypes.c_void_p, ctypes.c_char_p, REAL], REAL),
+    "variable_get_integer_property": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_int),
+    "variable_get_logical_property": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_int),
+    "find_standard_variable": ([ctypes.c_char_p], ctypes.c_void_p),
+
+    # Read/write/reset access to parameters.
+    "get_real_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], REAL),
+    "get_integer_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    "get_logical_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    "get_string_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_char_p], None),
+    "reset_parameter": ([ctypes.c_void_p, ctypes.c_int], None),
+    "set_real_parameter": ([ctypes.c_void_p, ctypes.c_char_p, REAL], None),
+    "set_real_parameters": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ARR_1D], None),
+    "set_integer_parameter": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], None),
+    "set_logical_parameter": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], None),
+    "set_string_parameter": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p], None),
+
+    # Read access to lists of variables (e.g., suitable coupling targets).
+    "link_list_count": ([ctypes.c_void_p], ctypes.c_int),
+    "link_list_index": ([ctypes.c_void_p, ctypes.c_int], ctypes.c_void_p),
+    "link_list_finalize": ([ctypes.c_void_p], None),
+
+    # Routines for sending pointers to state and dependency data.
+    "link_interior_state_data": ([ctypes.c_void_p, ctypes.c_int, ARR_INTERIOR], None),
+    "link_surface_state_data": ([ctypes.c_void_p, ctypes.c_int, ARR_HORIZONTAL], None),
+    "link_bottom_state_data": ([ctypes.c_void_p, ctypes.c_int, ARR_HORIZONTAL], None),
+    "link_interior_data": ([ctypes.c_void_p, ctypes.c_void_p, ARR_INTERIOR], None),
+    "link_horizontal_data": ([ctypes.c_void_p, ctypes.c_void_p, ARR_HORIZONTAL], None),
+    "link_scalar": ([ctypes.c_void_p, ctypes.c_void_p, ARR_0D], None),
+
+    # Read access to diagnostic data.
+    "get_interior_diagnostic_data": ([ctypes.c_void_p, ctypes.c_int], REAL_POINTER),
+    "get_horizontal_diagnostic_data": ([ctypes.c_void_p, ctypes.c_int], REAL_POINTER),
+    "get_interior_diagnostics": ([ctypes.c_void_p, ctypes.c_int, INT_ARR_1D, ARR_INTERIOR_EXT], None),
+    "get_horizontal_diagnostics": ([ctypes.c_void_p, ctypes.c_int, INT_ARR_1D, ARR_HORIZONTAL_EXT], None),
+    "get_jacobian_sparsity": ([ctypes.c_void_p, ctypes.c_int, INT_ARR_2D], None),
+    "get_schedule": ([ctypes.c_void_p, LOG_CALLBACK], None),
+    "set_incremental": ([ctypes.c_void_p, ctypes.c_int], None),
+    "invalidate": ([ctypes.c_void_p, ctypes.c_void_p], None),
+    "require_data": ([ctypes.c_void_p, ctypes.c_void_p], None),
+    "get_standard_variable_data": ([ctypes.c_void_p, ctypes.c_void_p, c_int_p], REAL_POINTER),
+
+    "start": ([ctypes.c_void_p], None),
+
+    # Routine for retrieving source-sink terms for the interior domain.
+    "get_sources": ([ctypes.c_void_p, REAL, ARR_INTERIOR_EXT, ARR_HORIZONTAL_EXT, ARR_HORIZONTAL_EXT, ctypes.c_int, ctypes.c_int, ARR_INTERIOR], None),
+    "get_vertical_movement": ([ctypes.c_void_p, ARR_INTERIOR_EXT], None),
+    "get_conserved_quantities": ([ctypes.c_void_p, ARR_HORIZONTAL_EXT, ARR_INTERIOR], None),
+    "check_state": ([ctypes.c_void_p, ctypes.c_int], ctypes.c_int),
+    "check_state_points": ([ctypes.c_void_p, ctypes.c_int, BOOL_ARR_INTERIOR, INT_ARR_1D], ctypes.c_int),
+
+    # Routine for getting git repository version information.
+    "get_version": ([ctypes.c_int, ctypes.c_char_p], None),
+
+    "save_settings": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_void_p),
+
+    # Only in 0D libraries
+    "integrate": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ARR_1D, ARR_INTERIOR_EXT, ARR_INTERIOR_EXT2, REAL, ctypes.c_int, ctypes.c_int, ARR_INTERIOR, ctypes.c_int, ctypes.c_int, ARR_INTERIOR_EXT2, REAL, c_int_p, c_int_p], None),
+}
+# fmt: on
+
+_ndpointer_cache: Dict[Tuple[Any, int], type] = {}
+
+
+def _ndpointer(dtype: Any, ndim: int) -> type:
+    """Return a contiguous array type for use in argtypes. Types are shared
+    between all libraries, irrespective of their dimensionality."""
+    key = (dtype, ndim)
+    if key not in _ndpointer_cache:
+        _ndpointer_cache[key] = np.ctypeslib.ndpointer(
+            dtype=dtype, ndim=ndim, flags="CONTIGUOUS"
+        )
+    return _ndpointer_cache[key]
+
+
+class FABMLibrary(ctypes.CDLL):
+    """FABM shared library. Argument and return types of each routine are
+    set when the routine is first accessed, based on :data:`PROTOTYPES`."""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        func = self[name]
+        if name in PROTOTYPES:
+            argtypes, restype = PROTOTYPES[name]
+            func.argtypes = [t for arg in argtypes for t in self._resolve_arg(arg)]
+            func.restype = self._resolve(restype)
+        setattr(self, name, func)
+        return func
+
+    def _resolve_arg(self, arg: Any) -> List[Any]:
+        if arg == LOCATION:
+            return [ctypes.c_int] * self.ndim_int
+        elif arg == MASKS:
+            # Horizontal mask, preceded by interior mask if mask_type is 2
+            masks = [INT_ARR_INTERIOR, INT_ARR_HORIZONTAL][-self.mask_type :]
+            return [self._resolve(mask) for mask in masks]
+        return [self._resolve(arg)]
+
+    def _resolve(self, t: Any) -> Any:
+        if not isinstance(t, str):
+            return t
+        if t == REAL:
+            return self.dtype
+        elif t == REAL_POINTER:
+            return ctypes.POINTER(self.dtype)
+        ndim, dtype = {
+            ARR_0D: (0, self.dtype),
+            ARR_1D: (1, self.dtype),
+            ARR_INTERIOR: (self.ndim_int, self.dtype),
+            ARR_HORIZONTAL: (self.ndim_hz, self.dtype),
+            ARR_INTERIOR_EXT: (self.ndim_int + 1, self.dtype),
+            ARR_HORIZONTAL_EXT: (self.ndim_hz + 1, self.dtype),
+            ARR_INTERIOR_EXT2: (self.ndim_int + 2, self.dtype),
+            INT_ARR_INTERIOR: (self.ndim_int, ctypes.c_int),
+            INT_ARR_HORIZONTAL: (self.ndim_hz, ctypes.c_int),
+            INT_ARR_1D: (1, ctypes.c_int),
+            INT_ARR_2D: (2, ctypes.c_int),
+            BOOL_ARR_INTERIOR: (self.ndim_int, np.bool_),
+        }[t]
+        return _ndpointer(dtype, ndim)
+
+
+def get_lib(name: str) -> FABMLibrary:
+    if name in name2lib:
+        return name2lib[name]
+
+    if os.path.isfile(name):
+        path = name
+    else:
+        path = _find_library(name)
+
+    # Load FABM library.
+    lib = FABMLibrary(path)
+    lib.dtype = ctypes.c_double
+    lib.numpy_dtype = np.dtype(lib.dtype).newbyteorder("=")
+
+    # Driver settings (number of spatial dimensions, depth index)
+    ndim_c = ctypes.c_int()
+    idepthdim_c = ctypes.c_int()
+    mask_type = ctypes.c_int()
+    variable_bottom_index = ctypes.c_int()
+    lib.get_driver_settings(
+        ctypes.byref(ndim_c),
+        ctypes.byref(idepthdim_c),
+        ctypes.byref(mask_type),
+        ctypes.byref(variable_bottom_index),
+    )
+    ndim_int = ndim_c.value
+    ndim_hz = ndim_int if idepthdim_c.value == -1 else ndim_int - 1
+    lib.ndim_int = ndim_int
+    lib.ndim_hz = ndim_hz
+    lib.idepthdim = idepthdim_c.value
+    lib.mask_type = mask_type.value
+    lib.variable_bottom_index = variable_bottom_index.value != 0
+
+    lib.set_log_callback(log_callback)
+
+    name2lib[name] = lib
+    return lib
+
+
+logger: Optional[logging.Logger] = None
+
+# Set to suppress all messages, e.g., while probing states with check_state
+_muted = False
+
+
+@LOG_CALLBACK
+def log_callback(msg: bytes):
+    log(msg.decode("ascii"))
+
+
+def log(msg: str):
+    if _muted:
+        return
+    if logger is not None:
+        logger.info(msg)
+    else:
+        print(msg)
+
+
+INTERIOR_STATE_VARIABLE = 1
+SURFACE_STATE_VARIABLE = 2
+BOTTOM_STATE_VARIABLE = 3
+INTERIOR_DIAGNOSTIC_VARIABLE = 4
+HORIZONTAL_DIAGNOSTIC_VARIABLE = 5
+CONSERVED_QUANTITY = 6
+INTERIOR_DEPENDENCY = 7
+HORIZONTAL_DEPENDENCY = 8
+SCALAR_DEPENDENCY = 9
+
+
+class DataType(enum.IntEnum):
+    REAL = 1
+    INTEGER = 2
+    LOGICAL = 3
+    STRING = 4
+
+
+ATTRIBUTE_LENGTH = 256
+
+DISPLAY_MINIMUM = 0
+DISPLAY_NORMAL = 1
+DISPLAY_ADVANCED = 2
+
+unicodesuperscript = {
+    "0": "⁰",
+    "1": "¹",
+    "2": "²",
+    "3": "³",
+    "4": "⁴",
+    "5": "⁵",
+    "6": "⁶",
+    "7": "⁷",
+    "8": "⁸",
+    "9": "⁹",
+    "-": "⁻",
+}
+unicodesubscript = {
+    "0": "₀",
+    "1": "₁",
+    "2": "₂",
+    "3": "₃",
+    "4": "₄",
+    "5": "₅",
+    "6": "₆",
+    "7": "₇",
+    "8": "₈",
+    "9": "₉",
+}
+supnumber = re.compile(r"(?<=\w)(-?\d+)(?=[ \*+\-/]|$)")
+supenumber = re.compile(r"(?<=\d)e(-?\d+)(?=[ \*+\-/]|$)")
+oldsupminus = re.compile(r"/(\w+)(?:\*\*|\^)(\d+)(?=[ \*+\-/]|$)")
+oldsup = re.compile(r"(?<=\w)(?:\*\*|\^)(-?\d+)(?=[ \*+\-/]|$)")
+oldsub = re.compile(r"(?<=\w)_(-?\d+)(?=[ \*+\-/]|$)")
+
+
+def createPrettyUnit(unit: str) -> str:
+    def replace_superscript(m: re.Match) -> str:
+        return "".join([unicodesuperscript[n] for n in m.group(1)])
+
+    def replace_subscript(m: re.Match) -> str:
+        return "".join([unicodesubscript[n] for n in m.group(1)])
+
+    def reple(m: re.Match) -> str:
+        return "×10%s" % "".join([unicodesuperscript[n] for n in m.group(1)])
+
+    def reploldminus(m: re.Match) -> str:
+        return " %s⁻%s" % (
+            m.group(1),
+            "".join([unicodesuperscript[n] for n in m.group(2)]),
+        )
+
+    # def replold(m):
+    #    return u'%s%s' % (m.group(1),u''.join([unicodesuperscript[n] for n in m.group(2)]))
+    unit = oldsup.sub(replace_superscript, unit)
+    unit = oldsub.sub(replace_subscript, unit)
+    unit = supenumber.sub(reple, unit)
+    unit = supnumber.sub(replace_superscript, unit)
+    # unit = oldsupminus.sub(reploldminus,unit)
+    return unit
+
+
+class FABMException(Exception):
+    pass
+
+
+def hasError() -> bool:
+    for lib in name2lib.values():
+        if lib.get_error_state() != 0:
+            return True
+    return False
+
+
+def getError() -> Optional[str]:
+    for lib in name2lib.values():
+        if lib.get_error_state() != 0:
+            strmessage = ctypes.create_string_buffer(1024)
+            lib.get_error(1024, strmessage)
+            return strmessage.value.decode("ascii")
+
+
+NodeValue = TypeVar("NodeValue")
+NodeType = Mapping[str, Union["NodeType", NodeValue]]
+
+
+def printTree(
+    root: NodeType, stringmapper: Callable[[NodeValue], str], indent: str = ""
+):
+    """Print an indented tree of objects, encoded by dictionaries linking the
+    names of children to their subtree, or to their object. Objects are finally
+    printed as string obtained by calling the provided stringmapper method."""
+    for name, item in root.items():
+        if isinstance(item, Mapping):
+            log(f"{indent}{name}")
+            printTree(item, stringmapper, indent + "   ")
+        else:
+            log(f"{indent}{name} = {stringmapper(item)}")
+
+
+def color_columns(sparsity: np.ndarray) -> np.ndarray:
+    """Partition the columns of a sparse matrix into groups ("colors") of
+    structurally orthogonal columns: columns with the same color have no
+    nonzero element in a common row. In finite-difference Jacobians, all
+    columns with the same color can then be perturbed together. Columns are
+    colored greedily, starting with the most populated.
+
+    Args:
+        sparsity: boolean matrix with the pattern of nonzero elements
+
+    Returns:
+        the color of each column, from 0 to the number of colors minus one
+    """
+    sparsity = np.asarray(sparsity, dtype=bool)
+    colors = np.empty(sparsity.shape[1], dtype=int)
+    rows_per_color: List[np.ndarray] = []
+    for j in np.argsort(-sparsity.sum(axis=0), kind="stable"):
+        for color, rows in enumerate(rows_per_color):
+            if not (rows & sparsity[:, j]).any():
+                rows |= sparsity[:, j]
+                break
+        else:
+            color = len(rows_per_color)
+            rows_per_color.append(sparsity[:, j].copy())
+        colors[j] = color
+    return colors
+
+
+class VariableProperties:
+    def __init__(self, model: "Model", variable_pointer: ctypes.c_void_p):
+        self.model = model
+        self._pvariable = variable_pointer
+
+    def __getitem__(self, key: str) -> Union[float, int, bool]:
+        typecode = self.model.fabm.variable_get_property_type(
+            self._pvariable, key.encode("ascii")
+        )
+        if typecode == DataType.REAL:
+            return self.model.fabm.variable_get_real_property(
+                self._pvariable, key.encode("ascii"), -1.0
+            )
+        elif typecode == DataType.INTEGER:
+            return self.model.fabm.variable_get_integer_property(
+                self._pvariable, key.encode("ascii"), 0
+            )
+        elif typecode == DataType.LOGICAL:
+            return (
+                self.model.fabm.variable_get_logical_property(
+                    self._pvariable, key.encode("ascii"), 0
+                )
+                != 0
+            )
+        raise KeyError
+
+
+class Variable(object):
+    def __init__(
+        self,
+        model: "Model",
+        name: str,
+        units: str,
+        long_name: str,
+        path: Optional[str] = None,
+    ):
+        self.model = model
+        self.name = name
+        self.units = units
+        self.units_unicode = None if units is None else createPrettyUnit(units)
+        self.long_name = long_name or name
+        self.path = path or name
+
+    @property
+    def long_path(self) -> str:
+        return self.long_name
+
+    @property
+    def output_name(self) -> str:
+        """Name suitable for output (alphanumeric characters and underscores only)"""
+        return re.sub(r"\W", "_", self.name)
+
+    @property
+    def options(self) -> Optional[Sequence]:
+        """Collection of values that this variable can take.
+        `None` if the variable is not limited to any particular value."""
+        return None
+
+    def __repr__(self) -> str:
+        postfix = f"={self.value}" if hasattr(self, "value") else ""
+        return f"<{self.name}{postfix}>"
+
+
+class VariableFromPointer(Variable):
+    def __init__(self, model: "Model", variable_pointer: ctypes.c_void_p):
+        strname = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        strunits = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        model.fabm.variable_get_metadata(
+            variable_pointer, ATTRIBUTE_LENGTH, strname, strunits, strlong_name
+        )
+        name = strname.value.decode("ascii")
+        units = strunits.value.decode("ascii")
+        long_name = strlong_name.value.decode("ascii")
+
+        super().__init__(model, name, units, long_name)
+
+        self._pvariable = variable_pointer
+        self.properties = VariableProperties(self.model, self._pvariable)
+
+    @property
+    def long_path(self) -> str:
+        """Long model instance name, followed by a slash, followed by long variable name."""
+        strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        self.model.fabm.variable_get_long_path(
+            self._pvariable, ATTRIBUTE_LENGTH, strlong_name
+        )
+        return strlong_name.value.decode("ascii")
+
+    @property
+    def missing_value(self) -> float:
+        """Value that indicates missing data, for instance, on land."""
+        return self.model.fabm.variable_get_missing_value(self._pvariable)
+
+    def getRealProperty(self, name, default=-1.0) -> float:
+        return self.model.fabm.variable_get_real_property(
+            self._pvariable, name.encode("ascii"), default
+        )
+
+
+class Dependency(VariableFromPointer):
+    def __init__(
+        self,
+        model: "Model",
+        variable_pointer: ctypes.c_void_p,
+        shape: Tuple[int],
+        link_function: Callable[[ctypes.c_void_p, ctypes.c_void_p, np.ndarray], None],
+    ):
+        super().__init__(model, variable_pointer)
+        self._is_set = False
+        self._link_function = link_function
+        self._shape = shape
+        self._version = 0
+
+    @property
+    def value(self) -> Optional[np.ndarray]:
+        return None if not self._is_set else self._data
+
+    @value.setter
+    def value(self, value: npt.ArrayLike):
+        if not self._is_set:
+            self.link(np.empty(self._shape, dtype=self.model.fabm.numpy_dtype))
+        self._data[...] = value
+        self.model._mark_changed((self,))
+
+    @property
+    def version(self) -> int:
+        """Number of times the value has been set or linked, or has been
+        reported changed with :meth:`Model.invalidate`."""
+        return self._version
+
+    def link(self, data: np.ndarray):
+        assert data.shape == self._shape, (
+            f"{self.name}: shape of provided array {data.shape}"
+            f" does not match the shape required {self._shape}"
+        )
+        self._data = data
+        self._link_function(self.model.pmodel, self._pvariable, self._data)
+        self._is_set = True
+        self.model._mark_changed((self,))
+
+    @property
+    def required(self) -> bool:
+        return self.model.fabm.variable_is_required(self._pvariable) != 0
+
+
+class StateVariable(VariableFromPointer):
+    def __init__(
+        self, model: "Model", variable_pointer: ctypes.c_void_p, data: np.ndarray
+    ):
+        super().__init__(model, variable_pointer)
+        self._data = data
+        self._version = 0
+
+    @property
+    def value(self) -> np.ndarray:
+        return self._data
+
+    @value.setter
+    def value(self, value: npt.ArrayLike):
+        self._data[...] = value
+        self.model._mark_changed((self,))
+
+    @property
+    def version(self) -> int:
+        """Number of times the value has been set, or has been reported
+        changed with :meth:`Model.invalidate`."""
+        return self._version
+
+    @property
+    def background_value(self) -> float:
+        return self.model.fabm.variable_get_background_value(self._pvariable)
+
+    @property
+    def output(self) -> bool:
+        return self.model.fabm.variable_get_output(self._pvariable) != 0
+
+    @property
+    def no_river_dilution(self) -> bool:
+        return self.model.fabm.variable_get_no_river_dilution(self._pvariable) != 0
+
+    @property
+    def no_precipitation_dilution(self) -> bool:
+        return (
+            self.model.fabm.variable_get_no_precipitation_dilution(self._pvariable) != 0
+        )
+
+
+class DiagnosticVariable(VariableFromPointer):
+    def __init__(
+        self,
+        model: "Model",
+        variable_pointer: ctypes.c_void_p,
+        index: int,
+        horizontal: bool,
+    ):
+        super().__init__(model, variable_pointer)
+        self._data = None
+        self._horizontal = horizontal
+        self._index = index + 1
+        self._save = self.output
+
+    @property
+    def value(self) -> Optional[np.ndarray]:
+        return self._data
+
+    @property
+    def output(self) -> bool:
+        """Whether this diagnostic is meant to be included in output by default"""
+        return self.model.fabm.variable_get_output(self._pvariable) != 0
+
+    def _set_save(self, value: bool):
+        vartype = (
+            HORIZONTAL_DIAGNOSTIC_VARIABLE
+            if self._horizontal
+            else INTERIOR_DIAGNOSTIC_VARIABLE
+        )
+        self.model.fabm.set_variable_save(
+            self.model.pmodel, vartype, self._index, 1 if value else 0
+        )
+        self._save = bool(value)
+
+    def _get_save(self) -> bool:
+        return self._save
+
+    #: Whether the value of this diagnostic must be calculated, for instance, for output
+    save: bool = property(_get_save, _set_save)
+
+
+class Parameter(Variable):
+    def __init__(
+        self,
+        model: "Model",
+        name: str,
+        index: int,
+        units: Optional[str] = None,
+        long_name: Optional[str] = None,
+        type: Optional[DataType] = None,
+        has_default: bool = False,
+    ):
+        super().__init__(model, name, units, long_name)
+        self._type = type
+        self._index = index + 1
+        self._has_default = has_default
+
+    def _get_value(self, *, default: bool = False):
+        default = 1 if default else 0
+        if self._type == DataType.REAL:
+            return self.model.fabm.get_real_parameter(
+                self.model.pmodel, self._index, default
+            )
+        elif self._type == DataType.INTEGER:
+            return self.model.fabm.get_integer_parameter(
+                self.model.pmodel, self._index, default
+            )
+        elif self._type == DataType.LOGICAL:
+            return (
+                self.model.fabm.get_logical_parameter(
+                    self.model.pmodel, self._index, default
+                )
+                != 0
+            )
+        elif self._type == DataType.STRING:
+            result = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+            self.model.fabm.get_string_parameter(
+                self.model.pmodel, self._index, default, ATTRIBUTE_LENGTH, result
+            )
+            return result.value.decode("ascii")
+
+    @property
+    def value(self) -> Union[float, int, bool, str]:
+        return self._get_value()
+
+    @value.setter
+    def value(self, value: Union[float, int, bool, str]):
+        settings = self.model._save_state()
+
+        if self._type == DataType.REAL:
+            self.model.fabm.set_real_parameter(
+                self.model.pmodel, self.name.encode("ascii"), value
+            )
+        elif self._type == DataType.INTEGER:
+            self.model.fabm.set_integer_parameter(
+                self.model.pmodel, self.name.encode("ascii"), value
+            )
+        elif self._type == DataType.LOGICAL:
+            self.model.fabm.set_logical_parameter(
+                self.model.pmodel, self.name.encode("ascii"), value
+            )
+        elif self._type == DataType.STRING:
+            self.model.fabm.set_string_parameter(
+                self.model.pmodel, self.name.encode("ascii"), value.encode("ascii")
+            )
+
+        # Update the model configuration
+        # (arrays with variables and parameters have changed)
+        self.model._update_configuration(settings)
+
+    @property
+    def default(self) -> Union[float, int, bool, str, None]:
+        """Default value for this parameter (`None` if no default is set)"""
+        if not self._has_default:
+            return None
+        return self._get_value(default=True)
+
+    @property
+    def field(self) -> Optional[Dependency]:
+        """Dependency through which this parameter can be given a spatially
+        varying value (`None` if the model does not support this)"""
+        if self._type != DataType.REAL or self.name not in self.model.parameter_fields:
+            return None
+        return self.model.parameter_fields[self.name]
+
+    def link_field(self, data: np.ndarray):
+        """Use spatially varying values for this parameter, for instance,
+        to evaluate an ensemble of parameter values in a single call.
+        The values must be provided in the units of the parameter and take
+        precedence over :attr:`value`. This is only supported for parameters
+        of models that opt in, and must be done before the model is started."""
+        field = self.field
+        if field is None:
+            raise FABMException(
+                f"Parameter {self.name} cannot vary in space,"
+                " because its model does not support this."
+            )
+        if self.model._started:
+            raise FABMException(
+                f"The field for parameter {self.name} must be linked"
+                " before start is called."
+            )
+        field.link(data)
+
+    def reset(self):
+        """Reset this parameter to its default value"""
+        settings = self.model._save_state()
+        self.model.fabm.reset_parameter(self.model.pmodel, self._index)
+        self.model._update_configuration(settings)
+
+
+class StandardVariable:
+    def __init__(self, model: "Model", pointer: ctypes.c_void_p):
+        self.model = model
+        self._pvariable = pointer
+
+    @property
+    def value(self) -> np.ndarray:
+        horizontal = ctypes.c_int()
+        pdata = self.model.fabm.get_standard_variable_data(
+            self.model.pmodel, self._pvariable, horizontal
+        )
+        if horizontal.value == 0:
+            shape = self.model.interior_domain_shape
+        else:
+            shape = self.model.horizontal_domain.shape
+        arr = np.ctypeslib.as_array(pdata, shape)
+        return arr.view(dtype=self.model.fabm.numpy_dtype)
+
+
+T = TypeVar("T")
+
+
+class NamedObjectList(Sequence[T]):
+    def __init__(self, *data: Iterable[T]):
+        self._data: List[T] = []
+        for d in data:
+            self._data.extend(d)
+        self._lookup: Optional[Dict[str, T]] = None
+        self._lookup_ci: Optional[Dict[str, T]] = None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, key: Union[int, str]) -> T:
+        if isinstance(key, str):
+            return self.find(key)
+        return self._data[key]
+
+    def __contains__(self, key: Union[T, str]) -> bool:
+        if isinstance(key, str):
+            try:
+                self.find(key)
+                return True
+            except KeyError:
+                return False
+        return key in self._data
+
+    def index(self, key: Union[T, str], *args) -> int:
+        if isinstance(key, str):
+            try:
+                key = self.find(key)
+            except KeyError:
+                raise ValueError from None
+        return self._data.index(key, *args)
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def __add__(self, other: "NamedObjectList[T]") -> "NamedObjectList[T]":
+        return NamedObjectList(self._data, other._data)
+
+    def find(self, name: str, case_insensitive: bool = False) -> T:
+        if case_insensitive:
+            if self._lookup_ci is None:
+                self._lookup_ci = {obj.name.lower(): obj for obj in self._data}
+            return self._lookup_ci[name.lower()]
+        else:
+            if self._lookup is None:
+                self._lookup = {obj.name: obj for obj in self._data}
+            return self._lookup[name]
+
+    def clear(self):
+        self._data.clear()
+        self._lookup = None
+        self._lookup_ci = None
+
+
+class Coupling(VariableFromPointer):
+    def __init__(self, model: "Model", index: int):
+        self._ptarget = ctypes.c_void_p()
+        self._psource = ctypes.c_void_p()
+        model.fabm.get_coupling(
+            model.pmodel,
+            index + 1,
+            ctypes.byref(self._psource),
+            ctypes.byref(self._ptarget),
+        )
+        super().__init__(model, self._psource)
+        self._options = None
+
+    @property
+    def value(self) -> Optional[str]:
+        if self._psource.value == self._ptarget.value:
+            return
+        strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        self.model.fabm.variable_get_long_path(
+            self._ptarget, ATTRIBUTE_LENGTH, strlong_name
+        )
+        return strlong_name.value.decode("ascii")
+
+    @value.setter
+    def value(self, value: str):
+        log(f"New coupling specified: {value}")
+        pass
+
+    @property
+    def options(self) -> Sequence[str]:
+        if self._options is None:
+            self.model._load_coupling_options()
+        return self._options
+
+
+class SubModel(object):
+    def __init__(self, model: "Model", name: str):
+        strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        iuser = ctypes.c_int()
+        model.fabm.get_model_metadata(
+            model.pmodel, name.encode("ascii"), ATTRIBUTE_LENGTH, strlong_name, iuser
+        )
+        self.long_name = strlong_name.value.decode("ascii")
+        self.user_created = iuser.value != 0
+
+
+class _ClosedLibrary:
+    """Stand-in for the FABM library of a model that has been closed."""
+
+    def __getattr__(self, name: str):
+        raise FABMException("This model has been closed and can no longer be used.")
+
+
+class Model(object):
+    def __init__(
+        self,
+        path: Union[str, dict] = "fabm.yaml",
+        shape: Tuple[int] = (),
+        libname: Optional[str] = None,
+        start: Optional[Tuple[int]] = None,
+        stop: Optional[Tuple[int]] = None,
+    ):
+        delete = False
+        if isinstance(path, dict):
+            import tempfile
+            import yaml
+            import io
+
+            with tempfile.NamedTemporaryFile(
+                suffix=".yaml", prefix="fabm", delete=False
+            ) as f:
+                with io.TextIOWrapper(f, encoding="ascii") as wrapper:
+                    yaml.safe_dump(path, wrapper)
+                path = f.name
+            delete = True
+
+        # Arguments needed to recreate the model (see __getstate__)
+        self._libname = libname
+        self._domain_start = start
+        self._domain_stop = stop
+
+        if libname is None:
+            # Pick one of the built-in FABM libraries (0D, 1D, 2D or 3D)
+            # In 2D and 3D, the first dimension is depth.
+            ndim = len(shape)
+            if ndim > 3:
+                raise FABMException(
+                    f"Invalid domain shape {shape}."
+                    " Domain must have between 0 and 3 dimensions."
+                )
+            libname = f"fabm_{ndim}d"
+
+        self.fabm = get_lib(libname)
+
+        if len(shape) != self.fabm.ndim_int:
+            raise FABMException(
+                f"Invalid domain shape {shape}."
+                f" Domain must have {self.fabm.ndim_int} dimensions."
+                f" FABM library: {self.fabm._name}"
+            )
+
+        self.fabm.reset_error_state()
+        self._cell_thickness = None
+        self.pmodel = None
+        pmodel = self.fabm.create_model(path.encode("ascii"), *shape[::-1])
+        if hasError():
+            raise FABMException(
+                f"An error occurred while parsing {path}:\n{getError()}"
+            )
+        self.pmodel = pmodel
+        if start is not None:
+            self.fabm.set_domain_start(self.pmodel, *[s + 1 for s in start[::-1]])
+        if stop is not None:
+            self.fabm.set_domain_stop(self.pmodel, *stop[::-1])
+        self.interior_domain_shape = tuple(shape)
+        self.horizontal_domain_shape = tuple(
+            [l for i, l in enumerate(shape) if i != self.fabm.idepthdim]
+        )
+        if delete:
+            os.remove(path)
+
+        # fmt: off
+        self.interior_state_variables: NamedObjectList[StateVariable] = NamedObjectList()
+        self.surface_state_variables: NamedObjectList[StateVariable] = NamedObjectList()
+        self.bottom_state_variables: NamedObjectList[StateVariable] = NamedObjectList()
+        self.interior_diagnostic_variables: NamedObjectList[DiagnosticVariable] = NamedObjectList()
+        self.horizontal_diagnostic_variables: NamedObjectList[DiagnosticVariable] = NamedObjectList()
+        self.conserved_quantities: NamedObjectList[Variable] = NamedObjectList()
+        self.parameters: NamedObjectList[Parameter] = NamedObjectList()
+        self.interior_dependencies: NamedObjectList[Dependency] = NamedObjectList()
+        self.horizontal_dependencies: NamedObjectList[Dependency] = NamedObjectList()
+        self.scalar_dependencies: NamedObjectList[Dependency] = NamedObjectList()
+        self.parameter_fields: NamedObjectList[Dependency] = NamedObjectList()
+        # fmt: on
+
+        self._linked_state = None
+        self._incremental = False
+        self._changed: Set[VariableFromPointer] = set()
+        self._changed_all = False
+        self._update_configuration()
+        self._mask = None
+        self._bottom_index = None
+
+    def close(self):
+        """Release all memory held by the underlying FABM model, including its
+        diagnostic buffers. Afterwards, the model and its variables can no
+        longer be used. Calling this method more than once has no effect."""
+        if self.pmodel is None:
+            return
+
+        # Diagnostic values are views of memory owned by FABM; drop them before
+        # that memory is released.
+        for variable in self.diagnostic_variables:
+            variable._data = None
+
+        # If the library was unloaded (see unload), its memory is already gone.
+        if any(lib is self.fabm for lib in name2lib.values()):
+            self.fabm.finalize_model(self.pmodel)
+        self.pmodel = None
+
+        # Variable wrappers keep a reference to the model and access FABM via
+        # its library attribute. Replace that with a stand-in that raises an
+        # exception instead of touching released memory.
+        self.fabm = _ClosedLibrary()
+
+    def __getstate__(self) -> Dict:
+        """Describe the model by its configuration (including any parameter
+        changes), domain, mask, bottom indices, state and environment.
+        This allows the model to be pickled, e.g., to send it to another
+        process. Memory owned by FABM is not included."""
+        return dict(
+            configuration=self._get_configuration(),
+            libname=self._libname,
+            shape=self.interior_domain_shape,
+            start=self._domain_start,
+            stop=self._domain_stop,
+            mask=self._mask,
+            bottom_index=self._bottom_index,
+            cell_thickness=self._cell_thickness,
+            settings=self._save_state(),
+            time=self.itime,
+            started=self._started,
+        )
+
+    def __setstate__(self, state: Dict):
+        self._create_from_configuration(
+            state["configuration"],
+            state["shape"],
+            state["libname"],
+            state["start"],
+            state["stop"],
+        )
+        if state["mask"] is not None:
+            self.link_mask(*state["mask"])
+        if state["bottom_index"] is not None:
+            self.link_bottom_index(state["bottom_index"])
+        if state["cell_thickness"] is not None:
+            self.link_cell_thickness(state["cell_thickness"])
+        self._restore_state(state["settings"])
+        if state["started"]:
+            self.start(verbose=False)
+        self.itime = state["time"]
+
+    def _get_configuration(self) -> bytes:
+        """Return the current model configuration as YAML, including any
+        parameter values that were changed after the model was created."""
+        import tempfile
+
+        fd, path = tempfile.mkstemp(suffix=".yaml", prefix="fabm")
+        os.close(fd)
+        try:
+            self.save_settings(path, DISPLAY_MINIMUM)
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            os.remove(path)
+
+    def _create_from_configuration(self, configuration: bytes, *args):
+        import tempfile
+
+        fd, path = tempfile.mkstemp(suffix=".yaml", prefix="fabm")
+        with os.fdopen(fd, "wb") as f:
+            f.write(configuration)
+        try:
+            self.__init__(path, *args)
+        finally:
+            os.remove(path)
+
+    def save_checkpoint(self, path: str):
+        """Save the model configuration, state, environment, mask, bottom
+        indices, cell thickness and time to a single binary (NumPy .npz) file.
+        The model can be returned to this point with :meth:`load_checkpoint`."""
+        import hashlib
+
+        configuration = self._get_configuration()
+        data = dict(
+            configuration=np.frombuffer(configuration, dtype=np.uint8),
+            configuration_hash=np.array(hashlib.sha1(configuration).hexdigest()),
+            time=np.array(self.itime),
+            started=np.array(self._started),
+            interior_state=self._interior_state,
+            surface_state=self._surface_state,
+            bottom_state=self._bottom_state,
+        )
+        if self._mask is not None:
+            for i, mask in enumerate(self._mask):
+                data[f"mask{i}"] = mask
+        if self._bottom_index is not None:
+            data["bottom_index"] = self._bottom_index
+        if self._cell_thickness is not None:
+            data["cell_thickness"] = self._cell_thickness
+        for dependency in self.dependencies + self.parameter_fields:
+            if dependency.value is not None:
+                data[f"dependency:{dependency.name}"] = dependency.value
+        with open(path, "wb") as f:
+            np.savez(f, **data)
+
+    def load_checkpoint(self, path: str):
+        """Restore the model to a point previously saved with
+        :meth:`save_checkpoint`. If the model configuration differs from the
+        one in the checkpoint (e.g., because parameters have been changed since),
+        the model is first recreated from the checkpointed configuration.
+        In that case, previously obtained variable and parameter objects can
+        no longer be used. Otherwise, only data are copied."""
+        import hashlib
+
+        with np.load(path) as data:
+            configuration = self._get_configuration()
+            if hashlib.sha1(configuration).hexdigest() != data["configuration_hash"]:
+                self.close()
+                self._create_from_configuration(
+                    data["configuration"].tobytes(),
+                    self.interior_domain_shape,
+                    self._libname,
+                    self._domain_start,
+                    self._domain_stop,
+                )
+            if "mask0" in data:
+                masks = [data[f"mask{i}"] for i in range(self.fabm.mask_type)]
+                self.mask = masks[0] if len(masks) == 1 else masks
+            if "bottom_index" in data:
+                self.bottom_index = data["bottom_index"]
+            if "cell_thickness" in data:
+                self.cell_thickness = data["cell_thickness"]
+            self.interior_state = data["interior_state"]
+            self.surface_state = data["surface_state"]
+            self.bottom_state = data["bottom_state"]
+            for dependency in self.dependencies + self.parameter_fields:
+                key = f"dependency:{dependency.name}"
+                if key in data:
+                    dependency.value = data[key]
+            if data["started"] and not self._started:
+                self.start()
+            self.itime = float(data["time"])
+
+    def __enter__(self) -> "Model":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, "pmodel", None) is not None:
+            self.close()
+
+    def link_mask(self, *masks: np.ndarray):
+        if self.fabm.mask_type == 0:
+            raise FABMException(
+                "the underlying FABM library has been compiled without support for masks"
+            )
+        if len(masks) != self.fabm.mask_type:
+            raise FABMException(
+                f"link_mask must be provided with {self.fabm.mask_type} masks"
+            )
+        if len(masks) > 1:
+            assert (
+                masks[0].shape == self.interior_domain_shape
+                and masks[0].dtype == np.intc
+                and masks[0].flags["C_CONTIGUOUS"]
+            )
+        assert (
+            masks[-1].shape == self.horizontal_domain_shape
+            and masks[-1].dtype == np.intc
+            and masks[-1].flags["C_CONTIGUOUS"]
+        )
+        self._mask = masks
+        self.fabm.set_mask(self.pmodel, *self._mask)
+        self.invalidate()
+
+    @property
+    def mask(self) -> Union[np.ndarray, Sequence[np.ndarray], None]:
+        mask = self._mask
+        if mask is not None and len(mask) == 1:
+            mask = mask[0]
+        return mask
+
+    @mask.setter
+    def mask(self, values: Union[npt.ArrayLike, Sequence[npt.ArrayLike]]):
+        if self.fabm.mask_type == 1:
+            values = (values,)
+        if len(values) != self.fabm.mask_type:
+            raise FABMException(f"mask must be set to {self.fabm.mask_type} values")
+        if self._mask is None:
+            masks = (np.ones(self.horizontal_domain_shape, dtype=np.intc),)
+            if self.fabm.mask_type > 1:
+                masks = (np.ones(self.interior_domain_shape, dtype=np.intc),) + masks
+            self.link_mask(*masks)
+        for value, mask in zip(values, self._mask):
+            if value is not mask:
+                mask[...] = value
+        self.invalidate()
+
+    def link_bottom_index(self, indices: np.ndarray):
+        if not self.fabm.variable_bottom_index:
+            raise FABMException(
+                "the underlying FABM library has been compiled without support for variable bottom indices"
+            )
+        assert (
+            indices.shape == self.horizontal_domain_shape
+            and indices.dtype == np.intc
+            and indices.flags["C_CONTIGUOUS"]
+        )
+        self._bottom_index = indices
+        self.fabm.set_bottom_index(self.pmodel, self._bottom_index)
+        self.invalidate()
+
+    @property
+    def bottom_index(self) -> Optional[np.ndarray]:
+        return self._bottom_index
+
+    @bottom_index.setter
+    def bottom_index(self, indices: npt.ArrayLike):
+        if self._bottom_index is None:
+            self.link_bottom_index(np.ones(self.horizontal_domain_shape, dtype=np.intc))
+        if indices is not self._bottom_index:
+            self._bottom_index[...] = indices
+        self.invalidate()
+
+    @property
+    def state(self) -> np.ndarray:
+        if self._state is None:
+            raise Exception(
+                "State is not available as one contiguous array because interior and"
+                " surface/bottom state variables have different shapes."
+                " Use interior_state, surface_state, bottom_state attributes instead."
+            )
+        return self._state
+
+    @state.setter
+    def state(self, value: npt.ArrayLike):
+        if self._state is None:
+            raise Exception(
+                "State is not available as one contiguous array because interior and"
+                " surface/bottom state variables have different shapes."
+                " Use interior_state, surface_state, bottom_state attributes instead."
+            )
+        if value is not self._state:
+            self._state[...] = value
+        self._mark_changed(self.state_variables)
+
+    @property
+    def interior_state(self) -> np.ndarray:
+        return self._interior_state
+
+    @interior_state.setter
+    def interior_state(self, value: npt.ArrayLike):
+        if value is not self._interior_state:
+            self._interior_state[...] = value
+        self._mark_changed(self.interior_state_variables)
+
+    @property
+    def surface_state(self) -> np.ndarray:
+        return self._surface_state
+
+    @surface_state.setter
+    def surface_state(self, value: npt.ArrayLike):
+        if value is not self._surface_state:
+            self._surface_state[...] = value
+        self._mark_changed(self.surface_state_variables)
+
+    @property
+    def bottom_state(self) -> np.ndarray:
+        return self._bottom_state
+
+    @bottom_state.setter
+    def bottom_state(self, value: npt.ArrayLike):
+        if value is not self._bottom_state:
+            self._bottom_state[...] = value
+        self._mark_changed(self.bottom_state_variables)
+
+    def link_cell_thickness(self, data: np.ndarray):
+        assert (
+            data.shape == self.interior_domain_shape
+            and data.dtype == self.fabm.numpy_dtype
+            and data.flags["C_CONTIGUOUS"]
+        )
+        self._cell_thickness = data
+
+    def setCellThickness(self, value: npt.ArrayLike):
+        if self._cell_thickness is None:
+            self.link_cell_thickness(np.empty(self.interior_domain_shape))
+        self._cell_thickness[...] = value
+
+    cell_thickness = property(fset=setCellThickness)
+
+    def _load_coupling_options(self):
+        """Retrieve the possible targets of all couplings in one pass.
+        Couplings typically share most of their candidate targets; the path
+        of each candidate is retrieved only once."""
+        paths: Dict[int, str] = {}
+        strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        for coupling in self.couplings:
+            if coupling._options is not None:
+                continue
+            options: List[str] = []
+            plist = self.fabm.variable_get_suitable_masters(
+                self.pmodel, coupling._psource
+            )
+            for i in range(self.fabm.link_list_count(plist)):
+                variable = self.fabm.link_list_index(plist, i + 1)
+                path = paths.get(variable)
+                if path is None:
+                    self.fabm.variable_get_long_path(
+                        variable, ATTRIBUTE_LENGTH, strlong_name
+                    )
+                    path = paths[variable] = strlong_name.value.decode("ascii")
+                options.append(path)
+            self.fabm.link_list_finalize(plist)
+            coupling._options = options
+
+    def getSubModel(self, name: str) -> SubModel:
+        return SubModel(self, name)
+
+    def save_settings(self, path: str, display: int = DISPLAY_NORMAL):
+        """Write model configuration to yaml file"""
+        self.fabm.save_settings(self.pmodel, path.encode("ascii"), display)
+
+    def _save_state(self) -> Tuple:
+        environment = {}
+        for dependency in self.dependencies + self.parameter_fields:
+            if dependency.value is not None:
+                environment[dependency.name] = dependency.value
+        state = {variable.name: variable.value for variable in self.state_variables}
+        save = {variable.name: variable.save for variable in self.diagnostic_variables}
+        return environment, state, save
+
+    def _restore_state(self, data: Tuple):
+        environment, state, save = data
+        for dependency in self.dependencies + self.parameter_fields:
+            if dependency.name in environment:
+                dependency.value = environment[dependency.name]
+        for variable in self.state_variables:
+            if variable.name in state:
+                variable.value = state[variable.name]
+        for variable in self.diagnostic_variables:
+            if variable.name in save and variable.save != save[variable.name]:
+                variable.save = save[variable.name]
+
+    def _get_state_shapes(
+        self, nstate_interior: int, nstate_surface: int, nstate_bottom: int
+    ) -> List[Tuple[int, ...]]:
+        if self.fabm.idepthdim == -1:
+            # No depth dimension, so interior and surface/bottom variables have
+            # the same shape. Values for all are stored in one contiguous array
+            nstate = nstate_interior + nstate_surface + nstate_bottom
+            return [(nstate,) + self.interior_domain_shape]
+        else:
+            # Surface/bottom variables have one dimension less than interior variables
+            # Values for each variable type are stored in a separate array.
+            return [
+                (nstate_interior,) + self.interior_domain_shape,
+                (nstate_surface,) + self.horizontal_domain_shape,
+                (nstate_bottom,) + self.horizontal_domain_shape,
+            ]
+
+    def _set_state_arrays(
+        self, nstate_interior: int, nstate_surface: int, nstate_bottom: int
+    ) -> bool:
+        """Set the arrays that hold state variable values. These are the arrays
+        provided to :meth:`link_state` if their shapes are valid, or newly
+        allocated arrays otherwise. Returns whether provided arrays are used."""
+        shapes = self._get_state_shapes(nstate_interior, nstate_surface, nstate_bottom)
+        arrays = self._linked_state
+        valid = arrays is None or [a.shape for a in arrays] == shapes
+        if arrays is None or not valid:
+            arrays = [np.empty(s, dtype=self.fabm.numpy_dtype) for s in shapes]
+        if len(arrays) == 1:
+            self._state = arrays[0]
+            self._interior_state = self._state[:nstate_interior, ...]
+            self._surface_state = self._state[
+                nstate_interior : nstate_interior + nstate_surface, ...
+            ]
+            self._bottom_state = self._state[nstate_interior + nstate_surface :, ...]
+        else:
+            self._state = None
+            self._interior_state, self._surface_state, self._bottom_state = arrays
+        return valid
+
+    def link_state(self, *arrays: np.ndarray):
+        """Use the provided arrays to store the values of all state variables,
+        for instance, to place them in shared memory. If interior and
+        surface/bottom variables have the same shape, a single array with
+        the shape of :attr:`state` must be provided. Otherwise, separate
+        arrays for interior, surface and bottom state variables must be
+        provided. Current state variable values are not copied."""
+        counts = (
+            len(self.interior_state_variables),
+            len(self.surface_state_variables),
+            len(self.bottom_state_variables),
+        )
+        shapes = self._get_state_shapes(*counts)
+        if len(arrays) != len(shapes):
+            raise FABMException(
+                f"link_state must be provided with {len(shapes)} arrays"
+            )
+        for array, shape in zip(arrays, shapes):
+            if (
+                array.shape != shape
+                or array.dtype != self.fabm.numpy_dtype
+                or not array.flags["C_CONTIGUOUS"]
+            ):
+                raise FABMException(
+                    f"link_state must be provided with C-contiguous arrays of"
+                    f" type {self.fabm.numpy_dtype} and shapes {shapes}"
+                )
+        self._linked_state = arrays
+        self._set_state_arrays(*counts)
+        self._link_state_data()
+        self._mark_changed(self.state_variables)
+
+    def _link_state_data(self):
+        """Send the location of the values of each state variable to FABM."""
+        for i, variable in enumerate(self.interior_state_variables):
+            variable._data = self._interior_state[i, ...]
+            self.fabm.link_interior_state_data(self.pmodel, i + 1, variable._data)
+        for i, variable in enumerate(self.surface_state_variables):
+            variable._data = self._surface_state[i, ...]
+            self.fabm.link_surface_state_data(self.pmodel, i + 1, variable._data)
+        for i, variable in enumerate(self.bottom_state_variables):
+            variable._data = self._bottom_state[i, ...]
+            self.fabm.link_bottom_state_data(self.pmodel, i + 1, variable._data)
+
+    def _update_configuration(self, settings: Optional[Tuple] = None):
+        # Get number of model variables per category
+        nstate_interior = ctypes.c_int()
+        nstate_surface = ctypes.c_int()
+        nstate_bottom = ctypes.c_int()
+        ndiag_interior = ctypes.c_int()
+        ndiag_horizontal = ctypes.c_int()
+        ndependencies_interior = ctypes.c_int()
+        ndependencies_horizontal = ctypes.c_int()
+        ndependencies_scalar = ctypes.c_int()
+        nconserved = ctypes.c_int()
+        nparameters = ctypes.c_int()
+        ncouplings = ctypes.c_int()
+        self.fabm.get_counts(
+            self.pmodel,
+            ctypes.byref(nstate_interior),
+            ctypes.byref(nstate_surface),
+            ctypes.byref(nstate_bottom),
+            ctypes.byref(ndiag_interior),
+            ctypes.byref(ndiag_horizontal),
+            ctypes.byref(ndependencies_interior),
+            ctypes.byref(ndependencies_horizontal),
+            ctypes.byref(ndependencies_scalar),
+            ctypes.byref(nconserved),
+            ctypes.byref(nparameters),
+            ctypes.byref(ncouplings),
+        )
+
+        # Allocate memory for state variable values (or use memory provided
+        # earlier with link_state), and send ctypes.pointer to this memory to FABM.
+        if not self._set_state_arrays(
+            nstate_interior.value, nstate_surface.value, nstate_bottom.value
+        ):
+            log(
+                "Number of state variables has changed."
+                " Arrays previously provided to link_state are no longer used."
+            )
+            self._linked_state = None
+
+        # Retrieve variable metadata
+        strname = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        strunits = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        strpath = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        typecode = ctypes.c_int()
+        has_default = ctypes.c_int()
+        self.interior_state_variables.clear()
+        self.surface_state_variables.clear()
+        self.bottom_state_variables.clear()
+        self.interior_diagnostic_variables.clear()
+        self.horizontal_diagnostic_variables.clear()
+        self.conserved_quantities.clear()
+        self.parameters.clear()
+        self.interior_dependencies.clear()
+        self.horizontal_dependencies.clear()
+        self.scalar_dependencies.clear()
+        self.parameter_fields.clear()
+
+        def add_dependency(dependencies: NamedObjectList, dependency: Dependency):
+            # Fields of spatially varying parameters are kept apart from other
+            # dependencies: hosts do not need to provide them
+            # (see Parameter.link_field)
+            if self.fabm.variable_get_logical_property(
+                dependency._pvariable, b"parameter_field", 0
+            ):
+                dependencies = self.parameter_fields
+            dependencies._data.append(dependency)
+
+        for i in range(nstate_interior.value):
+            values = self._interior_state[i, ...]
+            ptr = self.fabm.get_variable(self.pmodel, INTERIOR_STATE_VARIABLE, i + 1)
+            self.interior_state_variables._data.append(StateVariable(self, ptr, values))
+            self.fabm.link_interior_state_data(self.pmodel, i + 1, values)
+        for i in range(nstate_surface.value):
+            values = self._surface_state[i, ...]
+            ptr = self.fabm.get_variable(self.pmodel, SURFACE_STATE_VARIABLE, i + 1)
+            self.surface_state_variables._data.append(StateVariable(self, ptr, values))
+            self.fabm.link_surface_state_data(self.pmodel, i + 1, values)
+        for i in range(nstate_bottom.value):
+            values = self._bottom_state[i, ...]
+            ptr = self.fabm.get_variable(self.pmodel, BOTTOM_STATE_VARIABLE, i + 1)
+            self.bottom_state_variables._data.append(StateVariable(self, ptr, values))
+            self.fabm.link_bottom_state_data(self.pmodel, i + 1, values)
+        for i in range(ndiag_interior.value):
+            ptr = self.fabm.get_variable(
+                self.pmodel, INTERIOR_DIAGNOSTIC_VARIABLE, i + 1
+            )
+            self.interior_diagnostic_variables._data.append(
+                DiagnosticVariable(self, ptr, i, False)
+            )
+        for i in range(ndiag_horizontal.value):
+            ptr = self.fabm.get_variable(
+                self.pmodel, HORIZONTAL_DIAGNOSTIC_VARIABLE, i + 1
+            )
+            self.horizontal_diagnostic_variables._data.append(
+                DiagnosticVariable(self, ptr, i, True)
+            )
+        for i in range(ndependencies_interior.value):
+            ptr = self.fabm.get_variable(self.pmodel, INTERIOR_DEPENDENCY, i + 1)
+            add_dependency(
+                self.interior_dependencies,
+                Dependency(
+                    self, ptr, self.interior_domain_shape, self.fabm.link_interior_data
+                ),
+            )
+        for i in range(ndependencies_horizontal.value):
+            ptr = self.fabm.get_variable(self.pmodel, HORIZONTAL_DEPENDENCY, i + 1)
+            add_dependency(
+                self.horizontal_dependencies,
+                Dependency(
+                    self,
+                    ptr,
+                    self.horizontal_domain_shape,
+                    self.fabm.link_horizontal_data,
+                ),
+            )
+        for i in range(ndependencies_scalar.value):
+            ptr = self.fabm.get_variable(self.pmodel, SCALAR_DEPENDENCY, i + 1)
+            self.scalar_dependencies._data.append(
+                Dependency(self, ptr, (), self.fabm.link_scalar)
+            )
+        for i in range(nconserved.value):
+            self.fabm.get_variable_metadata(
+                self.pmodel,
+                CONSERVED_QUANTITY,
+                i + 1,
+                ATTRIBUTE_LENGTH,
+                strname,
+                strunits,
+                strlong_name,
+                strpath,
+            )
+            self.conserved_quantities._data.append(
+                Variable(
+                    self,
+                    strname.value.decode("ascii"),
+                    strunits.value.decode("ascii"),
+                    strlong_name.value.decode("ascii"),
+                    strpath.value.decode("ascii"),
+                )
+            )
+        for i in range(nparameters.value):
+            self.fabm.get_parameter_metadata(
+                self.pmodel,
+                i + 1,
+                ATTRIBUTE_LENGTH,
+                strname,
+                strunits,
+                strlong_name,
+                ctypes.byref(typecode),
+                ctypes.byref(has_default),
+            )
+            self.parameters._data.append(
+                Parameter(
+                    self,
+                    strname.value.decode("ascii"),
+                    i,
+                    type=typecode.value,
+                    units=strunits.value.decode("ascii"),
+                    long_name=strlong_name.value.decode("ascii"),
+                    has_default=has_default.value != 0,
+                )
+            )
+
+        self.couplings = NamedObjectList(
+            [Coupling(self, i) for i in range(ncouplings.value)]
+        )
+
+        # Arrays that combine variables from pelagic and boundary domains.
+        self.state_variables = (
+            self.interior_state_variables
+            + self.surface_state_variables
+            + self.bottom_state_variables
+        )
+        self.diagnostic_variables = (
+            self.interior_diagnostic_variables + self.horizontal_diagnostic_variables
+        )
+        self.dependencies = (
+            self.interior_dependencies
+            + self.horizontal_dependencies
+            + self.scalar_dependencies
+        )
+        self.variables: NamedObjectList[VariableFromPointer] = (
+            self.state_variables + self.diagnostic_variables + self.dependencies
+        )
+
+        if settings is not None:
+            self._restore_state(settings)
+
+        # For backward compatibility
+        self.bulk_state_variables = self.interior_state_variables
+        self.bulk_diagnostic_variables = self.interior_diagnostic_variables
+
+        self.itime = -1.0
+        self._started = False
+        self._diagnostic_blocks = {}
+        self._current_diagnostic_blocks = set()
+
+    @property
+    def incremental(self) -> bool:
+        """Whether to evaluate the model incrementally. In incremental mode,
+        calls to biogeochemical models whose inputs have not changed since
+        the previous evaluation are skipped, and their previous outputs are
+        reused. This is beneficial if only some inputs change between
+        evaluations, e.g., when a few state variables are perturbed to
+        compute the Jacobian, or when dependencies change at different
+        frequencies.
+
+        Inputs changed by assigning to :attr:`state` (or
+        :attr:`interior_state`, etc.), to the ``value`` of a state variable
+        or dependency, or by linking new data, are detected automatically.
+        Changes made in place, e.g., by modifying the array returned by
+        ``value`` or by assigning to part of :attr:`state`, must be
+        reported with :meth:`invalidate`."""
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, value: bool):
+        self._incremental = bool(value)
+        self._changed.clear()
+        self._changed_all = False
+        if self._started:
+            self.fabm.set_incremental(self.pmodel, self._incremental)
+            if hasError():
+                raise FABMException(getError())
+
+    def invalidate(self, *variables: Union[str, StateVariable, Dependency]):
+        """Report that the values of the specified state variables or
+        dependencies have been changed in place, so that everything that
+        depends on them is recomputed by the next incremental evaluation.
+        Without arguments, all inputs are considered changed.
+        See :attr:`incremental`."""
+        inputs = self.state_variables + self.dependencies + self.parameter_fields
+        if not variables:
+            self._changed_all = self._incremental
+            for variable in inputs:
+                variable._version += 1
+            return
+        self._mark_changed([inputs[v] if isinstance(v, str) else v for v in variables])
+
+    def _mark_changed(self, variables: Iterable[Union[StateVariable, Dependency]]):
+        for variable in variables:
+            variable._version += 1
+            if self._incremental:
+                self._changed.add(variable)
+
+    def _state_changed(self, indices: Optional[Iterable[int]] = None):
+        """Report in-place changes to all state variables, or to those with
+        the specified indices into :attr:`state_variables`."""
+        if indices is None:
+            self._mark_changed(self.state_variables)
+        else:
+            self._mark_changed([self.state_variables[i] for i in indices])
+
+    def _invalidate_changed_inputs(self):
+        """Prepare for an evaluation: pass changed inputs on to FABM (for
+        incremental evaluation) and mark the diagnostic blocks as outdated."""
+        self._current_diagnostic_blocks.clear()
+        if self._changed_all:
+            self.fabm.invalidate(self.pmodel, None)
+        else:
+            for variable in self._changed:
+                self.fabm.invalidate(self.pmodel, variable._pvariable)
+        self._changed.clear()
+        self._changed_all = False
+
+    def getRates(self, t: Optional[float] = None, surface: bool = True, bottom: bool = True):
+        """Returns the local rate of change in state variables,
+        given the current state and environment.
+        """
+        assert self.fabm.idepthdim == -1
+        if t is None:
+            t = self.itime
+        sources = np.empty_like(self._state)
+        sources_interior = sources[: len(self.interior_state_variables), ...]
+        sources_surface = sources[
+            len(self.interior_state_variables) : len(self.interior_state_variables)
+            + len(self.surface_state_variables),
+            ...,
+        ]
+        sources_bottom = sources[
+            len(self.interior_state_variables) + len(self.surface_state_variables) :,
+            ...,
+        ]
+        assert not (
+            (surface or bottom) and self._cell_thickness is None
+        ), "You must assign model.cell_thickness to use getRates"
+        self._invalidate_changed_inputs()
+        self.fabm.get_sources(
+            self.pmodel,
+            t,
+            sources_interior,
+            sources_surface,
+            sources_bottom,
+            surface,
+            bottom,
+            self._cell_thickness,
+        )
+        if hasError():
+            raise FABMException(getError())
+        return sources
+
+    def get_sources(
+        self,
+        t: Optional[float] = None,
+        out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if t is None:
+            t = self.itime
+        if out is None:
+            sources_interior = np.empty_like(self._interior_state)
+            sources_surface = np.empty_like(self._surface_state)
+            sources_bottom = np.empty_like(self._bottom_state)
+        else:
+            sources_interior, sources_surface, sources_bottom = out
+        assert (
+            self._cell_thickness is not None
+        ), "You must assign model.cell_thickness to use get_sources"
+        self._invalidate_changed_inputs()
+        self.fabm.get_sources(
+            self.pmodel,
+            t,
+            sources_interior,
+            sources_surface,
+            sources_bottom,
+            True,
+            True,
+            self._cell_thickness,
+        )
+        if hasError():
+            raise FABMException(getError())
+        return sources_interior, sources_surface, sources_bottom
+
+    async def aget_sources(
+        self,
+        t: Optional[float] = None,
+        out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Version of :meth:`get_sources` for use in :mod:`asyncio` code. The
+        sources are computed on a worker thread (see :mod:`pyfabm.aio`)."""
+        from . import aio
+
+        return await aio.run(self.get_sources, t, out)
+
+    def get_vertical_movement(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        if out is None:
+            out = np.empty_like(self._interior_state)
+        self._invalidate_changed_inputs()
+        self.fabm.get_vertical_movement(self.pmodel, out)
+        if hasError():
+            raise FABMException(getError())
+        return out
+
+    def get_conserved_quantities(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        assert (
+            self._cell_thickness is not None
+        ), "You must assign model.cell_thickness to use get_conserved_quantities"
+        if out is None:
+            out = np.empty(
+                (len(self.conserved_quantities),) + self.horizontal_domain_shape,
+                dtype=self.fabm.numpy_dtype,
+            )
+        self._invalidate_changed_inputs()
+        self.fabm.get_conserved_quantities(self.pmodel, out, self._cell_thickness)
+        if hasError():
+            raise FABMException(getError())
+        return out
+
+    async def aget_conserved_quantities(
+        self, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Version of :meth:`get_conserved_quantities` for use in
+        :mod:`asyncio` code (see :mod:`pyfabm.aio`)."""
+        from . import aio
+
+        return await aio.run(self.get_conserved_quantities, out)
+
+    def check_state(self, repair: bool = False) -> bool:
+        self._invalidate_changed_inputs()
+        valid = self.fabm.check_state(self.pmodel, repair) != 0
+        if hasError():
+            raise FABMException(getError())
+        if repair and not valid:
+            self._state_changed()
+        return valid
+
+    checkState = check_state
+
+    def check_state_points(
+        self,
+        repair: bool = False,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[bool, np.ndarray, np.ndarray]:
+        """Check the state throughout the domain and report where it is
+        invalid. Unlike :meth:`check_state`, this continues past the first
+        invalid point if ``repair`` is not set.
+
+        Args:
+            repair: whether to repair invalid values (typically by clipping)
+            out: arrays to store the validity mask and repair counts in
+
+        Returns:
+            a tuple with whether the entire state was valid, a boolean mask
+            with the shape of the interior domain that is set where the state
+            is valid, and the number of values of each state variable that
+            lay outside their valid range (and were repaired if ``repair``
+            is set), in the order of :attr:`state_variables`. If the domain
+            has a depth dimension, invalid surface or bottom values mark the
+            entire water column as invalid. Custom checks of biogeochemical
+            models that flag the state as invalid without changing values
+            mark the point as invalid, but are not counted.
+        """
+        if out is None:
+            valid_mask = np.empty(self.interior_domain_shape, dtype=bool)
+            counts = np.empty(len(self.state_variables), dtype=np.intp)
+        else:
+            valid_mask, counts = out
+        counts_c = np.empty(len(self.state_variables), dtype=ctypes.c_int)
+        self._invalidate_changed_inputs()
+        ok = self.fabm.check_state_points(self.pmodel, repair, valid_mask, counts_c)
+        valid = ok != 0
+        if hasError():
+            raise FABMException(getError())
+        if repair and not valid:
+            self._state_changed()
+        counts[...] = counts_c
+        return valid, valid_mask, counts
+
+    def getJacobian(
+        self, pert: Union[float, np.ndarray, None] = None, sparse: bool = False
+    ):
+        """Jacobian of the rates of change with respect to the state, computed
+        by finite differences. If ``sparse`` is set, state variables that do not
+        affect the same rates (see :meth:`jacobian_sparsity`) are perturbed
+        together, which reduces the number of evaluations of the rates."""
+        # Define perturbation per state variable.
+        y_pert = np.empty_like(self.state)
+        if pert is None:
+            pert = 1e-6
+        y_pert[:] = pert
+
+        # Determine which state variables can be perturbed simultaneously
+        n = len(self.state)
+        if sparse:
+            sparsity = self.jacobian_sparsity()
+            colors = color_columns(sparsity)
+        else:
+            sparsity = np.ones((n, n), dtype=bool)
+            colors = np.arange(n)
+
+        # Compute dy for original state (used as reference for finite
+        # differences later on)
+        dy_ori = self.getRates()
+
+        # Create memory for Jacobian
+        Jac = np.zeros((n, n), dtype=self.state.dtype)
+
+        for color in range(colors.max(initial=-1) + 1):
+            # Save original state variable values, create perturbed ones.
+            columns = np.flatnonzero(colors == color)
+            y_ori = self.state[columns]
+            self.state[columns] += y_pert[columns]
+            self._state_changed(columns)
+
+            # Compute dy for perturbed state, compute Jacobian elements using
+            # finite difference.
+            dy_pert = self.getRates()
+            for i in columns:
+                rows = sparsity[:, i]
+                Jac[rows, i] = (dy_pert[rows] - dy_ori[rows]) / y_pert[i]
+
+            # Restore original state variable values.
+            self.state[columns] = y_ori
+            self._state_changed(columns)
+
+        return Jac
+
+    def jacobian_sparsity(self) -> np.ndarray:
+        """Sparsity pattern of the Jacobian of the rates of change with respect
+        to the state, derived from FABM's dependency graph. Element ``[i, j]``
+        is True if the rate of state variable ``i`` may depend on state variable
+        ``j``. Rows and columns are ordered as :attr:`state_variables`.
+
+        The pattern can be used to compute the Jacobian with fewer evaluations
+        (:func:`color_columns`), or by implicit solvers that use sparse
+        factorization, e.g., as ``jac_sparsity`` of
+        :func:`scipy.integrate.solve_ivp`."""
+        if not self._started:
+            raise FABMException(
+                "The Jacobian sparsity is only available after start is called."
+            )
+        n = len(self.state_variables)
+        sparsity = np.empty((n, n), dtype=ctypes.c_int)
+        self.fabm.get_jacobian_sparsity(self.pmodel, n, sparsity)
+        if hasError():
+            raise FABMException(getError())
+        return sparsity != 0
+
+    def get_schedule(self) -> "pyfabm.schedule.Schedule":
+        """Jobs, tasks and calls by which FABM computes its outputs, with the
+        variables each call reads and writes and the number of times each
+        call has been made so far. See :mod:`pyfabm.schedule`."""
+        import pyfabm.schedule
+
+        if not self._started:
+            raise FABMException("The schedule is only available after start is called.")
+        records: List[str] = []
+
+        @LOG_CALLBACK
+        def add_record(record: bytes):
+            records.append(record.decode())
+
+        self.fabm.get_schedule(self.pmodel, add_record)
+        if hasError():
+            raise FABMException(getError())
+        return pyfabm.schedule.Schedule.from_records(records)
+
+    def find_steady_state(
+        self,
+        t: Optional[float] = None,
+        rtol: float = 1e-10,
+        atol: float = 1e-15,
+        dt: float = 86400.0,
+        dt_max: float = 1e12,
+        max_iterations: int = 100,
+        perturbation: float = 1e-7,
+        max_backtracks: int = 20,
+        verbose: bool = False,
+    ) -> bool:
+        """Find the state at which all rates of change vanish, starting from
+        the current state. This uses pseudo-transient continuation: damped
+        Newton iterations ``(I/dt - J) dx = f`` in which the pseudo time step
+        ``dt`` grows as the rates decrease, so that the final iterations are
+        regular Newton steps. All points of the domain are solved for at
+        once, with a Jacobian computed by finite differences that perturb
+        state variables at all points simultaneously. State variables that
+        do not affect the same rates (see :meth:`jacobian_sparsity`) are
+        perturbed together. After each step, the
+        state is made valid (e.g., non-negative) with :meth:`check_state`.
+
+        Args:
+            t: time to evaluate the rates at (default: current time)
+            rtol: relative tolerance for the rates of change (s-1)
+            atol: absolute tolerance for the rates of change (state units s-1)
+            dt: initial pseudo time step (s)
+            dt_max: maximum pseudo time step (s)
+            max_iterations: maximum number of Newton iterations
+            perturbation: relative perturbation of state variables used to
+                compute the Jacobian
+            max_backtracks: maximum number of times a step is halved to keep
+                the state valid, before the state is repaired instead
+            verbose: whether to report progress
+
+        Returns:
+            whether a steady state was found at all points. The model state
+            is set to the final iterate in either case.
+        """
+        global _muted
+        if self._state is None:
+            raise FABMException(
+                "find_steady_state requires interior and surface/bottom state"
+                " variables to have the same shape."
+            )
+        if t is None:
+            t = self.itime
+        nvar = self._state.shape[0]
+        x = self._state.reshape(nvar, -1)
+        identity = np.eye(nvar)
+        sparsity = self.jacobian_sparsity()
+        colors = color_columns(sparsity)
+        ncolors = colors.max(initial=-1) + 1
+
+        def get_rates() -> np.ndarray:
+            return self.getRates(t).reshape(nvar, -1)
+
+        def get_residual(f: np.ndarray) -> np.ndarray:
+            # Maximum scaled rate per point; <= 1 indicates convergence
+            return np.max(np.abs(f) / (rtol * np.abs(x) + atol), axis=0)
+
+        self.check_state(repair=True)
+        f = get_rates()
+        nevaluations = 1
+        residual = get_residual(f)
+        dts = np.full(x.shape[1], dt)
+        for iteration in range(max_iterations):
+            active = ~(residual <= 1.0)
+            if verbose:
+                log(
+                    f"Iteration {iteration}: maximum scaled rate {residual.max():.3g},"
+                    f" {active.sum()} of {active.size} points active."
+                )
+            if not active.any():
+                break
+
+            # Jacobian (one matrix per point), with all state variables of
+            # one color perturbed at all points simultaneously
+            jac = np.zeros((x.shape[1], nvar, nvar), dtype=x.dtype)
+            for color in range(ncolors):
+                columns = np.flatnonzero(colors == color)
+                x_ori = x[columns].copy()
+                scale = np.abs(x_ori).max(axis=1, keepdims=True)
+                scale[scale == 0.0] = 1.0
+                x[columns] += perturbation * np.maximum(np.abs(x_ori), 0.01 * scale)
+                self._state_changed(columns)
+                h = x[columns] - x_ori
+                df = get_rates() - f
+                for j, h_j in zip(columns, h):
+                    rows = sparsity[:, j]
+                    jac[:, rows, j] = (df[rows] / h_j).T
+                x[columns] = x_ori
+                self._state_changed(columns)
+            nevaluations += ncolors
+
+            # Growing modes (eigenvalues with positive real part) would change
+            # sign in an implicit step longer than their time scale. Limit the
+            # time step accordingly, so growth is followed rather than reversed.
+            growth = np.linalg.eigvals(jac[active]).real.max(axis=-1)
+            dt_active = dts[active]
+            limited = growth > 0.0
+            dt_active[limited] = np.minimum(dt_active[limited], 0.5 / growth[limited])
+
+            # Pseudo-transient step
+            x_old = x.copy()
+            a = identity / dt_active[:, np.newaxis, np.newaxis] - jac[active]
+            try:
+                dx = np.linalg.solve(a, f[:, active].T[..., np.newaxis])[..., 0]
+            except np.linalg.LinAlgError:
+                dts[active] *= 0.1
+                continue
+            # Backtrack until the state is valid, e.g., non-negative
+            step = 1.0
+            for _ in range(max_backtracks):
+                x[:, active] = x_old[:, active] + step * dx.T
+                self._state_changed()
+                _muted = True
+                try:
+                    valid = self.check_state()
+                finally:
+                    _muted = False
+                if valid:
+                    break
+                step *= 0.5
+            else:
+                self.check_state(repair=True)
+            f_new = get_rates()
+            nevaluations += 1
+            residual_new = get_residual(f_new)
+
+            # Reject steps that produce invalid rates and retry with smaller time step.
+            # Otherwise, increase the time step with the reduction in rates
+            # (switched evolution relaxation). Increases in rates do not shorten
+            # the time step, as these are expected while growing modes develop.
+            failed = active & ~np.isfinite(residual_new)
+            if failed.any():
+                x[:, failed] = x_old[:, failed]
+                self._state_changed()
+                dts[failed] *= 0.1
+                self.check_state(repair=True)
+                f_new = get_rates()
+                nevaluations += 1
+                residual_new = get_residual(f_new)
+            accepted = active & ~failed
+            norm_old = np.linalg.norm(f[:, accepted], axis=0)
+            norm_new = np.linalg.norm(f_new[:, accepted], axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(norm_new > 0.0, norm_old / norm_new, 10.0)
+            dts[accepted] = np.minimum(
+                dts[accepted] * np.clip(ratio, 1.0, 10.0), dt_max
+            )
+            f, residual = f_new, residual_new
+
+        converged = bool(np.all(residual <= 1.0))
+        if verbose:
+            log(
+                f"Steady state {'found' if converged else 'not found'}"
+                f" after {nevaluations} evaluations of the rates of change."
+            )
+        return converged
+
+    def set_parameters(self, values: Mapping[str, Union[float, int, bool, str]]):
+        """Set the values of multiple parameters. Assigning
+        :attr:`Parameter.value` re-initializes the model for every
+        parameter; here, the model is re-initialized once for all real
+        parameters. This makes it cheaper to evaluate many parameter sets,
+        e.g., in sensitivity analysis or calibration.
+
+        Args:
+            values: values by parameter name
+        """
+        reals = {}
+        for name, value in values.items():
+            parameter = self.parameters[name]
+            if parameter._type == DataType.REAL:
+                reals[parameter.name] = value
+            else:
+                parameter.value = value
+        if not reals:
+            return
+        settings = self._save_state()
+        names = b"".join(
+            name.encode("ascii").ljust(ATTRIBUTE_LENGTH, b"\0") for name in reals
+        )
+        data = np.array(list(reals.values()), dtype=self.fabm.numpy_dtype)
+        self.fabm.set_real_parameters(self.pmodel, len(reals), names, data)
+        if hasError():
+            raise FABMException(getError())
+        self._update_configuration(settings)
+
+    def findParameter(self, name: str, case_insensitive: bool = False):
+        return self.parameters.find(name, case_insensitive)
+
+    def findDependency(self, name: str, case_insensitive: bool = False):
+        return self.dependencies.find(name, case_insensitive)
+
+    def findStateVariable(self, name: str, case_insensitive: bool = False):
+        return self.state_variables.find(name, case_insensitive)
+
+    def findDiagnosticVariable(self, name: str, case_insensitive: bool = False):
+        return self.diagnostic_variables.find(name, case_insensitive)
+
+    def findCoupling(self, name: str, case_insensitive: bool = False):
+        return self.couplings.find(name, case_insensitive)
+
+    def find_standard_variable(self, name: str) -> Optional[StandardVariable]:
+        pointer = self.fabm.find_standard_variable(name.encode("ascii"))
+        if pointer:
+            return StandardVariable(self, pointer)
+
+    def require_data(self, standard_variable: StandardVariable):
+        return self.fabm.require_data(self.pmodel, standard_variable._pvariable)
+
+    def _get_parameter_tree(self) -> Mapping:
+        root = {}
+        for parameter in self.parameters:
+            pathcomps = parameter.name.split("/")
+            parent = root
+            for component in pathcomps[:-1]:
+                parent = root.setdefault(component, {})
+            parent[pathcomps[-1]] = parameter
+        return root
+
+    def select_diagnostics(
+        self, patterns: Union[str, Iterable[str]], verbose: bool = True
+    ) -> NamedObjectList[DiagnosticVariable]:
+        """Select the diagnostics that must be calculated and stored, and
+        disable all others. This must be done before :meth:`start`.
+
+        Args:
+            patterns: one or more shell-style patterns (e.g., ``"phy/*"``)
+                matched against the name and output name of each diagnostic.
+                ``"all"`` selects all diagnostics, ``"output"`` those that
+                are included in output by default, and ``"none"`` disables
+                all diagnostics, which allows FABM to skip all work that is
+                needed only to calculate diagnostics.
+            verbose: whether to report the number of selected diagnostics
+                and the estimated savings
+
+        Returns:
+            The selected diagnostics
+        """
+        if self._started:
+            raise FABMException("Diagnostics must be selected before start is called.")
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        patterns = list(patterns)
+
+        unused_patterns = set(patterns) - {"all", "output", "none"}
+
+        def is_selected(variable: DiagnosticVariable) -> bool:
+            selected = False
+            for pattern in patterns:
+                if pattern == "all" or (pattern == "output" and variable.output):
+                    selected = True
+                elif fnmatch.fnmatchcase(variable.name, pattern) or (
+                    fnmatch.fnmatchcase(variable.output_name, pattern)
+                ):
+                    unused_patterns.discard(pattern)
+                    selected = True
+            return selected
+
+        interior_size = int(np.prod(self.interior_domain_shape))
+        horizontal_size = int(np.prod(self.horizontal_domain_shape))
+        selected = []
+        nsaved_old = 0
+        nvalues_old = 0
+        nvalues_new = 0
+        for variable in self.diagnostic_variables:
+            size = horizontal_size if variable._horizontal else interior_size
+            if variable.save:
+                nsaved_old += 1
+                nvalues_old += size
+            save = is_selected(variable)
+            if save:
+                selected.append(variable)
+                nvalues_new += size
+            if save != variable.save:
+                variable.save = save
+
+        for pattern in unused_patterns:
+            log(f"Pattern {pattern} does not match any diagnostic.")
+        if verbose:
+            nbytes = (nvalues_old - nvalues_new) * self.fabm.numpy_dtype.itemsize
+            log(
+                f"Selected {len(selected)} of {len(self.diagnostic_variables)}"
+                f" diagnostics (previously {nsaved_old})."
+            )
+            log(
+                f"Estimated savings: {nsaved_old - len(selected)} fewer diagnostics"
+                f" to compute and store per call, {nbytes / 1024:.1f} kB less memory."
+            )
+        return NamedObjectList(selected)
+
+    def start(self, verbose: bool = True, stop: bool = False) -> bool:
+        ready = True
+        if self.fabm.mask_type and self._mask is None:
+            log("Mask not yet assigned")
+            ready = False
+        if self.fabm.variable_bottom_index and self._bottom_index is None:
+            log("Bottom indices not yet assigned")
+            ready = False
+
+        def process_dependencies(dependencies: Sequence[Dependency]):
+            ready = True
+            for dependency in dependencies:
+                if dependency.required and dependency.value is None:
+                    log(f"Value for dependency {dependency.name} is not set.")
+                    ready = False
+            return ready
+
+        ready = process_dependencies(self.interior_dependencies) and ready
+        ready = process_dependencies(self.horizontal_dependencies) and ready
+        ready = process_dependencies(self.scalar_dependencies) and ready
+        assert ready or not stop, "Not all dependencies have been fulfilled."
+
+        self.fabm.start(self.pmodel)
+        if hasError():
+            return False
+        self._started = True
+        self._diagnostic_blocks.clear()
+        self._current_diagnostic_blocks.clear()
+        if self._incremental:
+            self.fabm.set_incremental(self.pmodel, True)
+            self._changed.clear()
+            self._changed_all = False
+        for i, variable in enumerate(self.interior_diagnostic_variables):
+            pdata = self.fabm.get_interior_diagnostic_data(self.pmodel, i + 1)
+            if pdata:
+                arr = np.ctypeslib.as_array(pdata, self.interior_domain_shape)
+                variable._data = arr.view(dtype=self.fabm.numpy_dtype)
+            else:
+                variable._data = None
+        for i, variable in enumerate(self.horizontal_diagnostic_variables):
+            pdata = self.fabm.get_horizontal_diagnostic_data(self.pmodel, i + 1)
+            if pdata:
+                arr = np.ctypeslib.as_array(pdata, self.horizontal_domain_shape)
+                variable._data = arr.view(dtype=self.fabm.numpy_dtype)
+            else:
+                variable._data = None
+        return ready
+
+    checkReady = start
+
+    def _get_diagnostic_block(self, horizontal: bool) -> np.ndarray:
+        if not self._started:
+            raise FABMException("Diagnostics are only available after start is called.")
+        if horizontal not in self._diagnostic_blocks:
+            if horizontal:
+                variables = self.horizontal_diagnostic_variables
+                shape = self.horizontal_domain_shape
+            else:
+                variables = self.interior_diagnostic_variables
+                shape = self.interior_domain_shape
+            indices = np.array(
+                [variable._index for variable in variables if variable.save],
+                dtype=ctypes.c_int,
+            )
+            data = np.empty((indices.size,) + shape, dtype=self.fabm.numpy_dtype)
+            self._diagnostic_blocks[horizontal] = (indices, data)
+        indices, data = self._diagnostic_blocks[horizontal]
+        if horizontal not in self._current_diagnostic_blocks:
+            get_diagnostics = (
+                self.fabm.get_horizontal_diagnostics
+                if horizontal
+                else self.fabm.get_interior_diagnostics
+            )
+            get_diagnostics(self.pmodel, indices.size, indices, data)
+            if hasError():
+                raise FABMException(getError())
+            self._current_diagnostic_blocks.add(horizontal)
+        return data
+
+    @property
+    def interior_diagnostics(self) -> np.ndarray:
+        """Values of all saved interior diagnostics in a single contiguous
+        array with shape ``(ndiag,) + interior_domain_shape``. Its rows
+        correspond to the interior diagnostics with :attr:`~DiagnosticVariable.save`
+        set, in the order of :attr:`interior_diagnostic_variables`.
+        The array is allocated on first access after :meth:`start`. It is
+        updated in place, with a single call to FABM, on the first access
+        after each evaluation of the model (e.g., :meth:`get_sources`);
+        further accesses return it without copying."""
+        return self._get_diagnostic_block(horizontal=False)
+
+    @property
+    def horizontal_diagnostics(self) -> np.ndarray:
+        """Values of all saved horizontal diagnostics in a single contiguous
+        array with shape ``(ndiag,) + horizontal_domain_shape``. Its rows
+        correspond to the horizontal diagnostics with :attr:`~DiagnosticVariable.save`
+        set, in the order of :attr:`horizontal_diagnostic_variables`.
+        The array is allocated on first access after :meth:`start`. It is
+        updated in place, with a single call to FABM, on the first access
+        after each evaluation of the model (e.g., :meth:`get_sources`);
+        further accesses return it without copying."""
+        return self._get_diagnostic_block(horizontal=True)
+
+    def updateTime(self, nsec: float):
+        self.itime = nsec
+
+    def printInformation(self):
+        """Show information about the model."""
+
+        def printArray(classname: str, array: Sequence[Variable]):
+            if not array:
+                return
+            log(f" {len(array)} {classname}:")
+            for variable in array:
+                log(f"    {variable.name} = {variable.value} {variable.units}")
+
+        def parameter2str(p: Parameter) -> str:
+            return f"{p.value} {p.units}"
+
+        log("FABM model contains the following:")
+        printArray("interior state variables", self.interior_state_variables)
+        printArray("bottom state variables", self.bottom_state_variables)
+        printArray("surface state variables", self.surface_state_variables)
+        printArray("interior diagnostic variables", self.interior_diagnostic_variables)
+        printArray(
+            "horizontal diagnostic variables", self.horizontal_diagnostic_variables
+        )
+        printArray("external variables", self.dependencies)
+        log(f" {len(self.parameters)} parameters:")
+        printTree(self._get_parameter_tree(), parameter2str, "    ")
+
+
+class Simulator(object):
+    def __init__(self, model: Model):
+        assert (
+            model._cell_thickness is not None
+        ), "You must assign model.cell_thickness to use Simulator"
+        self.model = model
+
+    def integrate(
+        self,
+        y0: np.ndarray,
+        t: np.ndarray,
+        dt: float,
+        surface: bool = True,
+        bottom: bool = True,
+        audit_interval: Optional[int] = None,
+        drift_tolerance: Optional[float] = None,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Integrate the model state in time with the forward Euler scheme.
+
+        Args:
+            y0: initial state
+            t: times at which to return the state
+            dt: time step
+            surface: whether to include surface sources
+            bottom: whether to include bottom sources
+            audit_interval: if provided, the totals of all conserved quantities
+                are computed every ``audit_interval`` time steps, starting
+                with the initial state, within the compiled time loop
+            drift_tolerance: if provided, stop the integration as soon as
+                the total of any conserved quantity deviates from its initial
+                value by more than this fraction of that initial value.
+                This requires ``audit_interval``.
+
+        Returns:
+            the state at the requested times, with shape ``(nt, nstate)``.
+            If ``audit_interval`` is provided, a tuple with this state and
+            the totals of conserved quantities, with shape
+            ``(naudit, nconserved)``. If the integration stopped early, both
+            include only the times reached.
+        """
+        if drift_tolerance is not None and audit_interval is None:
+            raise FABMException(
+                "drift_tolerance requires audit_interval,"
+                " as drift is only checked when conserved quantities are audited."
+            )
+        nsteps = int(np.ceil((t[-1] - t[0]) / dt)) + 2 if t.size else 0
+        naudit_max = 0 if audit_interval is None else nsteps // audit_interval + 1
+        y = np.empty((t.size, self.model.state.size))
+        conserved = np.empty(
+            (naudit_max, len(self.model.conserved_quantities)),
+            dtype=self.model.fabm.numpy_dtype,
+        )
+        naudit = ctypes.c_int()
+        nt_done = ctypes.c_int()
+        self.model._invalidate_changed_inputs()
+        self.model.fabm.integrate(
+            self.model.pmodel,
+            t.size,
+            self.model.state.size,
+            t,
+            y0,
+            y,
+            dt,
+            surface,
+            bottom,
+            self.model._cell_thickness,
+            audit_interval or 0,
+            naudit_max,
+            conserved,
+            drift_tolerance or 0.0,
+            ctypes.byref(naudit),
+            ctypes.byref(nt_done),
+        )
+
+        # The integrator links the state to its own work array; restore links
+        # to the model state.
+        self.model._link_state_data()
+        self.model._state_changed()
+        if hasError():
+            raise FABMException(getError())
+        if nt_done.value < t.size:
+            excess = np.abs(conserved[naudit.value - 1] - conserved[0])
+            excess -= drift_tolerance * np.abs(conserved[0])
+            quantity = self.model.conserved_quantities[int(np.argmax(excess))]
+            log(
+                f"Integration stopped at t={t[nt_done.value - 1]} because"
+                f" the drift in {quantity.name} exceeds {drift_tolerance}"
+            )
+            y = y[: nt_done.value]
+        if audit_interval is None:
+            return y
+        return y, conserved[: naudit.value]
+
+
+def unload():
+    global ctypes
+
+    for lib in name2lib.values():
+        handle = lib._handle
+        if os.name == "nt":
+            import ctypes.wintypes
+
+            ctypes.windll.kernel32.FreeLibrary.argtypes = [ctypes.wintypes.HMODULE]
+            ctypes.windll.kernel32.FreeLibrary(handle)
+        else:
+            dlclose = ctypes.CDLL(None).dlclose
+            dlclose.argtypes = [ctypes.c_void_p]
+            dlclose.restype = ctypes.c_int
+            dlclose(handle)
+    name2lib.clear()
+
+
+def get_version() -> Optional[str]:
+    for lib in name2lib.values():
+        version_length = 256
+        strversion = ctypes.create_string_buffer(version_length)
+        lib.get_version(version_length, strversion)
+        return strversion.value.decode("ascii")
@@ -0,0 +1,167 @@
+"""Time-varying forcing of model dependencies from large arrays or binary files.
+
+A :class:`ForcingProvider` links dependencies of a model to successive slices
+of arrays with time as their first dimension. Typically these are
+:class:`numpy.memmap` objects that map (possibly very large) files into memory,
+so that only the slices that are used are read from disk. Moving to another
+time index relinks each dependency to the corresponding slice without copying,
+provided the data are stored in the model's own floating point type. Otherwise,
+each slice is converted into one of two alternating buffers.
+
+While the model is being evaluated, the provider prepares the next time index
+on a background thread: it reads the corresponding pages of mapped files
+(or converts the slice). This overlaps I/O with calls like
+:meth:`pyfabm.Model.get_sources`.
+
+Example::
+
+    forcing = pyfabm.forcing.ForcingProvider(model)
+    forcing.add("temperature", "temp.bin", dtype="<f8")
+    forcing.add("practical_salinity", np.load("salt.npy", mmap_mode="r"))
+    model.start()
+    for itime in forcing:
+        sources = model.get_sources()
+"""
+
+import mmap
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterator, List, Optional, Union
+
+import numpy as np
+
+import pyfabm
+
+
+class TimeSeries:
+    """Values of a single dependency, with time as the first dimension."""
+
+    def __init__(self, dependency: pyfabm.Dependency, data: np.ndarray):
+        if data.shape[1:] != dependency._shape:
+            raise pyfabm.FABMException(
+                f"{dependency.name}: shape of provided data per time {data.shape[1:]}"
+                f" does not match the shape required {dependency._shape}"
+            )
+        self.dependency = dependency
+        self.data = data
+        dtype = dependency.model.fabm.numpy_dtype
+        self.zero_copy = data.dtype == dtype and data[0, ...].flags["C_CONTIGUOUS"]
+        self._buffers: List[np.ndarray] = []
+        if not self.zero_copy:
+            self._buffers = [np.empty(dependency._shape, dtype=dtype) for _ in range(2)]
+        self._prepared: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def prepare(self, index: int):
+        """Make the values for the specified time index available in memory.
+        This may be called on a background thread."""
+        if self.zero_copy:
+            # Touch one value per page, so that the operating system reads
+            # all pages of the slice from disk now rather than when FABM uses them.
+            values = self.data[index, ...].reshape(-1)
+            step = max(1, mmap.PAGESIZE // values.itemsize)
+            values[::step].sum()
+        else:
+            self._buffers[index % 2][...] = self.data[index, ...]
+        self._prepared = index
+
+    def link(self, index: int):
+        """Link the dependency to the values for the specified time index."""
+        if self.zero_copy:
+            self.dependency.link(self.data[index, ...])
+        else:
+            if self._prepared != index:
+                self.prepare(index)
+            self.dependency.link(self._buffers[index % 2])
+
+
+class ForcingProvider:
+    """Links dependencies of a model to slices of time-varying data.
+
+    Args:
+        model: model whose dependencies are to be forced
+        prefetch: whether to prepare the next time index on a background thread
+    """
+
+    def __init__(self, model: pyfabm.Model, prefetch: bool = True):
+        self.model = model
+        self.series: List[TimeSeries] = []
+        self.index: Optional[int] = None
+        self._executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        self._pending: Optional[Future] = None
+        self._pending_index: Optional[int] = None
+
+    def add(
+        self,
+        name: str,
+        data: Union[np.ndarray, str],
+        dtype: Any = None,
+        offset: int = 0,
+    ) -> TimeSeries:
+        """Force the specified dependency with time-varying data.
+
+        Args:
+            name: name of the dependency
+            data: array with time as first dimension, or path to a raw binary
+                file with values for successive times (in C order)
+            dtype: data type of the values in the binary file
+                (by default, the floating point type of the model)
+            offset: position in the binary file where the values start (bytes)
+        """
+        dependency = self.model.dependencies[name]
+        if isinstance(data, str):
+            if dtype is None:
+                dtype = self.model.fabm.numpy_dtype
+            data = np.memmap(data, dtype=dtype, mode="r", offset=offset)
+            data = data.reshape((-1,) + dependency._shape)
+        series = TimeSeries(dependency, data)
+        self.series.append(series)
+        return series
+
+    def __len__(self) -> int:
+        """Number of time indices available for all forced dependencies"""
+        return min(len(series) for series in self.series) if self.series else 0
+
+    def _wait(self):
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+            self._pending_index = None
+
+    def _prepare(self, index: int):
+        for series in self.series:
+            series.prepare(index)
+
+    def seek(self, index: int):
+        """Link all forced dependencies to the values for the specified time
+        index, and start preparing the next time index in the background."""
+        if index < 0 or index >= len(self):
+            raise IndexError(f"Time index {index} is out of range [0, {len(self)})")
+        self._wait()
+        for series in self.series:
+            series.link(index)
+        self.index = index
+        if self._executor is not None and index + 1 < len(self):
+            self._pending = self._executor.submit(self._prepare, index + 1)
+            self._pending_index = index + 1
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over all time indices, linking forced dependencies to the
+        corresponding values before each index is returned."""
+        for index in range(len(self)):
+            self.seek(index)
+            yield index
+
+    def close(self):
+        """Stop the background thread."""
+        self._wait()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> "ForcingProvider":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,519 @@
+import sys
+import difflib
+from typing import Dict, Iterable, Iterator, Union, List, Optional, Tuple
+import numpy as np
+import pyfabm
+
+try:
+    from PyQt5 import QtCore, QtGui, QtWidgets
+except ImportError as e1:
+    try:
+        from PySide import QtCore, QtGui
+
+        QtWidgets = QtGui
+    except ImportError as e2:
+        print(e1)
+        print(e2)
+        print("Unable to load PyQt5 or PySide. Is either installed?")
+        sys.exit(1)
+
+
+class Delegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, parent=None):
+        QtWidgets.QStyledItemDelegate.__init__(self, parent)
+
+    def createEditor(self, parent, option, index):
+        assert index.isValid()
+        data: Union[str, pyfabm.Variable] = index.internalPointer().object
+        if not isinstance(data, str):
+            if data.options is not None:
+                widget = QtWidgets.QComboBox(parent)
+                widget.addItems(data.options)
+                return widget
+            elif data.value is None or isinstance(data.value, (float, np.ndarray)):
+                widget = ScientificDoubleEditor(parent)
+                if data.units:
+                    widget.setSuffix(f" {data.units_unicode}")
+                return widget
+        return QtWidgets.QStyledItemDelegate.createEditor(self, parent, option, index)
+
+    def setEditorData(self, editor, index):
+        if isinstance(editor, QtWidgets.QComboBox):
+            data: Union[str, pyfabm.Variable] = index.internalPointer().object
+            if not isinstance(data, str):
+                if data.options is not None and data.value is not None:
+                    editor.setCurrentIndex(data.options.index(data.value))
+                    return
+        elif isinstance(editor, ScientificDoubleEditor):
+            data = index.internalPointer().object
+            editor.setValue(data.value if data.value is None else float(data.value))
+            return
+        return QtWidgets.QStyledItemDelegate.setEditorData(self, editor, index)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, QtWidgets.QComboBox):
+            data = index.internalPointer().object
+            if not isinstance(data, str):
+                if data.options is not None:
+                    i = editor.currentIndex()
+                    model.setData(index, data.options[i], QtCore.Qt.EditRole)
+                    return
+        elif isinstance(editor, ScientificDoubleEditor):
+            model.setData(index, editor.value(), QtCore.Qt.EditRole)
+            return
+        return QtWidgets.QStyledItemDelegate.setModelData(self, editor, model, index)
+
+
+class Entry:
+    def __init__(self, object: Union[None, str, "Entry"] = None, name: str = ""):
+        if name == "" and object is not None:
+            name = object
+        self.object = object
+        self.name = name
+        self.key: Optional[Tuple[str, str]] = None
+        self.parent: Optional["Entry"] = None
+        self.children: List["Entry"] = []
+        self._groups: Dict[str, "Entry"] = {}
+        self._rows: Optional[Dict[int, int]] = None
+        assert isinstance(self.name, str)
+
+    def addChild(self, child: "Entry"):
+        child.parent = self
+        self.children.append(child)
+        if isinstance(child.object, str):
+            self._groups.setdefault(child.object, child)
+        if self._rows is not None:
+            self._rows[id(child)] = len(self.children) - 1
+
+    def insertChild(self, index: int, child: "Entry"):
+        child.parent = self
+        self.children.insert(index, child)
+        if isinstance(child.object, str):
+            self._groups.setdefault(child.object, child)
+        self._rows = None
+
+    def removeChild(self, index: int):
+        child = self.children.pop(index)
+        child.parent = None
+        if self._groups.get(child.name) is child:
+            del self._groups[child.name]
+        self._rows = None
+
+    def findChild(self, name: str):
+        child = self._groups.get(name)
+        if child is None:
+            child = Entry(name)
+            self.addChild(child)
+        return child
+
+    def row(self, child: "Entry") -> int:
+        if self._rows is None:
+            self._rows = {id(c): i for i, c in enumerate(self.children)}
+        return self._rows[id(child)]
+
+    def addTree(self, arr: Iterable[pyfabm.Variable], category: Optional[str] = None):
+        for variable in arr:
+            pathcomps = variable.path.split("/")
+            if len(pathcomps) < 2:
+                # print 'Skipping root level entity %s' % pathcomps[0]
+                continue
+            if category is not None:
+                pathcomps = [pathcomps[0], category] + list(pathcomps[1:])
+            parent = self
+            for component in pathcomps[:-1]:
+                parent = parent.findChild(component)
+            entry = Entry(variable, pathcomps[-1])
+            entry.key = (category or "", variable.path)
+            parent.addChild(entry)
+
+    def iterLeaves(self) -> Iterator["Entry"]:
+        for child in self.children:
+            if child.key is not None:
+                yield child
+            yield from child.iterLeaves()
+
+
+class Submodel:
+    def __init__(self, long_name):
+        self.units = None
+        self.units_unicode = None
+        self.value = None
+        self.long_name = long_name
+
+
+class ItemModel(QtCore.QAbstractItemModel):
+    def __init__(self, model: pyfabm.Model, parent):
+        QtCore.QAbstractItemModel.__init__(self, parent)
+        self.root = None
+        self.model = model
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[Tuple[str, str], Entry] = {}
+        self.rebuild()
+
+    def _get_objects(self) -> List[Tuple[Tuple[str, str], pyfabm.Variable]]:
+        # All objects shown, with keys that identify them across
+        # changes in model configuration (objects themselves are recreated)
+        objects = [(("environment", d.name), d) for d in self.model.dependencies]
+        for category, variables in (
+            ("parameters", self.model.parameters),
+            ("initialization", self.model.state_variables),
+            ("coupling", self.model.couplings),
+        ):
+            objects.extend(((category, v.path), v) for v in variables)
+        return objects
+
+    def rebuild(self):
+        objects = self._get_objects()
+        keys = [key for key, _ in objects]
+        if self.root is not None and keys == self._keys:
+            # Same variables as before - point existing entries to the new objects
+            for key, object in objects:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.object = object
+            return
+
+        root = Entry()
+        env = Entry("environment")
+        for d in self.model.dependencies:
+            entry = Entry(d, d.name)
+            entry.key = ("environment", d.name)
+            env.addChild(entry)
+        root.addTree(self.model.parameters, "parameters")
+        root.addTree(self.model.state_variables, "initialization")
+        root.addTree(self.model.couplings, "coupling")
+        root.addChild(env)
+
+        # For all models, create an object that returns appropriate metadata.
+        def processNode(n, path=()):
+            for i in range(len(n.children) - 1, -1, -1):
+                child = n.children[i]
+                childpath = path + (child.name,)
+                if isinstance(child.object, str):
+                    if childpath[-1] in (
+                        "parameters",
+                        "initialization",
+                        "environment",
+                        "coupling",
+                    ):
+                        childpath = childpath[:-1]
+                    else:
+                        submodel = self.model.getSubModel("/".join(childpath))
+                        if submodel.user_created:
+                            child.object = Submodel(submodel.long_name)
+                        else:
+                            n.removeChild(i)
+                            child = None
+                if child is not None:
+                    processNode(child, childpath)
+
+        processNode(root)
+
+        if self.root is not None:
+            # We already have an old tree - compare and amend model.
+            # Children are matched by name; only subtrees whose names differ
+            # are changed, with the minimal set of row insertions and removals.
+            def processChange(newnode, oldnode, parent):
+                oldnode.object = newnode.object
+                oldnode.key = newnode.key
+                oldnames = [child.name for child in oldnode.children]
+                newnames = [child.name for child in newnode.children]
+                if oldnames == newnames:
+                    opcodes = [("equal", 0, len(oldnames), 0, len(newnames))]
+                else:
+                    matcher = difflib.SequenceMatcher(
+                        None, oldnames, newnames, autojunk=False
+                    )
+                    opcodes = matcher.get_opcodes()
+                irow = 0
+                for tag, i1, i2, j1, j2 in opcodes:
+                    if tag == "equal":
+                        for node in newnode.children[j1:j2]:
+                            oldchild = oldnode.children[irow]
+                            index = self.createIndex(irow, 0, oldchild)
+                            processChange(node, oldchild, index)
+                            irow += 1
+                        continue
+                    if i2 > i1:
+                        # Remove old nodes that are not in the new tree
+                        self.beginRemoveRows(parent, irow, irow + i2 - i1 - 1)
+                        for _ in range(i2 - i1):
+                            oldnode.removeChild(irow)
+                        self.endRemoveRows()
+                    if j2 > j1:
+                        # Insert new nodes that are not in the old tree
+                        self.beginInsertRows(parent, irow, irow + j2 - j1 - 1)
+                        for node in newnode.children[j1:j2]:
+                            oldnode.insertChild(irow, node)
+                            irow += 1
+                        self.endInsertRows()
+
+            processChange(root, self.root, QtCore.QModelIndex())
+        else:
+            # First time a tree was created - store it and move on.
+            self.root = root
+        self._keys = keys
+        self._entries = {entry.key: entry for entry in self.root.iterLeaves()}
+
+    def rowCount(self, index):
+        if not index.isValid():
+            return len(self.root.children)
+        elif index.column() == 0:
+            return len(index.internalPointer().children)
+        return 0
+
+    def columnCount(self, index):
+        return 4
+
+    def index(self, row, column, parent):
+        if not parent.isValid():
+            # top-level
+            children = self.root.children
+        else:
+            # not top-level
+            children = parent.internalPointer().children
+        if row < 0 or row >= len(children) or column < 0 or column >= 4:
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column, children[row])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is self.root:
+            return QtCore.QModelIndex()
+        irow = parent.parent.row(parent)
+        return self.createIndex(irow, 0, parent)
+
+    def data(self, index, role):
+        if not index.isValid():
+            return
+        entry = index.internalPointer()
+        data = entry.object
+        if role == QtCore.Qt.DisplayRole:
+            if index.column() == 0:
+                return entry.name if isinstance(data, str) else data.long_name
+            if not isinstance(data, (str, Submodel)):
+                if index.column() == 1:
+                    value = data.value
+                    if value is None:
+                        return "<not set>"
+                    if not isinstance(value, bool):
+                        if data.units and not isinstance(value, str):
+                            return f"{value} {data.units_unicode}"
+                        else:
+                            return f"{value}"
+                elif index.column() == 2 and data.units:
+                    return data.units_unicode
+                elif index.column() == 3:
+                    return entry.name
+        elif role == QtCore.Qt.ToolTipRole and index.parent().isValid():
+            if not isinstance(data, str):
+                return data.long_path
+        elif role == QtCore.Qt.EditRole:
+            if not isinstance(data, (str, Submodel)):
+                # print data.options
+                return data.value
+        elif role == QtCore.Qt.FontRole and index.column() == 1:
+            if isinstance(data, pyfabm.Parameter) and data.value != data.default:
+                font = QtGui.QFont()
+                font.setBold(True)
+                return font
+        elif (
+            role == QtCore.Qt.CheckStateRole
+            and index.column() == 1
+            and not isinstance(data, str)
+            and isinstance(data.value, bool)
+        ):
+            return QtCore.Qt.Checked if data.value else QtCore.Qt.Unchecked
+        return None
+
+    def setData(self, index, value, role):
+        if role == QtCore.Qt.CheckStateRole:
+            value = value == QtCore.Qt.Checked
+        if role in (QtCore.Qt.EditRole, QtCore.Qt.CheckStateRole):
+            data = index.internalPointer().object
+            data.value = value
+            if isinstance(data, pyfabm.Parameter):
+                self.rebuild()
+            return True
+        return False
+
+    def flags(self, index):
+        flags = QtCore.Qt.NoItemFlags
+        if not index.isValid():
+            return flags
+        if index.column() == 1:
+            entry = index.internalPointer().object
+            if not isinstance(entry, (str, Submodel)):
+                if isinstance(entry.value, bool):
+                    flags |= QtCore.Qt.ItemIsUserCheckable
+                else:
+                    flags |= QtCore.Qt.ItemIsEditable
+        return flags | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role):
+        if (
+            orientation == QtCore.Qt.Horizontal
+            and role == QtCore.Qt.DisplayRole
+            and section >= 0
+            and section < 4
+        ):
+            return ("name", "value", "units", "symbol")[section]
+
+
+class TreeView(QtWidgets.QTreeView):
+    def __init__(self, model, parent):
+        QtWidgets.QTreeView.__init__(self, parent)
+        itemmodel = pyfabm.gui_qt.ItemModel(model, parent)
+        self.setItemDelegate(Delegate(parent))
+        self.setModel(itemmodel)
+        self.setUniformRowHeights(True)
+        self.expandAll()
+
+        def onTreeViewContextMenu(pos):
+            index = self.indexAt(pos)
+            if index.isValid() and index.column() == 1:
+                data = index.internalPointer().object
+                if (
+                    isinstance(data, pyfabm.Parameter)
+                    and data.value != data.default
+                    and data.default is not None
+                ):
+
+                    def reset():
+                        data.reset()
+                        itemmodel.rebuild()
+
+                    contextMenu = QtWidgets.QMenu(self)
+                    default = data.default
+                    if data.units:
+                        default = f"{data.default} {data.units_unicode}"
+                    contextMenu.addAction(f"Reset to default: {default}", reset)
+                    contextMenu.exec_(self.mapToGlobal(pos))
+
+        self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
+        self.customContextMenuRequested.connect(onTreeViewContextMenu)
+        for i in range(3):
+            self.resizeColumnToContents(i)
+
+
+# From xmlstore (GOTM-GUI)
+
+
+class ScientificDoubleValidator(QtGui.QValidator):
+    """Qt validator for floating point values
+    Less strict than the standard QDoubleValidator, in the sense that is
+    also accepts values in scientific format (e.g. 1.2e6)
+    Also has properties 'minimum' and 'maximum', used for validation and
+    fix-up.
+    """
+
+    def __init__(self, parent=None):
+        QtGui.QValidator.__init__(self, parent)
+        self.minimum = None
+        self.maximum = None
+        self.suffix = ""
+
+    def validate(self, input, pos):
+        assert isinstance(input, str), "input argument is not a string (old PyQt4 API?)"
+
+        # Check for suffix (if ok, cut it off for further value checking)
+        if not input.endswith(self.suffix):
+            return (QtGui.QValidator.Invalid, input, pos)
+        vallength = len(input) - len(self.suffix)
+
+        # Check for invalid characters
+        rx = QtCore.QRegExp(r"[^\d\-+eE,.]")
+        if rx.indexIn(input[:vallength]) != -1:
+            return (QtGui.QValidator.Invalid, input, pos)
+
+        # Check if we can convert it into a floating point value
+        try:
+            v = float(input[:vallength])
+        except ValueError:
+            return (QtGui.QValidator.Intermediate, input, pos)
+
+        # Check for minimum and maximum.
+        if self.minimum is not None and v < self.minimum:
+            return (QtGui.QValidator.Intermediate, input, pos)
+        if self.maximum is not None and v > self.maximum:
+            return (QtGui.QValidator.Intermediate, input, pos)
+
+        return (QtGui.QValidator.Acceptable, input, pos)
+
+    def fixup(self, input):
+        assert isinstance(input, str), "input argument is not a string (old PyQt4 API?)"
+        if not input.endswith(self.suffix):
+            return input
+
+        try:
+            v = float(input[: len(input) - len(self.suffix)])
+        except ValueError:
+            return input
+
+        if self.minimum is not None and v < self.minimum:
+            input = f"{self.minimum}{self.suffix}"
+        if self.maximum is not None and v > self.maximum:
+            input = f"{self.maximum}{self.suffix}"
+        print(repr(input))
+        return input
+
+    def setSuffix(self, suffix):
+        self.suffix = suffix
+
+
+class ScientificDoubleEditor(QtWidgets.QLineEdit):
+    """Editor for a floating point value."""
+
+    def __init__(self, parent):
+        QtWidgets.QLineEdit.__init__(self, parent)
+
+        self.curvalidator = ScientificDoubleValidator(self)
+        self.setValidator(self.curvalidator)
+        self.suffix = ""
+        # self.editingFinished.connect(self.onPropertyEditingFinished)
+
+    def setSuffix(self, suffix):
+        value = self.value()
+        self.suffix = suffix
+        self.curvalidator.setSuffix(suffix)
+        self.setValue(value)
+
+    def value(self):
+        text = self.text()
+        text = text[: len(text) - len(self.suffix)]
+        if text == "":
+            return 0
+        return float(text)
+
+    def setValue(self, value, format=None):
+        if value is None:
+            strvalue = ""
+        else:
+            if format is None:
+                strvalue = str(value)
+            else:
+                strvalue = format % value
+        self.setText(f"{strvalue}{self.suffix}")
+
+    def focusInEvent(self, e):
+        QtWidgets.QLineEdit.focusInEvent(self, e)
+        self.selectAll()
+
+    def selectAll(self):
+        QtWidgets.QLineEdit.setSelection(self, 0, len(self.text()) - len(self.suffix))
+
+    def setMinimum(self, minimum):
+        self.curvalidator.minimum = minimum
+
+    def setMaximum(self, maximum):
+        self.curvalidator.maximum = maximum
+
+    def interpretText(self):
+        if not self.hasAcceptableInput():
+            text = self.text()
+            textnew = self.curvalidator.fixup(text)
+            if textnew is None:
+                textnew = text
+            self.setText(textnew)
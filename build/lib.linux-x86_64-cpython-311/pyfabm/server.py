@@ -0,0 +1,399 @@
+"""Server that keeps models warm for repeated evaluation by command line tools.
+
+Creating a :class:`pyfabm.Model` loads the FABM library, parses the
+configuration and resolves all couplings. Tools that are run many times, such
+as ``fabm_evaluate`` or ``fabm_describe_model`` in scripted checks, pay this
+cost on every invocation. :class:`Server` instead keeps a pool of started
+models, keyed by the hash of their configuration and the number of points
+evaluated together, and serves requests on a Unix domain socket. It is started
+with the ``fabm_server`` command. :class:`Client` sends requests; the command
+line tools use it when given the ``--server`` option.
+
+Each message consists of a fixed-size prefix with the lengths of a header and
+a data block (two little-endian unsigned 32-bit integers), the header (JSON,
+UTF-8), and the data block: the raw values of the arrays listed in the header,
+as little-endian 64-bit floats in C order. Requests identify a configuration
+by the SHA-256 hash of its contents. The contents are sent only if the server
+does not know the configuration yet.
+
+Example::
+
+    with pyfabm.server.Client() as client:
+        rates, diagnostics = client.evaluate("fabm.yaml", state, dependencies)
+"""
+
+import os
+import json
+import struct
+import socket
+import hashlib
+import tempfile
+import threading
+import socketserver
+import collections
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+import pyfabm
+import pyfabm.cache
+
+PREFIX = struct.Struct("<II")
+DTYPE = np.dtype("<f8")
+
+
+def get_default_socket() -> str:
+    """Path of the socket used if none is specified. This can be set with
+    environment variable ``PYFABM_SERVER_SOCKET``; by default it is
+    ``server.sock`` in the pyfabm cache directory."""
+    path = os.environ.get("PYFABM_SERVER_SOCKET")
+    if path is None:
+        path = os.path.join(pyfabm.cache.get_cache_dir(), "server.sock")
+    return path
+
+
+def _receive_exactly(sock: socket.socket, n: int) -> bytes:
+    buffer = bytearray(n)
+    view = memoryview(buffer)
+    while view:
+        nread = sock.recv_into(view)
+        if nread == 0:
+            raise ConnectionError("Connection closed")
+        view = view[nread:]
+    return bytes(buffer)
+
+
+def send_message(
+    sock: socket.socket, header: Dict[str, Any], arrays: Sequence[np.ndarray] = ()
+):
+    """Send a header and arrays. The shape of each array is added to the
+    header (``shapes``)."""
+    arrays = [np.ascontiguousarray(array, dtype=DTYPE) for array in arrays]
+    header = dict(header, shapes=[array.shape for array in arrays])
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    size = sum(array.nbytes for array in arrays)
+    sock.sendall(PREFIX.pack(len(encoded), size) + encoded)
+    for array in arrays:
+        if array.size:
+            sock.sendall(memoryview(array).cast("B"))
+
+
+def receive_message(sock: socket.socket) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+    """Receive a header and the arrays that accompany it."""
+    header_size, data_size = PREFIX.unpack(_receive_exactly(sock, PREFIX.size))
+    header = json.loads(_receive_exactly(sock, header_size).decode("utf-8"))
+    data = _receive_exactly(sock, data_size)
+    arrays = []
+    offset = 0
+    for shape in header.pop("shapes", []):
+        array = np.frombuffer(
+            data, dtype=DTYPE, count=int(np.prod(shape)), offset=offset
+        )
+        arrays.append(array.reshape(shape))
+        offset += array.nbytes
+    return header, arrays
+
+
+def hash_configuration(configuration: bytes) -> str:
+    return hashlib.sha256(configuration).hexdigest()
+
+
+class UnknownConfiguration(Exception):
+    pass
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve model metadata and evaluations from a pool of warm models.
+
+    Args:
+        path: path of the Unix domain socket to listen on
+        pool_size: maximum number of models to keep; the least recently
+            used model is released when this is exceeded
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Optional[str] = None, pool_size: int = 8):
+        if path is None:
+            path = get_default_socket()
+        if os.path.exists(path):
+            os.remove(path)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.pool_size = pool_size
+        self.configurations: Dict[str, bytes] = {}
+        self.models: "collections.OrderedDict[Tuple[str, int], pyfabm.Model]" = (
+            collections.OrderedDict()
+        )
+        self.metadata: Dict[str, Dict[str, Any]] = {}
+
+        # FABM libraries keep global error state; serve one request at a time
+        self.lock = threading.Lock()
+        super().__init__(path, RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        for model in self.models.values():
+            model.close()
+        self.models.clear()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _create_model(self, key: str, shape: Tuple[int, ...]) -> pyfabm.Model:
+        if key not in self.configurations:
+            raise UnknownConfiguration(key)
+        with tempfile.NamedTemporaryFile(
+            suffix=".yaml", prefix="fabm", delete=False
+        ) as f:
+            f.write(self.configurations[key])
+        try:
+            return pyfabm.Model(f.name, shape=shape)
+        finally:
+            os.remove(f.name)
+
+    def get_model(self, key: str, n: int) -> pyfabm.Model:
+        """Return a model for the specified configuration that evaluates
+        ``n`` points at once, creating it if needed."""
+        model = self.models.get((key, n))
+        if model is None:
+            model = self._create_model(key, (n,))
+            model.cell_thickness = 1.0
+            self.models[(key, n)] = model
+            while len(self.models) > self.pool_size:
+                _, evicted = self.models.popitem(last=False)
+                evicted.close()
+        self.models.move_to_end((key, n))
+        return model
+
+    def handle_request_message(
+        self, header: Dict[str, Any], arrays: List[np.ndarray]
+    ) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+        op = header["op"]
+        if "configuration" in header:
+            configuration = header["configuration"].encode("utf-8")
+            self.configurations[hash_configuration(configuration)] = configuration
+        if op == "status":
+            return {"configurations": len(self.configurations)}, []
+        elif op == "describe":
+            return {"metadata": self.describe(header["key"])}, []
+        elif op == "evaluate":
+            return self.evaluate(header, *arrays)
+        raise pyfabm.FABMException(f"Unknown operation {op!r}")
+
+    def describe(self, key: str) -> Dict[str, Any]:
+        if key not in self.metadata:
+            model = self._create_model(key, ())
+            try:
+                metadata = pyfabm.cache.collect_metadata(model)
+                for category in (
+                    "interior_state_variables",
+                    "surface_state_variables",
+                    "bottom_state_variables",
+                    "interior_dependencies",
+                    "horizontal_dependencies",
+                    "scalar_dependencies",
+                    "parameter_fields",
+                ):
+                    for data, variable in zip(
+                        metadata[category], getattr(model, category)
+                    ):
+                        value = variable.value
+                        data["value"] = None if value is None else float(value)
+            finally:
+                model.close()
+            self.metadata[key] = metadata
+        return self.metadata[key]
+
+    def evaluate(
+        self, header: Dict[str, Any], state: np.ndarray, dependencies: np.ndarray
+    ) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+        model = self.get_model(header["key"], state.shape[0])
+
+        # Models are shared between requests; do not reuse values of others
+        missing = [
+            d.name
+            for d in model.dependencies
+            if d.required and d.name not in header["dependencies"]
+        ]
+        if missing:
+            raise pyfabm.FABMException(
+                f"No values provided for required dependencies {', '.join(missing)}"
+            )
+        model.state[...] = state.T
+        for name, values in zip(header["dependencies"], dependencies.T):
+            dependency = model.dependencies[name]
+            dependency.value = values if dependency._shape else values[0]
+        if not model._started and not model.start():
+            raise pyfabm.FABMException(
+                f"Failed to start model:\n{pyfabm.getError() or ''}"
+            )
+        rates = model.getRates(
+            header.get("t", 0.0),
+            header.get("surface", True),
+            header.get("bottom", True),
+        )
+        names = []
+        diagnostics = []
+        for variable in model.diagnostic_variables:
+            if variable.value is not None:
+                names.append(variable.name)
+                diagnostics.append(np.broadcast_to(variable.value, state.shape[:1]))
+        diagnostics = np.array(diagnostics, dtype=DTYPE).reshape((-1, state.shape[0]))
+        return {"diagnostics": names}, [rates.T, diagnostics.T]
+
+
+class RequestHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        while True:
+            try:
+                header, arrays = receive_message(self.request)
+            except ConnectionError:
+                return
+            if header.get("op") == "shutdown":
+                send_message(self.request, {})
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            try:
+                with self.server.lock:
+                    response, arrays = self.server.handle_request_message(
+                        header, arrays
+                    )
+            except UnknownConfiguration:
+                response, arrays = {"unknown_configuration": True}, []
+            except Exception as e:
+                response, arrays = {"error": f"{type(e).__name__}: {e}"}, []
+            send_message(self.request, response, arrays)
+
+
+class Client:
+    """Connection to a server started with ``fabm_server``.
+
+    Args:
+        path: path of the Unix domain socket the server listens on
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            path = get_default_socket()
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+        self._keys: Dict[str, str] = {}
+
+    def close(self):
+        self.socket.close()
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def request(
+        self, header: Dict[str, Any], arrays: Sequence[np.ndarray] = ()
+    ) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+        send_message(self.socket, header, arrays)
+        response, arrays = receive_message(self.socket)
+        if "error" in response:
+            raise pyfabm.FABMException(f"Server error: {response['error']}")
+        return response, arrays
+
+    def _request_for_configuration(
+        self, path: str, header: Dict[str, Any], arrays: Sequence[np.ndarray] = ()
+    ) -> Tuple[Dict[str, Any], List[np.ndarray]]:
+        # Send the configuration by hash; include contents only if the server
+        # does not know it yet.
+        with open(path, "rb") as f:
+            configuration = f.read()
+        key = hash_configuration(configuration)
+        header = dict(header, key=key)
+        response, result = self.request(header, arrays)
+        if response.get("unknown_configuration"):
+            header["configuration"] = configuration.decode("utf-8")
+            response, result = self.request(header, arrays)
+        return response, result
+
+    def get_metadata(self, path: str) -> Dict[str, List[Dict[str, Any]]]:
+        response, _ = self._request_for_configuration(path, {"op": "describe"})
+        return response["metadata"]
+
+    def describe(self, path: str) -> pyfabm.cache.ModelMetadata:
+        """Return the metadata of the model described by the specified
+        configuration file. State variables and dependencies have their
+        default value as attribute ``value`` (``None`` if not set)."""
+        return pyfabm.cache.ModelMetadata(self.get_metadata(path))
+
+    def evaluate(
+        self,
+        path: str,
+        state: np.ndarray,
+        dependencies: Mapping[str, np.ndarray],
+        t: float = 0.0,
+        surface: bool = True,
+        bottom: bool = True,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Compute rates of change and diagnostics for a batch of points.
+
+        Args:
+            path: configuration file
+            state: values of all state variables, with shape ``(n, nstate)``
+            dependencies: values of dependencies (arrays with shape ``(n,)``).
+                All dependencies that the model requires must be included.
+            t: time
+            surface: whether to include surface processes
+            bottom: whether to include bottom processes
+
+        Returns:
+            rates of change with shape ``(n, nstate)``, and the values of
+            all diagnostics that are computed by default, per name
+        """
+        state = np.atleast_2d(state)
+        n = state.shape[0]
+        names = list(dependencies)
+        values = np.empty((n, len(names)))
+        for i, name in enumerate(names):
+            values[:, i] = dependencies[name]
+        header = dict(
+            op="evaluate",
+            dependencies=names,
+            t=t,
+            surface=surface,
+            bottom=bottom,
+        )
+        response, (rates, diagnostics) = self._request_for_configuration(
+            path, header, (state, values)
+        )
+        return rates, dict(zip(response["diagnostics"], diagnostics.T))
+
+    def shutdown(self):
+        """Stop the server."""
+        send_message(self.socket, {"op": "shutdown"})
+        receive_message(self.socket)
+
+
+class RemoteModel(pyfabm.cache.ModelMetadata):
+    """Stand-in for a 0D :class:`pyfabm.Model` that is evaluated by a server.
+    Values of state variables and dependencies are set on the variables;
+    :meth:`getRates` sends them to the server and sets the values of the
+    diagnostic variables it returns."""
+
+    def __init__(self, client: Client, path: str):
+        self.client = client
+        self.path = path
+        super().__init__(client.get_metadata(path))
+        for variable in self.diagnostic_variables:
+            variable.value = None
+
+    def getRates(
+        self, t: float = 0.0, surface: bool = True, bottom: bool = True
+    ) -> np.ndarray:
+        state = np.array([[v.value for v in self.state_variables]], dtype=float)
+        dependencies = {
+            d.name: 0.0 if d.value is None else d.value for d in self.dependencies
+        }
+        rates, diagnostics = self.client.evaluate(
+            self.path, state, dependencies, t, surface, bottom
+        )
+        for variable in self.diagnostic_variables:
+            if variable.name in diagnostics:
+                variable.value = diagnostics[variable.name][0]
+        return rates[0]
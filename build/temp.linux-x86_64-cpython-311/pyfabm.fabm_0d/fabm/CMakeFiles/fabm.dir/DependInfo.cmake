@@ -0,0 +1,74 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  "Fortran"
+  )
+# The set of files for implicit dependencies of each language:
+set(CMAKE_DEPENDS_CHECK_Fortran
+  "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/fabm_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/fabm_library.F90.o"
+  "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/fabm_version.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/fabm_version.F90.o"
+  "/root/package/src/c/c_helper.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/c/c_helper.F90.o"
+  "/root/package/src/c/fabm_c.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/c/fabm_c.F90.o"
+  "/root/package/src/c/helper.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/c/helper.F90.o"
+  "/root/package/src/c/integrate.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/c/integrate.F90.o"
+  "/root/package/src/c/link_list.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/c/link_list.F90.o"
+  "/root/package/src/c/parameter.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/c/parameter.F90.o"
+  "/root/package/src/c/variable.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/c/variable.F90.o"
+  "/root/package/src/fabm.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm.F90.o"
+  "/root/package/src/fabm_config.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_config.F90.o"
+  "/root/package/src/fabm_coupling.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_coupling.F90.o"
+  "/root/package/src/fabm_debug.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_debug.F90.o"
+  "/root/package/src/fabm_graph.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_graph.F90.o"
+  "/root/package/src/fabm_job.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_job.F90.o"
+  "/root/package/src/fabm_schedule.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_schedule.F90.o"
+  "/root/package/src/fabm_task_order.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_task_order.F90.o"
+  "/root/package/src/fabm_v0_compatibility.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_v0_compatibility.F90.o"
+  "/root/package/src/fabm_work.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm.dir/src/fabm_work.F90.o"
+  )
+set(CMAKE_Fortran_COMPILER_ID "GNU")
+set(CMAKE_Fortran_SUBMODULE_SEP "@")
+set(CMAKE_Fortran_SUBMODULE_EXT ".smod")
+
+# Preprocessor definitions for this target.
+set(CMAKE_TARGET_DEFINITIONS_Fortran
+  "NDEBUG"
+  "_FABM_DIMENSION_COUNT_=0"
+  "fabm_EXPORTS"
+  )
+
+# The include file search paths:
+set(CMAKE_Fortran_TARGET_INCLUDE_PATH
+  "fabm/modules"
+  "/root/package/src/drivers/python"
+  "/root/package/src/../include"
+  "fabm/yaml/modules"
+  "fabm/models/akvaplan"
+  "fabm/models/au"
+  "fabm/models/bb"
+  "fabm/models/csiro"
+  "fabm/models/examples"
+  "fabm/models/gotm"
+  "fabm/models/iow"
+  "fabm/models/jrc"
+  "fabm/models/msi"
+  "fabm/models/nersc"
+  "fabm/models/niva"
+  "fabm/models/pml"
+  "fabm/models/selma"
+  "fabm/models/su"
+  "fabm/models/uhh"
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/modules")
@@ -0,0 +1,70 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "modules/fabm_builtin_constant.mod"
+  "modules/FABM_BUILTIN_CONSTANT.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_constant.mod.stamp"
+
+  "modules/fabm_builtin_depth_integral.mod"
+  "modules/FABM_BUILTIN_DEPTH_INTEGRAL.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_depth_integral.mod.stamp"
+
+  "modules/fabm_builtin_depth_mapping.mod"
+  "modules/FABM_BUILTIN_DEPTH_MAPPING.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_depth_mapping.mod.stamp"
+
+  "modules/fabm_builtin_models.mod"
+  "modules/FABM_BUILTIN_MODELS.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_models.mod.stamp"
+
+  "modules/fabm_builtin_reduction.mod"
+  "modules/FABM_BUILTIN_REDUCTION.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_reduction.mod.stamp"
+
+  "modules/fabm_builtin_relaxation.mod"
+  "modules/FABM_BUILTIN_RELAXATION.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_relaxation.mod.stamp"
+
+  "modules/fabm_builtin_scale.mod"
+  "modules/FABM_BUILTIN_SCALE.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_scale.mod.stamp"
+
+  "modules/fabm_builtin_source.mod"
+  "modules/FABM_BUILTIN_SOURCE.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_source.mod.stamp"
+
+  "modules/fabm_builtin_sum.mod"
+  "modules/FABM_BUILTIN_SUM.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_sum.mod.stamp"
+
+  "modules/fabm_builtin_time_filter.mod"
+  "modules/FABM_BUILTIN_TIME_FILTER.mod"
+  "CMakeFiles/fabm_base.dir/fabm_builtin_time_filter.mod.stamp"
+
+  "modules/fabm_driver.mod"
+  "modules/FABM_DRIVER.mod"
+  "CMakeFiles/fabm_base.dir/fabm_driver.mod.stamp"
+
+  "modules/fabm_expressions.mod"
+  "modules/FABM_EXPRESSIONS.mod"
+  "CMakeFiles/fabm_base.dir/fabm_expressions.mod.stamp"
+
+  "modules/fabm_parameters.mod"
+  "modules/FABM_PARAMETERS.mod"
+  "CMakeFiles/fabm_base.dir/fabm_parameters.mod.stamp"
+
+  "modules/fabm_particle.mod"
+  "modules/FABM_PARTICLE.mod"
+  "CMakeFiles/fabm_base.dir/fabm_particle.mod.stamp"
+
+  "modules/fabm_properties.mod"
+  "modules/FABM_PROPERTIES.mod"
+  "CMakeFiles/fabm_base.dir/fabm_properties.mod.stamp"
+
+  "modules/fabm_standard_variables.mod"
+  "modules/FABM_STANDARD_VARIABLES.mod"
+  "CMakeFiles/fabm_base.dir/fabm_standard_variables.mod.stamp"
+
+  "modules/fabm_types.mod"
+  "modules/FABM_TYPES.mod"
+  "CMakeFiles/fabm_base.dir/fabm_types.mod.stamp"
+  )
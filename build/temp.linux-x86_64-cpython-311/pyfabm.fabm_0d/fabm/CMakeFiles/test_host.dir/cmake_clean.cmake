@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_host.dir/src/test/host.F90.o"
+  "CMakeFiles/test_host.dir/src/test/models.F90.o"
+  "test_host"
+  "test_host.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/test_host.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
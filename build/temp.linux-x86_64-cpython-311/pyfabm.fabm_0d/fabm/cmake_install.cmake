@@ -0,0 +1,123 @@
+# Install script for directory: /root/package
+
+# Set the install prefix
+if(NOT DEFINED CMAKE_INSTALL_PREFIX)
+  set(CMAKE_INSTALL_PREFIX "/usr/local")
+endif()
+string(REGEX REPLACE "/$" "" CMAKE_INSTALL_PREFIX "${CMAKE_INSTALL_PREFIX}")
+
+# Set the install configuration name.
+if(NOT DEFINED CMAKE_INSTALL_CONFIG_NAME)
+  if(BUILD_TYPE)
+    string(REGEX REPLACE "^[^A-Za-z0-9_]+" ""
+           CMAKE_INSTALL_CONFIG_NAME "${BUILD_TYPE}")
+  else()
+    set(CMAKE_INSTALL_CONFIG_NAME "Release")
+  endif()
+  message(STATUS "Install configuration: \"${CMAKE_INSTALL_CONFIG_NAME}\"")
+endif()
+
+# Set the component getting installed.
+if(NOT CMAKE_INSTALL_COMPONENT)
+  if(COMPONENT)
+    message(STATUS "Install component: \"${COMPONENT}\"")
+    set(CMAKE_INSTALL_COMPONENT "${COMPONENT}")
+  else()
+    set(CMAKE_INSTALL_COMPONENT)
+  endif()
+endif()
+
+# Install shared libraries without execute permission?
+if(NOT DEFINED CMAKE_INSTALL_SO_NO_EXE)
+  set(CMAKE_INSTALL_SO_NO_EXE "1")
+endif()
+
+# Is this installation the result of a crosscompile?
+if(NOT DEFINED CMAKE_CROSSCOMPILING)
+  set(CMAKE_CROSSCOMPILING "FALSE")
+endif()
+
+# Set default install directory permissions.
+if(NOT DEFINED CMAKE_OBJDUMP)
+  set(CMAKE_OBJDUMP "/usr/bin/objdump")
+endif()
+
+if(CMAKE_INSTALL_COMPONENT STREQUAL "Unspecified" OR NOT CMAKE_INSTALL_COMPONENT)
+  file(INSTALL DESTINATION "${CMAKE_INSTALL_PREFIX}/include/yaml" TYPE DIRECTORY FILES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/yaml/modules/${BUILD_TYPE}/")
+endif()
+
+if(CMAKE_INSTALL_COMPONENT STREQUAL "Unspecified" OR NOT CMAKE_INSTALL_COMPONENT)
+  if(EXISTS "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/lib/libfabm_0d.so" AND
+     NOT IS_SYMLINK "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/lib/libfabm_0d.so")
+    file(RPATH_CHECK
+         FILE "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/lib/libfabm_0d.so"
+         RPATH "")
+  endif()
+  file(INSTALL DESTINATION "${CMAKE_INSTALL_PREFIX}/lib" TYPE SHARED_LIBRARY FILES "/root/package/build/lib.linux-x86_64-cpython-311/pyfabm/libfabm_0d.so")
+  if(EXISTS "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/lib/libfabm_0d.so" AND
+     NOT IS_SYMLINK "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/lib/libfabm_0d.so")
+    if(CMAKE_INSTALL_DO_STRIP)
+      execute_process(COMMAND "/usr/bin/strip" "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/lib/libfabm_0d.so")
+    endif()
+  endif()
+endif()
+
+if(CMAKE_INSTALL_COMPONENT STREQUAL "Unspecified" OR NOT CMAKE_INSTALL_COMPONENT)
+endif()
+
+if(CMAKE_INSTALL_COMPONENT STREQUAL "Unspecified" OR NOT CMAKE_INSTALL_COMPONENT)
+  file(INSTALL DESTINATION "${CMAKE_INSTALL_PREFIX}/include" TYPE DIRECTORY FILES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/modules/${BUILD_TYPE}/")
+endif()
+
+if(CMAKE_INSTALL_COMPONENT STREQUAL "Unspecified" OR NOT CMAKE_INSTALL_COMPONENT)
+  file(INSTALL DESTINATION "${CMAKE_INSTALL_PREFIX}/include" TYPE FILE FILES
+    "/root/package/src/../include/fabm.h"
+    "/root/package/src/../include/fabm_version.h"
+    "/root/package/src/drivers/python/fabm_driver.h"
+    )
+endif()
+
+if(CMAKE_INSTALL_COMPONENT STREQUAL "Unspecified" OR NOT CMAKE_INSTALL_COMPONENT)
+  if(EXISTS "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/cmake/fabmConfig.cmake")
+    file(DIFFERENT _cmake_export_file_changed FILES
+         "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/cmake/fabmConfig.cmake"
+         "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/Export/272ceadb8458515b2ae4b5630a6029cc/fabmConfig.cmake")
+    if(_cmake_export_file_changed)
+      file(GLOB _cmake_old_config_files "$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/cmake/fabmConfig-*.cmake")
+      if(_cmake_old_config_files)
+        string(REPLACE ";" ", " _cmake_old_config_files_text "${_cmake_old_config_files}")
+        message(STATUS "Old export file \"$ENV{DESTDIR}${CMAKE_INSTALL_PREFIX}/cmake/fabmConfig.cmake\" will be replaced.  Removing files [${_cmake_old_config_files_text}].")
+        unset(_cmake_old_config_files_text)
+        file(REMOVE ${_cmake_old_config_files})
+      endif()
+      unset(_cmake_old_config_files)
+    endif()
+    unset(_cmake_export_file_changed)
+  endif()
+  file(INSTALL DESTINATION "${CMAKE_INSTALL_PREFIX}/cmake" TYPE FILE FILES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/Export/272ceadb8458515b2ae4b5630a6029cc/fabmConfig.cmake")
+  if(CMAKE_INSTALL_CONFIG_NAME MATCHES "^([Rr][Ee][Ll][Ee][Aa][Ss][Ee])$")
+    file(INSTALL DESTINATION "${CMAKE_INSTALL_PREFIX}/cmake" TYPE FILE FILES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/Export/272ceadb8458515b2ae4b5630a6029cc/fabmConfig-release.cmake")
+  endif()
+endif()
+
+if(NOT CMAKE_INSTALL_LOCAL_ONLY)
+  # Include the install script for each subdirectory.
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/au/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/bb/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/csiro/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/gotm/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/iow/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/jrc/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/msi/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/nersc/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/pml/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/selma/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/cmake_install.cmake")
+  include("/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/c/cmake_install.cmake")
+
+endif()
+
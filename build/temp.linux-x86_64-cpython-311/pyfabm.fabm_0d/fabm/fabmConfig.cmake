@@ -0,0 +1,322 @@
+# Generated by CMake
+
+if("${CMAKE_MAJOR_VERSION}.${CMAKE_MINOR_VERSION}" LESS 2.8)
+   message(FATAL_ERROR "CMake >= 2.8.0 required")
+endif()
+if(CMAKE_VERSION VERSION_LESS "2.8.3")
+   message(FATAL_ERROR "CMake >= 2.8.3 required")
+endif()
+cmake_policy(PUSH)
+cmake_policy(VERSION 2.8.3...3.23)
+#----------------------------------------------------------------
+# Generated CMake target import file.
+#----------------------------------------------------------------
+
+# Commands may need to know the format version.
+set(CMAKE_IMPORT_FILE_VERSION 1)
+
+# Protect against multiple inclusion, which would fail when already imported targets are added once more.
+set(_cmake_targets_defined "")
+set(_cmake_targets_not_defined "")
+set(_cmake_expected_targets "")
+foreach(_cmake_expected_target IN ITEMS yaml fabm_base fabm_models_akvaplan fabm_models_au fabm_models_bb fabm_models_csiro fabm_models_examples fabm_models_gotm fabm_models_iow fabm_models_jrc fabm_models_msi fabm_models_nersc fabm_models_niva fabm_models_pml fabm_models_selma fabm_models_su fabm_models_uhh fabm)
+  list(APPEND _cmake_expected_targets "${_cmake_expected_target}")
+  if(TARGET "${_cmake_expected_target}")
+    list(APPEND _cmake_targets_defined "${_cmake_expected_target}")
+  else()
+    list(APPEND _cmake_targets_not_defined "${_cmake_expected_target}")
+  endif()
+endforeach()
+unset(_cmake_expected_target)
+if(_cmake_targets_defined STREQUAL _cmake_expected_targets)
+  unset(_cmake_targets_defined)
+  unset(_cmake_targets_not_defined)
+  unset(_cmake_expected_targets)
+  unset(CMAKE_IMPORT_FILE_VERSION)
+  cmake_policy(POP)
+  return()
+endif()
+if(NOT _cmake_targets_defined STREQUAL "")
+  string(REPLACE ";" ", " _cmake_targets_defined_text "${_cmake_targets_defined}")
+  string(REPLACE ";" ", " _cmake_targets_not_defined_text "${_cmake_targets_not_defined}")
+  message(FATAL_ERROR "Some (but not all) targets in this export set were already defined.\nTargets Defined: ${_cmake_targets_defined_text}\nTargets not yet defined: ${_cmake_targets_not_defined_text}\n")
+endif()
+unset(_cmake_targets_defined)
+unset(_cmake_targets_not_defined)
+unset(_cmake_expected_targets)
+
+
+# Create imported target yaml
+add_library(yaml OBJECT IMPORTED)
+
+set_target_properties(yaml PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/yaml/modules"
+)
+
+# Create imported target fabm_base
+add_library(fabm_base OBJECT IMPORTED)
+
+set_target_properties(fabm_base PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/modules;/root/package/src/drivers/python;/root/package/src/../include"
+  INTERFACE_LINK_LIBRARIES "yaml"
+)
+
+# Create imported target fabm_models_akvaplan
+add_library(fabm_models_akvaplan OBJECT IMPORTED)
+
+set_target_properties(fabm_models_akvaplan PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_au
+add_library(fabm_models_au OBJECT IMPORTED)
+
+set_target_properties(fabm_models_au PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/au"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_bb
+add_library(fabm_models_bb OBJECT IMPORTED)
+
+set_target_properties(fabm_models_bb PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/bb"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_csiro
+add_library(fabm_models_csiro OBJECT IMPORTED)
+
+set_target_properties(fabm_models_csiro PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/csiro"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_examples
+add_library(fabm_models_examples OBJECT IMPORTED)
+
+set_target_properties(fabm_models_examples PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_gotm
+add_library(fabm_models_gotm OBJECT IMPORTED)
+
+set_target_properties(fabm_models_gotm PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/gotm"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_iow
+add_library(fabm_models_iow OBJECT IMPORTED)
+
+set_target_properties(fabm_models_iow PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/iow"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_jrc
+add_library(fabm_models_jrc OBJECT IMPORTED)
+
+set_target_properties(fabm_models_jrc PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/jrc"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_msi
+add_library(fabm_models_msi OBJECT IMPORTED)
+
+set_target_properties(fabm_models_msi PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/msi"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_nersc
+add_library(fabm_models_nersc OBJECT IMPORTED)
+
+set_target_properties(fabm_models_nersc PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/nersc"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_niva
+add_library(fabm_models_niva OBJECT IMPORTED)
+
+set_target_properties(fabm_models_niva PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_pml
+add_library(fabm_models_pml OBJECT IMPORTED)
+
+set_target_properties(fabm_models_pml PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/pml"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_selma
+add_library(fabm_models_selma OBJECT IMPORTED)
+
+set_target_properties(fabm_models_selma PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/selma"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_su
+add_library(fabm_models_su OBJECT IMPORTED)
+
+set_target_properties(fabm_models_su PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_uhh
+add_library(fabm_models_uhh OBJECT IMPORTED)
+
+set_target_properties(fabm_models_uhh PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh"
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm
+add_library(fabm SHARED IMPORTED)
+
+set_target_properties(fabm PROPERTIES
+  INTERFACE_LINK_LIBRARIES "yaml;fabm_base"
+)
+
+# Import target "yaml" for configuration "Release"
+set_property(TARGET yaml APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(yaml PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/yaml/CMakeFiles/yaml.dir/yaml_types.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/yaml/CMakeFiles/yaml.dir/yaml_settings.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/yaml/CMakeFiles/yaml.dir/yaml.F90.o"
+  )
+
+# Import target "fabm_base" for configuration "Release"
+set_property(TARGET fabm_base APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_base PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/fabm_parameters.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/fabm_driver.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/fabm_standard_variables.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/fabm_properties.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/fabm_types.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/fabm_particle.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/fabm_expressions.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/constant.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/reduction.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/sum.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/scale.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/source.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/time_filter.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/depth_integral.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/relaxation.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/depth_mapping.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/CMakeFiles/fabm_base.dir/src/builtin/model_library.F90.o"
+  )
+
+# Import target "fabm_models_akvaplan" for configuration "Release"
+set_property(TARGET fabm_models_akvaplan APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_akvaplan PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/akvaplan_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/tracer.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/plume_injection.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/tracer_sed.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/antiparasitic.F90.o"
+  )
+
+# Import target "fabm_models_au" for configuration "Release"
+set_property(TARGET fabm_models_au APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_au PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/au/CMakeFiles/fabm_models_au.dir/model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/au/CMakeFiles/fabm_models_au.dir/prey_predator/prey_predator.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/au/CMakeFiles/fabm_models_au.dir/prey_predator/lotka_volterra.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/au/CMakeFiles/fabm_models_au.dir/prey_predator/jacob_monod.F90.o"
+  )
+
+# Import target "fabm_models_bb" for configuration "Release"
+set_property(TARGET fabm_models_bb APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_bb PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/bb/CMakeFiles/fabm_models_bb.dir/bb_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/bb/CMakeFiles/fabm_models_bb.dir/filter_feeder/filter_feeder.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/bb/CMakeFiles/fabm_models_bb.dir/lorenz63/lorenz63.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/bb/CMakeFiles/fabm_models_bb.dir/passive/passive.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/bb/CMakeFiles/fabm_models_bb.dir/gas/gas.F90.o"
+  )
+
+# Import target "fabm_models_csiro" for configuration "Release"
+set_property(TARGET fabm_models_csiro APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_csiro PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/csiro/CMakeFiles/fabm_models_csiro.dir/csiro_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/csiro/CMakeFiles/fabm_models_csiro.dir/seagrass.F90.o"
+  )
+
+# Import target "fabm_models_examples" for configuration "Release"
+set_property(TARGET fabm_models_examples APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_examples PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/examples_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/benthic_predator.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/mean.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/examples_npzd_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/det.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/nut.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/phy.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/zoo.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/nonlocal.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/light_cycle.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/particle/examples_particle_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/particle/passive_particle.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/particle/depth_integrated_predator.F90.o"
+  )
+
+# Import target "fabm_models_gotm" for configuration "Release"
+set_property(TARGET fabm_models_gotm APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_gotm PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/gotm/CMakeFiles/fabm_models_gotm.dir/gotm_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/gotm/CMakeFiles/fabm_models_gotm.dir/ergom.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/gotm/CMakeFiles/fabm_models_gotm.dir/fasham.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/gotm/CMakeFiles/fabm_models_gotm.dir/npzd.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/gotm/CMakeFiles/fabm_models_gotm.dir/light.F90.o"
+  )
+
+# Import target "fabm_models_iow" for configuration "Release"
+set_property(TARGET fabm_models_iow APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_iow PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/iow/CMakeFiles/fabm_models_iow.dir/iow_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/iow/CMakeFiles/fabm_models_iow.dir/age/iow_age.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/iow/CMakeFiles/fabm_models_iow.dir/ergom/ergom_cgt.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/iow/CMakeFiles/fabm_models_iow.dir/spm/spm.F90.o"
+  )
+
+# Import target "fabm_models_jrc" for configuration "Release"
+set_property(TARGET fabm_models_jrc APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_jrc PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/jrc/CMakeFiles/fabm_models_jrc.dir/jrc_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/jrc/CMakeFiles/fabm_models_jrc.dir/bsem/bsem.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/jrc/CMakeFiles/fabm_models_jrc.dir/med_ergom/med_ergom.F90.o"
+  )
+
+# Import target "fabm_models_msi" for configuration "Release"
+set_property(TARGET fabm_models_msi APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_msi PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/msi/CMakeFiles/fabm_models_msi.dir/msi_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/msi/CMakeFiles/fabm_models_msi.dir/ergom1.F90.o"
+  )
+
+# Import target "fabm_models_nersc" for configuration "Release"
+set_property(TARGET fabm_models_nersc APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_nersc PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/nersc/CMakeFiles/fabm_models_nersc.dir/nersc_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/nersc/CMakeFiles/fabm_models_nersc.dir/ecosmo/ecosmo_operational.F90.o"
+  )
+
+# Import target "fabm_models_niva" for configuration "Release"
+set_property(TARGET fabm_models_niva APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_niva PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/niva_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/oxydep/oxydep.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_bio.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_bioplast.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_carb.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_eqconst.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_redox.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_salt.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/domcast/domcast.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/roms/niva_roms_npzd_Franks.F90.o"
+  )
+
+# Import target "fabm_models_pml" for configuration "Release"
+set_property(TARGET fabm_models_pml APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_pml PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/pml/CMakeFiles/fabm_models_pml.dir/pml_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/pml/CMakeFiles/fabm_models_pml.dir/carbonate/carbonate.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/pml/CMakeFiles/fabm_models_pml.dir/carbonate/co2_dyn.F90.o"
+  )
+
+# Import target "fabm_models_selma" for configuration "Release"
+set_property(TARGET fabm_models_selma APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_selma PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/selma/CMakeFiles/fabm_models_selma.dir/selma_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/selma/CMakeFiles/fabm_models_selma.dir/selma.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/selma/CMakeFiles/fabm_models_selma.dir/phytoplankton.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/selma/CMakeFiles/fabm_models_selma.dir/zooplankton.F90.o"
+  )
+
+# Import target "fabm_models_su" for configuration "Release"
+set_property(TARGET fabm_models_su APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_su PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/CMakeFiles/fabm_models_su.dir/su_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/CMakeFiles/fabm_models_su.dir/npz.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/CMakeFiles/fabm_models_su.dir/mixo.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/CMakeFiles/fabm_models_su.dir/algae.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/CMakeFiles/fabm_models_su.dir/bacteria.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/CMakeFiles/fabm_models_su.dir/pools.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/su/CMakeFiles/fabm_models_su.dir/light_cycle.F90.o"
+  )
+
+# Import target "fabm_models_uhh" for configuration "Release"
+set_property(TARGET fabm_models_uhh APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm_models_uhh PROPERTIES
+  IMPORTED_COMMON_LANGUAGE_RUNTIME_RELEASE ""
+  IMPORTED_OBJECTS_RELEASE "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/uhh_model_library.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_base.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_utilities.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_zoo.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_base.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_heterocysts.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_recruitive_cells.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_vegetative_cells.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_akinetes.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/dinoflag/dinoflag.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/diatoms/diatoms.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/phy_feedback/phy_feedback.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/halogen/halogen.F90.o;/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/halogen/uv.F90.o"
+  )
+
+# Import target "fabm" for configuration "Release"
+set_property(TARGET fabm APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm PROPERTIES
+  IMPORTED_LOCATION_RELEASE "/root/package/build/lib.linux-x86_64-cpython-311/pyfabm/libfabm_0d.so"
+  IMPORTED_SONAME_RELEASE "libfabm_0d.so"
+  )
+
+# This file does not depend on other imported targets which have
+# been exported from the same project but in a separate export set.
+
+# Commands beyond this point should not need to know the version.
+set(CMAKE_IMPORT_FILE_VERSION)
+cmake_policy(POP)
@@ -0,0 +1,45 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  "Fortran"
+  )
+# The set of files for implicit dependencies of each language:
+set(CMAKE_DEPENDS_CHECK_Fortran
+  "/root/package/src/models/akvaplan/akvaplan_model_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/akvaplan_model_library.F90.o"
+  "/root/package/src/models/akvaplan/antiparasitic.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/antiparasitic.F90.o"
+  "/root/package/src/models/akvaplan/plume_injection.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/plume_injection.F90.o"
+  "/root/package/src/models/akvaplan/tracer.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/tracer.F90.o"
+  "/root/package/src/models/akvaplan/tracer_sed.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/tracer_sed.F90.o"
+  )
+set(CMAKE_Fortran_COMPILER_ID "GNU")
+set(CMAKE_Fortran_SUBMODULE_SEP "@")
+set(CMAKE_Fortran_SUBMODULE_EXT ".smod")
+
+# Preprocessor definitions for this target.
+set(CMAKE_TARGET_DEFINITIONS_Fortran
+  "NDEBUG"
+  "_FABM_DIMENSION_COUNT_=0"
+  )
+
+# The include file search paths:
+set(CMAKE_Fortran_TARGET_INCLUDE_PATH
+  "fabm/modules"
+  "/root/package/src/drivers/python"
+  "/root/package/src/../include"
+  "fabm/yaml/modules"
+  "fabm/models/akvaplan"
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/akvaplan")
@@ -0,0 +1,12 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_akvaplan.dir/akvaplan_model_library.F90.o"
+  "CMakeFiles/fabm_models_akvaplan.dir/antiparasitic.F90.o"
+  "CMakeFiles/fabm_models_akvaplan.dir/plume_injection.F90.o"
+  "CMakeFiles/fabm_models_akvaplan.dir/tracer.F90.o"
+  "CMakeFiles/fabm_models_akvaplan.dir/tracer_sed.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_akvaplan.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
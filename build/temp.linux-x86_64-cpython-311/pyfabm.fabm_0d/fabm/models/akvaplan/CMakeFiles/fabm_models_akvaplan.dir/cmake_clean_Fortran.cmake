@@ -0,0 +1,22 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "akvaplan_antiparasitic.mod"
+  "AKVAPLAN_ANTIPARASITIC.mod"
+  "CMakeFiles/fabm_models_akvaplan.dir/akvaplan_antiparasitic.mod.stamp"
+
+  "akvaplan_model_library.mod"
+  "AKVAPLAN_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_akvaplan.dir/akvaplan_model_library.mod.stamp"
+
+  "akvaplan_plume_injection.mod"
+  "AKVAPLAN_PLUME_INJECTION.mod"
+  "CMakeFiles/fabm_models_akvaplan.dir/akvaplan_plume_injection.mod.stamp"
+
+  "akvaplan_tracer.mod"
+  "AKVAPLAN_TRACER.mod"
+  "CMakeFiles/fabm_models_akvaplan.dir/akvaplan_tracer.mod.stamp"
+
+  "akvaplan_tracer_sed.mod"
+  "AKVAPLAN_TRACER_SED.mod"
+  "CMakeFiles/fabm_models_akvaplan.dir/akvaplan_tracer_sed.mod.stamp"
+  )
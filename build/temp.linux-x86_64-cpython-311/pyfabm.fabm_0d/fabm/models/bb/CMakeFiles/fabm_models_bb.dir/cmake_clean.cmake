@@ -0,0 +1,12 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_bb.dir/bb_model_library.F90.o"
+  "CMakeFiles/fabm_models_bb.dir/filter_feeder/filter_feeder.F90.o"
+  "CMakeFiles/fabm_models_bb.dir/gas/gas.F90.o"
+  "CMakeFiles/fabm_models_bb.dir/lorenz63/lorenz63.F90.o"
+  "CMakeFiles/fabm_models_bb.dir/passive/passive.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_bb.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
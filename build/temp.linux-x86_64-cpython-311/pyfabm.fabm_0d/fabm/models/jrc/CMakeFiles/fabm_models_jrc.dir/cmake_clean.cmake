@@ -0,0 +1,10 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_jrc.dir/bsem/bsem.F90.o"
+  "CMakeFiles/fabm_models_jrc.dir/jrc_model_library.F90.o"
+  "CMakeFiles/fabm_models_jrc.dir/med_ergom/med_ergom.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_jrc.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
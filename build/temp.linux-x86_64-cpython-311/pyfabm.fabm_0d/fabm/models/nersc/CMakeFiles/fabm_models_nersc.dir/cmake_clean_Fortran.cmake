@@ -0,0 +1,10 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "fabm_nersc_ecosmo_operational.mod"
+  "FABM_NERSC_ECOSMO_OPERATIONAL.mod"
+  "CMakeFiles/fabm_models_nersc.dir/fabm_nersc_ecosmo_operational.mod.stamp"
+
+  "nersc_model_library.mod"
+  "NERSC_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_nersc.dir/nersc_model_library.mod.stamp"
+  )
@@ -0,0 +1,50 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  "Fortran"
+  )
+# The set of files for implicit dependencies of each language:
+set(CMAKE_DEPENDS_CHECK_Fortran
+  "/root/package/src/models/niva/brom/brom_bio.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_bio.F90.o"
+  "/root/package/src/models/niva/brom/brom_bioplast.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_bioplast.F90.o"
+  "/root/package/src/models/niva/brom/brom_carb.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_carb.F90.o"
+  "/root/package/src/models/niva/brom/brom_eqconst.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_eqconst.F90.o"
+  "/root/package/src/models/niva/brom/brom_redox.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_redox.F90.o"
+  "/root/package/src/models/niva/brom/brom_salt.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/brom/brom_salt.F90.o"
+  "/root/package/src/models/niva/domcast/domcast.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/domcast/domcast.F90.o"
+  "/root/package/src/models/niva/niva_model_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/niva_model_library.F90.o"
+  "/root/package/src/models/niva/oxydep/oxydep.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/oxydep/oxydep.F90.o"
+  "/root/package/src/models/niva/roms/niva_roms_npzd_Franks.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva/CMakeFiles/fabm_models_niva.dir/roms/niva_roms_npzd_Franks.F90.o"
+  )
+set(CMAKE_Fortran_COMPILER_ID "GNU")
+set(CMAKE_Fortran_SUBMODULE_SEP "@")
+set(CMAKE_Fortran_SUBMODULE_EXT ".smod")
+
+# Preprocessor definitions for this target.
+set(CMAKE_TARGET_DEFINITIONS_Fortran
+  "NDEBUG"
+  "_FABM_DIMENSION_COUNT_=0"
+  )
+
+# The include file search paths:
+set(CMAKE_Fortran_TARGET_INCLUDE_PATH
+  "fabm/modules"
+  "/root/package/src/drivers/python"
+  "/root/package/src/../include"
+  "fabm/yaml/modules"
+  "fabm/models/niva"
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_0d/fabm/models/niva")
@@ -0,0 +1,17 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_niva.dir/brom/brom_bio.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/brom/brom_bioplast.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/brom/brom_carb.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/brom/brom_eqconst.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/brom/brom_redox.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/brom/brom_salt.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/domcast/domcast.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/niva_model_library.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/oxydep/oxydep.F90.o"
+  "CMakeFiles/fabm_models_niva.dir/roms/niva_roms_npzd_Franks.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_niva.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
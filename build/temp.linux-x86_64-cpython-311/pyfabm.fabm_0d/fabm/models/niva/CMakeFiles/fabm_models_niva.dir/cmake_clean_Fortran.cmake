@@ -0,0 +1,42 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "fabm_niva_brom_bio.mod"
+  "FABM_NIVA_BROM_BIO.mod"
+  "CMakeFiles/fabm_models_niva.dir/fabm_niva_brom_bio.mod.stamp"
+
+  "fabm_niva_brom_bioplast.mod"
+  "FABM_NIVA_BROM_BIOPLAST.mod"
+  "CMakeFiles/fabm_models_niva.dir/fabm_niva_brom_bioplast.mod.stamp"
+
+  "fabm_niva_brom_carb.mod"
+  "FABM_NIVA_BROM_CARB.mod"
+  "CMakeFiles/fabm_models_niva.dir/fabm_niva_brom_carb.mod.stamp"
+
+  "fabm_niva_brom_eqconst.mod"
+  "FABM_NIVA_BROM_EQCONST.mod"
+  "CMakeFiles/fabm_models_niva.dir/fabm_niva_brom_eqconst.mod.stamp"
+
+  "fabm_niva_brom_redox.mod"
+  "FABM_NIVA_BROM_REDOX.mod"
+  "CMakeFiles/fabm_models_niva.dir/fabm_niva_brom_redox.mod.stamp"
+
+  "fabm_niva_brom_salt.mod"
+  "FABM_NIVA_BROM_SALT.mod"
+  "CMakeFiles/fabm_models_niva.dir/fabm_niva_brom_salt.mod.stamp"
+
+  "fabm_niva_oxydep.mod"
+  "FABM_NIVA_OXYDEP.mod"
+  "CMakeFiles/fabm_models_niva.dir/fabm_niva_oxydep.mod.stamp"
+
+  "niva_domcast.mod"
+  "NIVA_DOMCAST.mod"
+  "CMakeFiles/fabm_models_niva.dir/niva_domcast.mod.stamp"
+
+  "niva_model_library.mod"
+  "NIVA_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_niva.dir/niva_model_library.mod.stamp"
+
+  "niva_roms_npzd_franks.mod"
+  "NIVA_ROMS_NPZD_FRANKS.mod"
+  "CMakeFiles/fabm_models_niva.dir/niva_roms_npzd_franks.mod.stamp"
+  )
@@ -0,0 +1,30 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "su_algae.mod"
+  "SU_ALGAE.mod"
+  "CMakeFiles/fabm_models_su.dir/su_algae.mod.stamp"
+
+  "su_bacteria.mod"
+  "SU_BACTERIA.mod"
+  "CMakeFiles/fabm_models_su.dir/su_bacteria.mod.stamp"
+
+  "su_light_cycle.mod"
+  "SU_LIGHT_CYCLE.mod"
+  "CMakeFiles/fabm_models_su.dir/su_light_cycle.mod.stamp"
+
+  "su_mixo.mod"
+  "SU_MIXO.mod"
+  "CMakeFiles/fabm_models_su.dir/su_mixo.mod.stamp"
+
+  "su_model_library.mod"
+  "SU_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_su.dir/su_model_library.mod.stamp"
+
+  "su_npz.mod"
+  "SU_NPZ.mod"
+  "CMakeFiles/fabm_models_su.dir/su_npz.mod.stamp"
+
+  "su_pools.mod"
+  "SU_POOLS.mod"
+  "CMakeFiles/fabm_models_su.dir/su_pools.mod.stamp"
+  )
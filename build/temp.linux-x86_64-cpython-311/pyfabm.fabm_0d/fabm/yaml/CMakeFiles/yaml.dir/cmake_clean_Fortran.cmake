@@ -0,0 +1,14 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "modules/yaml.mod"
+  "modules/YAML.mod"
+  "CMakeFiles/yaml.dir/yaml.mod.stamp"
+
+  "modules/yaml_settings.mod"
+  "modules/YAML_SETTINGS.mod"
+  "CMakeFiles/yaml.dir/yaml_settings.mod.stamp"
+
+  "modules/yaml_types.mod"
+  "modules/YAML_TYPES.mod"
+  "CMakeFiles/yaml.dir/yaml_types.mod.stamp"
+  )
@@ -0,0 +1,128 @@
+# CMAKE generated file: DO NOT EDIT!
+# Generated by "Unix Makefiles" Generator, CMake Version 3.25
+
+# The generator used is:
+set(CMAKE_DEPENDS_GENERATOR "Unix Makefiles")
+
+# The top level Makefile was generated from the following files:
+set(CMAKE_MAKEFILE_DEPENDS
+  "CMakeCache.txt"
+  "/root/package/CMakeLists.txt"
+  "CMakeFiles/3.25.1/CMakeFortranCompiler.cmake"
+  "CMakeFiles/3.25.1/CMakeSystem.cmake"
+  "/root/package/src/CMakeLists.txt"
+  "/root/package/src/c/CMakeLists.txt"
+  "/root/package/src/drivers/python/CMakeLists.txt"
+  "/root/package/src/fabm_library.F90.in"
+  "/root/package/src/fabm_parameters.F90.in"
+  "/root/package/src/fabm_version.F90.in"
+  "/root/package/src/models/akvaplan/CMakeLists.txt"
+  "/root/package/src/models/au/CMakeLists.txt"
+  "/root/package/src/models/bb/CMakeLists.txt"
+  "/root/package/src/models/csiro/CMakeLists.txt"
+  "/root/package/src/models/examples/CMakeLists.txt"
+  "/root/package/src/models/examples/particle/CMakeLists.txt"
+  "/root/package/src/models/gotm/CMakeLists.txt"
+  "/root/package/src/models/iow/CMakeLists.txt"
+  "/root/package/src/models/jrc/CMakeLists.txt"
+  "/root/package/src/models/msi/CMakeLists.txt"
+  "/root/package/src/models/nersc/CMakeLists.txt"
+  "/root/package/src/models/niva/CMakeLists.txt"
+  "/root/package/src/models/pml/CMakeLists.txt"
+  "/root/package/src/models/selma/CMakeLists.txt"
+  "/root/package/src/models/su/CMakeLists.txt"
+  "/root/package/src/models/uhh/CMakeLists.txt"
+  "/root/package/src/yaml/CMakeLists.txt"
+  "/usr/share/cmake-3.25/Modules/CMakeCommonLanguageInclude.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeCompilerIdDetection.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeDetermineCompiler.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeDetermineCompilerABI.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeDetermineCompilerId.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeDetermineFortranCompiler.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeDetermineSystem.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeFindBinUtils.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeFortranCompiler.cmake.in"
+  "/usr/share/cmake-3.25/Modules/CMakeFortranCompilerABI.F90"
+  "/usr/share/cmake-3.25/Modules/CMakeFortranInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeGenericSystem.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeInitializeConfigs.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeLanguageInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeParseImplicitIncludeInfo.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeParseImplicitLinkInfo.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeParseLibraryArchitecture.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeSystem.cmake.in"
+  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInformation.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeSystemSpecificInitialize.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeTestCompilerCommon.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeTestFortranCompiler.cmake"
+  "/usr/share/cmake-3.25/Modules/CMakeUnixFindMake.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/CMakeCommonCompilerMacros.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU-FindBinUtils.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU-Fortran.cmake"
+  "/usr/share/cmake-3.25/Modules/Compiler/GNU.cmake"
+  "/usr/share/cmake-3.25/Modules/GNUInstallDirs.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU-Fortran.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux-GNU.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/Linux.cmake"
+  "/usr/share/cmake-3.25/Modules/Platform/UnixPaths.cmake"
+  )
+
+# The corresponding makefile is:
+set(CMAKE_MAKEFILE_OUTPUTS
+  "Makefile"
+  "CMakeFiles/cmake.check_cache"
+  )
+
+# Byproducts of CMake generate step:
+set(CMAKE_MAKEFILE_PRODUCTS
+  "CMakeFiles/3.25.1/CMakeSystem.cmake"
+  "CMakeFiles/3.25.1/CMakeFortranCompiler.cmake"
+  "CMakeFiles/3.25.1/CMakeFortranCompiler.cmake"
+  "CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/fabm_library.F90"
+  "fabm/fabm_version.F90"
+  "fabm/fabm_parameters.F90"
+  "fabm/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/yaml/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/akvaplan/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/au/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/bb/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/csiro/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/examples/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/examples/particle/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/gotm/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/iow/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/jrc/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/msi/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/nersc/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/niva/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/pml/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/selma/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/su/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/models/uhh/CMakeFiles/CMakeDirectoryInformation.cmake"
+  "fabm/c/CMakeFiles/CMakeDirectoryInformation.cmake"
+  )
+
+# Dependency information for all targets:
+set(CMAKE_DEPEND_INFO_FILES
+  "fabm/CMakeFiles/fabm_base.dir/DependInfo.cmake"
+  "fabm/CMakeFiles/fabm.dir/DependInfo.cmake"
+  "fabm/CMakeFiles/test_host.dir/DependInfo.cmake"
+  "fabm/yaml/CMakeFiles/yaml.dir/DependInfo.cmake"
+  "fabm/yaml/CMakeFiles/test_yaml.dir/DependInfo.cmake"
+  "fabm/models/akvaplan/CMakeFiles/fabm_models_akvaplan.dir/DependInfo.cmake"
+  "fabm/models/au/CMakeFiles/fabm_models_au.dir/DependInfo.cmake"
+  "fabm/models/bb/CMakeFiles/fabm_models_bb.dir/DependInfo.cmake"
+  "fabm/models/csiro/CMakeFiles/fabm_models_csiro.dir/DependInfo.cmake"
+  "fabm/models/examples/CMakeFiles/fabm_models_examples.dir/DependInfo.cmake"
+  "fabm/models/gotm/CMakeFiles/fabm_models_gotm.dir/DependInfo.cmake"
+  "fabm/models/iow/CMakeFiles/fabm_models_iow.dir/DependInfo.cmake"
+  "fabm/models/jrc/CMakeFiles/fabm_models_jrc.dir/DependInfo.cmake"
+  "fabm/models/msi/CMakeFiles/fabm_models_msi.dir/DependInfo.cmake"
+  "fabm/models/nersc/CMakeFiles/fabm_models_nersc.dir/DependInfo.cmake"
+  "fabm/models/niva/CMakeFiles/fabm_models_niva.dir/DependInfo.cmake"
+  "fabm/models/pml/CMakeFiles/fabm_models_pml.dir/DependInfo.cmake"
+  "fabm/models/selma/CMakeFiles/fabm_models_selma.dir/DependInfo.cmake"
+  "fabm/models/su/CMakeFiles/fabm_models_su.dir/DependInfo.cmake"
+  "fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/DependInfo.cmake"
+  )
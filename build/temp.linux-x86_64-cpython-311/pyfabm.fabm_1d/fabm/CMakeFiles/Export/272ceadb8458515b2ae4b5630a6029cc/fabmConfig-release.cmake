@@ -0,0 +1,19 @@
+#----------------------------------------------------------------
+# Generated CMake target import file for configuration "Release".
+#----------------------------------------------------------------
+
+# Commands may need to know the format version.
+set(CMAKE_IMPORT_FILE_VERSION 1)
+
+# Import target "fabm" for configuration "Release"
+set_property(TARGET fabm APPEND PROPERTY IMPORTED_CONFIGURATIONS RELEASE)
+set_target_properties(fabm PROPERTIES
+  IMPORTED_LOCATION_RELEASE "${_IMPORT_PREFIX}/lib/libfabm_1d.so"
+  IMPORTED_SONAME_RELEASE "libfabm_1d.so"
+  )
+
+list(APPEND _cmake_import_check_targets fabm )
+list(APPEND _cmake_import_check_files_for_fabm "${_IMPORT_PREFIX}/lib/libfabm_1d.so" )
+
+# Commands beyond this point should not need to know the version.
+set(CMAKE_IMPORT_FILE_VERSION)
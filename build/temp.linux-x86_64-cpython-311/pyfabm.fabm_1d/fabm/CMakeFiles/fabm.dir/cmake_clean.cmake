@@ -0,0 +1,28 @@
+file(REMOVE_RECURSE
+  "/root/package/build/lib.linux-x86_64-cpython-311/pyfabm/libfabm_1d.pdb"
+  "/root/package/build/lib.linux-x86_64-cpython-311/pyfabm/libfabm_1d.so"
+  "CMakeFiles/fabm.dir/fabm_library.F90.o"
+  "CMakeFiles/fabm.dir/fabm_version.F90.o"
+  "CMakeFiles/fabm.dir/src/c/c_helper.F90.o"
+  "CMakeFiles/fabm.dir/src/c/fabm_c.F90.o"
+  "CMakeFiles/fabm.dir/src/c/helper.F90.o"
+  "CMakeFiles/fabm.dir/src/c/integrate.F90.o"
+  "CMakeFiles/fabm.dir/src/c/link_list.F90.o"
+  "CMakeFiles/fabm.dir/src/c/parameter.F90.o"
+  "CMakeFiles/fabm.dir/src/c/variable.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_config.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_coupling.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_debug.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_graph.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_job.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_schedule.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_task_order.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_v0_compatibility.F90.o"
+  "CMakeFiles/fabm.dir/src/fabm_work.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,56 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  "Fortran"
+  )
+# The set of files for implicit dependencies of each language:
+set(CMAKE_DEPENDS_CHECK_Fortran
+  "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/fabm_parameters.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/fabm_parameters.F90.o"
+  "/root/package/src/builtin/constant.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/constant.F90.o"
+  "/root/package/src/builtin/depth_integral.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/depth_integral.F90.o"
+  "/root/package/src/builtin/depth_mapping.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/depth_mapping.F90.o"
+  "/root/package/src/builtin/model_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/model_library.F90.o"
+  "/root/package/src/builtin/reduction.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/reduction.F90.o"
+  "/root/package/src/builtin/relaxation.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/relaxation.F90.o"
+  "/root/package/src/builtin/scale.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/scale.F90.o"
+  "/root/package/src/builtin/source.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/source.F90.o"
+  "/root/package/src/builtin/sum.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/sum.F90.o"
+  "/root/package/src/builtin/time_filter.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/builtin/time_filter.F90.o"
+  "/root/package/src/fabm_driver.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/fabm_driver.F90.o"
+  "/root/package/src/fabm_expressions.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/fabm_expressions.F90.o"
+  "/root/package/src/fabm_particle.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/fabm_particle.F90.o"
+  "/root/package/src/fabm_properties.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/fabm_properties.F90.o"
+  "/root/package/src/fabm_standard_variables.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/fabm_standard_variables.F90.o"
+  "/root/package/src/fabm_types.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/CMakeFiles/fabm_base.dir/src/fabm_types.F90.o"
+  )
+set(CMAKE_Fortran_COMPILER_ID "GNU")
+set(CMAKE_Fortran_SUBMODULE_SEP "@")
+set(CMAKE_Fortran_SUBMODULE_EXT ".smod")
+
+# Preprocessor definitions for this target.
+set(CMAKE_TARGET_DEFINITIONS_Fortran
+  "NDEBUG"
+  "_FABM_DIMENSION_COUNT_=1"
+  )
+
+# The include file search paths:
+set(CMAKE_Fortran_TARGET_INCLUDE_PATH
+  "fabm/modules"
+  "/root/package/src/drivers/python"
+  "/root/package/src/../include"
+  "fabm/yaml/modules"
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/modules")
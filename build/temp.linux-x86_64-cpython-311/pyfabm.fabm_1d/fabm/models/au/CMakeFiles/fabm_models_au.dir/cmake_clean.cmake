@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_au.dir/model_library.F90.o"
+  "CMakeFiles/fabm_models_au.dir/prey_predator/jacob_monod.F90.o"
+  "CMakeFiles/fabm_models_au.dir/prey_predator/lotka_volterra.F90.o"
+  "CMakeFiles/fabm_models_au.dir/prey_predator/prey_predator.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_au.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,10 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "csiro_model_library.mod"
+  "CSIRO_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_csiro.dir/csiro_model_library.mod.stamp"
+
+  "csiro_seagrass.mod"
+  "CSIRO_SEAGRASS.mod"
+  "CMakeFiles/fabm_models_csiro.dir/csiro_seagrass.mod.stamp"
+  )
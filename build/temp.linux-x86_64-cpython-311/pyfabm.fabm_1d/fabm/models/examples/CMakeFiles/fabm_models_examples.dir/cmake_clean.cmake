@@ -0,0 +1,20 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_examples.dir/benthic_predator.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/examples_model_library.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/light_cycle.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/mean.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/nonlocal.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/npzd/det.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/npzd/examples_npzd_model_library.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/npzd/nut.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/npzd/phy.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/npzd/zoo.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/particle/depth_integrated_predator.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/particle/examples_particle_model_library.F90.o"
+  "CMakeFiles/fabm_models_examples.dir/particle/passive_particle.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_examples.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
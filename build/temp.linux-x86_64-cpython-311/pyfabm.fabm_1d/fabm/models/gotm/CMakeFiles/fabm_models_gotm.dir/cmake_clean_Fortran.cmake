@@ -0,0 +1,22 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "gotm_ergom.mod"
+  "GOTM_ERGOM.mod"
+  "CMakeFiles/fabm_models_gotm.dir/gotm_ergom.mod.stamp"
+
+  "gotm_fasham.mod"
+  "GOTM_FASHAM.mod"
+  "CMakeFiles/fabm_models_gotm.dir/gotm_fasham.mod.stamp"
+
+  "gotm_light.mod"
+  "GOTM_LIGHT.mod"
+  "CMakeFiles/fabm_models_gotm.dir/gotm_light.mod.stamp"
+
+  "gotm_model_library.mod"
+  "GOTM_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_gotm.dir/gotm_model_library.mod.stamp"
+
+  "gotm_npzd.mod"
+  "GOTM_NPZD.mod"
+  "CMakeFiles/fabm_models_gotm.dir/gotm_npzd.mod.stamp"
+  )
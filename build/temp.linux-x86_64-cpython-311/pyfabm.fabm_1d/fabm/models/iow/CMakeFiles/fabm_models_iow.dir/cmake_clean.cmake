@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_iow.dir/age/iow_age.F90.o"
+  "CMakeFiles/fabm_models_iow.dir/ergom/ergom_cgt.F90.o"
+  "CMakeFiles/fabm_models_iow.dir/iow_model_library.F90.o"
+  "CMakeFiles/fabm_models_iow.dir/spm/spm.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_iow.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,14 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "jrc_bsem.mod"
+  "JRC_BSEM.mod"
+  "CMakeFiles/fabm_models_jrc.dir/jrc_bsem.mod.stamp"
+
+  "jrc_med_ergom.mod"
+  "JRC_MED_ERGOM.mod"
+  "CMakeFiles/fabm_models_jrc.dir/jrc_med_ergom.mod.stamp"
+
+  "jrc_model_library.mod"
+  "JRC_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_jrc.dir/jrc_model_library.mod.stamp"
+  )
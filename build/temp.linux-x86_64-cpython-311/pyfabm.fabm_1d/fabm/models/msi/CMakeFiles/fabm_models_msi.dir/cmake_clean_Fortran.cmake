@@ -0,0 +1,10 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "fabm_msi_ergom1.mod"
+  "FABM_MSI_ERGOM1.mod"
+  "CMakeFiles/fabm_models_msi.dir/fabm_msi_ergom1.mod.stamp"
+
+  "msi_model_library.mod"
+  "MSI_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_msi.dir/msi_model_library.mod.stamp"
+  )
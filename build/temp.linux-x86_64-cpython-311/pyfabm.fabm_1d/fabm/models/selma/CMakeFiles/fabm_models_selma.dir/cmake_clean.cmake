@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_selma.dir/phytoplankton.F90.o"
+  "CMakeFiles/fabm_models_selma.dir/selma.F90.o"
+  "CMakeFiles/fabm_models_selma.dir/selma_model_library.F90.o"
+  "CMakeFiles/fabm_models_selma.dir/zooplankton.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_selma.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
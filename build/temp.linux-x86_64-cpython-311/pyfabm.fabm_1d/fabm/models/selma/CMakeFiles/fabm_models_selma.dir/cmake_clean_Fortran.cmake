@@ -0,0 +1,18 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "selma.mod"
+  "SELMA.mod"
+  "CMakeFiles/fabm_models_selma.dir/selma.mod.stamp"
+
+  "selma_model_library.mod"
+  "SELMA_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_selma.dir/selma_model_library.mod.stamp"
+
+  "selma_phytoplankton.mod"
+  "SELMA_PHYTOPLANKTON.mod"
+  "CMakeFiles/fabm_models_selma.dir/selma_phytoplankton.mod.stamp"
+
+  "selma_zooplankton.mod"
+  "SELMA_ZOOPLANKTON.mod"
+  "CMakeFiles/fabm_models_selma.dir/selma_zooplankton.mod.stamp"
+  )
@@ -0,0 +1,54 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  "Fortran"
+  )
+# The set of files for implicit dependencies of each language:
+set(CMAKE_DEPENDS_CHECK_Fortran
+  "/root/package/src/models/uhh/clc/clc_akinetes.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_akinetes.F90.o"
+  "/root/package/src/models/uhh/clc/clc_base.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_base.F90.o"
+  "/root/package/src/models/uhh/clc/clc_heterocysts.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_heterocysts.F90.o"
+  "/root/package/src/models/uhh/clc/clc_recruitive_cells.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_recruitive_cells.F90.o"
+  "/root/package/src/models/uhh/clc/clc_vegetative_cells.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/clc/clc_vegetative_cells.F90.o"
+  "/root/package/src/models/uhh/diatoms/diatoms.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/diatoms/diatoms.F90.o"
+  "/root/package/src/models/uhh/dinoflag/dinoflag.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/dinoflag/dinoflag.F90.o"
+  "/root/package/src/models/uhh/ergom_split/ergom_base.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_base.F90.o"
+  "/root/package/src/models/uhh/ergom_split/ergom_utilities.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_utilities.F90.o"
+  "/root/package/src/models/uhh/ergom_split/ergom_zoo.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_zoo.F90.o"
+  "/root/package/src/models/uhh/halogen/halogen.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/halogen/halogen.F90.o"
+  "/root/package/src/models/uhh/halogen/uv.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/halogen/uv.F90.o"
+  "/root/package/src/models/uhh/phy_feedback/phy_feedback.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/phy_feedback/phy_feedback.F90.o"
+  "/root/package/src/models/uhh/uhh_model_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh/CMakeFiles/fabm_models_uhh.dir/uhh_model_library.F90.o"
+  )
+set(CMAKE_Fortran_COMPILER_ID "GNU")
+set(CMAKE_Fortran_SUBMODULE_SEP "@")
+set(CMAKE_Fortran_SUBMODULE_EXT ".smod")
+
+# Preprocessor definitions for this target.
+set(CMAKE_TARGET_DEFINITIONS_Fortran
+  "NDEBUG"
+  "_FABM_DIMENSION_COUNT_=1"
+  )
+
+# The include file search paths:
+set(CMAKE_Fortran_TARGET_INCLUDE_PATH
+  "fabm/modules"
+  "/root/package/src/drivers/python"
+  "/root/package/src/../include"
+  "fabm/yaml/modules"
+  "fabm/models/uhh"
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_1d/fabm/models/uhh")
@@ -0,0 +1,21 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_uhh.dir/clc/clc_akinetes.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/clc/clc_base.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/clc/clc_heterocysts.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/clc/clc_recruitive_cells.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/clc/clc_vegetative_cells.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/diatoms/diatoms.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/dinoflag/dinoflag.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_base.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_utilities.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/ergom_split/ergom_zoo.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/halogen/halogen.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/halogen/uv.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/phy_feedback/phy_feedback.F90.o"
+  "CMakeFiles/fabm_models_uhh.dir/uhh_model_library.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_uhh.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
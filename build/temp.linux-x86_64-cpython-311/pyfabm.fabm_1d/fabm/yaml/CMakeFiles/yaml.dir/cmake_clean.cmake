@@ -0,0 +1,10 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/yaml.dir/yaml.F90.o"
+  "CMakeFiles/yaml.dir/yaml_settings.F90.o"
+  "CMakeFiles/yaml.dir/yaml_types.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/yaml.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,224 @@
+# Generated by CMake
+
+if("${CMAKE_MAJOR_VERSION}.${CMAKE_MINOR_VERSION}" LESS 2.8)
+   message(FATAL_ERROR "CMake >= 2.8.0 required")
+endif()
+if(CMAKE_VERSION VERSION_LESS "2.8.3")
+   message(FATAL_ERROR "CMake >= 2.8.3 required")
+endif()
+cmake_policy(PUSH)
+cmake_policy(VERSION 2.8.3...3.23)
+#----------------------------------------------------------------
+# Generated CMake target import file.
+#----------------------------------------------------------------
+
+# Commands may need to know the format version.
+set(CMAKE_IMPORT_FILE_VERSION 1)
+
+# Protect against multiple inclusion, which would fail when already imported targets are added once more.
+set(_cmake_targets_defined "")
+set(_cmake_targets_not_defined "")
+set(_cmake_expected_targets "")
+foreach(_cmake_expected_target IN ITEMS yaml fabm_base fabm_models_akvaplan fabm_models_au fabm_models_bb fabm_models_csiro fabm_models_examples fabm_models_gotm fabm_models_iow fabm_models_jrc fabm_models_msi fabm_models_nersc fabm_models_niva fabm_models_pml fabm_models_selma fabm_models_su fabm_models_uhh fabm)
+  list(APPEND _cmake_expected_targets "${_cmake_expected_target}")
+  if(TARGET "${_cmake_expected_target}")
+    list(APPEND _cmake_targets_defined "${_cmake_expected_target}")
+  else()
+    list(APPEND _cmake_targets_not_defined "${_cmake_expected_target}")
+  endif()
+endforeach()
+unset(_cmake_expected_target)
+if(_cmake_targets_defined STREQUAL _cmake_expected_targets)
+  unset(_cmake_targets_defined)
+  unset(_cmake_targets_not_defined)
+  unset(_cmake_expected_targets)
+  unset(CMAKE_IMPORT_FILE_VERSION)
+  cmake_policy(POP)
+  return()
+endif()
+if(NOT _cmake_targets_defined STREQUAL "")
+  string(REPLACE ";" ", " _cmake_targets_defined_text "${_cmake_targets_defined}")
+  string(REPLACE ";" ", " _cmake_targets_not_defined_text "${_cmake_targets_not_defined}")
+  message(FATAL_ERROR "Some (but not all) targets in this export set were already defined.\nTargets Defined: ${_cmake_targets_defined_text}\nTargets not yet defined: ${_cmake_targets_not_defined_text}\n")
+endif()
+unset(_cmake_targets_defined)
+unset(_cmake_targets_not_defined)
+unset(_cmake_expected_targets)
+
+
+# Compute the installation prefix relative to this file.
+get_filename_component(_IMPORT_PREFIX "${CMAKE_CURRENT_LIST_FILE}" PATH)
+get_filename_component(_IMPORT_PREFIX "${_IMPORT_PREFIX}" PATH)
+if(_IMPORT_PREFIX STREQUAL "/")
+  set(_IMPORT_PREFIX "")
+endif()
+
+# Create imported target yaml
+add_library(yaml INTERFACE IMPORTED)
+
+set_target_properties(yaml PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "${_IMPORT_PREFIX}/include"
+)
+
+# Create imported target fabm_base
+add_library(fabm_base INTERFACE IMPORTED)
+
+set_target_properties(fabm_base PROPERTIES
+  INTERFACE_INCLUDE_DIRECTORIES "${_IMPORT_PREFIX}/include"
+  INTERFACE_LINK_LIBRARIES "yaml"
+)
+
+# Create imported target fabm_models_akvaplan
+add_library(fabm_models_akvaplan INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_akvaplan PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_au
+add_library(fabm_models_au INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_au PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_bb
+add_library(fabm_models_bb INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_bb PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_csiro
+add_library(fabm_models_csiro INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_csiro PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_examples
+add_library(fabm_models_examples INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_examples PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_gotm
+add_library(fabm_models_gotm INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_gotm PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_iow
+add_library(fabm_models_iow INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_iow PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_jrc
+add_library(fabm_models_jrc INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_jrc PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_msi
+add_library(fabm_models_msi INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_msi PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_nersc
+add_library(fabm_models_nersc INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_nersc PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_niva
+add_library(fabm_models_niva INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_niva PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_pml
+add_library(fabm_models_pml INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_pml PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_selma
+add_library(fabm_models_selma INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_selma PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_su
+add_library(fabm_models_su INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_su PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm_models_uhh
+add_library(fabm_models_uhh INTERFACE IMPORTED)
+
+set_target_properties(fabm_models_uhh PROPERTIES
+  INTERFACE_LINK_LIBRARIES "\$<LINK_ONLY:fabm_base>"
+)
+
+# Create imported target fabm
+add_library(fabm SHARED IMPORTED)
+
+set_target_properties(fabm PROPERTIES
+  INTERFACE_LINK_LIBRARIES "yaml;fabm_base"
+)
+
+if(CMAKE_VERSION VERSION_LESS 3.0.0)
+  message(FATAL_ERROR "This file relies on consumers using CMake 3.0.0 or greater.")
+endif()
+
+# Load information for each installed configuration.
+file(GLOB _cmake_config_files "${CMAKE_CURRENT_LIST_DIR}/fabmConfig-*.cmake")
+foreach(_cmake_config_file IN LISTS _cmake_config_files)
+  include("${_cmake_config_file}")
+endforeach()
+unset(_cmake_config_file)
+unset(_cmake_config_files)
+
+# Cleanup temporary variables.
+set(_IMPORT_PREFIX)
+
+# Loop over all imported files and verify that they actually exist
+foreach(_cmake_target IN LISTS _cmake_import_check_targets)
+  foreach(_cmake_file IN LISTS "_cmake_import_check_files_for_${_cmake_target}")
+    if(NOT EXISTS "${_cmake_file}")
+      message(FATAL_ERROR "The imported target \"${_cmake_target}\" references the file
+   \"${_cmake_file}\"
+but this file does not exist.  Possible reasons include:
+* The file was deleted, renamed, or moved to another location.
+* An install or uninstall procedure did not complete successfully.
+* The installation package was faulty and contained
+   \"${CMAKE_CURRENT_LIST_FILE}\"
+but not all the files it references.
+")
+    endif()
+  endforeach()
+  unset(_cmake_file)
+  unset("_cmake_import_check_files_for_${_cmake_target}")
+endforeach()
+unset(_cmake_target)
+unset(_cmake_import_check_targets)
+
+# This file does not depend on other imported targets which have
+# been exported from the same project but in a separate export set.
+
+# Commands beyond this point should not need to know the version.
+set(CMAKE_IMPORT_FILE_VERSION)
+cmake_policy(POP)
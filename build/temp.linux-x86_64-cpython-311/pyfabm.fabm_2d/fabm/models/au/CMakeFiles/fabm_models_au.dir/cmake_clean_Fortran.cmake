@@ -0,0 +1,18 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "au_model_library.mod"
+  "AU_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_au.dir/au_model_library.mod.stamp"
+
+  "au_pp_jacob_monod.mod"
+  "AU_PP_JACOB_MONOD.mod"
+  "CMakeFiles/fabm_models_au.dir/au_pp_jacob_monod.mod.stamp"
+
+  "au_pp_lotka_volterra.mod"
+  "AU_PP_LOTKA_VOLTERRA.mod"
+  "CMakeFiles/fabm_models_au.dir/au_pp_lotka_volterra.mod.stamp"
+
+  "au_prey_predator.mod"
+  "AU_PREY_PREDATOR.mod"
+  "CMakeFiles/fabm_models_au.dir/au_prey_predator.mod.stamp"
+  )
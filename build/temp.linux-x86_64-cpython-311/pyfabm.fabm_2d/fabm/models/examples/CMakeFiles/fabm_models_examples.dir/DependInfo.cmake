@@ -0,0 +1,53 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  "Fortran"
+  )
+# The set of files for implicit dependencies of each language:
+set(CMAKE_DEPENDS_CHECK_Fortran
+  "/root/package/src/models/examples/benthic_predator.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/benthic_predator.F90.o"
+  "/root/package/src/models/examples/examples_model_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/examples_model_library.F90.o"
+  "/root/package/src/models/examples/light_cycle.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/light_cycle.F90.o"
+  "/root/package/src/models/examples/mean.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/mean.F90.o"
+  "/root/package/src/models/examples/nonlocal.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/nonlocal.F90.o"
+  "/root/package/src/models/examples/npzd/det.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/det.F90.o"
+  "/root/package/src/models/examples/npzd/examples_npzd_model_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/examples_npzd_model_library.F90.o"
+  "/root/package/src/models/examples/npzd/nut.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/nut.F90.o"
+  "/root/package/src/models/examples/npzd/phy.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/phy.F90.o"
+  "/root/package/src/models/examples/npzd/zoo.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/npzd/zoo.F90.o"
+  "/root/package/src/models/examples/particle/depth_integrated_predator.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/particle/depth_integrated_predator.F90.o"
+  "/root/package/src/models/examples/particle/examples_particle_model_library.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/particle/examples_particle_model_library.F90.o"
+  "/root/package/src/models/examples/particle/passive_particle.F90" "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples/CMakeFiles/fabm_models_examples.dir/particle/passive_particle.F90.o"
+  )
+set(CMAKE_Fortran_COMPILER_ID "GNU")
+set(CMAKE_Fortran_SUBMODULE_SEP "@")
+set(CMAKE_Fortran_SUBMODULE_EXT ".smod")
+
+# Preprocessor definitions for this target.
+set(CMAKE_TARGET_DEFINITIONS_Fortran
+  "NDEBUG"
+  "_FABM_DIMENSION_COUNT_=2"
+  )
+
+# The include file search paths:
+set(CMAKE_Fortran_TARGET_INCLUDE_PATH
+  "fabm/modules"
+  "/root/package/src/drivers/python"
+  "/root/package/src/../include"
+  "fabm/yaml/modules"
+  "fabm/models/examples"
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "/root/package/build/temp.linux-x86_64-cpython-311/pyfabm.fabm_2d/fabm/models/examples")
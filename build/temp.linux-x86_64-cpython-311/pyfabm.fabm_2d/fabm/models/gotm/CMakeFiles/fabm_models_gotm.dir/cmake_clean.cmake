@@ -0,0 +1,12 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_gotm.dir/ergom.F90.o"
+  "CMakeFiles/fabm_models_gotm.dir/fasham.F90.o"
+  "CMakeFiles/fabm_models_gotm.dir/gotm_model_library.F90.o"
+  "CMakeFiles/fabm_models_gotm.dir/light.F90.o"
+  "CMakeFiles/fabm_models_gotm.dir/npzd.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_gotm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,18 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "fabm_iow_age.mod"
+  "FABM_IOW_AGE.mod"
+  "CMakeFiles/fabm_models_iow.dir/fabm_iow_age.mod.stamp"
+
+  "fabm_iow_ergom.mod"
+  "FABM_IOW_ERGOM.mod"
+  "CMakeFiles/fabm_models_iow.dir/fabm_iow_ergom.mod.stamp"
+
+  "fabm_iow_spm.mod"
+  "FABM_IOW_SPM.mod"
+  "CMakeFiles/fabm_models_iow.dir/fabm_iow_spm.mod.stamp"
+
+  "iow_model_library.mod"
+  "IOW_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_iow.dir/iow_model_library.mod.stamp"
+  )
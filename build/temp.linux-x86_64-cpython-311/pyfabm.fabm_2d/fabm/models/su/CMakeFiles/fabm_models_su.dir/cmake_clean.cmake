@@ -0,0 +1,14 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_su.dir/algae.F90.o"
+  "CMakeFiles/fabm_models_su.dir/bacteria.F90.o"
+  "CMakeFiles/fabm_models_su.dir/light_cycle.F90.o"
+  "CMakeFiles/fabm_models_su.dir/mixo.F90.o"
+  "CMakeFiles/fabm_models_su.dir/npz.F90.o"
+  "CMakeFiles/fabm_models_su.dir/pools.F90.o"
+  "CMakeFiles/fabm_models_su.dir/su_model_library.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_su.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
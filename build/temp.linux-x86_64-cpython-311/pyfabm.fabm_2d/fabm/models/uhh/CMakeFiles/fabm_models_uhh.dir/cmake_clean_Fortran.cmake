@@ -0,0 +1,58 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "fabm_uhh_clcaki.mod"
+  "FABM_UHH_CLCAKI.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_clcaki.mod.stamp"
+
+  "fabm_uhh_clcbase.mod"
+  "FABM_UHH_CLCBASE.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_clcbase.mod.stamp"
+
+  "fabm_uhh_clchet.mod"
+  "FABM_UHH_CLCHET.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_clchet.mod.stamp"
+
+  "fabm_uhh_clcrec.mod"
+  "FABM_UHH_CLCREC.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_clcrec.mod.stamp"
+
+  "fabm_uhh_clcveg.mod"
+  "FABM_UHH_CLCVEG.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_clcveg.mod.stamp"
+
+  "fabm_uhh_diatoms.mod"
+  "FABM_UHH_DIATOMS.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_diatoms.mod.stamp"
+
+  "fabm_uhh_dinoflag.mod"
+  "FABM_UHH_DINOFLAG.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_dinoflag.mod.stamp"
+
+  "fabm_uhh_ergom_split_base.mod"
+  "FABM_UHH_ERGOM_SPLIT_BASE.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_ergom_split_base.mod.stamp"
+
+  "fabm_uhh_ergom_split_utilities.mod"
+  "FABM_UHH_ERGOM_SPLIT_UTILITIES.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_ergom_split_utilities.mod.stamp"
+
+  "fabm_uhh_ergom_split_zoo.mod"
+  "FABM_UHH_ERGOM_SPLIT_ZOO.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_ergom_split_zoo.mod.stamp"
+
+  "fabm_uhh_halogen.mod"
+  "FABM_UHH_HALOGEN.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_halogen.mod.stamp"
+
+  "fabm_uhh_phy_feedback.mod"
+  "FABM_UHH_PHY_FEEDBACK.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_phy_feedback.mod.stamp"
+
+  "fabm_uhh_uv.mod"
+  "FABM_UHH_UV.mod"
+  "CMakeFiles/fabm_models_uhh.dir/fabm_uhh_uv.mod.stamp"
+
+  "uhh_model_library.mod"
+  "UHH_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_uhh.dir/uhh_model_library.mod.stamp"
+  )
@@ -0,0 +1,86 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "modules/fabm.mod"
+  "modules/FABM.mod"
+  "CMakeFiles/fabm.dir/fabm.mod.stamp"
+
+  "modules/fabm_c.mod"
+  "modules/FABM_C.mod"
+  "CMakeFiles/fabm.dir/fabm_c.mod.stamp"
+
+  "modules/fabm_c_helper.mod"
+  "modules/FABM_C_HELPER.mod"
+  "CMakeFiles/fabm.dir/fabm_c_helper.mod.stamp"
+
+  "modules/fabm_c_integrate.mod"
+  "modules/FABM_C_INTEGRATE.mod"
+  "CMakeFiles/fabm.dir/fabm_c_integrate.mod.stamp"
+
+  "modules/fabm_c_link_list.mod"
+  "modules/FABM_C_LINK_LIST.mod"
+  "CMakeFiles/fabm.dir/fabm_c_link_list.mod.stamp"
+
+  "modules/fabm_c_parameter.mod"
+  "modules/FABM_C_PARAMETER.mod"
+  "CMakeFiles/fabm.dir/fabm_c_parameter.mod.stamp"
+
+  "modules/fabm_c_variable.mod"
+  "modules/FABM_C_VARIABLE.mod"
+  "CMakeFiles/fabm.dir/fabm_c_variable.mod.stamp"
+
+  "modules/fabm_config.mod"
+  "modules/FABM_CONFIG.mod"
+  "CMakeFiles/fabm.dir/fabm_config.mod.stamp"
+
+  "modules/fabm_config_types.mod"
+  "modules/FABM_CONFIG_TYPES.mod"
+  "CMakeFiles/fabm.dir/fabm_config_types.mod.stamp"
+
+  "modules/fabm_coupling.mod"
+  "modules/FABM_COUPLING.mod"
+  "CMakeFiles/fabm.dir/fabm_coupling.mod.stamp"
+
+  "modules/fabm_debug.mod"
+  "modules/FABM_DEBUG.mod"
+  "CMakeFiles/fabm.dir/fabm_debug.mod.stamp"
+
+  "modules/fabm_graph.mod"
+  "modules/FABM_GRAPH.mod"
+  "CMakeFiles/fabm.dir/fabm_graph.mod.stamp"
+
+  "modules/fabm_job.mod"
+  "modules/FABM_JOB.mod"
+  "CMakeFiles/fabm.dir/fabm_job.mod.stamp"
+
+  "modules/fabm_library.mod"
+  "modules/FABM_LIBRARY.mod"
+  "CMakeFiles/fabm.dir/fabm_library.mod.stamp"
+
+  "modules/fabm_python_helper.mod"
+  "modules/FABM_PYTHON_HELPER.mod"
+  "CMakeFiles/fabm.dir/fabm_python_helper.mod.stamp"
+
+  "modules/fabm_schedule.mod"
+  "modules/FABM_SCHEDULE.mod"
+  "CMakeFiles/fabm.dir/fabm_schedule.mod.stamp"
+
+  "modules/fabm_task_order.mod"
+  "modules/FABM_TASK_ORDER.mod"
+  "CMakeFiles/fabm.dir/fabm_task_order.mod.stamp"
+
+  "modules/fabm_v0_compatibility.mod"
+  "modules/FABM_V0_COMPATIBILITY.mod"
+  "CMakeFiles/fabm.dir/fabm_v0_compatibility.mod.stamp"
+
+  "modules/fabm_version.mod"
+  "modules/FABM_VERSION.mod"
+  "CMakeFiles/fabm.dir/fabm_version.mod.stamp"
+
+  "modules/fabm_work.mod"
+  "modules/FABM_WORK.mod"
+  "CMakeFiles/fabm.dir/fabm_work.mod.stamp"
+
+  "modules/fabm_yaml.mod"
+  "modules/FABM_YAML.mod"
+  "CMakeFiles/fabm.dir/fabm_yaml.mod.stamp"
+  )
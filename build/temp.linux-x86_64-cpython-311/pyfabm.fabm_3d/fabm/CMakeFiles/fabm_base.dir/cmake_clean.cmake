@@ -0,0 +1,24 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_base.dir/fabm_parameters.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/constant.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/depth_integral.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/depth_mapping.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/model_library.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/reduction.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/relaxation.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/scale.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/source.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/sum.F90.o"
+  "CMakeFiles/fabm_base.dir/src/builtin/time_filter.F90.o"
+  "CMakeFiles/fabm_base.dir/src/fabm_driver.F90.o"
+  "CMakeFiles/fabm_base.dir/src/fabm_expressions.F90.o"
+  "CMakeFiles/fabm_base.dir/src/fabm_particle.F90.o"
+  "CMakeFiles/fabm_base.dir/src/fabm_properties.F90.o"
+  "CMakeFiles/fabm_base.dir/src/fabm_standard_variables.F90.o"
+  "CMakeFiles/fabm_base.dir/src/fabm_types.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_base.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
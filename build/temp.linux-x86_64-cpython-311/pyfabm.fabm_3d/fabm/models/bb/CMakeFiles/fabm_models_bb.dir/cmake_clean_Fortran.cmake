@@ -0,0 +1,22 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "bb_filter_feeder.mod"
+  "BB_FILTER_FEEDER.mod"
+  "CMakeFiles/fabm_models_bb.dir/bb_filter_feeder.mod.stamp"
+
+  "bb_gas.mod"
+  "BB_GAS.mod"
+  "CMakeFiles/fabm_models_bb.dir/bb_gas.mod.stamp"
+
+  "bb_lorenz63.mod"
+  "BB_LORENZ63.mod"
+  "CMakeFiles/fabm_models_bb.dir/bb_lorenz63.mod.stamp"
+
+  "bb_model_library.mod"
+  "BB_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_bb.dir/bb_model_library.mod.stamp"
+
+  "bb_passive.mod"
+  "BB_PASSIVE.mod"
+  "CMakeFiles/fabm_models_bb.dir/bb_passive.mod.stamp"
+  )
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_csiro.dir/csiro_model_library.F90.o"
+  "CMakeFiles/fabm_models_csiro.dir/seagrass.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_csiro.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
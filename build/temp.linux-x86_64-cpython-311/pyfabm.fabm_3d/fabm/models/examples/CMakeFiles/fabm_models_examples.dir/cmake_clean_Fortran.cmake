@@ -0,0 +1,54 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "examples_benthic_predator.mod"
+  "EXAMPLES_BENTHIC_PREDATOR.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_benthic_predator.mod.stamp"
+
+  "examples_light_cycle.mod"
+  "EXAMPLES_LIGHT_CYCLE.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_light_cycle.mod.stamp"
+
+  "examples_mean.mod"
+  "EXAMPLES_MEAN.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_mean.mod.stamp"
+
+  "examples_model_library.mod"
+  "EXAMPLES_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_model_library.mod.stamp"
+
+  "examples_npzd_det.mod"
+  "EXAMPLES_NPZD_DET.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_npzd_det.mod.stamp"
+
+  "examples_npzd_model_library.mod"
+  "EXAMPLES_NPZD_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_npzd_model_library.mod.stamp"
+
+  "examples_npzd_nut.mod"
+  "EXAMPLES_NPZD_NUT.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_npzd_nut.mod.stamp"
+
+  "examples_npzd_phy.mod"
+  "EXAMPLES_NPZD_PHY.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_npzd_phy.mod.stamp"
+
+  "examples_npzd_zoo.mod"
+  "EXAMPLES_NPZD_ZOO.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_npzd_zoo.mod.stamp"
+
+  "examples_particle_depth_integrated_predator.mod"
+  "EXAMPLES_PARTICLE_DEPTH_INTEGRATED_PREDATOR.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_particle_depth_integrated_predator.mod.stamp"
+
+  "examples_particle_model_library.mod"
+  "EXAMPLES_PARTICLE_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_particle_model_library.mod.stamp"
+
+  "examples_particle_passive_particle.mod"
+  "EXAMPLES_PARTICLE_PASSIVE_PARTICLE.mod"
+  "CMakeFiles/fabm_models_examples.dir/examples_particle_passive_particle.mod.stamp"
+
+  "nonlocal.mod"
+  "NONLOCAL.mod"
+  "CMakeFiles/fabm_models_examples.dir/nonlocal.mod.stamp"
+  )
@@ -0,0 +1,9 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_nersc.dir/ecosmo/ecosmo_operational.F90.o"
+  "CMakeFiles/fabm_models_nersc.dir/nersc_model_library.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_nersc.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,10 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/fabm_models_pml.dir/carbonate/carbonate.F90.o"
+  "CMakeFiles/fabm_models_pml.dir/carbonate/co2_dyn.F90.o"
+  "CMakeFiles/fabm_models_pml.dir/pml_model_library.F90.o"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/fabm_models_pml.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,10 @@
+# Remove fortran modules provided by this target.
+FILE(REMOVE
+  "fabm_pml_carbonate.mod"
+  "FABM_PML_CARBONATE.mod"
+  "CMakeFiles/fabm_models_pml.dir/fabm_pml_carbonate.mod.stamp"
+
+  "pml_model_library.mod"
+  "PML_MODEL_LIBRARY.mod"
+  "CMakeFiles/fabm_models_pml.dir/pml_model_library.mod.stamp"
+  )
@@ -0,0 +1,10 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_yaml.dir/test_yaml.F90.o"
+  "test_yaml"
+  "test_yaml.pdb"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang Fortran)
+  include(CMakeFiles/test_yaml.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
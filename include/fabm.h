@@ -292,6 +292,8 @@
 #define _GET_SURFACE_(variable,target) _GET_HORIZONTAL_(variable,target)
 #define _GET_BOTTOM_(variable,target) _GET_HORIZONTAL_(variable,target)
 #define _GET_GLOBAL_(variable,target) target = cache%read_scalar(variable%global_index)
+#define _GET_PARAMETER_(field,value,target) if (_AVAILABLE_(field)) then;target = cache%read _INDEX_SLICE_PLUS_1_(field%index)*field%scale_factor;else;target = value;end if
+#define _GET_HORIZONTAL_PARAMETER_(field,value,target) if (_AVAILABLE_HORIZONTAL_(field)) then;target = cache%read_hz _INDEX_HORIZONTAL_SLICE_PLUS_1_(field%horizontal_index)*field%scale_factor;else;target = value;end if
 #define _SET_(variable,value) cache%set_interior=.true.;cache%read _INDEX_SLICE_PLUS_1_(variable%index) = value
 #define _SET_HORIZONTAL_(variable,value) cache%set_horizontal=.true.;cache%read_hz _INDEX_HORIZONTAL_SLICE_PLUS_1_(variable%horizontal_index) = value
 #define _SET_DIAGNOSTIC_(variable,value) cache%write _INDEX_SLICE_PLUS_1_(variable%write_index) = value
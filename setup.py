@@ -17,6 +17,12 @@ setup(
         CMakeExtension(
             "pyfabm.fabm_1d", "-DPYFABM_DEFINITIONS=_FABM_DIMENSION_COUNT_=1"
         ),
+        CMakeExtension(
+            "pyfabm.fabm_2d", "-DPYFABM_DEFINITIONS=_FABM_DIMENSION_COUNT_=2"
+        ),
+        CMakeExtension(
+            "pyfabm.fabm_3d", "-DPYFABM_DEFINITIONS=_FABM_DIMENSION_COUNT_=3"
+        ),
     ],
     cmdclass={"bdist_wheel": bdist_wheel, "build_ext": CMakeBuild},
     zip_safe=False,
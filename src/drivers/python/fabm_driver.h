@@ -3,7 +3,16 @@
 #elif _FABM_DIMENSION_COUNT_ > 0
 #  define _FABM_VECTORIZED_DIMENSION_INDEX_ 1
 #  define _FABM_CONTIGUOUS_
+#  if _FABM_DIMENSION_COUNT_ > 1
+!    Multidimensional domains: depth is the slowest varying dimension, i.e.,
+!    the first in Python (C order), with the surface at index 0 (as in most
+!    NetCDF files). Both interior and horizontal masks are used; the bottom
+!    index can vary horizontally.
+#    define _FABM_DEPTH_DIMENSION_INDEX_ _FABM_DIMENSION_COUNT_
+#    define _FABM_MASK_TYPE_ integer
+#    define _FABM_UNMASKED_VALUE_ 1
+#    define _FABM_BOTTOM_INDEX_ -1
+#  endif
 #endif
 
 #include "fabm.h"
-
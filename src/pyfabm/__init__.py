@@ -1,9 +1,11 @@
+from __future__ import annotations
+
 import sys
 import os
 import ctypes
 import re
-import logging
 import enum
+import fnmatch
 from typing import (
     MutableMapping,
     Optional,
@@ -16,21 +18,35 @@ from typing import (
     TypeVar,
     List,
     Dict,
+    Set,
+    Any,
+    TYPE_CHECKING,
 )
 
-try:
-    import importlib.metadata
-
-    __version__ = importlib.metadata.version("pyfabm")
-except ImportError:
-    pass
-
 try:
     import numpy as np
 except ImportError:
     print("Unable to import NumPy. Please ensure it is installed.")
     sys.exit(1)
-import numpy.typing as npt
+
+if TYPE_CHECKING:
+    import logging
+    import numpy.typing as npt
+
+
+def __getattr__(name: str) -> Any:
+    # Determine the package version only when it is asked for,
+    # as importlib.metadata is slow to import.
+    if name == "__version__":
+        try:
+            import importlib.metadata
+
+            global __version__
+            __version__ = importlib.metadata.version("pyfabm")
+            return __version__
+        except ImportError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 LOG_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_char_p)
@@ -68,7 +84,202 @@ def _find_library(name: str) -> str:
     )
 
 
-def get_lib(name: str) -> ctypes.CDLL:
+# Placeholders for argument and return types that depend on the library:
+# its real data type, the dimensionality of its domain, and the number of
+# spatial indices needed to identify a location.
+REAL = "real"
+REAL_POINTER = "real_pointer"
+LOCATION = "location"
+MASKS = "masks"
+ARR_0D = "array_0d"
+ARR_1D = "array_1d"
+ARR_INTERIOR = "array_interior"
+ARR_HORIZONTAL = "array_horizontal"
+ARR_INTERIOR_EXT = "array_interior_ext"
+ARR_HORIZONTAL_EXT = "array_horizontal_ext"
+ARR_INTERIOR_EXT2 = "array_interior_ext2"
+INT_ARR_INTERIOR = "int_array_interior"
+INT_ARR_HORIZONTAL = "int_array_horizontal"
+INT_ARR_1D = "int_array_1d"
+INT_ARR_2D = "int_array_2d"
+BOOL_ARR_INTERIOR = "bool_array_interior"
+
+c_int_p = ctypes.POINTER(ctypes.c_int)
+
+# Prototypes of all routines in the FABM library: name -> (argtypes, restype)
+# These are assigned to each routine when it is first used.
+# fmt: off
+PROTOTYPES: Dict[str, Tuple[List[Any], Any]] = {
+    # Driver settings (number of spatial dimensions, depth index)
+    "get_driver_settings": ([c_int_p, c_int_p, c_int_p, c_int_p], ctypes.c_void_p),
+
+    # Initialization
+    "create_model": ([ctypes.c_char_p, LOCATION], ctypes.c_void_p),
+    "finalize_model": ([ctypes.c_void_p], None),
+    "set_domain_start": ([ctypes.c_void_p, LOCATION], ctypes.c_void_p),
+    "set_domain_stop": ([ctypes.c_void_p, LOCATION], ctypes.c_void_p),
+
+    # Access to model objects (variables, parameters, dependencies, couplings,
+    # model instances)
+    "get_counts": ([ctypes.c_void_p] + [c_int_p] * 11, None),
+    "get_variable_metadata": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p], None),
+    "set_variable_save": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int], None),
+    "get_variable": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], ctypes.c_void_p),
+    "get_parameter_metadata": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p, c_int_p, c_int_p], None),
+    "get_model_metadata": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, c_int_p], None),
+    "get_coupling": ([ctypes.c_void_p, ctypes.c_int, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_void_p)], None),
+    "get_error_state": ([], ctypes.c_int),
+    "get_error": ([ctypes.c_int, ctypes.c_char_p], None),
+    "reset_error_state": ([], None),
+    "set_log_callback": ([LOG_CALLBACK], None),
+    "set_mask": ([ctypes.c_void_p, MASKS], None),
+    "set_bottom_index": ([ctypes.c_void_p, INT_ARR_HORIZONTAL], None),
+
+    # Read access to variable attributes
+    "variable_get_metadata": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p], None),
+    "variable_get_background_value": ([ctypes.c_void_p], REAL),
+    "variable_get_missing_value": ([ctypes.c_void_p], REAL),
+    "variable_get_long_path": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p], None),
+    "variable_get_suitable_masters": ([ctypes.c_void_p, ctypes.c_void_p], ctypes.c_void_p),
+    "variable_get_output": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_is_required": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_get_no_river_dilution": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_get_no_precipitation_dilution": ([ctypes.c_void_p], ctypes.c_int),
+    "variable_get_property_type": ([ctypes.c_void_p, ctypes.c_char_p], ctypes.c_int),
+    "variable_get_real_property": ([ctypes.c_void_p, ctypes.c_char_p, REAL], REAL),
+    "variable_get_integer_property": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_int),
+    "variable_get_logical_property": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_int),
+    "find_standard_variable": ([ctypes.c_char_p], ctypes.c_void_p),
+
+    # Read/write/reset access to parameters.
+    "get_real_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], REAL),
+    "get_integer_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    "get_logical_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int], ctypes.c_int),
+    "get_string_parameter": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_char_p], None),
+    "reset_parameter": ([ctypes.c_void_p, ctypes.c_int], None),
+    "set_real_parameter": ([ctypes.c_void_p, ctypes.c_char_p, REAL], None),
+    "set_real_parameters": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_char_p, ARR_1D], None),
+    "set_integer_parameter": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], None),
+    "set_logical_parameter": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], None),
+    "set_string_parameter": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p], None),
+
+    # Read access to lists of variables (e.g., suitable coupling targets).
+    "link_list_count": ([ctypes.c_void_p], ctypes.c_int),
+    "link_list_index": ([ctypes.c_void_p, ctypes.c_int], ctypes.c_void_p),
+    "link_list_finalize": ([ctypes.c_void_p], None),
+
+    # Routines for sending pointers to state and dependency data.
+    "link_interior_state_data": ([ctypes.c_void_p, ctypes.c_int, ARR_INTERIOR], None),
+    "link_surface_state_data": ([ctypes.c_void_p, ctypes.c_int, ARR_HORIZONTAL], None),
+    "link_bottom_state_data": ([ctypes.c_void_p, ctypes.c_int, ARR_HORIZONTAL], None),
+    "link_interior_data": ([ctypes.c_void_p, ctypes.c_void_p, ARR_INTERIOR], None),
+    "link_horizontal_data": ([ctypes.c_void_p, ctypes.c_void_p, ARR_HORIZONTAL], None),
+    "link_scalar": ([ctypes.c_void_p, ctypes.c_void_p, ARR_0D], None),
+
+    # Read access to diagnostic data.
+    "get_interior_diagnostic_data": ([ctypes.c_void_p, ctypes.c_int], REAL_POINTER),
+    "get_horizontal_diagnostic_data": ([ctypes.c_void_p, ctypes.c_int], REAL_POINTER),
+    "get_jacobian_sparsity": ([ctypes.c_void_p, ctypes.c_int, INT_ARR_2D], None),
+    "get_schedule": ([ctypes.c_void_p, LOG_CALLBACK], None),
+    "set_contiguous_diagnostics": ([ctypes.c_void_p, ctypes.c_int], None),
+    "set_incremental": ([ctypes.c_void_p, ctypes.c_int], None),
+    "invalidate": ([ctypes.c_void_p, ctypes.c_void_p], None),
+    "require_data": ([ctypes.c_void_p, ctypes.c_void_p], None),
+    "get_standard_variable_data": ([ctypes.c_void_p, ctypes.c_void_p, c_int_p], REAL_POINTER),
+
+    "start": ([ctypes.c_void_p], None),
+
+    # Routine for retrieving source-sink terms for the interior domain.
+    "get_sources": ([ctypes.c_void_p, REAL, ARR_INTERIOR_EXT, ARR_HORIZONTAL_EXT, ARR_HORIZONTAL_EXT, ctypes.c_int, ctypes.c_int, ARR_INTERIOR], None),
+    "get_vertical_movement": ([ctypes.c_void_p, ARR_INTERIOR_EXT], None),
+    "get_conserved_quantities": ([ctypes.c_void_p, ARR_HORIZONTAL_EXT, ARR_INTERIOR], None),
+    "check_state": ([ctypes.c_void_p, ctypes.c_int], ctypes.c_int),
+    "check_state_points": ([ctypes.c_void_p, ctypes.c_int, BOOL_ARR_INTERIOR, INT_ARR_1D], ctypes.c_int),
+
+    # Routine for getting git repository version information.
+    "get_version": ([ctypes.c_int, ctypes.c_char_p], None),
+
+    "save_settings": ([ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int], ctypes.c_void_p),
+
+    # Only in 0D libraries
+    "integrate": ([ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ARR_1D, ARR_INTERIOR_EXT, ARR_INTERIOR_EXT2, REAL, ctypes.c_int, ctypes.c_int, ARR_INTERIOR, ctypes.c_int, ctypes.c_int, ARR_INTERIOR_EXT2, REAL, c_int_p, c_int_p], None),
+}
+# fmt: on
+
+_ndpointer_cache: Dict[Tuple[Any, int], type] = {}
+
+
+def _ndpointer(dtype: Any, ndim: int) -> type:
+    """Return a contiguous array type for use in argtypes. Types are shared
+    between all libraries, irrespective of their dimensionality."""
+    key = (dtype, ndim)
+    if key not in _ndpointer_cache:
+        _ndpointer_cache[key] = np.ctypeslib.ndpointer(
+            dtype=dtype, ndim=ndim, flags="CONTIGUOUS"
+        )
+    return _ndpointer_cache[key]
+
+
+class FABMLibrary(ctypes.CDLL):
+    """FABM shared library. Argument and return types of each routine are
+    set when the routine is first accessed, based on :data:`PROTOTYPES`."""
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") and name.endswith("__"):
+            raise AttributeError(name)
+        func = self[name]
+        if name in PROTOTYPES:
+            argtypes, restype = PROTOTYPES[name]
+            func.argtypes = [t for arg in argtypes for t in self._resolve_arg(arg)]
+            func.restype = self._resolve(restype)
+        setattr(self, name, func)
+        return func
+
+    def _resolve_arg(self, arg: Any) -> List[Any]:
+        if arg == LOCATION:
+            return [ctypes.c_int] * self.ndim_int
+        elif arg == MASKS:
+            # Horizontal mask, preceded by interior mask if mask_type is 2
+            masks = [INT_ARR_INTERIOR, INT_ARR_HORIZONTAL][-self.mask_type :]
+            return [self._resolve(mask) for mask in masks]
+        return [self._resolve(arg)]
+
+    def _resolve(self, t: Any) -> Any:
+        if not isinstance(t, str):
+            return t
+        if t == REAL:
+            return self.dtype
+        elif t == REAL_POINTER:
+            return ctypes.POINTER(self.dtype)
+        ndim, dtype = {
+            ARR_0D: (0, self.dtype),
+            ARR_1D: (1, self.dtype),
+            ARR_INTERIOR: (self.ndim_int, self.dtype),
+            ARR_HORIZONTAL: (self.ndim_hz, self.dtype),
+            ARR_INTERIOR_EXT: (self.ndim_int + 1, self.dtype),
+            ARR_HORIZONTAL_EXT: (self.ndim_hz + 1, self.dtype),
+            ARR_INTERIOR_EXT2: (self.ndim_int + 2, self.dtype),
+            INT_ARR_INTERIOR: (self.ndim_int, ctypes.c_int),
+            INT_ARR_HORIZONTAL: (self.ndim_hz, ctypes.c_int),
+            INT_ARR_1D: (1, ctypes.c_int),
+            INT_ARR_2D: (2, ctypes.c_int),
+            BOOL_ARR_INTERIOR: (self.ndim_int, np.bool_),
+        }[t]
+        return _ndpointer(dtype, ndim)
+
+
+def get_lib(name: str) -> FABMLibrary:
+    """Load the FABM library with the specified name or path, or return it
+    if it was loaded before.
+
+    Each dimension variant (0D, 1D, 2D, 3D) is a separate library, because
+    FABM is compiled with the number of dimensions and the depth index as
+    preprocessor settings. Variants therefore cannot share a single load;
+    what they do share is the table of prototypes (:data:`PROTOTYPES`) and
+    the array types built from it (:func:`_ndpointer`). Each variant is
+    loaded at most once per process, when the first model that needs it is
+    created.
+    """
     if name in name2lib:
         return name2lib[name]
 
@@ -78,19 +289,11 @@ def get_lib(name: str) -> ctypes.CDLL:
         path = _find_library(name)
 
     # Load FABM library.
-    lib = ctypes.CDLL(path)
+    lib = FABMLibrary(path)
     lib.dtype = ctypes.c_double
     lib.numpy_dtype = np.dtype(lib.dtype).newbyteorder("=")
 
     # Driver settings (number of spatial dimensions, depth index)
-    lib.get_driver_settings.argtypes = [
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-    ]
-    lib.get_driver_settings.restype = ctypes.c_void_p
-
     ndim_c = ctypes.c_int()
     idepthdim_c = ctypes.c_int()
     mask_type = ctypes.c_int()
@@ -109,322 +312,6 @@ def get_lib(name: str) -> ctypes.CDLL:
     lib.mask_type = mask_type.value
     lib.variable_bottom_index = variable_bottom_index.value != 0
 
-    CONTIGUOUS = "CONTIGUOUS"
-    arrtype0D = np.ctypeslib.ndpointer(dtype=lib.dtype, ndim=0, flags=CONTIGUOUS)
-    arrtype1D = np.ctypeslib.ndpointer(dtype=lib.dtype, ndim=1, flags=CONTIGUOUS)
-    arrtypeInterior = np.ctypeslib.ndpointer(
-        dtype=lib.dtype, ndim=ndim_int, flags=CONTIGUOUS
-    )
-    arrtypeHorizontal = np.ctypeslib.ndpointer(
-        dtype=lib.dtype, ndim=ndim_hz, flags=CONTIGUOUS
-    )
-    arrtypeInteriorExt = np.ctypeslib.ndpointer(
-        dtype=lib.dtype, ndim=ndim_int + 1, flags=CONTIGUOUS
-    )
-    arrtypeHorizontalExt = np.ctypeslib.ndpointer(
-        dtype=lib.dtype, ndim=ndim_hz + 1, flags=CONTIGUOUS
-    )
-    arrtypeInteriorExt2 = np.ctypeslib.ndpointer(
-        dtype=lib.dtype, ndim=ndim_int + 2, flags=CONTIGUOUS
-    )
-    arrtypeHorizontalExt2 = np.ctypeslib.ndpointer(
-        dtype=lib.dtype, ndim=ndim_hz + 2, flags=CONTIGUOUS
-    )
-
-    # Initialization
-    lib.create_model.argtypes = [ctypes.c_char_p] + [ctypes.c_int] * ndim_int
-    lib.create_model.restype = ctypes.c_void_p
-    if ndim_int > 0:
-        lib.set_domain_start.argtypes = [ctypes.c_void_p] + [ctypes.c_int] * ndim_int
-        lib.set_domain_start.restype = ctypes.c_void_p
-        lib.set_domain_stop.argtypes = [ctypes.c_void_p] + [ctypes.c_int] * ndim_int
-        lib.set_domain_stop.restype = ctypes.c_void_p
-
-    # Access to model objects (variables, parameters, dependencies, couplings,
-    # model instances)
-    lib.get_counts.argtypes = [
-        ctypes.c_void_p,
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-    ]
-    lib.get_counts.restype = None
-    lib.get_variable_metadata.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-    ]
-    lib.get_variable_metadata.restype = None
-    lib.set_variable_save.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_int,
-    ]
-    lib.set_variable_save.restype = None
-    lib.get_variable.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
-    lib.get_variable.restype = ctypes.c_void_p
-    lib.get_parameter_metadata.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.POINTER(ctypes.c_int),
-        ctypes.POINTER(ctypes.c_int),
-    ]
-    lib.get_parameter_metadata.restype = None
-    lib.get_model_metadata.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        ctypes.c_int,
-        ctypes.c_char_p,
-        ctypes.POINTER(ctypes.c_int),
-    ]
-    lib.get_model_metadata.restype = None
-    lib.get_coupling.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.POINTER(ctypes.c_void_p),
-        ctypes.POINTER(ctypes.c_void_p),
-    ]
-    lib.get_coupling.restype = None
-    lib.get_error_state.argtypes = []
-    lib.get_error_state.restype = ctypes.c_int
-    lib.get_error.argtypes = [ctypes.c_int, ctypes.c_char_p]
-    lib.get_error.restype = None
-    lib.reset_error_state.argtypes = []
-    lib.reset_error_state.restype = None
-    lib.set_log_callback.argtypes = [LOG_CALLBACK]
-    lib.set_log_callback.restype = None
-    if lib.mask_type == 1:
-        lib.set_mask.restype = None
-        lib.set_mask.argtypes = [
-            ctypes.c_void_p,
-            np.ctypeslib.ndpointer(dtype=ctypes.c_int, ndim=ndim_hz, flags=CONTIGUOUS),
-        ]
-    elif lib.mask_type == 2:
-        lib.set_mask.restype = None
-        lib.set_mask.argtypes = [
-            ctypes.c_void_p,
-            np.ctypeslib.ndpointer(dtype=ctypes.c_int, ndim=ndim_int, flags=CONTIGUOUS),
-            np.ctypeslib.ndpointer(dtype=ctypes.c_int, ndim=ndim_hz, flags=CONTIGUOUS),
-        ]
-    if lib.variable_bottom_index:
-        lib.set_bottom_index.restype = None
-        lib.set_bottom_index.argtypes = [
-            ctypes.c_void_p,
-            np.ctypeslib.ndpointer(dtype=ctypes.c_int, ndim=ndim_hz, flags=CONTIGUOUS),
-        ]
-
-    # Read access to variable attributes
-    lib.variable_get_metadata.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-    ]
-    lib.variable_get_metadata.restype = None
-    lib.variable_get_background_value.argtypes = [ctypes.c_void_p]
-    lib.variable_get_background_value.restype = lib.dtype
-    lib.variable_get_missing_value.argtypes = [ctypes.c_void_p]
-    lib.variable_get_missing_value.restype = lib.dtype
-    lib.variable_get_long_path.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_char_p,
-    ]
-    lib.variable_get_long_path.restype = None
-    lib.variable_get_suitable_masters.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-    lib.variable_get_suitable_masters.restype = ctypes.c_void_p
-    lib.variable_get_output.argtypes = [ctypes.c_void_p]
-    lib.variable_get_output.restype = ctypes.c_int
-    lib.variable_is_required.argtypes = [ctypes.c_void_p]
-    lib.variable_is_required.restype = ctypes.c_int
-    lib.variable_get_no_river_dilution.argtypes = [ctypes.c_void_p]
-    lib.variable_get_no_river_dilution.restype = ctypes.c_int
-    lib.variable_get_no_precipitation_dilution.argtypes = [ctypes.c_void_p]
-    lib.variable_get_no_precipitation_dilution.restype = ctypes.c_int
-    lib.variable_get_property_type.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-    lib.variable_get_property_type.restype = ctypes.c_int
-    lib.variable_get_real_property.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        lib.dtype,
-    ]
-    lib.variable_get_real_property.restype = lib.dtype
-    lib.variable_get_integer_property.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        ctypes.c_int,
-    ]
-    lib.variable_get_integer_property.restype = ctypes.c_int
-    lib.variable_get_logical_property.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        ctypes.c_int,
-    ]
-    lib.variable_get_logical_property.restype = ctypes.c_int
-    lib.find_standard_variable.argtypes = [ctypes.c_char_p]
-    lib.find_standard_variable.restype = ctypes.c_void_p
-
-    # Read/write/reset access to parameters.
-    lib.get_real_parameter.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
-    lib.get_real_parameter.restype = lib.dtype
-    lib.get_integer_parameter.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
-    lib.get_integer_parameter.restype = ctypes.c_int
-    lib.get_logical_parameter.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
-    lib.get_logical_parameter.restype = ctypes.c_int
-    lib.get_string_parameter.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_int,
-        ctypes.c_char_p,
-    ]
-    lib.get_string_parameter.restype = None
-    lib.reset_parameter.argtypes = [ctypes.c_void_p, ctypes.c_int]
-    lib.reset_parameter.restype = None
-    lib.set_real_parameter.argtypes = [ctypes.c_void_p, ctypes.c_char_p, lib.dtype]
-    lib.set_real_parameter.restype = None
-    lib.set_integer_parameter.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        ctypes.c_int,
-    ]
-    lib.set_integer_parameter.restype = None
-    lib.set_logical_parameter.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        ctypes.c_int,
-    ]
-    lib.set_logical_parameter.restype = None
-    lib.set_string_parameter.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_char_p,
-        ctypes.c_char_p,
-    ]
-    lib.set_string_parameter.restype = None
-
-    # Read access to lists of variables (e.g., suitable coupling targets).
-    lib.link_list_count.argtypes = [ctypes.c_void_p]
-    lib.link_list_count.restype = ctypes.c_int
-    lib.link_list_index.argtypes = [ctypes.c_void_p, ctypes.c_int]
-    lib.link_list_index.restype = ctypes.c_void_p
-    lib.link_list_finalize.argtypes = [ctypes.c_void_p]
-    lib.link_list_finalize.restype = None
-
-    # Routines for sending pointers to state and dependency data.
-    lib.link_interior_state_data.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        arrtypeInterior,
-    ]
-    lib.link_interior_state_data.restype = None
-    lib.link_surface_state_data.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        arrtypeHorizontal,
-    ]
-    lib.link_surface_state_data.restype = None
-    lib.link_bottom_state_data.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_int,
-        arrtypeHorizontal,
-    ]
-    lib.link_bottom_state_data.restype = None
-    lib.link_interior_data.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_void_p,
-        arrtypeInterior,
-    ]
-    lib.link_interior_data.restype = None
-    lib.link_horizontal_data.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_void_p,
-        arrtypeHorizontal,
-    ]
-    lib.link_horizontal_data.restype = None
-    lib.link_scalar.argtypes = [ctypes.c_void_p, ctypes.c_void_p, arrtype0D]
-    lib.link_scalar.restype = None
-
-    # Read access to diagnostic data.
-    lib.get_interior_diagnostic_data.argtypes = [ctypes.c_void_p, ctypes.c_int]
-    lib.get_interior_diagnostic_data.restype = ctypes.POINTER(lib.dtype)
-    lib.get_horizontal_diagnostic_data.argtypes = [ctypes.c_void_p, ctypes.c_int]
-    lib.get_horizontal_diagnostic_data.restype = ctypes.POINTER(lib.dtype)
-    lib.require_data.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
-    lib.require_data.restype = None
-    lib.get_standard_variable_data.argtypes = [
-        ctypes.c_void_p,
-        ctypes.c_void_p,
-        ctypes.POINTER(ctypes.c_int),
-    ]
-    lib.get_standard_variable_data.restype = ctypes.POINTER(lib.dtype)
-
-    lib.start.argtypes = [ctypes.c_void_p]
-    lib.start.restype = None
-
-    # Routine for retrieving source-sink terms for the interior domain.
-    lib.get_sources.argtypes = [
-        ctypes.c_void_p,
-        lib.dtype,
-        arrtypeInteriorExt,
-        arrtypeHorizontalExt,
-        arrtypeHorizontalExt,
-        ctypes.c_int,
-        ctypes.c_int,
-        arrtypeInterior,
-    ]
-    lib.get_sources.restype = None
-    lib.get_vertical_movement.argtypes = [ctypes.c_void_p, arrtypeInteriorExt]
-    lib.get_vertical_movement.restype = None
-    lib.get_conserved_quantities.argtypes = [
-        ctypes.c_void_p,
-        arrtypeHorizontalExt,
-        arrtypeInterior,
-    ]
-    lib.get_conserved_quantities.restype = None
-    lib.check_state.argtypes = [ctypes.c_void_p, ctypes.c_int]
-    lib.check_state.restype = ctypes.c_int
-
-    # Routine for getting git repository version information.
-    lib.get_version.argtypes = (ctypes.c_int, ctypes.c_char_p)
-    lib.get_version.restype = None
-
-    lib.save_settings.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
-    lib.save_settings.restype = ctypes.c_void_p
-
-    if ndim_int == 0:
-        lib.integrate.argtypes = [
-            ctypes.c_void_p,
-            ctypes.c_int,
-            ctypes.c_int,
-            arrtype1D,
-            arrtypeInteriorExt,
-            arrtypeInteriorExt2,
-            lib.dtype,
-            ctypes.c_int,
-            ctypes.c_int,
-            arrtypeInterior,
-        ]
-        lib.integrate.restype = None
-
     lib.set_log_callback(log_callback)
 
     name2lib[name] = lib
@@ -433,6 +320,9 @@ def get_lib(name: str) -> ctypes.CDLL:
 
 logger: Optional[logging.Logger] = None
 
+# Set to suppress all messages, e.g., while probing states with check_state
+_muted = False
+
 
 @LOG_CALLBACK
 def log_callback(msg: bytes):
@@ -440,6 +330,8 @@ def log_callback(msg: bytes):
 
 
 def log(msg: str):
+    if _muted:
+        return
     if logger is not None:
         logger.info(msg)
     else:
@@ -565,6 +457,34 @@ def printTree(
             log(f"{indent}{name} = {stringmapper(item)}")
 
 
+def color_columns(sparsity: np.ndarray) -> np.ndarray:
+    """Partition the columns of a sparse matrix into groups ("colors") of
+    structurally orthogonal columns: columns with the same color have no
+    nonzero element in a common row. In finite-difference Jacobians, all
+    columns with the same color can then be perturbed together. Columns are
+    colored greedily, starting with the most populated.
+
+    Args:
+        sparsity: boolean matrix with the pattern of nonzero elements
+
+    Returns:
+        the color of each column, from 0 to the number of colors minus one
+    """
+    sparsity = np.asarray(sparsity, dtype=bool)
+    colors = np.empty(sparsity.shape[1], dtype=int)
+    rows_per_color: List[np.ndarray] = []
+    for j in np.argsort(-sparsity.sum(axis=0), kind="stable"):
+        for color, rows in enumerate(rows_per_color):
+            if not (rows & sparsity[:, j]).any():
+                rows |= sparsity[:, j]
+                break
+        else:
+            color = len(rows_per_color)
+            rows_per_color.append(sparsity[:, j].copy())
+        colors[j] = color
+    return colors
+
+
 class VariableProperties:
     def __init__(self, model: "Model", variable_pointer: ctypes.c_void_p):
         self.model = model
@@ -677,6 +597,7 @@ class Dependency(VariableFromPointer):
         self._is_set = False
         self._link_function = link_function
         self._shape = shape
+        self._version = 0
 
     @property
     def value(self) -> Optional[np.ndarray]:
@@ -687,6 +608,13 @@ class Dependency(VariableFromPointer):
         if not self._is_set:
             self.link(np.empty(self._shape, dtype=self.model.fabm.numpy_dtype))
         self._data[...] = value
+        self.model._mark_changed((self,))
+
+    @property
+    def version(self) -> int:
+        """Number of times the value has been set or linked, or has been
+        reported changed with :meth:`Model.invalidate`."""
+        return self._version
 
     def link(self, data: np.ndarray):
         assert data.shape == self._shape, (
@@ -696,6 +624,7 @@ class Dependency(VariableFromPointer):
         self._data = data
         self._link_function(self.model.pmodel, self._pvariable, self._data)
         self._is_set = True
+        self.model._mark_changed((self,))
 
     @property
     def required(self) -> bool:
@@ -708,6 +637,7 @@ class StateVariable(VariableFromPointer):
     ):
         super().__init__(model, variable_pointer)
         self._data = data
+        self._version = 0
 
     @property
     def value(self) -> np.ndarray:
@@ -716,6 +646,13 @@ class StateVariable(VariableFromPointer):
     @value.setter
     def value(self, value: npt.ArrayLike):
         self._data[...] = value
+        self.model._mark_changed((self,))
+
+    @property
+    def version(self) -> int:
+        """Number of times the value has been set, or has been reported
+        changed with :meth:`Model.invalidate`."""
+        return self._version
 
     @property
     def background_value(self) -> float:
@@ -748,10 +685,20 @@ class DiagnosticVariable(VariableFromPointer):
         self._data = None
         self._horizontal = horizontal
         self._index = index + 1
+        self._save = self.output
+        self._row = None
 
     @property
     def value(self) -> Optional[np.ndarray]:
-        return self._data
+        return None if self._data is None else _fabm_array(self.model, self._data)
+
+    @property
+    def row(self) -> Optional[int]:
+        """Row with the value of this diagnostic in :attr:`Model.interior_diagnostics`
+        or :attr:`Model.horizontal_diagnostics`, or None if it is not saved.
+        Diagnostics that share their data (e.g., aliases of the same variable)
+        share a row."""
+        return self._row
 
     @property
     def output(self) -> bool:
@@ -767,9 +714,13 @@ class DiagnosticVariable(VariableFromPointer):
         self.model.fabm.set_variable_save(
             self.model.pmodel, vartype, self._index, 1 if value else 0
         )
+        self._save = bool(value)
+
+    def _get_save(self) -> bool:
+        return self._save
 
     #: Whether the value of this diagnostic must be calculated, for instance, for output
-    save: bool = property(fset=_set_save)
+    save: bool = property(_get_save, _set_save)
 
 
 class Parameter(Variable):
@@ -848,6 +799,33 @@ class Parameter(Variable):
             return None
         return self._get_value(default=True)
 
+    @property
+    def field(self) -> Optional[Dependency]:
+        """Dependency through which this parameter can be given a spatially
+        varying value (`None` if the model does not support this)"""
+        if self._type != DataType.REAL or self.name not in self.model.parameter_fields:
+            return None
+        return self.model.parameter_fields[self.name]
+
+    def link_field(self, data: np.ndarray):
+        """Use spatially varying values for this parameter, for instance,
+        to evaluate an ensemble of parameter values in a single call.
+        The values must be provided in the units of the parameter and take
+        precedence over :attr:`value`. This is only supported for parameters
+        of models that opt in, and must be done before the model is started."""
+        field = self.field
+        if field is None:
+            raise FABMException(
+                f"Parameter {self.name} cannot vary in space,"
+                " because its model does not support this."
+            )
+        if self.model._started:
+            raise FABMException(
+                f"The field for parameter {self.name} must be linked"
+                " before start is called."
+            )
+        field.link(data)
+
     def reset(self):
         """Reset this parameter to its default value"""
         settings = self.model._save_state()
@@ -871,7 +849,7 @@ class StandardVariable:
         else:
             shape = self.model.horizontal_domain.shape
         arr = np.ctypeslib.as_array(pdata, shape)
-        return arr.view(dtype=self.model.fabm.numpy_dtype)
+        return _fabm_array(self.model, arr.view(dtype=self.model.fabm.numpy_dtype))
 
 
 T = TypeVar("T")
@@ -963,18 +941,7 @@ class Coupling(VariableFromPointer):
     @property
     def options(self) -> Sequence[str]:
         if self._options is None:
-            self._options: List[str] = []
-            plist = self.model.fabm.variable_get_suitable_masters(
-                self.model.pmodel, self._psource
-            )
-            strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
-            for i in range(self.model.fabm.link_list_count(plist)):
-                variable = self.model.fabm.link_list_index(plist, i + 1)
-                self.model.fabm.variable_get_long_path(
-                    variable, ATTRIBUTE_LENGTH, strlong_name
-                )
-                self._options.append(strlong_name.value.decode("ascii"))
-            self.model.fabm.link_list_finalize(plist)
+            self.model._load_coupling_options()
         return self._options
 
 
@@ -989,6 +956,32 @@ class SubModel(object):
         self.user_created = iuser.value != 0
 
 
+class _ClosedLibrary:
+    """Stand-in for the FABM library of a model that has been closed."""
+
+    def __getattr__(self, name: str):
+        raise FABMException("This model has been closed and can no longer be used.")
+
+
+class _FABMMemory:
+    """Exposes an array that wraps memory owned by FABM through the NumPy
+    array interface, while holding a reference to the model that owns it."""
+
+    def __init__(self, model: "Model", data: np.ndarray):
+        self.model = model
+        self.__array_interface__ = data.__array_interface__
+
+
+def _fabm_array(model: "Model", data: np.ndarray) -> np.ndarray:
+    """Return a view of an array that wraps memory owned by FABM. The view
+    (and any array derived from it) keeps the model alive, so that the memory
+    is not released when the model is garbage-collected while still in use.
+    The model itself must store only the original array: NumPy arrays are
+    not tracked by the garbage collector, so a reference cycle through them
+    would never be collected."""
+    return np.asarray(_FABMMemory(model, data))
+
+
 class Model(object):
     def __init__(
         self,
@@ -1012,15 +1005,21 @@ class Model(object):
                 path = f.name
             delete = True
 
+        # Arguments needed to recreate the model (see __getstate__)
+        self._libname = libname
+        self._domain_start = start
+        self._domain_stop = stop
+
         if libname is None:
-            # Pick one of the built-in FABM libraries (0D or 1D)
+            # Pick one of the built-in FABM libraries (0D, 1D, 2D or 3D)
+            # In 2D and 3D, the first dimension is depth.
             ndim = len(shape)
-            if ndim > 1:
+            if ndim > 3:
                 raise FABMException(
                     f"Invalid domain shape {shape}."
-                    " Domain must have 0 or 1 dimensions."
+                    " Domain must have between 0 and 3 dimensions."
                 )
-            libname = {0: "fabm_0d", 1: "fabm_1d"}[ndim]
+            libname = f"fabm_{ndim}d"
 
         self.fabm = get_lib(libname)
 
@@ -1033,11 +1032,13 @@ class Model(object):
 
         self.fabm.reset_error_state()
         self._cell_thickness = None
-        self.pmodel = self.fabm.create_model(path.encode("ascii"), *shape[::-1])
+        self.pmodel = None
+        pmodel = self.fabm.create_model(path.encode("ascii"), *shape[::-1])
         if hasError():
             raise FABMException(
                 f"An error occurred while parsing {path}:\n{getError()}"
             )
+        self.pmodel = pmodel
         if start is not None:
             self.fabm.set_domain_start(self.pmodel, *[s + 1 for s in start[::-1]])
         if stop is not None:
@@ -1060,12 +1061,187 @@ class Model(object):
         self.interior_dependencies: NamedObjectList[Dependency] = NamedObjectList()
         self.horizontal_dependencies: NamedObjectList[Dependency] = NamedObjectList()
         self.scalar_dependencies: NamedObjectList[Dependency] = NamedObjectList()
+        self.parameter_fields: NamedObjectList[Dependency] = NamedObjectList()
         # fmt: on
 
+        self._linked_state = None
+        self._incremental = False
+        self._changed: Set[VariableFromPointer] = set()
+        self._changed_all = False
         self._update_configuration()
         self._mask = None
         self._bottom_index = None
 
+    def close(self):
+        """Release all memory held by the underlying FABM model, including its
+        diagnostic buffers. Afterwards, the model and its variables can no
+        longer be used. Calling this method more than once has no effect.
+
+        Arrays obtained earlier from the value of diagnostics or standard
+        variables are views of memory owned by FABM. They become invalid when
+        this method is called; copy them first if they are still needed.
+        This does not apply when the model is merely garbage-collected:
+        as long as such arrays exist, they keep the model alive."""
+        if self.pmodel is None:
+            return
+
+        # Diagnostic values are views of memory owned by FABM; drop them before
+        # that memory is released.
+        for variable in self.diagnostic_variables:
+            variable._data = None
+
+        # If the library was unloaded (see unload), its memory is already gone.
+        if any(lib is self.fabm for lib in name2lib.values()):
+            self.fabm.finalize_model(self.pmodel)
+        self.pmodel = None
+
+        # Variable wrappers keep a reference to the model and access FABM via
+        # its library attribute. Replace that with a stand-in that raises an
+        # exception instead of touching released memory.
+        self.fabm = _ClosedLibrary()
+
+    def __getstate__(self) -> Dict:
+        """Describe the model by its configuration (including any parameter
+        changes), domain, mask, bottom indices, state and environment.
+        This allows the model to be pickled, e.g., to send it to another
+        process. Memory owned by FABM is not included."""
+        return dict(
+            configuration=self._get_configuration(),
+            libname=self._libname,
+            shape=self.interior_domain_shape,
+            start=self._domain_start,
+            stop=self._domain_stop,
+            mask=self._mask,
+            bottom_index=self._bottom_index,
+            cell_thickness=self._cell_thickness,
+            settings=self._save_state(),
+            time=self.itime,
+            started=self._started,
+        )
+
+    def __setstate__(self, state: Dict):
+        self._create_from_configuration(
+            state["configuration"],
+            state["shape"],
+            state["libname"],
+            state["start"],
+            state["stop"],
+        )
+        if state["mask"] is not None:
+            self.link_mask(*state["mask"])
+        if state["bottom_index"] is not None:
+            self.link_bottom_index(state["bottom_index"])
+        if state["cell_thickness"] is not None:
+            self.link_cell_thickness(state["cell_thickness"])
+        self._restore_state(state["settings"])
+        if state["started"]:
+            self.start(verbose=False)
+        self.itime = state["time"]
+
+    def _get_configuration(self) -> bytes:
+        """Return the current model configuration as YAML, including any
+        parameter values that were changed after the model was created."""
+        import tempfile
+
+        fd, path = tempfile.mkstemp(suffix=".yaml", prefix="fabm")
+        os.close(fd)
+        try:
+            self.save_settings(path, DISPLAY_MINIMUM)
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            os.remove(path)
+
+    def _create_from_configuration(self, configuration: bytes, *args):
+        import tempfile
+
+        fd, path = tempfile.mkstemp(suffix=".yaml", prefix="fabm")
+        with os.fdopen(fd, "wb") as f:
+            f.write(configuration)
+        try:
+            self.__init__(path, *args)
+        finally:
+            os.remove(path)
+
+    def save_checkpoint(self, path: str):
+        """Save the model configuration, state, environment, mask, bottom
+        indices, cell thickness and time to a single binary (NumPy .npz) file.
+        The model can be returned to this point with :meth:`load_checkpoint`."""
+        import hashlib
+
+        configuration = self._get_configuration()
+        data = dict(
+            configuration=np.frombuffer(configuration, dtype=np.uint8),
+            configuration_hash=np.array(hashlib.sha1(configuration).hexdigest()),
+            time=np.array(self.itime),
+            started=np.array(self._started),
+            interior_state=self._interior_state,
+            surface_state=self._surface_state,
+            bottom_state=self._bottom_state,
+        )
+        if self._mask is not None:
+            for i, mask in enumerate(self._mask):
+                data[f"mask{i}"] = mask
+        if self._bottom_index is not None:
+            data["bottom_index"] = self._bottom_index
+        if self._cell_thickness is not None:
+            data["cell_thickness"] = self._cell_thickness
+        for dependency in self.dependencies + self.parameter_fields:
+            if dependency.value is not None:
+                data[f"dependency:{dependency.name}"] = dependency.value
+        with open(path, "wb") as f:
+            np.savez(f, **data)
+
+    def load_checkpoint(self, path: str):
+        """Restore the model to a point previously saved with
+        :meth:`save_checkpoint`. If the model configuration differs from the
+        one in the checkpoint (e.g., because parameters have been changed since),
+        the model is first recreated from the checkpointed configuration.
+        In that case, previously obtained variable and parameter objects can
+        no longer be used. Otherwise, only data are copied."""
+        import hashlib
+
+        with np.load(path) as data:
+            configuration = self._get_configuration()
+            if hashlib.sha1(configuration).hexdigest() != data["configuration_hash"]:
+                self.close()
+                self._create_from_configuration(
+                    data["configuration"].tobytes(),
+                    self.interior_domain_shape,
+                    self._libname,
+                    self._domain_start,
+                    self._domain_stop,
+                )
+            if "mask0" in data:
+                masks = [data[f"mask{i}"] for i in range(self.fabm.mask_type)]
+                self.mask = masks[0] if len(masks) == 1 else masks
+            if "bottom_index" in data:
+                self.bottom_index = data["bottom_index"]
+            if "cell_thickness" in data:
+                self.cell_thickness = data["cell_thickness"]
+            self.interior_state = data["interior_state"]
+            self.surface_state = data["surface_state"]
+            self.bottom_state = data["bottom_state"]
+            for dependency in self.dependencies + self.parameter_fields:
+                key = f"dependency:{dependency.name}"
+                if key in data:
+                    dependency.value = data[key]
+            if data["started"] and not self._started:
+                self.start()
+            self.itime = float(data["time"])
+
+    def __enter__(self) -> "Model":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        # Arrays handed out that wrap memory owned by FABM keep the model alive
+        # (see _fabm_array), so none of them can still be in use at this point.
+        if getattr(self, "pmodel", None) is not None:
+            self.close()
+
     def link_mask(self, *masks: np.ndarray):
         if self.fabm.mask_type == 0:
             raise FABMException(
@@ -1088,6 +1264,7 @@ class Model(object):
         )
         self._mask = masks
         self.fabm.set_mask(self.pmodel, *self._mask)
+        self.invalidate()
 
     @property
     def mask(self) -> Union[np.ndarray, Sequence[np.ndarray], None]:
@@ -1110,6 +1287,7 @@ class Model(object):
         for value, mask in zip(values, self._mask):
             if value is not mask:
                 mask[...] = value
+        self.invalidate()
 
     def link_bottom_index(self, indices: np.ndarray):
         if not self.fabm.variable_bottom_index:
@@ -1123,6 +1301,7 @@ class Model(object):
         )
         self._bottom_index = indices
         self.fabm.set_bottom_index(self.pmodel, self._bottom_index)
+        self.invalidate()
 
     @property
     def bottom_index(self) -> Optional[np.ndarray]:
@@ -1134,6 +1313,7 @@ class Model(object):
             self.link_bottom_index(np.ones(self.horizontal_domain_shape, dtype=np.intc))
         if indices is not self._bottom_index:
             self._bottom_index[...] = indices
+        self.invalidate()
 
     @property
     def state(self) -> np.ndarray:
@@ -1155,6 +1335,7 @@ class Model(object):
             )
         if value is not self._state:
             self._state[...] = value
+        self._mark_changed(self.state_variables)
 
     @property
     def interior_state(self) -> np.ndarray:
@@ -1164,6 +1345,7 @@ class Model(object):
     def interior_state(self, value: npt.ArrayLike):
         if value is not self._interior_state:
             self._interior_state[...] = value
+        self._mark_changed(self.interior_state_variables)
 
     @property
     def surface_state(self) -> np.ndarray:
@@ -1173,6 +1355,7 @@ class Model(object):
     def surface_state(self, value: npt.ArrayLike):
         if value is not self._surface_state:
             self._surface_state[...] = value
+        self._mark_changed(self.surface_state_variables)
 
     @property
     def bottom_state(self) -> np.ndarray:
@@ -1182,6 +1365,7 @@ class Model(object):
     def bottom_state(self, value: npt.ArrayLike):
         if value is not self._bottom_state:
             self._bottom_state[...] = value
+        self._mark_changed(self.bottom_state_variables)
 
     def link_cell_thickness(self, data: np.ndarray):
         assert (
@@ -1198,6 +1382,31 @@ class Model(object):
 
     cell_thickness = property(fset=setCellThickness)
 
+    def _load_coupling_options(self):
+        """Retrieve the possible targets of all couplings in one pass.
+        Couplings typically share most of their candidate targets; the path
+        of each candidate is retrieved only once."""
+        paths: Dict[int, str] = {}
+        strlong_name = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
+        for coupling in self.couplings:
+            if coupling._options is not None:
+                continue
+            options: List[str] = []
+            plist = self.fabm.variable_get_suitable_masters(
+                self.pmodel, coupling._psource
+            )
+            for i in range(self.fabm.link_list_count(plist)):
+                variable = self.fabm.link_list_index(plist, i + 1)
+                path = paths.get(variable)
+                if path is None:
+                    self.fabm.variable_get_long_path(
+                        variable, ATTRIBUTE_LENGTH, strlong_name
+                    )
+                    path = paths[variable] = strlong_name.value.decode("ascii")
+                options.append(path)
+            self.fabm.link_list_finalize(plist)
+            coupling._options = options
+
     def getSubModel(self, name: str) -> SubModel:
         return SubModel(self, name)
 
@@ -1207,20 +1416,108 @@ class Model(object):
 
     def _save_state(self) -> Tuple:
         environment = {}
-        for dependency in self.dependencies:
+        for dependency in self.dependencies + self.parameter_fields:
             if dependency.value is not None:
                 environment[dependency.name] = dependency.value
         state = {variable.name: variable.value for variable in self.state_variables}
-        return environment, state
+        save = {variable.name: variable.save for variable in self.diagnostic_variables}
+        return environment, state, save
 
     def _restore_state(self, data: Tuple):
-        environment, state = data
-        for dependency in self.dependencies:
+        environment, state, save = data
+        for dependency in self.dependencies + self.parameter_fields:
             if dependency.name in environment:
                 dependency.value = environment[dependency.name]
         for variable in self.state_variables:
             if variable.name in state:
                 variable.value = state[variable.name]
+        for variable in self.diagnostic_variables:
+            if variable.name in save and variable.save != save[variable.name]:
+                variable.save = save[variable.name]
+
+    def _get_state_shapes(
+        self, nstate_interior: int, nstate_surface: int, nstate_bottom: int
+    ) -> List[Tuple[int, ...]]:
+        if self.fabm.idepthdim == -1:
+            # No depth dimension, so interior and surface/bottom variables have
+            # the same shape. Values for all are stored in one contiguous array
+            nstate = nstate_interior + nstate_surface + nstate_bottom
+            return [(nstate,) + self.interior_domain_shape]
+        else:
+            # Surface/bottom variables have one dimension less than interior variables
+            # Values for each variable type are stored in a separate array.
+            return [
+                (nstate_interior,) + self.interior_domain_shape,
+                (nstate_surface,) + self.horizontal_domain_shape,
+                (nstate_bottom,) + self.horizontal_domain_shape,
+            ]
+
+    def _set_state_arrays(
+        self, nstate_interior: int, nstate_surface: int, nstate_bottom: int
+    ) -> bool:
+        """Set the arrays that hold state variable values. These are the arrays
+        provided to :meth:`link_state` if their shapes are valid, or newly
+        allocated arrays otherwise. Returns whether provided arrays are used."""
+        shapes = self._get_state_shapes(nstate_interior, nstate_surface, nstate_bottom)
+        arrays = self._linked_state
+        valid = arrays is None or [a.shape for a in arrays] == shapes
+        if arrays is None or not valid:
+            arrays = [np.empty(s, dtype=self.fabm.numpy_dtype) for s in shapes]
+        if len(arrays) == 1:
+            self._state = arrays[0]
+            self._interior_state = self._state[:nstate_interior, ...]
+            self._surface_state = self._state[
+                nstate_interior : nstate_interior + nstate_surface, ...
+            ]
+            self._bottom_state = self._state[nstate_interior + nstate_surface :, ...]
+        else:
+            self._state = None
+            self._interior_state, self._surface_state, self._bottom_state = arrays
+        return valid
+
+    def link_state(self, *arrays: np.ndarray):
+        """Use the provided arrays to store the values of all state variables,
+        for instance, to place them in shared memory. If interior and
+        surface/bottom variables have the same shape, a single array with
+        the shape of :attr:`state` must be provided. Otherwise, separate
+        arrays for interior, surface and bottom state variables must be
+        provided. Current state variable values are not copied."""
+        counts = (
+            len(self.interior_state_variables),
+            len(self.surface_state_variables),
+            len(self.bottom_state_variables),
+        )
+        shapes = self._get_state_shapes(*counts)
+        if len(arrays) != len(shapes):
+            raise FABMException(
+                f"link_state must be provided with {len(shapes)} arrays"
+            )
+        for array, shape in zip(arrays, shapes):
+            if (
+                array.shape != shape
+                or array.dtype != self.fabm.numpy_dtype
+                or not array.flags["C_CONTIGUOUS"]
+            ):
+                raise FABMException(
+                    f"link_state must be provided with C-contiguous arrays of"
+                    f" type {self.fabm.numpy_dtype} and shapes {shapes}"
+                )
+        self._linked_state = arrays
+        self._set_state_arrays(*counts)
+        self._link_state_data()
+        self._mark_changed(self.state_variables)
+
+    def _link_state_data(self):
+        """Send the location of the values of each state variable to FABM."""
+        for i, variable in enumerate(self.interior_state_variables):
+            variable._data = self._interior_state[i, ...]
+            self.fabm.link_interior_state_data(self.pmodel, i + 1, variable._data)
+        for i, variable in enumerate(self.surface_state_variables):
+            variable._data = self._surface_state[i, ...]
+            self.fabm.link_surface_state_data(self.pmodel, i + 1, variable._data)
+        for i, variable in enumerate(self.bottom_state_variables):
+            variable._data = self._bottom_state[i, ...]
+            self.fabm.link_bottom_state_data(self.pmodel, i + 1, variable._data)
 
     def _update_configuration(self, settings: Optional[Tuple] = None):
         # Get number of model variables per category
@@ -1250,40 +1547,16 @@ class Model(object):
             ctypes.byref(ncouplings),
         )
 
-        # Allocate memory for state variable values, and send ctypes.pointer to
-        # this memory to FABM.
-        if self.fabm.idepthdim == -1:
-            # No depth dimension, so interior and surface/bottom variables have
-            # the same shape. Store values for all together in one contiguous array
-            self._state = np.empty(
-                (nstate_interior.value + nstate_surface.value + nstate_bottom.value,)
-                + self.interior_domain_shape,
-                dtype=self.fabm.numpy_dtype,
-            )
-            self._interior_state = self._state[: nstate_interior.value, ...]
-            self._surface_state = self._state[
-                nstate_interior.value : nstate_interior.value + nstate_surface.value,
-                ...,
-            ]
-            self._bottom_state = self._state[
-                nstate_interior.value + nstate_surface.value :, ...
-            ]
-        else:
-            # Surface/bottom variables have one dimension less than interior variables
-            # Store values for each variable type in a separate array.
-            self._state = None
-            self._interior_state = np.empty(
-                (nstate_interior.value,) + self.interior_domain_shape,
-                dtype=self.fabm.numpy_dtype,
-            )
-            self._surface_state = np.empty(
-                (nstate_surface.value,) + self.horizontal_domain_shape,
-                dtype=self.fabm.numpy_dtype,
-            )
-            self._bottom_state = np.empty(
-                (nstate_bottom.value,) + self.horizontal_domain_shape,
-                dtype=self.fabm.numpy_dtype,
+        # Allocate memory for state variable values (or use memory provided
+        # earlier with link_state), and send ctypes.pointer to this memory to FABM.
+        if not self._set_state_arrays(
+            nstate_interior.value, nstate_surface.value, nstate_bottom.value
+        ):
+            log(
+                "Number of state variables has changed."
+                " Arrays previously provided to link_state are no longer used."
             )
+            self._linked_state = None
 
         # Retrieve variable metadata
         strname = ctypes.create_string_buffer(ATTRIBUTE_LENGTH)
@@ -1302,6 +1575,18 @@ class Model(object):
         self.interior_dependencies.clear()
         self.horizontal_dependencies.clear()
         self.scalar_dependencies.clear()
+        self.parameter_fields.clear()
+
+        def add_dependency(dependencies: NamedObjectList, dependency: Dependency):
+            # Fields of spatially varying parameters are kept apart from other
+            # dependencies: hosts do not need to provide them
+            # (see Parameter.link_field)
+            if self.fabm.variable_get_logical_property(
+                dependency._pvariable, b"parameter_field", 0
+            ):
+                dependencies = self.parameter_fields
+            dependencies._data.append(dependency)
+
         for i in range(nstate_interior.value):
             values = self._interior_state[i, ...]
             ptr = self.fabm.get_variable(self.pmodel, INTERIOR_STATE_VARIABLE, i + 1)
@@ -1333,20 +1618,22 @@ class Model(object):
             )
         for i in range(ndependencies_interior.value):
             ptr = self.fabm.get_variable(self.pmodel, INTERIOR_DEPENDENCY, i + 1)
-            self.interior_dependencies._data.append(
+            add_dependency(
+                self.interior_dependencies,
                 Dependency(
                     self, ptr, self.interior_domain_shape, self.fabm.link_interior_data
-                )
+                ),
             )
         for i in range(ndependencies_horizontal.value):
             ptr = self.fabm.get_variable(self.pmodel, HORIZONTAL_DEPENDENCY, i + 1)
-            self.horizontal_dependencies._data.append(
+            add_dependency(
+                self.horizontal_dependencies,
                 Dependency(
                     self,
                     ptr,
                     self.horizontal_domain_shape,
                     self.fabm.link_horizontal_data,
-                )
+                ),
             )
         for i in range(ndependencies_scalar.value):
             ptr = self.fabm.get_variable(self.pmodel, SCALAR_DEPENDENCY, i + 1)
@@ -1426,6 +1713,74 @@ class Model(object):
         self.bulk_diagnostic_variables = self.interior_diagnostic_variables
 
         self.itime = -1.0
+        self._started = False
+        self._diagnostic_blocks: Dict[bool, Optional[np.ndarray]] = {}
+
+    @property
+    def incremental(self) -> bool:
+        """Whether to evaluate the model incrementally. In incremental mode,
+        calls to biogeochemical models whose inputs have not changed since
+        the previous evaluation are skipped, and their previous outputs are
+        reused. This is beneficial if only some inputs change between
+        evaluations, e.g., when a few state variables are perturbed to
+        compute the Jacobian, or when dependencies change at different
+        frequencies.
+
+        Inputs changed by assigning to :attr:`state` (or
+        :attr:`interior_state`, etc.), to the ``value`` of a state variable
+        or dependency, or by linking new data, are detected automatically.
+        Changes made in place, e.g., by modifying the array returned by
+        ``value`` or by assigning to part of :attr:`state`, must be
+        reported with :meth:`invalidate`."""
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, value: bool):
+        self._incremental = bool(value)
+        self._changed.clear()
+        self._changed_all = False
+        if self._started:
+            self.fabm.set_incremental(self.pmodel, self._incremental)
+            if hasError():
+                raise FABMException(getError())
+
+    def invalidate(self, *variables: Union[str, StateVariable, Dependency]):
+        """Report that the values of the specified state variables or
+        dependencies have been changed in place, so that everything that
+        depends on them is recomputed by the next incremental evaluation.
+        Without arguments, all inputs are considered changed.
+        See :attr:`incremental`."""
+        inputs = self.state_variables + self.dependencies + self.parameter_fields
+        if not variables:
+            self._changed_all = self._incremental
+            for variable in inputs:
+                variable._version += 1
+            return
+        self._mark_changed([inputs[v] if isinstance(v, str) else v for v in variables])
+
+    def _mark_changed(self, variables: Iterable[Union[StateVariable, Dependency]]):
+        for variable in variables:
+            variable._version += 1
+            if self._incremental:
+                self._changed.add(variable)
+
+    def _state_changed(self, indices: Optional[Iterable[int]] = None):
+        """Report in-place changes to all state variables, or to those with
+        the specified indices into :attr:`state_variables`."""
+        if indices is None:
+            self._mark_changed(self.state_variables)
+        else:
+            self._mark_changed([self.state_variables[i] for i in indices])
+
+    def _invalidate_changed_inputs(self):
+        """Pass changed inputs on to FABM before an incremental evaluation."""
+        if self._changed_all:
+            self.fabm.invalidate(self.pmodel, None)
+        else:
+            for variable in self._changed:
+                self.fabm.invalidate(self.pmodel, variable._pvariable)
+        self._changed.clear()
+        self._changed_all = False
 
     def getRates(self, t: Optional[float] = None, surface: bool = True, bottom: bool = True):
         """Returns the local rate of change in state variables,
@@ -1445,9 +1800,14 @@ class Model(object):
             len(self.interior_state_variables) + len(self.surface_state_variables) :,
             ...,
         ]
-        assert not (
-            (surface or bottom) and self._cell_thickness is None
-        ), "You must assign model.cell_thickness to use getRates"
+        cell_thickness = self._cell_thickness
+        if cell_thickness is None:
+            assert not (
+                surface or bottom
+            ), "You must assign model.cell_thickness to use getRates"
+            # Only used to convert surface and bottom fluxes
+            cell_thickness = np.empty(self.interior_domain_shape)
+        self._invalidate_changed_inputs()
         self.fabm.get_sources(
             self.pmodel,
             t,
@@ -1456,7 +1816,7 @@ class Model(object):
             sources_bottom,
             surface,
             bottom,
-            self._cell_thickness,
+            cell_thickness,
         )
         if hasError():
             raise FABMException(getError())
@@ -1478,6 +1838,7 @@ class Model(object):
         assert (
             self._cell_thickness is not None
         ), "You must assign model.cell_thickness to use get_sources"
+        self._invalidate_changed_inputs()
         self.fabm.get_sources(
             self.pmodel,
             t,
@@ -1492,9 +1853,21 @@ class Model(object):
             raise FABMException(getError())
         return sources_interior, sources_surface, sources_bottom
 
+    async def aget_sources(
+        self,
+        t: Optional[float] = None,
+        out: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Version of :meth:`get_sources` for use in :mod:`asyncio` code. The
+        sources are computed on a worker thread (see :mod:`pyfabm.aio`)."""
+        from . import aio
+
+        return await aio.run(self.get_sources, t, out)
+
     def get_vertical_movement(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         if out is None:
             out = np.empty_like(self._interior_state)
+        self._invalidate_changed_inputs()
         self.fabm.get_vertical_movement(self.pmodel, out)
         if hasError():
             raise FABMException(getError())
@@ -1509,48 +1882,352 @@ class Model(object):
                 (len(self.conserved_quantities),) + self.horizontal_domain_shape,
                 dtype=self.fabm.numpy_dtype,
             )
+        self._invalidate_changed_inputs()
         self.fabm.get_conserved_quantities(self.pmodel, out, self._cell_thickness)
         if hasError():
             raise FABMException(getError())
         return out
 
+    async def aget_conserved_quantities(
+        self, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Version of :meth:`get_conserved_quantities` for use in
+        :mod:`asyncio` code (see :mod:`pyfabm.aio`)."""
+        from . import aio
+
+        return await aio.run(self.get_conserved_quantities, out)
+
     def check_state(self, repair: bool = False) -> bool:
+        self._invalidate_changed_inputs()
         valid = self.fabm.check_state(self.pmodel, repair) != 0
         if hasError():
             raise FABMException(getError())
+        if repair and not valid:
+            self._state_changed()
         return valid
 
     checkState = check_state
 
-    def getJacobian(self, pert: Union[float, np.ndarray, None] = None):
+    def check_state_points(
+        self,
+        repair: bool = False,
+        out: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> Tuple[bool, np.ndarray, np.ndarray]:
+        """Check the state throughout the domain and report where it is
+        invalid. Unlike :meth:`check_state`, this continues past the first
+        invalid point if ``repair`` is not set.
+
+        Args:
+            repair: whether to repair invalid values (typically by clipping)
+            out: arrays to store the validity mask and repair counts in
+
+        Returns:
+            a tuple with whether the entire state was valid, a boolean mask
+            with the shape of the interior domain that is set where the state
+            is valid, and the number of values of each state variable that
+            lay outside their valid range (and were repaired if ``repair``
+            is set), in the order of :attr:`state_variables`. If the domain
+            has a depth dimension, invalid surface or bottom values mark the
+            entire water column as invalid. Custom checks of biogeochemical
+            models that flag the state as invalid without changing values
+            mark the point as invalid, but are not counted.
+        """
+        if out is None:
+            valid_mask = np.empty(self.interior_domain_shape, dtype=bool)
+            counts = np.empty(len(self.state_variables), dtype=np.intp)
+        else:
+            valid_mask, counts = out
+        counts_c = np.empty(len(self.state_variables), dtype=ctypes.c_int)
+        self._invalidate_changed_inputs()
+        ok = self.fabm.check_state_points(self.pmodel, repair, valid_mask, counts_c)
+        valid = ok != 0
+        if hasError():
+            raise FABMException(getError())
+        if repair and not valid:
+            self._state_changed()
+        counts[...] = counts_c
+        return valid, valid_mask, counts
+
+    def getJacobian(
+        self, pert: Union[float, np.ndarray, None] = None, sparse: bool = False
+    ):
+        """Jacobian of the rates of change with respect to the state, computed
+        by finite differences. If ``sparse`` is set, state variables that do not
+        affect the same rates (see :meth:`jacobian_sparsity`) are perturbed
+        together, which reduces the number of evaluations of the rates."""
         # Define perturbation per state variable.
         y_pert = np.empty_like(self.state)
         if pert is None:
             pert = 1e-6
         y_pert[:] = pert
 
+        # Determine which state variables can be perturbed simultaneously
+        n = len(self.state)
+        if sparse:
+            sparsity = self.jacobian_sparsity()
+            colors = color_columns(sparsity)
+        else:
+            sparsity = np.ones((n, n), dtype=bool)
+            colors = np.arange(n)
+
         # Compute dy for original state (used as reference for finite
         # differences later on)
         dy_ori = self.getRates()
 
         # Create memory for Jacobian
-        Jac = np.empty((len(self.state), len(self.state)), dtype=self.state.dtype)
+        Jac = np.zeros((n, n), dtype=self.state.dtype)
 
-        for i in range(len(self.state)):
-            # Save original state variable value, create perturbed one.
-            y_ori = self.state[i]
-            self.state[i] += y_pert[i]
+        for color in range(colors.max(initial=-1) + 1):
+            # Save original state variable values, create perturbed ones.
+            columns = np.flatnonzero(colors == color)
+            y_ori = self.state[columns]
+            self.state[columns] += y_pert[columns]
+            self._state_changed(columns)
 
             # Compute dy for perturbed state, compute Jacobian elements using
             # finite difference.
             dy_pert = self.getRates()
-            Jac[:, i] = (dy_pert - dy_ori) / y_pert[i]
+            for i in columns:
+                rows = sparsity[:, i]
+                Jac[rows, i] = (dy_pert[rows] - dy_ori[rows]) / y_pert[i]
 
-            # Restore original state variable value.
-            self.state[i] = y_ori
+            # Restore original state variable values.
+            self.state[columns] = y_ori
+            self._state_changed(columns)
 
         return Jac
 
+    def jacobian_sparsity(self) -> np.ndarray:
+        """Sparsity pattern of the Jacobian of the rates of change with respect
+        to the state, derived from FABM's dependency graph. Element ``[i, j]``
+        is True if the rate of state variable ``i`` may depend on state variable
+        ``j``. Rows and columns are ordered as :attr:`state_variables`.
+
+        The pattern can be used to compute the Jacobian with fewer evaluations
+        (:func:`color_columns`), or by implicit solvers that use sparse
+        factorization, e.g., as ``jac_sparsity`` of
+        :func:`scipy.integrate.solve_ivp`."""
+        if not self._started:
+            raise FABMException(
+                "The Jacobian sparsity is only available after start is called."
+            )
+        n = len(self.state_variables)
+        sparsity = np.empty((n, n), dtype=ctypes.c_int)
+        self.fabm.get_jacobian_sparsity(self.pmodel, n, sparsity)
+        if hasError():
+            raise FABMException(getError())
+        return sparsity != 0
+
+    def get_schedule(self) -> "pyfabm.schedule.Schedule":
+        """Jobs, tasks and calls by which FABM computes its outputs, with the
+        variables each call reads and writes and the number of times each
+        call has been made so far. See :mod:`pyfabm.schedule`."""
+        import pyfabm.schedule
+
+        if not self._started:
+            raise FABMException("The schedule is only available after start is called.")
+        records: List[str] = []
+
+        @LOG_CALLBACK
+        def add_record(record: bytes):
+            records.append(record.decode())
+
+        self.fabm.get_schedule(self.pmodel, add_record)
+        if hasError():
+            raise FABMException(getError())
+        return pyfabm.schedule.Schedule.from_records(records)
+
+    def find_steady_state(
+        self,
+        t: Optional[float] = None,
+        rtol: float = 1e-10,
+        atol: float = 1e-15,
+        dt: float = 86400.0,
+        dt_max: float = 1e12,
+        max_iterations: int = 100,
+        perturbation: float = 1e-7,
+        max_backtracks: int = 20,
+        verbose: bool = False,
+    ) -> bool:
+        """Find the state at which all rates of change vanish, starting from
+        the current state. This uses pseudo-transient continuation: damped
+        Newton iterations ``(I/dt - J) dx = f`` in which the pseudo time step
+        ``dt`` grows as the rates decrease, so that the final iterations are
+        regular Newton steps. All points of the domain are solved for at
+        once, with a Jacobian computed by finite differences that perturb
+        state variables at all points simultaneously. State variables that
+        do not affect the same rates (see :meth:`jacobian_sparsity`) are
+        perturbed together. After each step, the
+        state is made valid (e.g., non-negative) with :meth:`check_state`.
+
+        Args:
+            t: time to evaluate the rates at (default: current time)
+            rtol: relative tolerance for the rates of change (s-1)
+            atol: absolute tolerance for the rates of change (state units s-1)
+            dt: initial pseudo time step (s)
+            dt_max: maximum pseudo time step (s)
+            max_iterations: maximum number of Newton iterations
+            perturbation: relative perturbation of state variables used to
+                compute the Jacobian
+            max_backtracks: maximum number of times a step is halved to keep
+                the state valid, before the state is repaired instead
+            verbose: whether to report progress
+
+        Returns:
+            whether a steady state was found at all points. The model state
+            is set to the final iterate in either case.
+        """
+        global _muted
+        if self._state is None:
+            raise FABMException(
+                "find_steady_state requires interior and surface/bottom state"
+                " variables to have the same shape."
+            )
+        if t is None:
+            t = self.itime
+        nvar = self._state.shape[0]
+        x = self._state.reshape(nvar, -1)
+        identity = np.eye(nvar)
+        sparsity = self.jacobian_sparsity()
+        colors = color_columns(sparsity)
+        ncolors = colors.max(initial=-1) + 1
+
+        def get_rates() -> np.ndarray:
+            return self.getRates(t).reshape(nvar, -1)
+
+        def get_residual(f: np.ndarray) -> np.ndarray:
+            # Maximum scaled rate per point; <= 1 indicates convergence
+            return np.max(np.abs(f) / (rtol * np.abs(x) + atol), axis=0)
+
+        self.check_state(repair=True)
+        f = get_rates()
+        nevaluations = 1
+        residual = get_residual(f)
+        dts = np.full(x.shape[1], dt)
+        for iteration in range(max_iterations):
+            active = ~(residual <= 1.0)
+            if verbose:
+                log(
+                    f"Iteration {iteration}: maximum scaled rate {residual.max():.3g},"
+                    f" {active.sum()} of {active.size} points active."
+                )
+            if not active.any():
+                break
+
+            # Jacobian (one matrix per point), with all state variables of
+            # one color perturbed at all points simultaneously
+            jac = np.zeros((x.shape[1], nvar, nvar), dtype=x.dtype)
+            for color in range(ncolors):
+                columns = np.flatnonzero(colors == color)
+                x_ori = x[columns].copy()
+                scale = np.abs(x_ori).max(axis=1, keepdims=True)
+                scale[scale == 0.0] = 1.0
+                x[columns] += perturbation * np.maximum(np.abs(x_ori), 0.01 * scale)
+                self._state_changed(columns)
+                h = x[columns] - x_ori
+                df = get_rates() - f
+                for j, h_j in zip(columns, h):
+                    rows = sparsity[:, j]
+                    jac[:, rows, j] = (df[rows] / h_j).T
+                x[columns] = x_ori
+                self._state_changed(columns)
+            nevaluations += ncolors
+
+            # Growing modes (eigenvalues with positive real part) would change
+            # sign in an implicit step longer than their time scale. Limit the
+            # time step accordingly, so growth is followed rather than reversed.
+            growth = np.linalg.eigvals(jac[active]).real.max(axis=-1)
+            dt_active = dts[active]
+            limited = growth > 0.0
+            dt_active[limited] = np.minimum(dt_active[limited], 0.5 / growth[limited])
+
+            # Pseudo-transient step
+            x_old = x.copy()
+            a = identity / dt_active[:, np.newaxis, np.newaxis] - jac[active]
+            try:
+                dx = np.linalg.solve(a, f[:, active].T[..., np.newaxis])[..., 0]
+            except np.linalg.LinAlgError:
+                dts[active] *= 0.1
+                continue
+            # Backtrack until the state is valid, e.g., non-negative
+            step = 1.0
+            for _ in range(max_backtracks):
+                x[:, active] = x_old[:, active] + step * dx.T
+                self._state_changed()
+                _muted = True
+                try:
+                    valid = self.check_state()
+                finally:
+                    _muted = False
+                if valid:
+                    break
+                step *= 0.5
+            else:
+                self.check_state(repair=True)
+            f_new = get_rates()
+            nevaluations += 1
+            residual_new = get_residual(f_new)
+
+            # Reject steps that produce invalid rates and retry with smaller time step.
+            # Otherwise, increase the time step with the reduction in rates
+            # (switched evolution relaxation). Increases in rates do not shorten
+            # the time step, as these are expected while growing modes develop.
+            failed = active & ~np.isfinite(residual_new)
+            if failed.any():
+                x[:, failed] = x_old[:, failed]
+                self._state_changed()
+                dts[failed] *= 0.1
+                self.check_state(repair=True)
+                f_new = get_rates()
+                nevaluations += 1
+                residual_new = get_residual(f_new)
+            accepted = active & ~failed
+            norm_old = np.linalg.norm(f[:, accepted], axis=0)
+            norm_new = np.linalg.norm(f_new[:, accepted], axis=0)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = np.where(norm_new > 0.0, norm_old / norm_new, 10.0)
+            dts[accepted] = np.minimum(
+                dts[accepted] * np.clip(ratio, 1.0, 10.0), dt_max
+            )
+            f, residual = f_new, residual_new
+
+        converged = bool(np.all(residual <= 1.0))
+        if verbose:
+            log(
+                f"Steady state {'found' if converged else 'not found'}"
+                f" after {nevaluations} evaluations of the rates of change."
+            )
+        return converged
+
+    def set_parameters(self, values: Mapping[str, Union[float, int, bool, str]]):
+        """Set the values of multiple parameters. Assigning
+        :attr:`Parameter.value` re-initializes the model for every
+        parameter; here, the model is re-initialized once for all real
+        parameters. This makes it cheaper to evaluate many parameter sets,
+        e.g., in sensitivity analysis or calibration.
+
+        Args:
+            values: values by parameter name
+        """
+        reals = {}
+        for name, value in values.items():
+            parameter = self.parameters[name]
+            if parameter._type == DataType.REAL:
+                reals[parameter.name] = value
+            else:
+                parameter.value = value
+        if not reals:
+            return
+        settings = self._save_state()
+        names = b"".join(
+            name.encode("ascii").ljust(ATTRIBUTE_LENGTH, b"\0") for name in reals
+        )
+        data = np.array(list(reals.values()), dtype=self.fabm.numpy_dtype)
+        self.fabm.set_real_parameters(self.pmodel, len(reals), names, data)
+        if hasError():
+            raise FABMException(getError())
+        self._update_configuration(settings)
+
     def findParameter(self, name: str, case_insensitive: bool = False):
         return self.parameters.find(name, case_insensitive)
 
@@ -1584,6 +2261,77 @@ class Model(object):
             parent[pathcomps[-1]] = parameter
         return root
 
+    def select_diagnostics(
+        self, patterns: Union[str, Iterable[str]], verbose: bool = True
+    ) -> NamedObjectList[DiagnosticVariable]:
+        """Select the diagnostics that must be calculated and stored, and
+        disable all others. This must be done before :meth:`start`.
+
+        Args:
+            patterns: one or more shell-style patterns (e.g., ``"phy/*"``)
+                matched against the name and output name of each diagnostic.
+                ``"all"`` selects all diagnostics, ``"output"`` those that
+                are included in output by default, and ``"none"`` disables
+                all diagnostics, which allows FABM to skip all work that is
+                needed only to calculate diagnostics.
+            verbose: whether to report the number of selected diagnostics
+                and the estimated savings
+
+        Returns:
+            The selected diagnostics
+        """
+        if self._started:
+            raise FABMException("Diagnostics must be selected before start is called.")
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        patterns = list(patterns)
+
+        unused_patterns = set(patterns) - {"all", "output", "none"}
+
+        def is_selected(variable: DiagnosticVariable) -> bool:
+            selected = False
+            for pattern in patterns:
+                if pattern == "all" or (pattern == "output" and variable.output):
+                    selected = True
+                elif fnmatch.fnmatchcase(variable.name, pattern) or (
+                    fnmatch.fnmatchcase(variable.output_name, pattern)
+                ):
+                    unused_patterns.discard(pattern)
+                    selected = True
+            return selected
+
+        interior_size = int(np.prod(self.interior_domain_shape))
+        horizontal_size = int(np.prod(self.horizontal_domain_shape))
+        selected = []
+        nsaved_old = 0
+        nvalues_old = 0
+        nvalues_new = 0
+        for variable in self.diagnostic_variables:
+            size = horizontal_size if variable._horizontal else interior_size
+            if variable.save:
+                nsaved_old += 1
+                nvalues_old += size
+            save = is_selected(variable)
+            if save:
+                selected.append(variable)
+                nvalues_new += size
+            if save != variable.save:
+                variable.save = save
+
+        for pattern in unused_patterns:
+            log(f"Pattern {pattern} does not match any diagnostic.")
+        if verbose:
+            nbytes = (nvalues_old - nvalues_new) * self.fabm.numpy_dtype.itemsize
+            log(
+                f"Selected {len(selected)} of {len(self.diagnostic_variables)}"
+                f" diagnostics (previously {nsaved_old})."
+            )
+            log(
+                f"Estimated savings: {nsaved_old - len(selected)} fewer diagnostics"
+                f" to compute and store per call, {nbytes / 1024:.1f} kB less memory."
+            )
+        return NamedObjectList(selected)
+
     def start(self, verbose: bool = True, stop: bool = False) -> bool:
         ready = True
         if self.fabm.mask_type and self._mask is None:
@@ -1606,26 +2354,106 @@ class Model(object):
         ready = process_dependencies(self.scalar_dependencies) and ready
         assert ready or not stop, "Not all dependencies have been fulfilled."
 
+        if not self._started:
+            # Have FABM place the saved diagnostics in consecutive entries of
+            # its store, so that they can be accessed as a single block.
+            self.fabm.set_contiguous_diagnostics(self.pmodel, 1)
         self.fabm.start(self.pmodel)
         if hasError():
             return False
-        for i, variable in enumerate(self.interior_diagnostic_variables):
-            pdata = self.fabm.get_interior_diagnostic_data(self.pmodel, i + 1)
-            if pdata:
-                arr = np.ctypeslib.as_array(pdata, self.interior_domain_shape)
-                variable._data = arr.view(dtype=self.fabm.numpy_dtype)
-            else:
-                variable._data = None
-        for i, variable in enumerate(self.horizontal_diagnostic_variables):
-            pdata = self.fabm.get_horizontal_diagnostic_data(self.pmodel, i + 1)
+        self._started = True
+        if self._incremental:
+            self.fabm.set_incremental(self.pmodel, True)
+            self._changed.clear()
+            self._changed_all = False
+        self._diagnostic_blocks[False] = self._link_diagnostics(horizontal=False)
+        self._diagnostic_blocks[True] = self._link_diagnostics(horizontal=True)
+        return ready
+
+    checkReady = start
+
+    def _link_diagnostics(self, horizontal: bool) -> Optional[np.ndarray]:
+        """Point all interior or horizontal diagnostics to their data in FABM.
+        Returns the data of the saved diagnostics as a single array with
+        shape ``(nrow,) + domain_shape``, with one row per distinct data
+        field, or None if these fields are not stored consecutively."""
+        if horizontal:
+            variables = self.horizontal_diagnostic_variables
+            shape = self.horizontal_domain_shape
+            get_data = self.fabm.get_horizontal_diagnostic_data
+        else:
+            variables = self.interior_diagnostic_variables
+            shape = self.interior_domain_shape
+            get_data = self.fabm.get_interior_diagnostic_data
+        address2row: Dict[int, int] = {}
+        for variable in variables:
+            pdata = get_data(self.pmodel, variable._index)
             if pdata:
-                arr = np.ctypeslib.as_array(pdata, self.horizontal_domain_shape)
+                arr = np.ctypeslib.as_array(pdata, shape)
                 variable._data = arr.view(dtype=self.fabm.numpy_dtype)
             else:
                 variable._data = None
-        return ready
+            variable._row = None
+            if variable.save and variable._data is not None:
+                address = variable._data.ctypes.data
+                variable._row = address2row.setdefault(address, len(address2row))
+        if not address2row:
+            return np.empty((0,) + shape, dtype=self.fabm.numpy_dtype)
+        nbytes = int(np.prod(shape, dtype=int)) * self.fabm.numpy_dtype.itemsize
+        start = min(address2row)
+        for address, row in address2row.items():
+            if address != start + row * nbytes:
+                return None
+        first = next(v for v in variables if v._row == 0)
+        pdata = get_data(self.pmodel, first._index)
+        arr = np.ctypeslib.as_array(pdata, (len(address2row),) + shape)
+        block = arr.view(dtype=self.fabm.numpy_dtype)
+        for variable in variables:
+            if variable._row is not None:
+                variable._data = block[variable._row, ...]
+        return block
+
+    def _get_diagnostic_block(self, horizontal: bool) -> np.ndarray:
+        if not self._started:
+            raise FABMException("Diagnostics are only available after start is called.")
+        block = self._diagnostic_blocks[horizontal]
+        if block is None:
+            kind = "horizontal" if horizontal else "interior"
+            raise FABMException(
+                f"The saved {kind} diagnostics are not stored as a single block"
+                " by FABM. Use the value of the individual diagnostics instead."
+            )
+        return _fabm_array(self, block)
 
-    checkReady = start
+    @property
+    def interior_diagnostics(self) -> np.ndarray:
+        """Values of all saved interior diagnostics as a single contiguous
+        array with shape ``(nrow,) + interior_domain_shape``. Its rows
+        correspond to the interior diagnostics with :attr:`~DiagnosticVariable.save`
+        set, in the order of :attr:`interior_diagnostic_variables`, except
+        that diagnostics that share their data have a single row.
+        :attr:`DiagnosticVariable.row` gives the row of each diagnostic.
+        This array is FABM's own storage for these diagnostics: FABM writes
+        into it during every evaluation, and the value of each saved
+        diagnostic is a view of one of its rows. It is therefore always up
+        to date and never copied. Like those values, it becomes invalid when
+        the model is closed."""
+        return self._get_diagnostic_block(horizontal=False)
+
+    @property
+    def horizontal_diagnostics(self) -> np.ndarray:
+        """Values of all saved horizontal diagnostics as a single contiguous
+        array with shape ``(nrow,) + horizontal_domain_shape``. Its rows
+        correspond to the horizontal diagnostics with :attr:`~DiagnosticVariable.save`
+        set, in the order of :attr:`horizontal_diagnostic_variables`, except
+        that diagnostics that share their data have a single row.
+        :attr:`DiagnosticVariable.row` gives the row of each diagnostic.
+        This array is FABM's own storage for these diagnostics: FABM writes
+        into it during every evaluation, and the value of each saved
+        diagnostic is a view of one of its rows. It is therefore always up
+        to date and never copied. Like those values, it becomes invalid when
+        the model is closed."""
+        return self._get_diagnostic_block(horizontal=True)
 
     def updateTime(self, nsec: float):
         self.itime = nsec
@@ -1670,8 +2498,47 @@ class Simulator(object):
         dt: float,
         surface: bool = True,
         bottom: bool = True,
-    ):
+        audit_interval: Optional[int] = None,
+        drift_tolerance: Optional[float] = None,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Integrate the model state in time with the forward Euler scheme.
+
+        Args:
+            y0: initial state
+            t: times at which to return the state
+            dt: time step
+            surface: whether to include surface sources
+            bottom: whether to include bottom sources
+            audit_interval: if provided, the totals of all conserved quantities
+                are computed every ``audit_interval`` time steps, starting
+                with the initial state, within the compiled time loop
+            drift_tolerance: if provided, stop the integration as soon as
+                the total of any conserved quantity deviates from its initial
+                value by more than this fraction of that initial value.
+                This requires ``audit_interval``.
+
+        Returns:
+            the state at the requested times, with shape ``(nt, nstate)``.
+            If ``audit_interval`` is provided, a tuple with this state and
+            the totals of conserved quantities, with shape
+            ``(naudit, nconserved)``. If the integration stopped early, both
+            include only the times reached.
+        """
+        if drift_tolerance is not None and audit_interval is None:
+            raise FABMException(
+                "drift_tolerance requires audit_interval,"
+                " as drift is only checked when conserved quantities are audited."
+            )
+        nsteps = int(np.ceil((t[-1] - t[0]) / dt)) + 2 if t.size else 0
+        naudit_max = 0 if audit_interval is None else nsteps // audit_interval + 1
         y = np.empty((t.size, self.model.state.size))
+        conserved = np.empty(
+            (naudit_max, len(self.model.conserved_quantities)),
+            dtype=self.model.fabm.numpy_dtype,
+        )
+        naudit = ctypes.c_int()
+        nt_done = ctypes.c_int()
+        self.model._invalidate_changed_inputs()
         self.model.fabm.integrate(
             self.model.pmodel,
             t.size,
@@ -1682,11 +2549,33 @@ class Simulator(object):
             dt,
             surface,
             bottom,
-            ctypes.byref(self.model._cell_thickness),
+            self.model._cell_thickness,
+            audit_interval or 0,
+            naudit_max,
+            conserved,
+            drift_tolerance or 0.0,
+            ctypes.byref(naudit),
+            ctypes.byref(nt_done),
         )
+
+        # The integrator links the state to its own work array; restore links
+        # to the model state.
+        self.model._link_state_data()
+        self.model._state_changed()
         if hasError():
             raise FABMException(getError())
-        return y
+        if nt_done.value < t.size:
+            excess = np.abs(conserved[naudit.value - 1] - conserved[0])
+            excess -= drift_tolerance * np.abs(conserved[0])
+            quantity = self.model.conserved_quantities[int(np.argmax(excess))]
+            log(
+                f"Integration stopped at t={t[nt_done.value - 1]} because"
+                f" the drift in {quantity.name} exceeds {drift_tolerance}"
+            )
+            y = y[: nt_done.value]
+        if audit_interval is None:
+            return y
+        return y, conserved[: naudit.value]
 
 
 def unload():
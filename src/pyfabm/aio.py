@@ -0,0 +1,153 @@
+"""Evaluation and simulation of models from :mod:`asyncio` code.
+
+Calls into FABM can take long for large domains or long simulations. The
+coroutines in this module run them on a thread pool, so that the event loop
+remains responsive while they execute. FABM libraries keep global error state,
+so at most one call into FABM runs at any time; calls from other coroutines
+wait for their turn without blocking the event loop. Running models truly in
+parallel requires multiple processes (see :mod:`pyfabm.shared`).
+
+:class:`AsyncSimulator` integrates a model in chunks of output times. It
+reports progress and results after each chunk, and can be cancelled between
+chunks.
+
+Example::
+
+    async def run(model, y0, t):
+        simulator = pyfabm.aio.AsyncSimulator(model, chunk_size=100)
+        async for chunk in simulator.iterate(y0, t, dt=3600.0 / 86400):
+            print(f"{chunk.progress:.0%} done")
+        return chunk.y
+"""
+
+import os
+import asyncio
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, NamedTuple, Optional, TypeVar
+
+import numpy as np
+
+import pyfabm
+
+T = TypeVar("T")
+
+# Serializes all calls into FABM libraries made through this module
+_lock = threading.Lock()
+_executor: Optional[Executor] = None
+
+
+def get_executor() -> Executor:
+    """Return the executor that runs calls into FABM."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) + 4),
+            thread_name_prefix="pyfabm",
+        )
+    return _executor
+
+
+def set_executor(executor: Optional[Executor]):
+    """Use the specified executor to run calls into FABM. It must be able to
+    run Python callables that operate on models of the current process
+    (e.g., :class:`concurrent.futures.ThreadPoolExecutor`)."""
+    global _executor
+    _executor = executor
+
+
+async def run(function: Callable[..., T], *args: Any) -> T:
+    """Call a function that operates on a model on the executor, and wait
+    for its result without blocking the event loop."""
+
+    def call() -> T:
+        with _lock:
+            return function(*args)
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), call)
+
+
+class Chunk(NamedTuple):
+    """Results of the time integration up to and including one chunk.
+
+    Attributes:
+        t: output times of this chunk
+        y: state at the output times of this chunk, with shape ``(nt, nstate)``
+        progress: fraction of all output times done
+    """
+
+    t: np.ndarray
+    y: np.ndarray
+    progress: float
+
+
+class AsyncSimulator:
+    """Integrate a 0D model in time without blocking the event loop.
+
+    The output times are divided into chunks of ``chunk_size`` times. Each
+    chunk is integrated by a single call to the compiled integrator
+    (:meth:`pyfabm.Simulator.integrate`), which starts from the state at the
+    last output time of the previous chunk. Results therefore equal those
+    of a single call if output times are multiples of the time step and the
+    time step is exactly representable as binary floating point number
+    (e.g., 1/64 rather than 1/100 day).
+
+    Args:
+        model: started model with cell thickness assigned
+        chunk_size: number of output times per chunk
+    """
+
+    def __init__(self, model: pyfabm.Model, chunk_size: int = 100):
+        if chunk_size < 1:
+            raise pyfabm.FABMException("chunk_size must be at least 1")
+        self.simulator = pyfabm.Simulator(model)
+        self.chunk_size = chunk_size
+
+    async def iterate(
+        self,
+        y0: np.ndarray,
+        t: np.ndarray,
+        dt: float,
+        surface: bool = True,
+        bottom: bool = True,
+    ) -> AsyncIterator[Chunk]:
+        """Integrate in time, yielding the results of each chunk as soon as
+        it is done. Cancelling the task that iterates, or leaving the loop,
+        stops the integration after the chunk in progress."""
+        y = np.asarray(y0, dtype=float)
+        start = 0
+        while start < t.size:
+            # Chunks after the first start at the last output time of the
+            # previous chunk; that output is not repeated.
+            first = max(start - 1, 0)
+            stop = min(start + self.chunk_size, t.size)
+            result = await run(
+                self.simulator.integrate, y, t[first:stop], dt, surface, bottom
+            )
+            result = result[start - first :]
+            y = result[-1]
+            chunk = Chunk(t[start:stop], result, stop / t.size)
+            start = stop
+            yield chunk
+
+    async def integrate(
+        self,
+        y0: np.ndarray,
+        t: np.ndarray,
+        dt: float,
+        surface: bool = True,
+        bottom: bool = True,
+        progress: Optional[Callable[[Chunk], None]] = None,
+    ) -> np.ndarray:
+        """Integrate in time and return the state at all output times, with
+        shape ``(nt, nstate)``. If provided, ``progress`` is called with
+        each chunk."""
+        results = []
+        async for chunk in self.iterate(y0, t, dt, surface, bottom):
+            results.append(chunk.y)
+            if progress is not None:
+                progress(chunk)
+        if not results:
+            return np.empty((0, self.simulator.model.state.size))
+        return np.concatenate(results)
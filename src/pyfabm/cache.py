@@ -0,0 +1,207 @@
+"""Persistent on-disk cache of model metadata (variables, parameters, couplings).
+
+Creating a :class:`pyfabm.Model` parses the configuration and resolves all
+couplings. Tools that only need to know what the model contains can use
+:func:`get_model_metadata` instead: the first call builds the model and stores
+its metadata on disk; subsequent calls for an unchanged configuration file and
+FABM library return the stored metadata without creating a model.
+
+The cache is stored in the directory given by environment variable
+``PYFABM_CACHE_DIR``, by default ``pyfabm`` under the user's cache directory.
+"""
+
+import os
+import sys
+import json
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+import pyfabm
+
+# Increase whenever the layout of cache entries changes
+CACHE_FORMAT = 2
+
+CATEGORIES = (
+    "interior_state_variables",
+    "surface_state_variables",
+    "bottom_state_variables",
+    "interior_diagnostic_variables",
+    "horizontal_diagnostic_variables",
+    "conserved_quantities",
+    "interior_dependencies",
+    "horizontal_dependencies",
+    "scalar_dependencies",
+    "parameter_fields",
+    "parameters",
+    "couplings",
+)
+
+
+def get_cache_dir() -> str:
+    cache_dir = os.environ.get("PYFABM_CACHE_DIR")
+    if cache_dir is None:
+        if os.name == "nt":
+            root = os.environ.get("LOCALAPPDATA", os.path.expanduser("~"))
+        elif sys.platform == "darwin":
+            root = os.path.expanduser("~/Library/Caches")
+        else:
+            root = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+        cache_dir = os.path.join(root, "pyfabm")
+    return cache_dir
+
+
+class CachedVariable(pyfabm.Variable):
+    """Variable, parameter or coupling restored from the cache.
+    Additional metadata (e.g., ``output``, ``value``, ``default``) are
+    available as attributes."""
+
+    def __init__(self, model: "ModelMetadata", **attributes: Any):
+        # Values of properties of pyfabm.Variable cannot be set as instance
+        # attributes; they are stored under private names instead.
+        self._long_path = attributes.pop("long_path", None)
+        super().__init__(
+            model,
+            attributes.pop("name"),
+            attributes.pop("units"),
+            attributes.pop("long_name"),
+            attributes.pop("path", None),
+        )
+        self.__dict__.update(attributes)
+
+    @property
+    def long_path(self) -> str:
+        return self._long_path or self.long_name
+
+
+class ModelMetadata:
+    """Metadata of a model, with the same collections of variables,
+    parameters and couplings as :class:`pyfabm.Model`."""
+
+    def __init__(self, data: Dict[str, List[Dict[str, Any]]]):
+        for category in CATEGORIES:
+            objects = [CachedVariable(self, **kwargs) for kwargs in data[category]]
+            setattr(self, category, pyfabm.NamedObjectList(objects))
+
+        self.state_variables = (
+            self.interior_state_variables
+            + self.surface_state_variables
+            + self.bottom_state_variables
+        )
+        self.diagnostic_variables = (
+            self.interior_diagnostic_variables + self.horizontal_diagnostic_variables
+        )
+        self.dependencies = (
+            self.interior_dependencies
+            + self.horizontal_dependencies
+            + self.scalar_dependencies
+        )
+        self.variables = (
+            self.state_variables + self.diagnostic_variables + self.dependencies
+        )
+
+
+def collect_metadata(model: pyfabm.Model) -> Dict[str, List[Dict[str, Any]]]:
+    """Describe all variables, parameters and couplings of a model with
+    JSON-serializable dictionaries."""
+
+    def describe(variable: pyfabm.Variable, **attributes: Any) -> Dict[str, Any]:
+        attributes.update(
+            name=variable.name,
+            units=variable.units,
+            long_name=variable.long_name,
+        )
+        if isinstance(variable, pyfabm.VariableFromPointer):
+            attributes["long_path"] = variable.long_path
+        else:
+            attributes["path"] = variable.path
+        return attributes
+
+    data = {}
+    for category in (
+        "interior_state_variables",
+        "surface_state_variables",
+        "bottom_state_variables",
+        "interior_diagnostic_variables",
+        "horizontal_diagnostic_variables",
+    ):
+        data[category] = [
+            describe(v, output=v.output) for v in getattr(model, category)
+        ]
+    data["conserved_quantities"] = [describe(v) for v in model.conserved_quantities]
+    for category in (
+        "interior_dependencies",
+        "horizontal_dependencies",
+        "scalar_dependencies",
+        "parameter_fields",
+    ):
+        data[category] = [
+            describe(v, required=v.required) for v in getattr(model, category)
+        ]
+    data["parameters"] = [
+        describe(p, type=p._type, value=p.value, default=p.default)
+        for p in model.parameters
+    ]
+    data["couplings"] = [describe(c, value=c.value) for c in model.couplings]
+    return data
+
+
+def get_cache_key(path: str, libname: str) -> str:
+    """Key that identifies a configuration file in combination with a
+    FABM library. The library is identified by its location, size and
+    modification time, which changes whenever it is rebuilt or upgraded."""
+    libpath = libname if os.path.isfile(libname) else pyfabm._find_library(libname)
+    libstat = os.stat(libpath)
+    key = hashlib.sha1()
+    with open(path, "rb") as f:
+        key.update(f.read())
+    key.update(
+        f"{os.path.abspath(libpath)}:{libstat.st_size}:{libstat.st_mtime_ns}".encode()
+    )
+    return key.hexdigest()
+
+
+def get_model_metadata(
+    path: str = "fabm.yaml",
+    shape: Tuple[int, ...] = (),
+    libname: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> ModelMetadata:
+    """Return the metadata of the model described by the specified
+    configuration file, from the cache if possible."""
+    if libname is None:
+        libname = f"fabm_{len(shape)}d"
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    cache_path = os.path.join(cache_dir, get_cache_key(path, libname) + ".json")
+
+    try:
+        with open(cache_path) as f:
+            entry = json.load(f)
+        if entry.get("format") == CACHE_FORMAT:
+            return ModelMetadata(entry["metadata"])
+    except (OSError, ValueError):
+        pass
+
+    with pyfabm.Model(path, shape=shape, libname=libname) as model:
+        metadata = collect_metadata(model)
+
+    # Write to a temporary file first to prevent concurrent readers
+    # from seeing an incomplete cache entry
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(dict(format=CACHE_FORMAT, metadata=metadata), f)
+    os.replace(tmp_path, cache_path)
+
+    return ModelMetadata(metadata)
+
+
+def clear(cache_dir: Optional[str] = None):
+    """Remove all cached model metadata."""
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    if not os.path.isdir(cache_dir):
+        return
+    for name in os.listdir(cache_dir):
+        if name.endswith(".json"):
+            os.remove(os.path.join(cache_dir, name))
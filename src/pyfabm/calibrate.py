@@ -0,0 +1,287 @@
+"""Objective functions for calibrating model parameters against observations.
+
+:class:`Objective` turns a model into a function of a vector of real
+parameter values, for use with external optimizers such as
+:func:`scipy.optimize.minimize` or population-based methods. For each
+parameter vector it configures the model, integrates it in time with
+:class:`pyfabm.Simulator`, and computes a cost from the simulated state
+(e.g., with :class:`Misfit`).
+
+Simulations run in worker processes that each keep a copy of the model, so
+that an evaluation costs only a reconfiguration
+(:meth:`pyfabm.Model.set_parameters`) and an integration. Vectors can be
+evaluated one at a time (by calling the objective), in batches spread over
+all workers (:meth:`Objective.evaluate`), or asynchronously
+(:meth:`Objective.submit`), which lets population-based optimizers propose
+new members while others are still being evaluated. Results are kept in a
+least-recently-used cache, keyed by the parameter vector rounded to a
+tolerance; vectors that optimizers revisit are not simulated again.
+
+Example::
+
+    observations = np.loadtxt("obs.dat")  # columns: phy, zoo (NaN if missing)
+    misfit = pyfabm.calibrate.Misfit(["npzd/phy", "npzd/zoo"], observations)
+    with pyfabm.calibrate.Objective(
+        model, ["npzd/rmax", "npzd/gmax"], t, dt=0.25, cost=misfit
+    ) as objective:
+        result = scipy.optimize.minimize(objective, x0, method="Nelder-Mead")
+"""
+
+import collections
+import concurrent.futures
+import os
+import pickle
+import threading
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+import numpy.typing as npt
+
+import pyfabm
+from .sensitivity import Worker
+
+
+class Misfit:
+    """Weighted sum of squared differences between simulated and observed
+    values of state variables.
+
+    Args:
+        variables: names of the observed state variables
+        observations: observed values at the output times of the simulation,
+            with shape ``(nt, nvariables)``. Missing observations are NaN.
+        weights: weight of each variable (e.g., the inverse of its error
+            variance), default: 1
+    """
+
+    def __init__(
+        self,
+        variables: Sequence[str],
+        observations: npt.ArrayLike,
+        weights: Optional[npt.ArrayLike] = None,
+    ):
+        self.variables = list(variables)
+        self.observations = np.asarray(observations, dtype=float)
+        if self.observations.ndim != 2 or self.observations.shape[1] != len(
+            self.variables
+        ):
+            raise pyfabm.FABMException(
+                "observations must have shape (nt, nvariables)"
+                f" with nvariables = {len(self.variables)}"
+            )
+        self.weights = np.ones(len(self.variables))
+        if weights is not None:
+            self.weights[:] = weights
+        self._indices = None
+
+    def __call__(self, model: pyfabm.Model, t: np.ndarray, y: np.ndarray) -> float:
+        if self._indices is None:
+            self._indices = [model.state_variables.index(v) for v in self.variables]
+        delta = y[:, self._indices] - self.observations
+        observed = np.isfinite(self.observations)
+        cost = (self.weights * np.where(observed, delta, 0.0) ** 2).sum()
+        return cost if np.isfinite(cost) else np.inf
+
+
+class Objective:
+    """Cost of a model simulation as function of real parameter values.
+
+    Args:
+        model: model to calibrate, with cell thickness and all
+            dependencies set. It is copied to the workers and not changed.
+        names: names of the real parameters to calibrate, in the order in
+            which they appear in parameter vectors
+        t: times at which the simulation produces output
+        dt: time step
+        cost: function that computes the cost from the model, ``t`` and the
+            simulated state with shape ``(nt, nstate)``. It must be
+            picklable, e.g., a :class:`Misfit` or a function defined at
+            module level. Non-finite costs are returned as infinity.
+        processes: number of worker processes (default: number of CPUs).
+            With 0, simulations run in the current process.
+        cache_size: maximum number of results kept in the cache
+        tolerance: parameter vectors are rounded to this tolerance, relative
+            to the magnitude of the initial parameter values, before they
+            are used as cache key. Vectors that differ less share results.
+    """
+
+    def __init__(
+        self,
+        model: pyfabm.Model,
+        names: Sequence[str],
+        t: np.ndarray,
+        dt: float,
+        cost: Callable[[pyfabm.Model, np.ndarray, np.ndarray], float],
+        processes: Optional[int] = None,
+        cache_size: int = 10000,
+        tolerance: float = 1e-10,
+    ):
+        self.names = [model.parameters[name].name for name in names]
+        self.processes = (os.cpu_count() or 1) if processes is None else processes
+        self.cache_size = cache_size
+        initial = np.array([model.parameters[name].value for name in self.names])
+        self._resolution = tolerance * np.where(initial != 0.0, np.abs(initial), 1.0)
+        self._cache: "collections.OrderedDict[Hashable, float]" = (
+            collections.OrderedDict()
+        )
+        self._pending: Dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+        # Serializes simulations with the model copy in the current process
+        self._worker_lock = threading.Lock()
+        initargs = (pickle.dumps(model), self.names, t, dt, cost)
+        self._executor = None
+        self._worker = None
+        if self.processes == 0:
+            self._worker = Worker(*initargs)
+        else:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                self.processes, initializer=Worker.initialize, initargs=initargs
+            )
+
+    def _key(self, x: np.ndarray) -> Hashable:
+        return tuple(np.round(x / self._resolution).astype(np.int64).tolist())
+
+    # _get and _put must be called with self._lock held
+
+    def _get(self, key: Hashable) -> Optional[float]:
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return self._cache[key]
+
+    def _put(self, key: Hashable, value: float):
+        self._cache[key] = float(value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _store(self, key: Hashable, value: float):
+        with self._lock:
+            self._put(key, value)
+
+    def _check(self, x: npt.ArrayLike) -> np.ndarray:
+        x = np.asarray(x, dtype=float)
+        if x.shape[-1:] != (len(self.names),):
+            raise pyfabm.FABMException(
+                f"Parameter vectors must have length {len(self.names)}"
+            )
+        return x
+
+    def __call__(self, x: npt.ArrayLike) -> float:
+        """Cost for a single parameter vector."""
+        return float(self.evaluate(self._check(x)[np.newaxis, :])[0])
+
+    def evaluate(self, xs: npt.ArrayLike) -> np.ndarray:
+        """Costs for a batch of parameter vectors, with shape
+        ``(nvectors, nparameters)``. Vectors without cached result are
+        divided over the workers and simulated in parallel."""
+        xs = self._check(xs)
+        costs = np.empty(xs.shape[0])
+        missing: Dict[Hashable, List[int]] = {}
+        keys = [self._key(x) for x in xs]
+        with self._lock:
+            for i, key in enumerate(keys):
+                cost = self._get(key)
+                if cost is not None:
+                    costs[i] = cost
+                elif key in missing:
+                    missing[key].append(i)
+                    self.hits += 1
+                else:
+                    missing[key] = [i]
+                    self.misses += 1
+        if not missing:
+            return costs
+        indices = [rows[0] for rows in missing.values()]
+        chunks = np.array_split(xs[indices], min(len(indices), max(self.processes, 1)))
+        if self._executor is None:
+            with self._worker_lock:
+                results = [self._worker(chunk) for chunk in chunks]
+        else:
+            futures = [
+                self._executor.submit(Worker.evaluate, chunk) for chunk in chunks
+            ]
+            results = [future.result() for future in futures]
+        results = np.concatenate(results)
+        results = np.where(np.isfinite(results), results, np.inf)
+        for (key, rows), cost in zip(missing.items(), results):
+            self._store(key, cost)
+            costs[rows] = cost
+        return costs
+
+    def submit(self, x: npt.ArrayLike) -> concurrent.futures.Future:
+        """Start evaluating the cost for a parameter vector, and return a
+        :class:`concurrent.futures.Future` for its result. Vectors that are
+        already being evaluated share the same future. In :mod:`asyncio`
+        code, the future can be awaited after wrapping it with
+        :func:`asyncio.wrap_future`."""
+        x = self._check(x)
+        key = self._key(x)
+        future = concurrent.futures.Future()
+        with self._lock:
+            cost = self._get(key)
+            if cost is None and self._executor is not None:
+                if key in self._pending:
+                    self.hits += 1
+                    return self._pending[key]
+                self.misses += 1
+                self._pending[key] = future
+        if cost is None and self._executor is None:
+            cost = self(x)
+        if cost is not None:
+            future.set_result(cost)
+            return future
+
+        def done(result: concurrent.futures.Future):
+            # Store the cost before the vector stops being pending, so that
+            # concurrent submissions always find one or the other
+            exception = result.exception()
+            if exception is None:
+                cost = float(result.result()[0])
+                cost = cost if np.isfinite(cost) else np.inf
+            with self._lock:
+                if exception is None:
+                    self._put(key, cost)
+                del self._pending[key]
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(cost)
+
+        self._executor.submit(Worker.evaluate, x[np.newaxis, :]).add_done_callback(done)
+        return future
+
+    def as_completed(self, xs: npt.ArrayLike) -> Iterator[Tuple[int, float]]:
+        """Evaluate parameter vectors asynchronously, and yield the index of
+        each vector with its cost as soon as that is available."""
+        futures: Dict[concurrent.futures.Future, List[int]] = {}
+        for i, x in enumerate(self._check(xs)):
+            futures.setdefault(self.submit(x), []).append(i)
+        for future in concurrent.futures.as_completed(futures):
+            for i in futures[future]:
+                yield i, future.result()
+
+    def close(self):
+        """Stop the worker processes, or release the model copy if
+        simulations run in the current process."""
+        if self._executor is not None:
+            self._executor.shutdown()
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+
+    def __enter__(self) -> "Objective":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
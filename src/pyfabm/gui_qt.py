@@ -1,5 +1,6 @@
 import sys
-from typing import Iterable, Union, List, Optional
+import difflib
+from typing import Dict, Iterable, Iterator, Union, List, Optional, Tuple
 import numpy as np
 import pyfabm
 
@@ -69,29 +70,47 @@ class Entry:
             name = object
         self.object = object
         self.name = name
+        self.key: Optional[Tuple[str, str]] = None
         self.parent: Optional["Entry"] = None
         self.children: List["Entry"] = []
+        self._groups: Dict[str, "Entry"] = {}
+        self._rows: Optional[Dict[int, int]] = None
         assert isinstance(self.name, str)
 
     def addChild(self, child: "Entry"):
         child.parent = self
         self.children.append(child)
+        if isinstance(child.object, str):
+            self._groups.setdefault(child.object, child)
+        if self._rows is not None:
+            self._rows[id(child)] = len(self.children) - 1
 
     def insertChild(self, index: int, child: "Entry"):
         child.parent = self
         self.children.insert(index, child)
+        if isinstance(child.object, str):
+            self._groups.setdefault(child.object, child)
+        self._rows = None
 
     def removeChild(self, index: int):
-        self.children.pop(index).parent = None
+        child = self.children.pop(index)
+        child.parent = None
+        if self._groups.get(child.name) is child:
+            del self._groups[child.name]
+        self._rows = None
 
     def findChild(self, name: str):
-        for child in self.children:
-            if isinstance(child.object, str) and child.object == name:
-                return child
-        child = Entry(name)
-        self.addChild(child)
+        child = self._groups.get(name)
+        if child is None:
+            child = Entry(name)
+            self.addChild(child)
         return child
 
+    def row(self, child: "Entry") -> int:
+        if self._rows is None:
+            self._rows = {id(c): i for i, c in enumerate(self.children)}
+        return self._rows[id(child)]
+
     def addTree(self, arr: Iterable[pyfabm.Variable], category: Optional[str] = None):
         for variable in arr:
             pathcomps = variable.path.split("/")
@@ -104,8 +123,15 @@ class Entry:
             for component in pathcomps[:-1]:
                 parent = parent.findChild(component)
             entry = Entry(variable, pathcomps[-1])
+            entry.key = (category or "", variable.path)
             parent.addChild(entry)
 
+    def iterLeaves(self) -> Iterator["Entry"]:
+        for child in self.children:
+            if child.key is not None:
+                yield child
+            yield from child.iterLeaves()
+
 
 class Submodel:
     def __init__(self, long_name):
@@ -120,13 +146,39 @@ class ItemModel(QtCore.QAbstractItemModel):
         QtCore.QAbstractItemModel.__init__(self, parent)
         self.root = None
         self.model = model
+        self._keys: List[Tuple[str, str]] = []
+        self._entries: Dict[Tuple[str, str], Entry] = {}
         self.rebuild()
 
+    def _get_objects(self) -> List[Tuple[Tuple[str, str], pyfabm.Variable]]:
+        # All objects shown, with keys that identify them across
+        # changes in model configuration (objects themselves are recreated)
+        objects = [(("environment", d.name), d) for d in self.model.dependencies]
+        for category, variables in (
+            ("parameters", self.model.parameters),
+            ("initialization", self.model.state_variables),
+            ("coupling", self.model.couplings),
+        ):
+            objects.extend(((category, v.path), v) for v in variables)
+        return objects
+
     def rebuild(self):
+        objects = self._get_objects()
+        keys = [key for key, _ in objects]
+        if self.root is not None and keys == self._keys:
+            # Same variables as before - point existing entries to the new objects
+            for key, object in objects:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.object = object
+            return
+
         root = Entry()
         env = Entry("environment")
         for d in self.model.dependencies:
-            env.addChild(Entry(d, d.name))
+            entry = Entry(d, d.name)
+            entry.key = ("environment", d.name)
+            env.addChild(entry)
         root.addTree(self.model.parameters, "parameters")
         root.addTree(self.model.state_variables, "initialization")
         root.addTree(self.model.couplings, "coupling")
@@ -159,49 +211,49 @@ class ItemModel(QtCore.QAbstractItemModel):
 
         if self.root is not None:
             # We already have an old tree - compare and amend model.
+            # Children are matched by name; only subtrees whose names differ
+            # are changed, with the minimal set of row insertions and removals.
             def processChange(newnode, oldnode, parent):
                 oldnode.object = newnode.object
-                if not newnode.children:
-                    return
-                ioldstart = 0
-                for node in newnode.children:
-                    iold = -1
-                    for i in range(ioldstart, len(oldnode.children)):
-                        if node.name == oldnode.children[i].name:
-                            iold = i
-                            break
-                    if iold != -1:
-                        # New node was found among old nodes;
-                        # remove any unused old nodes that precede it.
-                        if iold > ioldstart:
-                            self.beginRemoveRows(parent, ioldstart, iold - 1)
-                            for i in range(iold - 1, ioldstart - 1, -1):
-                                oldnode.removeChild(i)
-                            self.endRemoveRows()
-                        # Process changes to children of node.
-                        processChange(
-                            node,
-                            oldnode.children[ioldstart],
-                            self.createIndex(ioldstart, 0, oldnode.children[ioldstart]),
-                        )
-                    else:
-                        # New node not found; insert it.
-                        self.beginInsertRows(parent, ioldstart, ioldstart)
-                        oldnode.insertChild(ioldstart, node)
+                oldnode.key = newnode.key
+                oldnames = [child.name for child in oldnode.children]
+                newnames = [child.name for child in newnode.children]
+                if oldnames == newnames:
+                    opcodes = [("equal", 0, len(oldnames), 0, len(newnames))]
+                else:
+                    matcher = difflib.SequenceMatcher(
+                        None, oldnames, newnames, autojunk=False
+                    )
+                    opcodes = matcher.get_opcodes()
+                irow = 0
+                for tag, i1, i2, j1, j2 in opcodes:
+                    if tag == "equal":
+                        for node in newnode.children[j1:j2]:
+                            oldchild = oldnode.children[irow]
+                            index = self.createIndex(irow, 0, oldchild)
+                            processChange(node, oldchild, index)
+                            irow += 1
+                        continue
+                    if i2 > i1:
+                        # Remove old nodes that are not in the new tree
+                        self.beginRemoveRows(parent, irow, irow + i2 - i1 - 1)
+                        for _ in range(i2 - i1):
+                            oldnode.removeChild(irow)
+                        self.endRemoveRows()
+                    if j2 > j1:
+                        # Insert new nodes that are not in the old tree
+                        self.beginInsertRows(parent, irow, irow + j2 - j1 - 1)
+                        for node in newnode.children[j1:j2]:
+                            oldnode.insertChild(irow, node)
+                            irow += 1
                         self.endInsertRows()
-                    ioldstart = ioldstart + 1
-                if ioldstart < len(oldnode.children):
-                    # Remove any trailing unused old nodes.
-                    self.beginRemoveRows(parent, ioldstart, len(oldnode.children) - 1)
-                    for i in range(len(oldnode.children) - 1, ioldstart - 1, -1):
-                        oldnode.removeChild(i)
-                    self.endRemoveRows()
 
             processChange(root, self.root, QtCore.QModelIndex())
         else:
             # First time a tree was created - store it and move on.
             self.root = root
-        # self.reset()
+        self._keys = keys
+        self._entries = {entry.key: entry for entry in self.root.iterLeaves()}
 
     def rowCount(self, index):
         if not index.isValid():
@@ -230,7 +282,7 @@ class ItemModel(QtCore.QAbstractItemModel):
         parent = index.internalPointer().parent
         if parent is self.root:
             return QtCore.QModelIndex()
-        irow = parent.parent.children.index(parent)
+        irow = parent.parent.row(parent)
         return self.createIndex(irow, 0, parent)
 
     def data(self, index, role):
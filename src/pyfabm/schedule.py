@@ -0,0 +1,285 @@
+"""Introspection of the schedule by which FABM computes its outputs.
+
+When a model is started, FABM groups all calls to the APIs of its
+biogeochemical models (``do``, ``do_surface``, ``do_column``, etc.) into jobs,
+one for each operation a host can request (``get_interior_sources``,
+``get_conserved_quantities``, ...). Each job consists of tasks: sequences
+of calls that share an operation over the domain (e.g., interior, surface,
+column). Each call reads its inputs from a read cache and writes its outputs
+to a write cache; outputs needed by later calls are copied to the read cache,
+and outputs that are saved or used by other jobs are copied to the store.
+
+:meth:`pyfabm.Model.get_schedule` returns this schedule as a
+:class:`Schedule`, together with the number of times each call has been
+made so far (once per processed slice of the domain). Calls that appear
+in several jobs are recomputed each time any of these jobs runs; these can
+be listed with :meth:`Schedule.get_duplicate_calls`.
+
+Example::
+
+    model.start()
+    before = model.get_schedule().get_call_counts()
+    model.get_sources()
+    schedule = model.get_schedule()
+    for (path, source), count in schedule.get_call_counts().items():
+        print(path, source, count - before[path, source])
+    schedule.save_as_dot("schedule.gv")
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class CacheVariable:
+    """Variable read or written by a call.
+
+    Attributes:
+        name: name of the variable
+        domain: ``interior``, ``horizontal``, ``surface``, ``bottom`` or ``scalar``
+        source: for inputs, how the variable is provided: ``state``,
+            ``external`` (by the host), ``constant``, or the API of the
+            model that computes it (e.g., ``do``)
+        read_index: index in the read cache (0 if not in the read cache)
+        write_index: for outputs, index in the write cache
+        store_index: for outputs, index in the persistent store
+            (0 if not stored)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        domain: str,
+        source: Optional[str] = None,
+        read_index: int = 0,
+        write_index: int = 0,
+        store_index: int = 0,
+    ):
+        self.name = name
+        self.domain = domain
+        self.source = source
+        self.read_index = read_index
+        self.write_index = write_index
+        self.store_index = store_index
+
+    def __repr__(self) -> str:
+        return f"<{self.name} ({self.domain})>"
+
+
+class Call:
+    """Call to one API (``source``) of one biogeochemical model.
+
+    Attributes:
+        model: path of the model instance
+        source: API that is called, e.g., ``do`` or ``do_bottom``
+        active: whether the call is made (inactive calls only serve to
+            provide their outputs to other calls)
+        count: number of times the call has been made (once per slice
+            of the domain processed)
+        inputs: variables read
+        outputs: variables written
+    """
+
+    def __init__(self, model: str, source: str, active: bool, count: int):
+        self.model = model
+        self.source = source
+        self.active = active
+        self.count = count
+        self.inputs: List[CacheVariable] = []
+        self.outputs: List[CacheVariable] = []
+
+    def __repr__(self) -> str:
+        return f"<{self.model}:{self.source}>"
+
+
+class Task:
+    """Sequence of calls that share an operation over the domain.
+
+    Attributes:
+        operation: operation over the domain (e.g., ``do`` for the interior,
+            ``do_column`` for columns, ``do_surface`` for the surface)
+        loads: number of variables loaded into the read cache before
+            the calls are made, per domain (``interior``, ``horizontal``,
+            ``scalar``)
+        prefills: number of variables in the write cache that are
+            initialized before the calls are made, per domain
+            (``interior``, ``horizontal``)
+        calls: calls in the order in which they are made
+    """
+
+    def __init__(self, operation: str, loads: Dict[str, int], prefills: Dict[str, int]):
+        self.operation = operation
+        self.loads = loads
+        self.prefills = prefills
+        self.calls: List[Call] = []
+
+    def __repr__(self) -> str:
+        return f"<task {self.operation} with {len(self.calls)} calls>"
+
+
+class Job:
+    """Set of tasks performed for one operation requested by the host."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.tasks: List[Task] = []
+
+    def __repr__(self) -> str:
+        return f"<job {self.name} with {len(self.tasks)} tasks>"
+
+
+class Schedule:
+    """Jobs, tasks and calls of a started model."""
+
+    def __init__(self, jobs: Iterable[Job]):
+        self.jobs = list(jobs)
+
+    @classmethod
+    def from_records(cls, records: Iterable[str]) -> "Schedule":
+        """Create a schedule from the tab-separated records written by FABM."""
+        jobs: List[Job] = []
+        for record in records:
+            kind, *fields = record.split("\t")
+            if kind == "job":
+                jobs.append(Job(fields[0]))
+            elif kind == "task":
+                n = [int(f) for f in fields[1:]]
+                loads = dict(interior=n[0], horizontal=n[1], scalar=n[2])
+                prefills = dict(interior=n[3], horizontal=n[4])
+                jobs[-1].tasks.append(Task(fields[0], loads, prefills))
+            elif kind == "call":
+                model, source, active, count = fields
+                call = Call(model.lstrip("/"), source, active == "1", int(count))
+                jobs[-1].tasks[-1].calls.append(call)
+            elif kind == "input":
+                name, domain, source, read_index = fields
+                jobs[-1].tasks[-1].calls[-1].inputs.append(
+                    CacheVariable(name, domain, source, read_index=int(read_index))
+                )
+            elif kind == "output":
+                name, domain, write_index, read_index, store_index = fields
+                jobs[-1].tasks[-1].calls[-1].outputs.append(
+                    CacheVariable(
+                        name,
+                        domain,
+                        read_index=int(read_index),
+                        write_index=int(write_index),
+                        store_index=int(store_index),
+                    )
+                )
+        return cls(jobs)
+
+    def __getitem__(self, name: str) -> Job:
+        for job in self.jobs:
+            if job.name == name:
+                return job
+        raise KeyError(name)
+
+    def iter_calls(self) -> Iterator[Tuple[Job, Task, Call]]:
+        """Iterate over all calls, with the job and task they belong to."""
+        for job in self.jobs:
+            for task in job.tasks:
+                for call in task.calls:
+                    yield job, task, call
+
+    def get_call_counts(self) -> Dict[Tuple[str, str], int]:
+        """Number of times each API of each model has been called, summed
+        over all jobs. Keys are tuples of model path and API (source)."""
+        counts: Dict[Tuple[str, str], int] = {}
+        for _, _, call in self.iter_calls():
+            key = (call.model, call.source)
+            counts[key] = counts.get(key, 0) + call.count
+        return counts
+
+    def get_duplicate_calls(self) -> Dict[Tuple[str, str], List[str]]:
+        """Active calls that appear in more than one job. These are made
+        again whenever any of the jobs runs. Keys are tuples of model path
+        and API (source); values are the names of the jobs."""
+        jobs: Dict[Tuple[str, str], List[str]] = {}
+        for job, _, call in self.iter_calls():
+            if call.active:
+                jobs.setdefault((call.model, call.source), []).append(job.name)
+        return {key: names for key, names in jobs.items() if len(names) > 1}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Describe the schedule with JSON-serializable dictionaries."""
+
+        def describe_call(call: Call) -> Dict[str, Any]:
+            return dict(
+                model=call.model,
+                source=call.source,
+                active=call.active,
+                count=call.count,
+                inputs=[dict(vars(v)) for v in call.inputs],
+                outputs=[dict(vars(v)) for v in call.outputs],
+            )
+
+        return dict(
+            jobs=[
+                dict(
+                    name=job.name,
+                    tasks=[
+                        dict(
+                            operation=task.operation,
+                            loads=task.loads,
+                            prefills=task.prefills,
+                            calls=[describe_call(call) for call in task.calls],
+                        )
+                        for task in job.tasks
+                    ],
+                )
+                for job in self.jobs
+            ]
+        )
+
+    def save_as_json(self, path: str, indent: Optional[int] = 2):
+        """Save the schedule as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=indent)
+
+    def to_dot(self) -> str:
+        """Describe the schedule in the Graphviz DOT language. Jobs and their
+        tasks are shown as nested clusters, calls as nodes labelled with the
+        number of times they have been made. Solid edges connect calls in the
+        order they are made; dashed edges connect the call that computes a
+        variable to the calls that use it, in the same or a later job."""
+        lines = ["digraph {"]
+        producers: Dict[str, str] = {}
+        dataflow: List[str] = []
+        for ijob, job in enumerate(self.jobs):
+            lines.append(f'  subgraph "cluster_{ijob}" {{')
+            lines.append(f'    label="{job.name}";')
+            order: List[str] = []
+            previous: Optional[str] = None
+            for itask, task in enumerate(job.tasks):
+                lines.append(f'    subgraph "cluster_{ijob}_{itask}" {{')
+                lines.append(f'      label="{task.operation}";style=filled;')
+                lines.append("      node [color=black,style=filled];")
+                for icall, call in enumerate(task.calls):
+                    node = f"{ijob}_{itask}_{icall}"
+                    color = "white" if call.active else "lightgrey"
+                    lines.append(
+                        f'      "{node}" [label="{call.model}: {call.source}\\n'
+                        f'{call.count} calls",fillcolor={color}];'
+                    )
+                    if previous is not None:
+                        order.append(f'    "{previous}" -> "{node}";')
+                    previous = node
+                    for variable in call.inputs:
+                        if variable.name in producers:
+                            dataflow.append(
+                                f'  "{producers[variable.name]}" -> "{node}"'
+                                f' [style=dashed,label="{variable.name}"];'
+                            )
+                    for variable in call.outputs:
+                        producers[variable.name] = node
+                lines.append("    }")
+            lines.extend(order)
+            lines.append("  }")
+        lines.extend(dataflow)
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def save_as_dot(self, path: str):
+        """Save the schedule as Graphviz DOT file."""
+        with open(path, "w") as f:
+            f.write(self.to_dot())
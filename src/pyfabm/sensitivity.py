@@ -0,0 +1,430 @@
+"""Global sensitivity analysis of model outputs to parameters.
+
+The sensitivity of outputs to real-valued parameters is estimated from many
+model simulations with parameter values drawn from specified ranges. Two
+methods are available:
+
+* :class:`Morris`: elementary effects along random one-at-a-time trajectories.
+  This screens many parameters at low cost. It reports the mean (``mu``),
+  mean absolute value (``mu_star``) and standard deviation (``sigma``) of the
+  effects.
+* :class:`Sobol`: variance-based first-order and total indices, estimated
+  from a Saltelli design.
+
+:func:`analyze` evaluates a design in parallel worker processes. Each worker
+receives a copy of the model once and keeps it, so that evaluating a
+parameter set costs only a reconfiguration (:meth:`pyfabm.Model.set_parameters`)
+and a time integration (:class:`pyfabm.Simulator`). Each simulation is reduced
+to a vector of outputs in the worker, for instance, the final state. The design
+is generated block by block and only the blocks in progress are kept. Indices
+are accumulated as each block completes. Memory use is therefore independent of
+the size of the design.
+
+Example::
+
+    model = pyfabm.Model("fabm.yaml")
+    model.cell_thickness = 1.0
+    for dependency in model.dependencies:
+        dependency.value = ...
+    ranges = pyfabm.sensitivity.get_ranges(model, relative=0.2)
+    morris = pyfabm.sensitivity.Morris(ranges, trajectories=100)
+    result = pyfabm.sensitivity.analyze(model, morris, t=np.arange(366.0), dt=0.25)
+    for i, r in enumerate(ranges):
+        print(r.name, result["mu_star"][i])
+"""
+
+import concurrent.futures
+import os
+import pickle
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+import numpy as np
+
+import pyfabm
+
+
+class Range(NamedTuple):
+    """Range of values of a parameter.
+
+    Attributes:
+        name: name of the parameter
+        lower: lower bound
+        upper: upper bound
+        log: whether to sample uniformly in log space (bounds must be positive)
+    """
+
+    name: str
+    lower: float
+    upper: float
+    log: bool = False
+
+
+def get_ranges(
+    model: pyfabm.Model,
+    names: Optional[Iterable[str]] = None,
+    relative: float = 0.5,
+) -> List[Range]:
+    """Create ranges that span the current value of real parameters plus or
+    minus a fraction of that value. Parameters with value zero are skipped.
+
+    Args:
+        model: model with the parameters
+        names: names of the parameters to include (default: all real
+            parameters)
+        relative: half-width of each range, relative to the current value
+    """
+    if names is None:
+        names = [p.name for p in model.parameters if p._type == pyfabm.DataType.REAL]
+    ranges = []
+    for name in names:
+        value = model.parameters[name].value
+        if value != 0.0:
+            bounds = sorted((value * (1.0 - relative), value * (1.0 + relative)))
+            ranges.append(Range(name, *bounds))
+    return ranges
+
+
+class Design:
+    """Base class of sampling designs. A design generates blocks of parameter
+    sets, and accumulates sensitivity indices from the outputs computed for
+    each block. Blocks may be processed in any order."""
+
+    def __init__(self, ranges: Sequence[Range], seed: Optional[int] = None):
+        self.ranges = list(ranges)
+        self.names = [r.name for r in self.ranges]
+        self.rng = np.random.default_rng(seed)
+        lower = np.array([r.lower for r in self.ranges], dtype=float)
+        upper = np.array([r.upper for r in self.ranges], dtype=float)
+        self._log = np.array([r.log for r in self.ranges], dtype=bool)
+        if (lower[self._log] <= 0.0).any():
+            raise pyfabm.FABMException("Log-scaled ranges must be positive")
+        self._lower = np.where(
+            self._log, np.log(np.where(self._log, lower, 1.0)), lower
+        )
+        self._upper = np.where(
+            self._log, np.log(np.where(self._log, upper, 1.0)), upper
+        )
+
+    def scale(self, unit: np.ndarray) -> np.ndarray:
+        """Convert points in the unit hypercube to parameter values."""
+        values = self._lower + unit * (self._upper - self._lower)
+        return np.where(self._log, np.exp(values), values)
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        """Generate blocks of points in the unit hypercube, each with shape
+        ``(npoints, nparameters)``."""
+        raise NotImplementedError
+
+    def update(self, unit: np.ndarray, outputs: np.ndarray):
+        """Accumulate the outputs computed for one block, with shape
+        ``(npoints, noutputs)``."""
+        raise NotImplementedError
+
+    def result(self) -> Dict[str, np.ndarray]:
+        """Sensitivity indices, with shape ``(nparameters, noutputs)``."""
+        raise NotImplementedError
+
+
+class Morris(Design):
+    """Morris elementary effects screening.
+
+    Each trajectory starts at a random point on a grid of ``levels`` values
+    per parameter, and changes one parameter at a time (in random order) by
+    ``levels / (2 * (levels - 1))`` of its range. Effects are expressed per
+    unit of the normalized range. Trajectories with non-finite outputs are
+    skipped.
+
+    Args:
+        ranges: parameter ranges
+        trajectories: number of trajectories
+        levels: number of grid levels (even numbers are recommended)
+        block_size: number of trajectories per block sent to a worker
+        seed: seed for the random number generator
+    """
+
+    def __init__(
+        self,
+        ranges: Sequence[Range],
+        trajectories: int = 50,
+        levels: int = 4,
+        block_size: int = 1,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(ranges, seed)
+        self.trajectories = trajectories
+        self.levels = levels
+        self.block_size = block_size
+        self.delta = levels / (2.0 * (levels - 1))
+        self._n = 0
+        self._sum = self._sum_abs = self._sum_sq = 0.0
+
+    def _trajectory(self) -> np.ndarray:
+        k = len(self.ranges)
+        x = self.rng.integers(self.levels, size=k) / (self.levels - 1)
+        points = [x.copy()]
+        for i in self.rng.permutation(k):
+            x[i] += self.delta if x[i] + self.delta <= 1.0 else -self.delta
+            points.append(x.copy())
+        return np.array(points)
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        for start in range(0, self.trajectories, self.block_size):
+            n = min(self.block_size, self.trajectories - start)
+            yield np.concatenate([self._trajectory() for _ in range(n)])
+
+    def update(self, unit: np.ndarray, outputs: np.ndarray):
+        k = len(self.ranges)
+        unit = unit.reshape(-1, k + 1, k)
+        outputs = outputs.reshape(unit.shape[0], k + 1, -1)
+        for x, y in zip(unit, outputs):
+            if not np.isfinite(y).all():
+                continue
+            dx = np.diff(x, axis=0)
+            factor = np.abs(dx).argmax(axis=1)
+            effects = np.empty((k, y.shape[1]))
+            effects[factor] = np.diff(y, axis=0) / dx[np.arange(k), factor, None]
+            self._n += 1
+            self._sum = self._sum + effects
+            self._sum_abs = self._sum_abs + np.abs(effects)
+            self._sum_sq = self._sum_sq + effects**2
+
+    def result(self) -> Dict[str, np.ndarray]:
+        n = max(self._n, 1)
+        mu = self._sum / n
+        variance = (self._sum_sq - n * mu**2) / max(self._n - 1, 1)
+        return dict(
+            mu=mu,
+            mu_star=self._sum_abs / n,
+            sigma=np.sqrt(np.maximum(variance, 0.0)),
+            n=np.array(self._n),
+        )
+
+
+class Sobol(Design):
+    """First-order and total Sobol indices from a Saltelli design.
+
+    For each of ``samples`` base samples, two independent random points A and
+    B are drawn, along with the k points AB_i that equal A except for
+    parameter i, which is taken from B. First-order indices use the estimator
+    of Saltelli et al. (2010), total indices that of Jansen (1999). Base
+    samples with non-finite outputs are skipped.
+
+    Args:
+        ranges: parameter ranges
+        samples: number of base samples; the model is evaluated
+            ``samples * (nparameters + 2)`` times
+        block_size: number of base samples per block sent to a worker
+        seed: seed for the random number generator
+    """
+
+    def __init__(
+        self,
+        ranges: Sequence[Range],
+        samples: int = 1000,
+        block_size: int = 8,
+        seed: Optional[int] = None,
+    ):
+        super().__init__(ranges, seed)
+        self.samples = samples
+        self.block_size = block_size
+        self._n = 0
+        self._shift = None
+        self._sum = self._sum_sq = 0.0
+        self._sum_first = self._sum_total = 0.0
+
+    def blocks(self) -> Iterator[np.ndarray]:
+        k = len(self.ranges)
+        for start in range(0, self.samples, self.block_size):
+            n = min(self.block_size, self.samples - start)
+            a = self.rng.random((n, k))
+            b = self.rng.random((n, k))
+            points = np.empty((n, k + 2, k))
+            points[:, 0] = a
+            points[:, 1] = b
+            for i in range(k):
+                points[:, i + 2] = a
+                points[:, i + 2, i] = b[:, i]
+            yield points.reshape(-1, k)
+
+    def update(self, unit: np.ndarray, outputs: np.ndarray):
+        k = len(self.ranges)
+        outputs = outputs.reshape(-1, k + 2, outputs.shape[-1])
+        outputs = outputs[np.isfinite(outputs).all(axis=(1, 2))]
+        if outputs.shape[0] == 0:
+            return
+        if self._shift is None:
+            # Shift outputs by a first estimate of their mean to limit
+            # cancellation when computing the variance from sums
+            self._shift = outputs[:, :2].mean(axis=(0, 1))
+        f_a = outputs[:, 0] - self._shift
+        f_b = outputs[:, 1] - self._shift
+        f_ab = outputs[:, 2:] - self._shift
+        self._n += outputs.shape[0]
+        self._sum = self._sum + f_a.sum(axis=0) + f_b.sum(axis=0)
+        self._sum_sq = self._sum_sq + (f_a**2).sum(axis=0) + (f_b**2).sum(axis=0)
+        self._sum_first = self._sum_first + (f_b[:, None] * (f_ab - f_a[:, None])).sum(
+            axis=0
+        )
+        self._sum_total = self._sum_total + ((f_a[:, None] - f_ab) ** 2).sum(axis=0)
+
+    def result(self) -> Dict[str, np.ndarray]:
+        n = max(self._n, 1)
+        mean = self._sum / (2 * n)
+        variance = self._sum_sq / (2 * n) - mean**2
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return dict(
+                first=self._sum_first / n / variance,
+                total=0.5 * self._sum_total / n / variance,
+                variance=np.asarray(variance),
+                n=np.array(self._n),
+            )
+
+
+def final_state(model: pyfabm.Model, t: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Output of a simulation: the state at the last time."""
+    return y[-1]
+
+
+class Worker:
+    """Simulates a copy of a model for parameter sets, and reduces each
+    simulation to an array of outputs. This is shared by :func:`analyze` and
+    :class:`pyfabm.calibrate.Objective`. To evaluate in the current process,
+    create a worker and call it. For a process pool, pass :meth:`initialize`
+    as initializer, and submit :meth:`evaluate`.
+
+    Args:
+        model: pickled model, with cell thickness assigned and all
+            dependencies set. Simulations start from its current state.
+        names: names of the parameters, in the order of the values
+        t: times at which the simulation produces output
+        dt: time step
+        output: function that reduces a simulation to outputs. It is called
+            with the model, ``t`` and the simulated state with shape
+            ``(nt, nstate)``.
+    """
+
+    def __init__(
+        self,
+        model: bytes,
+        names: List[str],
+        t: np.ndarray,
+        dt: float,
+        output: Callable[[pyfabm.Model, np.ndarray, np.ndarray], Any],
+    ):
+        self.model: pyfabm.Model = pickle.loads(model)
+        self.y0 = self.model.state.copy()
+        self.names = names
+        self.t = t
+        self.dt = dt
+        self.output = output
+
+    def __call__(self, values: np.ndarray) -> np.ndarray:
+        """Outputs for parameter sets, with shape ``(nsets, nparameters)``."""
+        outputs = []
+        for row in values:
+            self.model.set_parameters(dict(zip(self.names, row)))
+            self.model.start(verbose=False, stop=True)
+            y = pyfabm.Simulator(self.model).integrate(self.y0, self.t, self.dt)
+            outputs.append(np.asarray(self.output(self.model, self.t, y), dtype=float))
+        return np.array(outputs)
+
+    def close(self):
+        """Release the model."""
+        self.model.close()
+
+    @staticmethod
+    def initialize(*args: Any):
+        """Create the worker of the current process (initializer for process
+        pools). Takes the same arguments as :class:`Worker`."""
+        global _worker
+        _worker = Worker(*args)
+
+    @staticmethod
+    def evaluate(values: np.ndarray) -> np.ndarray:
+        """Outputs for parameter sets, computed by the worker of the current
+        process (see :meth:`initialize`)."""
+        assert _worker is not None, "Worker.initialize has not been called"
+        return _worker(values)
+
+
+# Worker of a process in a pool (see Worker.initialize)
+_worker: Optional[Worker] = None
+
+
+def analyze(
+    model: pyfabm.Model,
+    design: Design,
+    t: np.ndarray,
+    dt: float,
+    output: Callable[[pyfabm.Model, np.ndarray, np.ndarray], np.ndarray] = final_state,
+    processes: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[str, np.ndarray]:
+    """Evaluate a design and return its sensitivity indices.
+
+    Each parameter set is simulated from the current state of the model
+    with :class:`pyfabm.Simulator`, which requires a 0D model with cell
+    thickness assigned and all dependencies set.
+
+    Args:
+        model: model to analyze. It is not changed.
+        design: sampling design, e.g., :class:`Morris` or :class:`Sobol`
+        t: times at which the simulation produces output
+        dt: time step
+        output: function that reduces a simulation to a 1D array of
+            outputs. It is called with the model, ``t`` and the simulated
+            state with shape ``(nt, nstate)``. It must be picklable, e.g.,
+            a function defined at module level. Default: final state.
+        processes: number of worker processes (default: number of CPUs).
+            With 0, the design is evaluated in the current process.
+        progress: function called with the number of blocks done after
+            each block completes
+    """
+    initargs = (pickle.dumps(model), design.names, t, dt, output)
+    blocks = design.blocks()
+    ndone = 0
+
+    def done(unit: np.ndarray, outputs: np.ndarray):
+        nonlocal ndone
+        design.update(unit, outputs)
+        ndone += 1
+        if progress is not None:
+            progress(ndone)
+
+    if processes == 0:
+        worker = Worker(*initargs)
+        try:
+            for unit in blocks:
+                done(unit, worker(design.scale(unit)))
+        finally:
+            worker.close()
+        return design.result()
+
+    with concurrent.futures.ProcessPoolExecutor(
+        processes, initializer=Worker.initialize, initargs=initargs
+    ) as executor:
+        # Keep a limited number of blocks in progress, so that the design
+        # is generated as it is evaluated
+        max_pending = 2 * (processes or os.cpu_count() or 1)
+        pending: Dict[concurrent.futures.Future, np.ndarray] = {}
+        for unit in blocks:
+            pending[executor.submit(Worker.evaluate, design.scale(unit))] = unit
+            if len(pending) >= max_pending:
+                finished, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in finished:
+                    done(pending.pop(future), future.result())
+        for future in concurrent.futures.as_completed(pending):
+            done(pending[future], future.result())
+    return design.result()
@@ -0,0 +1,253 @@
+"""Shared-memory buffers for running ensembles of models in multiple processes.
+
+:class:`SharedArrays` lays out a set of named arrays in a single block of shared
+memory. When it is pickled, for instance, to send it to a worker process, only
+the name of the block and the layout of the arrays are transferred. The worker
+attaches to the same memory: arrays are neither serialized nor copied.
+
+:class:`SharedEnsemble` uses this to lay out the state, dependencies and
+outputs of all members of an ensemble. A worker attaches its own model to
+one member with :meth:`SharedEnsemble.attach`. The model then operates on the
+shared state and dependencies directly, and writes its outputs in place.
+
+This module requires Python 3.8 or later (:mod:`multiprocessing.shared_memory`).
+"""
+
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+import numpy as np
+
+import pyfabm
+
+# Alignment (in bytes) of each array within the shared memory block
+ALIGNMENT = 64
+
+
+class SharedArrays(Mapping[str, np.ndarray]):
+    """Named arrays laid out in a single block of shared memory.
+
+    Args:
+        layout: shape and data type of each array
+        name: name of an existing shared memory block to attach to.
+            If not provided, a new block is created.
+    """
+
+    def __init__(
+        self,
+        layout: Mapping[str, Tuple[Tuple[int, ...], Any]],
+        name: Optional[str] = None,
+    ):
+        self.layout = {
+            key: (tuple(shape), np.dtype(dtype))
+            for key, (shape, dtype) in layout.items()
+        }
+        offsets = {}
+        size = 0
+        for key, (shape, dtype) in self.layout.items():
+            offsets[key] = size
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            size += -(-nbytes // ALIGNMENT) * ALIGNMENT
+        self.owner = name is None
+        if self.owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self.name = self._shm.name
+        self._arrays = {
+            key: np.ndarray(
+                shape, dtype=dtype, buffer=self._shm.buf, offset=offsets[key]
+            )
+            for key, (shape, dtype) in self.layout.items()
+        }
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self._arrays[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._arrays)
+
+    def __len__(self) -> int:
+        return len(self._arrays)
+
+    def __reduce__(self):
+        return (SharedArrays, (self.layout, self.name))
+
+    def close(self):
+        """Detach from the shared memory block. All arrays taken from this
+        object must have been released, including those linked to models."""
+        self._arrays = {}
+        self._shm.close()
+
+    def unlink(self):
+        """Free the shared memory block. This must be done once, by the
+        process that created it, after all processes have detached."""
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+
+class SharedEnsemble:
+    """State, dependencies and outputs of an ensemble of models in shared memory.
+
+    All members have the configuration and domain of the template model.
+    The arrays hold one entry per member along their first dimension:
+
+    * ``state`` (or ``interior_state``, ``surface_state``, ``bottom_state``
+      if interior and surface/bottom variables have different shapes)
+    * ``dependency:<name>`` for each selected dependency
+    * ``sources`` (or ``interior_sources``, ``surface_sources``, ``bottom_sources``)
+    * ``interior_diagnostics`` and ``horizontal_diagnostics`` if requested,
+      with all diagnostics that have :attr:`~pyfabm.DiagnosticVariable.save` set
+
+    Args:
+        model: template model
+        size: number of ensemble members
+        dependencies: names of the dependencies to lay out. By default, this
+            includes all required dependencies, and all dependencies for
+            which the template model has a value. Values set in the template
+            model are copied to all members.
+        diagnostics: whether to lay out arrays for diagnostics
+    """
+
+    def __init__(
+        self,
+        model: pyfabm.Model,
+        size: int,
+        dependencies: Optional[Iterable[str]] = None,
+        diagnostics: bool = False,
+    ):
+        if dependencies is None:
+            dependencies = [
+                d.name for d in model.dependencies if d.required or d.value is not None
+            ]
+        self.size = size
+        self.dependencies = list(dependencies)
+        self.diagnostics = diagnostics
+        self._counts = (
+            len(model.interior_state_variables),
+            len(model.surface_state_variables),
+            len(model.bottom_state_variables),
+        )
+        dtype = model.fabm.numpy_dtype
+        state_shapes = model._get_state_shapes(*self._counts)
+        layout: Dict[str, Tuple[Tuple[int, ...], Any]] = {}
+        if len(state_shapes) == 1:
+            layout["state"] = ((size,) + state_shapes[0], dtype)
+            layout["sources"] = ((size,) + state_shapes[0], dtype)
+        else:
+            for category, shape in zip(("interior", "surface", "bottom"), state_shapes):
+                layout[f"{category}_state"] = ((size,) + shape, dtype)
+                layout[f"{category}_sources"] = ((size,) + shape, dtype)
+        for name in self.dependencies:
+            shape = model.dependencies[name]._shape
+            layout[f"dependency:{name}"] = ((size,) + shape, dtype)
+        if diagnostics:
+            for horizontal, variables, shape in (
+                (
+                    False,
+                    model.interior_diagnostic_variables,
+                    model.interior_domain_shape,
+                ),
+                (
+                    True,
+                    model.horizontal_diagnostic_variables,
+                    model.horizontal_domain_shape,
+                ),
+            ):
+                nsave = sum(1 for variable in variables if variable.save)
+                key = "horizontal_diagnostics" if horizontal else "interior_diagnostics"
+                layout[key] = ((size, nsave) + shape, dtype)
+        self.arrays = SharedArrays(layout)
+
+        # Initialize all members with the state and environment of the template
+        for source, target in self._get_state(model, self.arrays, slice(None)):
+            target[...] = source
+        for name in self.dependencies:
+            value = model.dependencies[name].value
+            if value is not None:
+                self.arrays[f"dependency:{name}"][...] = value
+
+    @staticmethod
+    def _get_state(model: pyfabm.Model, arrays: SharedArrays, member: Any):
+        if "state" in arrays:
+            return [(model.state, arrays["state"][member, ...])]
+        return [
+            (model.interior_state, arrays["interior_state"][member, ...]),
+            (model.surface_state, arrays["surface_state"][member, ...]),
+            (model.bottom_state, arrays["bottom_state"][member, ...]),
+        ]
+
+    def _member_arrays(self, prefix: str, member: int):
+        if prefix in self.arrays:
+            # Interior, surface and bottom values are stored together
+            data = self.arrays[prefix][member, ...]
+            nint, nsurf, _ = self._counts
+            return data[:nint], data[nint : nint + nsurf], data[nint + nsurf :]
+        return tuple(
+            self.arrays[f"{category}_{prefix}"][member, ...]
+            for category in ("interior", "surface", "bottom")
+        )
+
+    def attach(self, model: pyfabm.Model, member: int) -> pyfabm.Model:
+        """Make the model use the state and dependencies of the specified
+        ensemble member. This must be done before the model is started."""
+        if "state" in self.arrays:
+            model.link_state(self.arrays["state"][member, ...])
+        else:
+            model.link_state(
+                *(
+                    self.arrays[f"{c}_state"][member, ...]
+                    for c in ("interior", "surface", "bottom")
+                )
+            )
+        for name in self.dependencies:
+            model.dependencies[name].link(
+                self.arrays[f"dependency:{name}"][member, ...]
+            )
+        return model
+
+    def get_sources(
+        self, model: pyfabm.Model, member: int, t: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute sources of the model attached to the specified member and
+        store them in the shared ``sources`` arrays."""
+        return model.get_sources(t, out=self._member_arrays("sources", member))
+
+    def store_diagnostics(self, model: pyfabm.Model, member: int):
+        """Copy the saved diagnostics of the model attached to the specified
+        member to the shared diagnostic arrays."""
+        if not self.diagnostics:
+            raise pyfabm.FABMException(
+                "This ensemble was created without arrays for diagnostics."
+            )
+        # Diagnostics that share their data share a row in the model's
+        # diagnostic blocks, but have a row of their own here.
+        for horizontal, variables, block in (
+            (False, model.interior_diagnostic_variables, model.interior_diagnostics),
+            (True, model.horizontal_diagnostic_variables, model.horizontal_diagnostics),
+        ):
+            rows = [variable.row for variable in variables if variable.save]
+            key = "horizontal_diagnostics" if horizontal else "interior_diagnostics"
+            self.arrays[key][member] = block[rows]
+
+    def close(self):
+        """Detach from the shared memory. Models attached to members must
+        have been closed first."""
+        self.arrays.close()
+
+    def unlink(self):
+        """Free the shared memory (only in the process that created the ensemble)."""
+        self.arrays.unlink()
+
+    def __enter__(self) -> "SharedEnsemble":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.arrays.__exit__(exc_type, exc_value, traceback)
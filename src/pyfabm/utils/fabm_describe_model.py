@@ -30,10 +30,39 @@ def main():
         action="store_true",
         help="Show diagnostics that are by default excluded from output",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            "Reuse model metadata stored on disk by a previous invocation"
+            " if the configuration and FABM library are unchanged"
+        ),
+    )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Obtain model metadata from a server started with fabm_server",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Path of the Unix domain socket the server listens on",
+    )
     args = parser.parse_args()
 
-    # Create model object from YAML file.
-    model = pyfabm.Model(args.path)
+    if args.server:
+        # Obtain model metadata from a server that keeps the model loaded
+        from pyfabm.server import Client
+
+        with Client(args.socket) as client:
+            model = client.describe(args.path)
+    elif args.cache:
+        # Obtain model metadata, if possible without creating the model
+        from pyfabm.cache import get_model_metadata
+
+        model = get_model_metadata(args.path)
+    else:
+        # Create model object from YAML file.
+        model = pyfabm.Model(args.path)
 
     print("Interior state variables:")
     for variable in model.interior_state_variables:
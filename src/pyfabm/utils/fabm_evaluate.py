@@ -19,7 +19,6 @@ except NameError:
     pass
 
 import numpy
-import netCDF4
 import yaml
 
 try:
@@ -38,9 +37,28 @@ def evaluate(
     ignore_missing=False,
     surface=True,
     bottom=True,
+    server=False,
+    socket=None,
+    cell_thickness=None,
 ):
-    # Create model object from YAML file.
-    model = pyfabm.Model(yaml_path)
+    if cell_thickness is None and (surface or bottom):
+        print(
+            "ERROR: --cell_thickness must be specified to include surface or"
+            " bottom processes (or use --no_surface and --no_bottom)"
+        )
+        sys.exit(2)
+
+    if not server:
+        # Create model object from YAML file.
+        model = pyfabm.Model(yaml_path)
+    else:
+        # Use a model kept loaded by a server
+        from pyfabm.server import Client, RemoteModel
+
+        client = Client(socket)
+        model = RemoteModel(client, yaml_path)
+    if cell_thickness is not None:
+        model.cell_thickness = cell_thickness
 
     allvariables = list(model.state_variables) + list(model.dependencies)
     name2variable = {}
@@ -70,7 +88,7 @@ def evaluate(
         for path in sources:
             if path.endswith("yaml"):
                 with open(path) as f:
-                    data = yaml.load(f)
+                    data = yaml.safe_load(f)
                 for name, value in data.items():
                     variable = name2variable.get(name)
                     if variable is None:
@@ -83,6 +101,8 @@ def evaluate(
                         sys.exit(1)
                     set_variable(variable, float(value), path)
             else:
+                import netCDF4
+
                 with netCDF4.Dataset(path) as nc:
                     for variable in allvariables:
                         if variable.output_name not in nc.variables:
@@ -140,6 +160,11 @@ def evaluate(
     missing = set_state(**location)
     if missing and not ignore_missing:
         sys.exit(1)
+    for variable in missing:
+        if variable.value is None:
+            variable.value = 0.0
+    if not server:
+        model.start()
 
     print("State variables with largest value:")
     for variable in sorted(
@@ -196,7 +221,7 @@ def evaluate(
 
     i = relative_rates.argmin()
     print(
-        f"Minimum time step = {-1.0 / relative_rates[i]:%.3f} s due to decrease"
+        f"Minimum time step = {-1.0 / relative_rates[i]:.3f} s due to decrease"
         f" in {model.state_variables[i].name}"
     )
 
@@ -264,12 +289,29 @@ def main():
         help="Whether to omit surface processes (do_bottom calls)",
         default=True,
     )
+    parser.add_argument(
+        "--cell_thickness",
+        type=float,
+        help=(
+            "Thickness of the grid cell (m), used to convert surface and bottom"
+            " fluxes into rates of change of interior state variables"
+        ),
+    )
     parser.add_argument(
         "--pause",
         action="store_true",
         help="Whether to pause before model evaluation to manually attach a debugger.",
         default=False,
     )
+    parser.add_argument(
+        "--server",
+        action="store_true",
+        help="Evaluate the model with a server started with fabm_server",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Path of the Unix domain socket the server listens on",
+    )
     args = parser.parse_args()
 
     if args.pause:
@@ -285,6 +327,9 @@ def main():
         ignore_missing=args.ignore_missing,
         surface=args.surface,
         bottom=args.bottom,
+        server=args.server,
+        socket=args.socket,
+        cell_thickness=args.cell_thickness,
     )
 
 
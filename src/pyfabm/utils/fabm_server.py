@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+
+"""
+This script runs a server that keeps FABM models loaded and started, so that
+command line tools given the --server option (e.g., fabm_evaluate,
+fabm_describe_model) do not need to load FABM and create a model on every
+invocation. The server listens on a Unix domain socket until it is stopped
+with Ctrl-C or with the --stop option.
+"""
+
+import sys
+import logging
+
+try:
+    import pyfabm
+    import pyfabm.server
+except ImportError:
+    print("Unable to load pyfabm. See https://fabm.net/python.")
+    sys.exit(1)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--socket",
+        help=(
+            "Path of the Unix domain socket to listen on (default:"
+            " $PYFABM_SERVER_SOCKET, or server.sock in the pyfabm cache directory)"
+        ),
+    )
+    parser.add_argument(
+        "--pool_size",
+        type=int,
+        default=8,
+        help="Maximum number of models to keep loaded",
+    )
+    parser.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the server that is listening on the socket",
+    )
+    args = parser.parse_args()
+
+    if args.stop:
+        with pyfabm.server.Client(args.socket) as client:
+            client.shutdown()
+        return
+
+    # Model creation messages go to the server log, not to clients
+    logging.basicConfig(level=logging.WARNING)
+    pyfabm.logger = logging.getLogger("fabm_server")
+
+    try:
+        server = pyfabm.server.Server(args.socket, pool_size=args.pool_size)
+    except OSError as e:
+        print(f"Unable to start server: {e.strerror}")
+        sys.exit(1)
+    with server:
+        print(f"Listening on {server.path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
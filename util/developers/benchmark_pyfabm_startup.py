@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+"""Measure the time needed to import pyfabm and to create a first model in a
+fresh Python interpreter. This is the startup cost paid by every invocation of
+command line utilities such as fabm_describe_model, and by every worker process.
+Each measurement is repeated in a new interpreter; the median is reported and
+compared against the specified budgets."""
+
+import os
+import sys
+import json
+import subprocess
+import statistics
+
+SCRIPT_ROOT = os.path.abspath(os.path.dirname(__file__))
+FABM_BASE = os.path.join(SCRIPT_ROOT, "../..")
+
+MEASURE = """
+import json, sys, timeit, logging
+start = timeit.default_timer()
+import pyfabm
+imported = timeit.default_timer()
+pyfabm.logger = logging.getLogger("benchmark")
+model = pyfabm.Model(sys.argv[1], shape=tuple(int(n) for n in sys.argv[2:]))
+created = timeit.default_timer()
+print(json.dumps({"import": imported - start, "model": created - imported}))
+"""
+
+
+def measure(config: str, shape, repeat: int):
+    timings = {"import": [], "model": []}
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", MEASURE, config] + [str(n) for n in shape],
+            universal_newlines=True,
+        )
+        result = json.loads(output.rstrip("\n").rsplit("\n", 1)[-1])
+        for key, value in result.items():
+            timings[key].append(value)
+    return timings
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--config",
+        default=os.path.join(FABM_BASE, "testcases/fabm-gotm-npzd.yaml"),
+        help="model configuration to create, default: testcases/fabm-gotm-npzd.yaml",
+    )
+    parser.add_argument(
+        "--shape",
+        type=int,
+        nargs="*",
+        default=[],
+        help="domain shape (no values for a 0D model)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=10,
+        help="number of fresh interpreters to measure in",
+    )
+    parser.add_argument(
+        "--import_budget",
+        type=float,
+        default=None,
+        help="maximum acceptable median time for import pyfabm (s)",
+    )
+    parser.add_argument(
+        "--model_budget",
+        type=float,
+        default=None,
+        help="maximum acceptable median time for creating the first model (s)",
+    )
+    args = parser.parse_args()
+
+    timings = measure(args.config, args.shape, args.repeat)
+    budgets = {"import": args.import_budget, "model": args.model_budget}
+    over_budget = False
+    for key, values in timings.items():
+        median = statistics.median(values)
+        print(
+            f"{key}: median {median * 1000:.1f} ms"
+            f" (min {min(values) * 1000:.1f} ms, max {max(values) * 1000:.1f} ms)",
+            end="",
+        )
+        budget = budgets[key]
+        if budget is not None:
+            within = median <= budget
+            over_budget = over_budget or not within
+            print(
+                f", budget {budget * 1000:.1f} ms: {'OK' if within else 'EXCEEDED'}",
+                end="",
+            )
+        print()
+    if over_budget:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
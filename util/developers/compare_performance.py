@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 
 # This script operates on outputs of run_unit_tests.py --performance
+# To track performance across commits and detect significant regressions,
+# use performance_history.py instead.
 
 from __future__ import print_function
 
@@ -0,0 +1,412 @@
+#!/usr/bin/env python
+
+"""Store timings of FABM performance tests in an SQLite database and detect
+regressions between commits.
+
+Each sample is the runtime of one test run for a given commit, FABM host and
+testcase on a given machine. Machines are identified by a fingerprint of their
+hardware, operating system, compiler (executable and version) and build type,
+so that timings are only compared between runs made under the same conditions.
+The host name is recorded in the description of a machine, but is not part of
+its fingerprint: timings from identical machines with different names (e.g.,
+CI runners) are compared.
+
+Samples are added by run_unit_tests.py --performance --history <DATABASE>, or
+imported from its reports with the "import" command. Each report comes with a
+description of the machine that produced it (<REPORT>.machine.json), which
+"import" records instead of the machine it runs on. The "compare" command
+compares two commits: for every machine, host and testcase, it estimates the
+relative change in the median runtime, along with a bootstrap confidence
+interval. A regression is reported only if the entire confidence interval
+lies above the threshold; the exit code is then 1.
+
+Example:
+
+    run_unit_tests.py --performance --repeat 10 --history performance.db
+    performance_history.py compare performance.db
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import hashlib
+import argparse
+import platform
+import statistics
+import subprocess
+from typing import Iterable, List, Mapping, Optional, Sequence, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS machines (
+    id INTEGER PRIMARY KEY,
+    fingerprint TEXT UNIQUE NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    id INTEGER PRIMARY KEY,
+    commit_id TEXT NOT NULL,
+    branch TEXT,
+    machine INTEGER NOT NULL REFERENCES machines(id),
+    host TEXT NOT NULL,
+    testcase TEXT NOT NULL,
+    duration REAL NOT NULL,
+    recorded REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_by_commit ON samples (commit_id, machine);
+"""
+
+
+def get_cpu_model() -> str:
+    if os.path.isfile("/proc/cpuinfo"):
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    return platform.processor()
+
+
+def get_compiler_version(compiler: str) -> str:
+    """First line of the output of ``<compiler> --version``."""
+    try:
+        output = subprocess.check_output(
+            (compiler, "--version"), stderr=subprocess.STDOUT
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    lines = output.decode("utf-8", "replace").strip().splitlines()
+    return lines[0].strip() if lines else "unknown"
+
+
+def get_build_settings(build_dir: str, config: str) -> Tuple[str, str]:
+    """Return the Fortran compiler and build type of a CMake build directory.
+    ``config`` is the configuration that was built; it is the build type if
+    the generator supports multiple configurations (e.g., Visual Studio)."""
+    cache = {}
+    with open(os.path.join(build_dir, "CMakeCache.txt")) as f:
+        for line in f:
+            name, sep, value = line.rstrip("\n").partition("=")
+            if sep and not line.startswith(("#", "//")):
+                cache[name.split(":", 1)[0]] = value
+    build_type = cache.get("CMAKE_BUILD_TYPE") or "none"
+    if "CMAKE_CONFIGURATION_TYPES" in cache:
+        build_type = config
+    return cache["CMAKE_Fortran_COMPILER"], build_type
+
+
+def get_machine(compiler: str, build_type: str) -> Mapping[str, str]:
+    """Describe the machine that runs the performance tests, including the
+    Fortran compiler (executable and version) and build type used. All
+    entries except the host name (``node``) are part of its fingerprint."""
+    return dict(
+        node=platform.node(),
+        system=platform.system(),
+        machine=platform.machine(),
+        cpu=get_cpu_model(),
+        cpu_count=str(os.cpu_count()),
+        compiler=compiler,
+        compiler_version=get_compiler_version(compiler),
+        build_type=build_type,
+    )
+
+
+def get_fingerprint(machine: Mapping[str, str]) -> str:
+    properties = {key: value for key, value in machine.items() if key != "node"}
+    encoded = json.dumps(properties, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()[:16]
+
+
+def get_git_commit(cwd: Optional[str] = None) -> Tuple[str, str]:
+    """Return the commit (as described by git, with a -dirty suffix if there
+    are local changes) and branch of the working tree."""
+
+    def git(*args: str) -> str:
+        output = subprocess.check_output(("git",) + args, cwd=cwd)
+        return output.decode("ascii").strip()
+
+    commit = git("describe", "--always", "--dirty")
+    branch = git("name-rev", "--name-only", "HEAD")
+    return commit, branch
+
+
+class History:
+    """Database with timings of performance tests."""
+
+    def __init__(self, path: str):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def get_machine_id(self, machine: Mapping[str, str]) -> int:
+        fingerprint = get_fingerprint(machine)
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO machines (fingerprint, description) VALUES (?, ?)",
+                (fingerprint, json.dumps(machine, sort_keys=True)),
+            )
+        (machine_id,) = self.connection.execute(
+            "SELECT id FROM machines WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return machine_id
+
+    def add_samples(
+        self,
+        commit: str,
+        branch: Optional[str],
+        machine: Mapping[str, str],
+        host: str,
+        testcase: str,
+        durations: Iterable[float],
+    ):
+        """Record the durations (s) of repeated runs of one test."""
+        machine_id = self.get_machine_id(machine)
+        now = time.time()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO samples (commit_id, branch, machine, host, testcase,"
+                " duration, recorded) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (commit, branch, machine_id, host, testcase, duration, now)
+                    for duration in durations
+                ],
+            )
+
+    def get_commits(self) -> List[Tuple[str, Optional[str], int, float]]:
+        """Commits with their branch, number of samples and time of the
+        first sample, in the order in which they were recorded."""
+        return self.connection.execute(
+            "SELECT commit_id, branch, COUNT(*), MIN(recorded) FROM samples"
+            " GROUP BY commit_id ORDER BY MIN(recorded)"
+        ).fetchall()
+
+    def get_samples(self, commit: str) -> Mapping[Tuple[int, str, str], List[float]]:
+        """Durations recorded for a commit, per machine, host and testcase."""
+        samples = {}
+        for machine, host, testcase, duration in self.connection.execute(
+            "SELECT machine, host, testcase, duration FROM samples"
+            " WHERE commit_id = ?",
+            (commit,),
+        ):
+            samples.setdefault((machine, host, testcase), []).append(duration)
+        return samples
+
+    def get_machine(self, fingerprint: str) -> Optional[Mapping[str, str]]:
+        """Description of the machine with the specified fingerprint, or
+        ``None`` if it is not in the database."""
+        row = self.connection.execute(
+            "SELECT description FROM machines WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def get_machine_descriptions(self) -> Mapping[int, Mapping[str, str]]:
+        return {
+            machine_id: json.loads(description)
+            for machine_id, description in self.connection.execute(
+                "SELECT id, description FROM machines"
+            )
+        }
+
+
+def bootstrap_change(
+    reference: Sequence[float],
+    other: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 2000,
+    seed: int = 0,
+) -> Tuple[float, float, float]:
+    """Estimate the relative change in median duration from ``reference`` to
+    ``other``, with a percentile bootstrap confidence interval. Returns the
+    estimate and the lower and upper bounds of the interval."""
+    rng = random.Random(seed)
+    changes = []
+    for _ in range(resamples):
+        ref_median = statistics.median(rng.choices(reference, k=len(reference)))
+        other_median = statistics.median(rng.choices(other, k=len(other)))
+        changes.append(other_median / ref_median - 1.0)
+    changes.sort()
+    alpha = 0.5 * (1.0 - confidence)
+    low = changes[int(alpha * (resamples - 1))]
+    high = changes[int(round((1.0 - alpha) * (resamples - 1)))]
+    estimate = statistics.median(other) / statistics.median(reference) - 1.0
+    return estimate, low, high
+
+
+def compare(
+    history: History,
+    reference: str,
+    other: str,
+    confidence: float,
+    threshold: float,
+    min_samples: int,
+) -> int:
+    """Compare timings of two commits and print the result for each machine,
+    host and testcase. Returns the number of regressions."""
+    ref_samples = history.get_samples(reference)
+    other_samples = history.get_samples(other)
+    machines = history.get_machine_descriptions()
+    keys = sorted(set(ref_samples) & set(other_samples))
+    print("Machines:")
+    for machine_id in sorted({machine for machine, _, _ in keys}):
+        description = ", ".join(
+            f"{key}={value}" for key, value in sorted(machines[machine_id].items())
+        )
+        print(f"{machine_id}\t{description}")
+    print(f"Change in runtime from {reference} to {other}")
+    print(f"(median, {confidence:.0%} confidence interval, threshold {threshold:.1%}):")
+    print("machine\thost\ttestcase\tsamples\tchange\tinterval\tverdict")
+    nregressions = 0
+    for key in keys:
+        machine, host, testcase = key
+        a, b = ref_samples[key], other_samples[key]
+        counts = f"{len(a)}/{len(b)}"
+        label = f"{machine}\t{host}\t{testcase}\t{counts}"
+        if min(len(a), len(b)) < min_samples:
+            print(f"{label}\tNA\tNA\tinsufficient samples")
+            continue
+        change, low, high = bootstrap_change(a, b, confidence)
+        if low > threshold:
+            verdict = "REGRESSION"
+            nregressions += 1
+        elif high < -threshold:
+            verdict = "improvement"
+        elif low > -threshold and high < threshold:
+            verdict = "no change"
+        else:
+            verdict = "inconclusive"
+        print(f"{label}\t{change:+.1%}\t[{low:+.1%}, {high:+.1%}]\t{verdict}")
+    missing = set(ref_samples) ^ set(other_samples)
+    if missing:
+        print(f"{len(missing)} tests were timed for only one of the commits.")
+    return nregressions
+
+
+def save_machine(path: str, machine: Mapping[str, str]):
+    """Save the description of a machine to accompany a report."""
+    with open(path, "w") as f:
+        json.dump(machine, f, indent=2, sort_keys=True)
+
+
+def load_report(path: str) -> Mapping[str, List[float]]:
+    """Load durations per host from a report of run_unit_tests.py --performance."""
+    result = {}
+    with open(path) as f:
+        f.readline()
+        for line in f:
+            items = line.rstrip("\n").split("\t")
+            durations = [float(item) for item in items[1:-1] if item != "NA"]
+            if durations:
+                result[items[0]] = durations
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("database", help="SQLite database with performance history")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    import_parser = subparsers.add_parser(
+        "import", help="import report of run_unit_tests.py --performance"
+    )
+    import_parser.add_argument("report")
+    import_parser.add_argument("--commit", required=True)
+    import_parser.add_argument("--branch")
+    import_parser.add_argument("--testcase", default="fabm.yaml")
+    import_parser.add_argument(
+        "--machine",
+        help="machine that produced the report: a JSON file with its description,"
+        " or the fingerprint of a machine in the database"
+        " (default: <REPORT>.machine.json)",
+    )
+
+    subparsers.add_parser("list", help="list commits with recorded timings")
+
+    compare_parser = subparsers.add_parser(
+        "compare", help="detect performance regressions between two commits"
+    )
+    compare_parser.add_argument(
+        "other", nargs="?", help="commit to test (default: last recorded)"
+    )
+    compare_parser.add_argument(
+        "--reference",
+        help="commit to compare against (default: recorded before the tested commit)",
+    )
+    compare_parser.add_argument(
+        "--confidence", type=float, default=0.95, help="confidence level"
+    )
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.02,
+        help="smallest relative change in runtime to report, default: 0.02",
+    )
+    compare_parser.add_argument(
+        "--min_samples",
+        type=int,
+        default=3,
+        help="minimum number of samples per commit, default: 3",
+    )
+    args = parser.parse_args()
+
+    history = History(args.database)
+    try:
+        if args.command == "import":
+            machine_path = args.machine or f"{args.report}.machine.json"
+            if os.path.isfile(machine_path):
+                with open(machine_path) as f:
+                    machine = json.load(f)
+            else:
+                machine = args.machine and history.get_machine(args.machine)
+                if not machine:
+                    print(
+                        f"{machine_path} is neither a machine description nor"
+                        " the fingerprint of a machine in the database."
+                        " Specify the machine that produced the report with --machine."
+                    )
+                    return 2
+            for host, durations in load_report(args.report).items():
+                history.add_samples(
+                    args.commit,
+                    args.branch,
+                    machine,
+                    host,
+                    args.testcase,
+                    durations,
+                )
+        elif args.command == "list":
+            print("commit\tbranch\tsamples")
+            for commit, branch, count, _ in history.get_commits():
+                print(f"{commit}\t{branch}\t{count}")
+        else:
+            commits = [commit for commit, _, _, _ in history.get_commits()]
+            other = args.other or (commits[-1] if commits else None)
+            if other not in commits:
+                print(f"No timings recorded for commit {other}.")
+                return 2
+            reference = args.reference
+            if reference is None:
+                index = commits.index(other)
+                if index == 0:
+                    print(f"No timings recorded before commit {other}.")
+                    return 2
+                reference = commits[index - 1]
+            if compare(
+                history,
+                reference,
+                other,
+                args.confidence,
+                args.threshold,
+                args.min_samples,
+            ):
+                return 1
+    finally:
+        history.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,11 @@ import collections
 import yaml
 import venv
 import logging
-from typing import Optional, Mapping
+import fnmatch
+import threading
+import traceback
+import concurrent.futures
+from typing import Any, Dict, List, Optional, Mapping, Tuple
 
 SCRIPT_ROOT = os.path.abspath(os.path.dirname(__file__))
 FABM_BASE = os.path.join(SCRIPT_ROOT, "../..")
@@ -22,6 +26,19 @@ FABM_BASE = os.path.join(SCRIPT_ROOT, "../..")
 DEFAULT_FABM_URL = "https://github.com/fabm-model/fabm.git"
 DEFAULT_GOTM_URL = "https://github.com/gotm-model/code.git"
 
+# Output times per day in pyfabm regression tests
+# (time steps must divide the interval between output times)
+OUTPUTS_PER_DAY = 8
+
+# Name of the array with output times in golden snapshots
+SNAPSHOT_TIME = "_time"
+
+# Testcases excluded from pyfabm regression tests, with the reason
+REGRESSION_SKIP = {
+    "fabm-bb-lorenz63": "chaotic, with rates per second that the time step"
+    " does not resolve",
+}
+
 def hack_pyyaml():
     # Do not convert on/off to bool
     # [done by pyyaml according to YAML 1.1, dropped from YAML 1.2]
@@ -143,37 +160,156 @@ def cmake(
     return ret == 0
 
 
-def compare_netcdf(path: str, ref_path: str):
+# Target size of the chunks in which NetCDF variables are compared (bytes)
+COMPARE_CHUNK_SIZE = 64 * 1024**2
+
+
+def compare_netcdf_variable(
+    ncvar,
+    ncvar_ref,
+    lock: threading.Lock,
+    stop: Optional[threading.Event] = None,
+    chunk_size: int = COMPARE_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """Compare a NetCDF variable against its reference, reading both in
+    chunks along the record (unlimited) dimension, or along the first
+    dimension if there is no record dimension. Reads, including those of
+    metadata, are serialized with ``lock`` as the NetCDF library is not
+    thread-safe; comparisons of chunks can run concurrently. Masked values
+    are ignored. If ``stop`` is provided, it is set once a mismatch is found,
+    and the comparison ends early when it is set (by this or any other
+    variable).
+
+    Returns the number of values compared (``n``), the number of invalid
+    (non-finite) values (``ninvalid``), the number of differing values
+    (``ndiff``), the maximum absolute and relative difference, the index of
+    the first invalid or differing value (``first``, C order), and whether
+    all values were compared (``complete``)."""
     import numpy
+
+    result = dict(
+        n=0, ninvalid=0, ndiff=0, max_abs=0.0, max_rel=0.0, first=None, complete=True
+    )
+
+    # Metadata queries go through the NetCDF library as well
+    with lock:
+        shape, ref_shape = ncvar.shape, ncvar_ref.shape
+        axis = 0
+        for i, dimname in enumerate(ncvar.dimensions):
+            if ncvar.group().dimensions[dimname].isunlimited():
+                axis = i
+                break
+        itemsize = ncvar.dtype.itemsize
+    if shape != ref_shape:
+        result.update(shape=(shape, ref_shape))
+        return result
+    if len(shape) == 0 or 0 in shape:
+        slices = [(0, (Ellipsis,))] if len(shape) == 0 else []
+    else:
+        size = int(numpy.prod(shape))
+        step = max(1, chunk_size * shape[axis] // (itemsize * size))
+        prefix = (slice(None),) * axis
+        slices = [
+            (start, prefix + (slice(start, start + step),))
+            for start in range(0, shape[axis], step)
+        ]
+
+    for offset, index in slices:
+        if stop is not None and stop.is_set():
+            result["complete"] = False
+            break
+        with lock:
+            dat = ncvar[index]
+            ref = ncvar_ref[index]
+        masked = numpy.ma.getmaskarray(dat) | numpy.ma.getmaskarray(ref)
+        dat = numpy.atleast_1d(numpy.ma.getdata(dat).astype(float))
+        ref = numpy.atleast_1d(numpy.ma.getdata(ref).astype(float))
+        invalid = ~numpy.isfinite(dat) & ~masked
+        with numpy.errstate(invalid="ignore", divide="ignore"):
+            delta = numpy.abs(dat - ref)
+            delta[masked | invalid] = 0.0
+            rel = delta / numpy.abs(ref)
+            rel[delta == 0.0] = 0.0
+        bad = invalid | (delta != 0.0)
+        result["n"] += int(dat.size - masked.sum())
+        result["ninvalid"] += int(invalid.sum())
+        result["ndiff"] += int((delta != 0.0).sum())
+        # fmax ignores NaN, which arises if the reference is not finite
+        result["max_abs"] = max(result["max_abs"], numpy.fmax.reduce(delta.ravel()))
+        result["max_rel"] = max(result["max_rel"], numpy.fmax.reduce(rel.ravel()))
+        if bad.any():
+            if result["first"] is None:
+                first = [int(i) for i in numpy.unravel_index(bad.argmax(), bad.shape)]
+                if len(shape) > 0:
+                    first[axis] += offset
+                result["first"] = tuple(first[: len(shape)])
+            if stop is not None:
+                stop.set()
+    return result
+
+
+def compare_netcdf(
+    path: str,
+    ref_path: str,
+    stop_early: bool = False,
+    max_workers: Optional[int] = None,
+) -> bool:
+    """Compare all variables in a NetCDF file against a reference file.
+    Variables are streamed in chunks along the record dimension and
+    compared in parallel threads. Returns whether all variables match
+    exactly. With ``stop_early``, the comparison ends as soon as one
+    mismatch is found; statistics then cover only the values compared."""
     import netCDF4
 
-    perfect = True
     nc = netCDF4.Dataset(path)
     nc_ref = netCDF4.Dataset(ref_path)
-    for varname in nc.variables.keys():
-        if varname not in nc_ref.variables or varname in (
-            "lon",
-            "lat",
-            "h",
-            "z",
-            "time",
-        ):
-            continue
-        ncvar = nc.variables[varname]
-        ncvar_ref = nc_ref.variables[varname]
-        dat = ncvar[...]
-        valid = numpy.isfinite(dat)
-        if not valid.all():
-            nbad = valid.size - valid.sum()
-            print(f"    {varname}: {nbad} of {valid.size} values are invalid")
-            perfect = False
-        else:
-            delta = dat - ncvar_ref[...]
-            maxdelta = numpy.abs(delta).max()
-            perfect = perfect and maxdelta == 0.0
-            print(f"    {varname}: max abs difference = {maxdelta}")
+    lock = threading.Lock()
+    stop = threading.Event() if stop_early else None
+    varnames = [
+        varname
+        for varname in nc.variables.keys()
+        if varname in nc_ref.variables
+        and varname not in ("lon", "lat", "h", "z", "time")
+    ]
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(
+                compare_netcdf_variable,
+                nc.variables[varname],
+                nc_ref.variables[varname],
+                lock,
+                stop,
+            )
+            for varname in varnames
+        ]
+        results = [future.result() for future in futures]
     nc.close()
     nc_ref.close()
+
+    perfect = True
+    for varname, result in zip(varnames, results):
+        if "shape" in result:
+            shape, ref_shape = result["shape"]
+            print(f"    {varname}: shape {shape} differs from reference {ref_shape}")
+            perfect = False
+            continue
+        if result["n"] == 0 and not result["complete"]:
+            print(f"    {varname}: skipped")
+            continue
+        summary = (
+            f"max abs difference = {result['max_abs']},"
+            f" max rel difference = {result['max_rel']}"
+        )
+        if result["ninvalid"]:
+            summary = (
+                f"{result['ninvalid']} of {result['n']} values are invalid, {summary}"
+            )
+        if result["first"] is not None:
+            summary += f", first mismatch at {result['first']}"
+            perfect = False
+        if not result["complete"]:
+            summary += f" (stopped after {result['n']} values)"
+        print(f"    {varname}: {summary}")
     return perfect
 
 
@@ -233,6 +369,7 @@ def compare(
     gotm_branch: Optional[str] = None,
     fabm_ref_branch: Optional[str] = None,
     gotm_ref_branch: Optional[str] = None,
+    stop_early: bool = False,
 ):
     assert fabm_branch != fabm_ref_branch or gotm_branch != gotm_ref_branch
     fabm_base = os.path.join(work_root, "code/fabm")
@@ -281,6 +418,7 @@ def compare(
             if compare_netcdf(
                 os.path.join(testcase_dir, "result_ref.nc"),
                 os.path.join(testcase_dir, "result.nc"),
+                stop_early=stop_early,
             ):
                 success.append(name)
             else:
@@ -313,6 +451,7 @@ def test_gotm(args, testcases: Mapping[str, str]):
             args.cmake,
             cmake_arguments=args.cmake_arguments,
             fabm_ref_branch=args.fabm_ref,
+            stop_early=args.stop_early,
         )
     else:
         test(
@@ -325,7 +464,11 @@ def test_gotm(args, testcases: Mapping[str, str]):
         )
 
 
-def test_pyfabm(args, testcases: Mapping[str, str]):
+def install_pyfabm(args) -> Optional[int]:
+    """Make pyfabm with the current source code available. Unless --inplace
+    is specified, this is done in a new virtual environment, in which this
+    script is then run again; its return code is returned. Otherwise, pyfabm
+    is installed into the current Python environment and None is returned."""
     if not args.inplace:
         env_root = os.path.join(args.work_root, "python")
         print(f"Setting up virtual environment in {env_root}...")
@@ -354,9 +497,16 @@ def test_pyfabm(args, testcases: Mapping[str, str]):
         )
         != 0
     ):
-        return
+        return 1
+
+
+def test_pyfabm(args, testcases: Mapping[str, str]):
+    retcode = install_pyfabm(args)
+    if retcode is not None:
+        return retcode
     with open(os.path.join(SCRIPT_ROOT, "environment.yaml")) as f:
         environment = yaml.safe_load(f)
+    import numpy
     import pyfabm
 
     pyfabm.logger = logging.getLogger()
@@ -365,34 +515,79 @@ def test_pyfabm(args, testcases: Mapping[str, str]):
     for case, path in testcases.items():
         print(f"  {case}... ", end="")
         sys.stdout.flush()
-        m0d = pyfabm.Model(path)
-        counts = collections.Counter(v.name for v in m0d.variables).items()
-        dup = [v for v, c in counts if c > 1]
-        assert not dup, f"Duplicate variable names in 0D: {dup}"
-        m1d = pyfabm.Model(path, shape=(5,))
-        counts = collections.Counter(v.name for v in m1d.variables).items()
-        dup = [v for v, c in counts if c > 1]
-        assert not dup, f"Duplicate variable names in 1D: {dup}"
-        for m in (m0d, m1d):
+        # Besides 0D and 1D, evaluate single-layer 2D and 3D domains (depth
+        # first), in which every column should reproduce the 0D results
+        models = {}
+        for shape in ((), (5,), (1, 5), (1, 2, 5)):
+            m = pyfabm.Model(path, shape=shape)
+            counts = collections.Counter(v.name for v in m.variables).items()
+            dup = [v for v, c in counts if c > 1]
+            assert not dup, f"Duplicate variable names in {len(shape)}D: {dup}"
             m.cell_thickness = environment["cell_thickness"]
+            if m.fabm.mask_type:
+                m.mask = (1,) * m.fabm.mask_type
+            if m.fabm.variable_bottom_index:
+                m.bottom_index = m.interior_domain_shape[m.fabm.idepthdim]
             for d in m.dependencies:
                 dependency_names.add(d.name)
                 if d.required:
                     d.value = environment[d.name]
             m.start()
-        r0d = m0d.getRates()
-        r1d = m1d.getRates()
-        if (r1d != r1d[:, :1]).any():
-            ran = r1d.max(axis=1) - r1d.min(axis=1)
-            bad = {}
-            for var, val in zip(m1d.state_variables, ran):
-                if val != 0.0:
-                    bad[var.name] = val
-            assert False, f"Variability among 1D results: {r1d} (range: {bad})"
-        assert (
-            r1d[:, 0] == r0d
-        ).all(), f"Mismatch between 0D and 1D results: {r0d} vs {r1d[:, 0]}. Difference: {r1d[:, 0] - r0d}"
+            models[shape] = m
+        def get_rates(m: pyfabm.Model):
+            # Rates of all state variables (rows) at all points (columns)
+            sources = [
+                s.reshape(s.shape[0], int(numpy.prod(s.shape[1:])))
+                for s in m.get_sources()
+            ]
+            return numpy.concatenate(sources)
+
+        r0d = models[()].getRates()
+        for shape, m in models.items():
+            if not shape:
+                continue
+            r = get_rates(m)
+            if (r != r[:, :1]).any():
+                ran = r.max(axis=1) - r.min(axis=1)
+                bad = {}
+                for var, val in zip(m.state_variables, ran):
+                    if val != 0.0:
+                        bad[var.name] = val
+                assert (
+                    False
+                ), f"Variability among {len(shape)}D results: {r} (range: {bad})"
+            assert (
+                r[:, 0] == r0d
+            ).all(), f"Mismatch between 0D and {len(shape)}D results: {r0d} vs {r[:, 0]}. Difference: {r[:, 0] - r0d}"
+        for m in models.values():
+            m.close()
+        print("SUCCESS")
+    case = "fabm-gotm-npzd" if "fabm-gotm-npzd" in testcases else next(iter(testcases))
+    for shape in ((5,), ()):
+        print(f"Checking shared ensemble with shape {shape} ({case})... ", end="")
+        sys.stdout.flush()
+        check_shared_ensemble(testcases[case], environment, shape)
+        print("SUCCESS")
+        print(f"Checking forcing with shape {shape} ({case})... ", end="")
+        sys.stdout.flush()
+        check_forcing(testcases[case], environment, shape)
         print("SUCCESS")
+    print(f"Checking command line tools ({case})... ", end="")
+    sys.stdout.flush()
+    check_command_line_tools(testcases[case], environment)
+    print("SUCCESS")
+    print(f"Checking lifetime of diagnostic arrays ({case})... ", end="")
+    sys.stdout.flush()
+    check_diagnostic_lifetime(testcases[case], environment)
+    print("SUCCESS")
+    print(f"Checking memory use of repeatedly created models ({case})... ", end="")
+    sys.stdout.flush()
+    growth = check_memory(testcases[case], environment)
+    if growth is None:
+        print("SKIPPED (resident memory unknown on this platform)")
+    else:
+        assert growth < 1024, f"Resident memory grows by {growth:.0f} bytes per model"
+        print(f"SUCCESS ({growth:.0f} bytes per model)")
     pyfabm_libs = ", ".join([f"{n}={l._name}" for n, l in pyfabm.name2lib.items()])
     print(f"pyfabm {pyfabm.__version__} loaded from {pyfabm.__file__} ({pyfabm_libs})")
     try:
@@ -404,6 +599,391 @@ def test_pyfabm(args, testcases: Mapping[str, str]):
         print(f"Combined dependency list:\n{dependencies}")
 
 
+def check_shared_ensemble(
+    path: str, environment: Mapping[str, float], shape: Tuple[int, ...]
+):
+    """Attach models to the members of a shared ensemble and verify that
+    each computes its sources from, and into, its own member, and stores all
+    its diagnostics (including aliases that share data) in its own member."""
+    import numpy
+    import pyfabm
+    import pyfabm.shared
+
+    def create() -> pyfabm.Model:
+        m = pyfabm.Model(path, shape=shape)
+        m.cell_thickness = environment["cell_thickness"]
+        for d in m.dependencies:
+            if d.required:
+                d.value = environment[d.name]
+        m.select_diagnostics("all", verbose=False)
+        return m
+
+    with create() as template, pyfabm.shared.SharedEnsemble(
+        template, 2, diagnostics=True
+    ) as ensemble:
+        template.start()
+        expected = template.getRates()
+        expected_diagnostics = {
+            key: numpy.array([v.value for v in variables if v.save])
+            for key, variables in (
+                ("interior_diagnostics", template.interior_diagnostic_variables),
+                ("horizontal_diagnostics", template.horizontal_diagnostic_variables),
+            )
+        }
+        for member in range(ensemble.size):
+            with ensemble.attach(create(), member) as m:
+                m.start()
+                ensemble.get_sources(m, member)
+                ensemble.store_diagnostics(m, member)
+        if "state" in ensemble.arrays:
+            sources = ensemble.arrays["sources"]
+        else:
+            sources = numpy.concatenate(
+                [
+                    ensemble.arrays[f"{c}_sources"].reshape(ensemble.size, -1)
+                    for c in ("interior", "surface", "bottom")
+                ],
+                axis=1,
+            )
+        for member in range(ensemble.size):
+            assert (
+                sources[member, ...] == expected
+            ).all(), f"Sources of member {member} differ from template: {sources[member, ...]} vs {expected}"
+            for key, values in expected_diagnostics.items():
+                assert numpy.array_equal(
+                    ensemble.arrays[key][member, ...], values, equal_nan=True
+                ), f"{key} of member {member} differ from template"
+
+
+def check_forcing(path: str, environment: Mapping[str, float], shape: Tuple[int, ...]):
+    """Force the required dependencies of a model with time-varying data, both
+    in the model's own data type (linked without copying) and in single
+    precision (copied), and verify that the rates match those computed with
+    the same values set directly."""
+    import numpy
+    import pyfabm
+    import pyfabm.forcing
+
+    factors = numpy.array([1.0, 0.5, 0.25])
+
+    def create() -> pyfabm.Model:
+        m = pyfabm.Model(path, shape=shape)
+        m.cell_thickness = environment["cell_thickness"]
+        return m
+
+    with create() as m, create() as reference:
+        names = [d.name for d in m.dependencies if d.required]
+        with pyfabm.forcing.ForcingProvider(m) as forcing:
+            for i, name in enumerate(names):
+                shape = m.dependencies[name]._shape
+                values = numpy.multiply.outer(
+                    factors, numpy.full(shape, environment[name])
+                )
+                if i % 2 == 1:
+                    values = values.astype(numpy.float32)
+                series = forcing.add(name, values)
+                assert series.zero_copy == (i % 2 == 0)
+            for index in forcing:
+                for name, series in zip(names, forcing.series):
+                    reference.dependencies[name].value = series.data[index, ...]
+                if index == 0:
+                    m.start()
+                    reference.start()
+                rates = m.getRates()
+                expected = reference.getRates()
+                assert (
+                    rates == expected
+                ).all(), f"Rates with forcing at time index {index} differ: {rates} vs {expected}"
+
+
+def check_command_line_tools(path: str, environment: Mapping[str, float]):
+    """Run fabm_describe_model and fabm_evaluate on a testcase, with values
+    for all state variables and dependencies, and verify that both succeed."""
+    import pyfabm
+
+    with pyfabm.Model(path) as m:
+        values = {v.name: float(v.value) for v in m.state_variables}
+        for d in m.dependencies:
+            values[d.name] = float(environment.get(d.name, 0.0))
+    cell_thickness = str(environment["cell_thickness"])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        values_path = os.path.join(tmpdir, "values.yaml")
+        with open(values_path, "w") as f:
+            yaml.safe_dump(values, f)
+        for tool, args in (
+            ("fabm_describe_model", [path]),
+            ("fabm_evaluate", [path, values_path, "--cell_thickness", cell_thickness]),
+        ):
+            proc = subprocess.run(
+                [sys.executable, "-m", f"pyfabm.utils.{tool}"] + args,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True,
+                cwd=tmpdir,
+            )
+            assert (
+                proc.returncode == 0
+            ), f"{tool} failed with return code {proc.returncode}:\n{proc.stdout}"
+
+
+def get_rss() -> Optional[int]:
+    """Resident memory of the current process in bytes (Linux only)."""
+    if not os.path.isfile("/proc/self/statm"):
+        return None
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def check_memory(
+    path: str, environment: Mapping[str, float], cycles: int = 1000
+) -> Optional[float]:
+    """Create, start and close a model repeatedly, in 0D and 1D. Returns
+    the growth in resident memory per model (bytes) after warming up, or
+    None if resident memory cannot be determined on this platform."""
+    import gc
+    import pyfabm
+
+    def cycle(shape: Tuple[int, ...]):
+        with pyfabm.Model(path, shape=shape) as m:
+            m.cell_thickness = environment["cell_thickness"]
+            for d in m.dependencies:
+                if d.required:
+                    d.value = environment[d.name]
+            m.start()
+            m.getRates()
+
+    if get_rss() is None:
+        return None
+    for i in range(cycles):
+        cycle(() if i % 2 == 0 else (5,))
+    gc.collect()
+    start = get_rss()
+    for i in range(cycles):
+        cycle(() if i % 2 == 0 else (5,))
+    gc.collect()
+    return (get_rss() - start) / cycles
+
+
+def check_diagnostic_lifetime(path: str, environment: Mapping[str, float]):
+    """Check that arrays with diagnostic values remain valid after the model
+    that produced them is garbage-collected, and that the model is released
+    once those arrays are gone."""
+    import gc
+    import weakref
+    import numpy
+    import pyfabm
+
+    def create() -> pyfabm.Model:
+        m = pyfabm.Model(path)
+        m.cell_thickness = environment["cell_thickness"]
+        for d in m.dependencies:
+            if d.required:
+                d.value = environment[d.name]
+        m.start(verbose=False)
+        m.getRates()
+        return m
+
+    def get_diagnostics() -> Tuple[weakref.ref, List[numpy.ndarray]]:
+        m = create()
+        values = [v.value for v in m.diagnostic_variables if v.value is not None]
+        return weakref.ref(m), values
+
+    ref, values = get_diagnostics()
+    expected = [numpy.array(v) for v in values]
+    gc.collect()
+    assert ref() is not None, "Model released while its diagnostics are in use"
+    others = [create() for _ in range(3)]
+    assert all(
+        numpy.array_equal(v, e, equal_nan=True) for v, e in zip(values, expected)
+    ), "Diagnostic values changed after their model was garbage-collected"
+    del values
+    gc.collect()
+    assert ref() is None, "Model not released after its diagnostics are gone"
+    for m in others:
+        m.close()
+
+
+def run_regression_case(
+    path: str, environment: Mapping[str, float], t, dt: float
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Integrate a testcase in 0D with constant forcing. Returns the state
+    at all output times and the diagnostics at the end of the simulation,
+    along with the time spent in initialization and integration. This runs
+    in a worker process."""
+    import numpy
+    import pyfabm
+
+    pyfabm.logger = logging.getLogger()
+    start = timeit.default_timer()
+    model = pyfabm.Model(path)
+    model.cell_thickness = environment["cell_thickness"]
+    for d in model.dependencies:
+        if d.required:
+            d.value = environment[d.name]
+    if not model.start():
+        raise Exception(f"Failed to start model: {pyfabm.getError()}")
+    initialized = timeit.default_timer()
+    y = pyfabm.Simulator(model).integrate(model.state.copy(), t, dt)
+    integrated = timeit.default_timer()
+    model.state[:] = y[-1]
+    model.get_sources()
+    results = {v.name: y[:, i] for i, v in enumerate(model.state_variables)}
+    for variable in model.diagnostic_variables:
+        if variable.value is not None:
+            results[variable.name] = numpy.array(variable.value)
+    timings = dict(initialize=initialized - start, integrate=integrated - initialized)
+    return results, timings
+
+
+def silence_worker():
+    """Discard output of FABM written by a worker process."""
+    os.dup2(os.open(os.devnull, os.O_WRONLY), 1)
+
+
+def compare_snapshot(
+    case: str,
+    results: Mapping[str, Any],
+    reference: Mapping[str, Any],
+    tolerances: Mapping[str, Mapping[str, float]],
+    rtol: float,
+    atol: float,
+) -> List[str]:
+    """Compare results of a testcase against its golden snapshot. Tolerances
+    of a variable are taken from the first pattern in ``tolerances`` that
+    matches <CASE>/<VARIABLE>; if none matches, ``rtol`` and ``atol`` are
+    used. Returns a description of each mismatch."""
+    import numpy
+
+    problems = []
+    for name, ref in reference.items():
+        if name == SNAPSHOT_TIME:
+            continue
+        if name not in results:
+            problems.append(f"{name}: missing from results")
+            continue
+        value = results[name]
+        if value.shape != ref.shape:
+            problems.append(f"{name}: shape {value.shape} differs from {ref.shape}")
+            continue
+        var_rtol, var_atol = rtol, atol
+        for pattern, tolerance in tolerances.items():
+            if fnmatch.fnmatchcase(f"{case}/{name}", pattern):
+                var_rtol = float(tolerance.get("rtol", rtol))
+                var_atol = float(tolerance.get("atol", atol))
+                break
+        delta = numpy.abs(value - ref)
+        bad = ~(delta <= var_atol + var_rtol * numpy.abs(ref))
+        bad &= ~(numpy.isnan(value) & numpy.isnan(ref))
+        if bad.any():
+            first = tuple(int(i) for i in numpy.unravel_index(bad.argmax(), bad.shape))
+            problems.append(
+                f"{name}: {bad.sum()} of {bad.size} values outside tolerance"
+                f" (rtol={var_rtol}, atol={var_atol}), max abs difference ="
+                f" {numpy.nanmax(delta)}, first at {first}:"
+                f" {value[first]} vs {ref[first]}"
+            )
+    for name in results:
+        if name not in reference:
+            problems.append(f"{name}: not in snapshot")
+    return problems
+
+
+def test_pyfabm_regression(args, testcases: Mapping[str, str]):
+    if not args.no_install:
+        retcode = install_pyfabm(args)
+        if retcode is not None:
+            return retcode
+    import numpy
+
+    with open(os.path.join(SCRIPT_ROOT, "environment.yaml")) as f:
+        environment = yaml.safe_load(f)
+    tolerances = {}
+    if args.tolerances is not None:
+        with open(args.tolerances) as f:
+            tolerances = yaml.safe_load(f) or {}
+    if (86400 / OUTPUTS_PER_DAY) % args.time_step != 0:
+        print(
+            f"Time step must divide the output interval ({86400 / OUTPUTS_PER_DAY} s)"
+        )
+        return 2
+    t = numpy.arange(round(args.days * OUTPUTS_PER_DAY) + 1) / OUTPUTS_PER_DAY
+    dt = args.time_step / 86400
+
+    def fail(case: str, message: str, timing: str = ""):
+        log_path = f"test_pyfabm_regression_{case.replace('/', '_')}.log"
+        with open(log_path, "w") as f:
+            f.write(message)
+        logs.append(log_path)
+        print(f"FAILED ({timing}{', ' if timing else ''}log written to {log_path})")
+
+    print(
+        f"Running FABM testcases with pyfabm for {args.days} days"
+        f" (time step {args.time_step} s) in {args.jobs or os.cpu_count()} processes:"
+    )
+    start = timeit.default_timer()
+    case2time = {}
+    with concurrent.futures.ProcessPoolExecutor(
+        args.jobs, initializer=None if args.verbose else silence_worker
+    ) as executor:
+        futures = collections.OrderedDict()
+        for case, path in testcases.items():
+            if case in REGRESSION_SKIP:
+                continue
+            futures[case] = executor.submit(
+                run_regression_case, path, environment, t, dt
+            )
+        for case in testcases:
+            print(f"  {case}... ", end="")
+            if case in REGRESSION_SKIP:
+                print(f"SKIPPED ({REGRESSION_SKIP[case]})")
+                continue
+            sys.stdout.flush()
+            try:
+                results, timings = futures[case].result()
+            except Exception:
+                fail(case, traceback.format_exc())
+                continue
+            case2time[case] = sum(timings.values())
+            timing = ", ".join(f"{k} {v:.3f} s" for k, v in timings.items())
+            snapshot = os.path.join(args.golden, f"{case}.npz")
+            if args.update_golden:
+                os.makedirs(os.path.dirname(snapshot), exist_ok=True)
+                numpy.savez_compressed(snapshot, **{SNAPSHOT_TIME: t}, **results)
+                print(f"SAVED ({timing})")
+                continue
+            if not os.path.isfile(snapshot):
+                fail(
+                    case,
+                    f"Golden snapshot {snapshot} not found."
+                    " Use --update_golden to create it.\n",
+                    timing,
+                )
+                continue
+            with numpy.load(snapshot) as npz:
+                reference = dict(npz)
+            ref_t = reference.get(SNAPSHOT_TIME)
+            if ref_t is None or ref_t.shape != t.shape or (ref_t != t).any():
+                problems = [
+                    f"Snapshot {snapshot} was created for other output times."
+                    " Use the same --days or --update_golden."
+                ]
+            else:
+                problems = compare_snapshot(
+                    case, results, reference, tolerances, args.rtol, args.atol
+                )
+            if problems:
+                fail(case, "\n".join(problems) + "\n", timing)
+            else:
+                print(f"SUCCESS ({timing})")
+    duration = timeit.default_timer() - start
+    print(
+        f"{len(testcases)} testcases took {duration:.3f} s"
+        f" ({sum(case2time.values()):.3f} s summed over testcases)."
+    )
+    slowest = sorted(case2time, key=case2time.get, reverse=True)[:5]
+    print(f"Slowest: {', '.join(f'{c} ({case2time[c]:.3f} s)' for c in slowest)}")
+
+
 def test_0d(args, testcases: Mapping[str, str], gotm_url=DEFAULT_GOTM_URL):
     build_dir = os.path.join(args.work_root, "build")
     gotm_dir = os.path.join(args.work_root, "code/gotm")
@@ -475,6 +1055,7 @@ if __name__ == "__main__":
     host2function = {
         "gotm": test_gotm,
         "pyfabm": test_pyfabm,
+        "pyfabm_regression": test_pyfabm_regression,
         "0d": test_0d,
         "harness": test_harness,
     }
@@ -495,6 +1076,12 @@ if __name__ == "__main__":
         help="Name of FABM branch/commit to compare results against.",
         default=None,
     )
+    parser.add_argument(
+        "--stop_early",
+        action="store_true",
+        help="Stop comparing results of a testcase against the reference"
+        " as soon as a mismatch is found",
+    )
     parser.add_argument(
         "--gotm_branch",
         help="Name of GOTM branch",
@@ -524,6 +1111,41 @@ if __name__ == "__main__":
         help="Additional institute (name + dir) to include",
         default=[],
     )
+    parser.add_argument(
+        "--no_install",
+        action="store_true",
+        help="Use pyfabm as already installed in the current Python environment"
+        " (pyfabm_regression only)",
+    )
+    parser.add_argument(
+        "--golden",
+        help="Directory with golden snapshots for pyfabm_regression",
+        default=os.path.join(FABM_BASE, "testcases/golden"),
+    )
+    parser.add_argument(
+        "--update_golden",
+        action="store_true",
+        help="Save results as golden snapshots instead of comparing against them",
+    )
+    parser.add_argument(
+        "--tolerances",
+        help="YAML file mapping patterns of <TESTCASE>/<VARIABLE> to rtol and atol"
+        " for pyfabm_regression (first match is used)",
+        default=os.path.join(FABM_BASE, "testcases/golden/tolerances.yaml"),
+    )
+    parser.add_argument(
+        "--rtol", type=float, default=1e-10, help="Default relative tolerance"
+    )
+    parser.add_argument(
+        "--atol", type=float, default=1e-15, help="Default absolute tolerance"
+    )
+    parser.add_argument(
+        "--days", type=float, default=5.0, help="Simulated period (days)"
+    )
+    parser.add_argument("--time_step", type=float, default=1350.0, help="Time step (s)")
+    parser.add_argument(
+        "-j", "--jobs", type=int, help="Number of worker processes (default: all cores)"
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable more detailed output"
     )
@@ -10,6 +10,8 @@ import argparse
 import timeit
 import errno
 
+import performance_history
+
 script_root = os.path.abspath(os.path.dirname(__file__))
 root = os.path.join(script_root, '../..')
 allowed_hosts = sorted(os.listdir(os.path.join(root, 'src/drivers')))
@@ -22,6 +24,7 @@ parser.add_argument('--performance', action='store_true', help='test performance
 parser.add_argument('--config', default='fabm.yaml', help='model configuration for performance testing, default: fabm.yaml')
 parser.add_argument('--env', default='environment.yaml', help='model environment for performance testing (YAML file containing a dictionary with variable: value combinations), default: environment.yaml')
 parser.add_argument('--report', default=None, help='file to write performance report to (only used with --performance), default: performance_<BRANCH>_<COMMIT>.log')
+parser.add_argument('--history', default=None, help='SQLite database to add performance timings to (only used with --performance, see performance_history.py)')
 parser.add_argument('--repeat', type=int, default=5, help='number of times to run each performance test. Increase this to reduce the noise in timings')
 parser.add_argument('-v', '--verbose', action='store_true', help='show test results even if completed successfully')
 args, cmake_arguments = parser.parse_known_args()
@@ -32,9 +35,8 @@ if args.performance:
     if not os.path.isfile(args.env):
         print('Model environment %s does not exist. Specify (or change) --env.' % args.env)
         sys.exit(2)
+    git_commit, git_branch = performance_history.get_git_commit(root)
     if args.report is None:
-        git_branch = subprocess.check_output(['git', 'name-rev', '--name-only', 'HEAD']).decode('ascii').strip()
-        git_commit = subprocess.check_output(['git', 'describe', '--always', '--dirty']).decode('ascii').strip()
         args.report = 'performance_%s_%s.log' % (git_branch, git_commit)
     print('Performance report will be written to %s' % args.report)
 
@@ -66,6 +68,7 @@ def run(phase, args, verbose=False, **kwargs):
     return proc.returncode
 
 build_root = tempfile.mkdtemp()
+build_settings = None
 try:
     vsconfig = 'Release' if args.performance else 'Debug'
     host2exe = {}
@@ -84,6 +87,9 @@ try:
             sys.exit(2)
         if generates[host] != 0:
             continue
+        if args.performance and build_settings is None:
+            # Compiler and build type that performance timings apply to
+            build_settings = performance_history.get_build_settings(build_dir, vsconfig)
         print('  building...', end='')
         sys.stdout.flush()
         builds[host] = run('%s_build' % host, [args.cmake, '--build', build_dir, '--target', 'test_host', '--config', vsconfig])
@@ -133,3 +139,12 @@ if args.performance:
             if host in timings:
                 ts = timings[host]
                 f.write('%s\t%s\t%.3f\n' % (host, '\t'.join(['%.3f' % t for t in ts]), sum(ts) / len(ts)))
+    if build_settings is not None:
+        machine = performance_history.get_machine(*build_settings)
+        performance_history.save_machine('%s.machine.json' % args.report, machine)
+    if args.history is not None and timings:
+        history = performance_history.History(args.history)
+        for host, ts in timings.items():
+            history.add_samples(git_commit, git_branch, machine, host, os.path.basename(args.config), ts)
+        history.close()
+        print('Timings added to %s (commit %s). To check for regressions: performance_history.py %s compare' % (args.history, git_commit, args.history))